@@ -58,9 +58,10 @@ from .brand import ONI, TARA, ONI_VERSION, TARA_VERSION, get_brand
 # =============================================================================
 # CORE: Signal Trust & Validation
 # =============================================================================
-from .coherence import CoherenceMetric, calculate_cs, VarianceComponents
+from .coherence import CoherenceMetric, StreamingCoherence, calculate_cs, VarianceComponents
 from .scale_freq import ScaleFrequencyInvariant
 from .firewall import NeuralFirewall
+from .decision_log import DecisionLog
 
 # =============================================================================
 # ARCHITECTURE: 14-Layer Reference Model
@@ -136,10 +137,12 @@ __all__ = [
 
     # Signal Trust
     "CoherenceMetric",
+    "StreamingCoherence",
     "calculate_cs",
     "VarianceComponents",
     "ScaleFrequencyInvariant",
     "NeuralFirewall",
+    "DecisionLog",
 
     # Architecture
     "ONIStack",
@@ -216,8 +219,10 @@ ARCHITECTURE
 
 SIGNAL VALIDATION
   CoherenceMetric      Calculate Cₛ trust scores (0-1)
+  StreamingCoherence   Sliding-window Cₛ per channel for live feeds
   ScaleFrequencyInvariant   Validate f × S ≈ k
   NeuralFirewall       Accept/reject/flag decisions
+  DecisionLog          Bounded decision log with running stats
 
 THREAT DETECTION
   KohnoThreatModel     CIA threat classification
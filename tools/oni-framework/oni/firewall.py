@@ -42,9 +42,36 @@ Reference: TechDoc-Neural_Firewall_Architecture.md
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Optional, Callable, Dict, Any
-
-from .coherence import CoherenceMetric, VarianceComponents
+from typing import List, Optional, Callable, Dict, Any, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array and stream filtering require it
+    np = None
+
+from .coherence import (
+    CoherenceMetric,
+    StreamingCoherence,
+    VarianceComponents,
+    calculate_cs,
+    _valid_samples,
+)
+from .decision_log import DecisionLog, DEFAULT_RETENTION, timestamp_from_ns
+
+# Rows scored per pass by filter_arrays; bounds the (rows, samples)
+# temporaries to a few MB whatever the batch size
+BATCH_CHUNK_SIZE = 4096
+
+# Decision matrix reasons, formatted with the coherence score. The signal
+# log stores each row's template as a code and rebuilds the reason on read.
+_HIGH_AUTHENTICATED = "High coherence ({:.3f}) with valid authentication"
+_HIGH_UNAUTHENTICATED = "High coherence ({:.3f}) but missing authentication"
+_MEDIUM_AUTHENTICATED = "Medium coherence ({:.3f}), flagged for review"
+_MEDIUM_UNAUTHENTICATED = "Medium coherence ({:.3f}) without authentication"
+_LOW = "Low coherence ({:.3f}), signal incoherent"
+
+# Signal log columns beyond the decision, alert level, score and time
+_SIGNAL_LOG_COLUMNS = {"phase": "d", "transport": "d", "gain": "d", "reason": "h"}
 
 
 class Decision(Enum):
@@ -118,6 +145,133 @@ class FilterResult:
         return self.decision == Decision.ACCEPT_FLAG
 
 
+def _decision_matrix(
+    coherence: float,
+    authenticated: bool,
+    threshold_high: float,
+    threshold_low: float,
+) -> tuple:
+    """
+    Apply the firewall decision matrix to one signal.
+
+    Returns:
+        Tuple of (Decision, AlertLevel, reason template); the reason is
+        the template formatted with the coherence score
+    """
+    if coherence > threshold_high:
+        # High coherence
+        if authenticated:
+            return Decision.ACCEPT, AlertLevel.ROUTINE, _HIGH_AUTHENTICATED
+        else:
+            return Decision.REJECT, AlertLevel.ALERT, _HIGH_UNAUTHENTICATED
+
+    elif coherence > threshold_low:
+        # Medium coherence
+        if authenticated:
+            return Decision.ACCEPT_FLAG, AlertLevel.ENHANCED, _MEDIUM_AUTHENTICATED
+        else:
+            return Decision.REJECT, AlertLevel.ALERT, _MEDIUM_UNAUTHENTICATED
+
+    else:
+        # Low coherence - reject regardless of authentication
+        return Decision.REJECT, AlertLevel.CRITICAL, _LOW
+
+
+def _bounds_reason(amplitude_bounds: tuple) -> str:
+    """Reason of a rejection by the amplitude bounds."""
+    min_amp, max_amp = amplitude_bounds
+    return f"Amplitude outside hardware bounds [{min_amp}, {max_amp}]"
+
+
+def _bounds_rejection(
+    amplitude_bounds: tuple, timestamp: Optional[datetime] = None
+) -> FilterResult:
+    """FilterResult of a signal with an amplitude outside the hardware bounds."""
+    return FilterResult(
+        decision=Decision.REJECT,
+        coherence=0.0,
+        variances=VarianceComponents(phase=0, transport=0, gain=float('inf')),
+        alert_level=AlertLevel.CRITICAL,
+        reason=_bounds_reason(amplitude_bounds),
+        timestamp=timestamp or datetime.now(),
+    )
+
+
+@dataclass
+class BatchFilterResult:
+    """
+    Columnar result of NeuralFirewall.filter_arrays, one row per signal.
+
+    Decisions and alert levels are stored as their enum values, so the
+    accepted/rejected/flagged masks are plain array comparisons.
+    result(i) rebuilds the FilterResult of a single row.
+
+    Attributes:
+        decision: Decision value per row (int8)
+        coherence: Calculated coherence score per row
+        variances: Variance components (phase and gain per row)
+        alert_level: AlertLevel value per row (int8)
+        authenticated: Authentication flag per row
+        in_bounds: False for rows rejected by the amplitude bounds
+        thresholds: (threshold_high, threshold_low) the rows were judged by
+        amplitude_bounds: Amplitude bounds in force, if any
+        timestamp: When the batch was filtered
+    """
+    decision: "np.ndarray"
+    coherence: "np.ndarray"
+    variances: VarianceComponents
+    alert_level: "np.ndarray"
+    authenticated: "np.ndarray"
+    in_bounds: "np.ndarray"
+    thresholds: tuple
+    amplitude_bounds: Optional[tuple] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        return len(self.decision)
+
+    def __iter__(self) -> Iterator[FilterResult]:
+        return (self.result(i) for i in range(len(self)))
+
+    @property
+    def accepted(self) -> "np.ndarray":
+        """Mask of accepted rows (with or without flag)."""
+        return self.decision != Decision.REJECT.value
+
+    @property
+    def rejected(self) -> "np.ndarray":
+        """Mask of rejected rows."""
+        return self.decision == Decision.REJECT.value
+
+    @property
+    def flagged(self) -> "np.ndarray":
+        """Mask of rows flagged for review."""
+        return self.decision == Decision.ACCEPT_FLAG.value
+
+    def result(self, i: int) -> FilterResult:
+        """FilterResult of row ``i``, with its decision reason."""
+        if not self.in_bounds[i]:
+            return _bounds_rejection(self.amplitude_bounds, self.timestamp)
+
+        coherence = float(self.coherence[i])
+        decision, alert_level, reason = _decision_matrix(
+            coherence, bool(self.authenticated[i]), *self.thresholds
+        )
+        reason = reason.format(coherence)
+        return FilterResult(
+            decision=decision,
+            coherence=coherence,
+            variances=VarianceComponents(
+                phase=float(self.variances.phase[i]),
+                transport=float(self.variances.transport),
+                gain=float(self.variances.gain[i]),
+            ),
+            alert_level=alert_level,
+            reason=reason,
+            timestamp=self.timestamp,
+        )
+
+
 class NeuralFirewall:
     """
     Zero-trust neural signal firewall operating at ONI Layer 8.
@@ -143,6 +297,8 @@ class NeuralFirewall:
         reference_freq: float = 40.0,
         amplitude_bounds: Optional[tuple] = None,
         rate_limit: Optional[int] = None,
+        log_retention: int = DEFAULT_RETENTION,
+        log_spill_path: Optional[str] = None,
     ):
         """
         Initialize the neural firewall.
@@ -153,6 +309,9 @@ class NeuralFirewall:
             reference_freq: Reference oscillation frequency for phase calculation
             amplitude_bounds: Optional (min, max) amplitude bounds for hard limits
             rate_limit: Optional maximum signals per second
+            log_retention: Decisions kept in memory by the signal log
+            log_spill_path: Optional file receiving decisions evicted from the
+                signal log, to keep the full history (kept open until close())
         """
         if threshold_low >= threshold_high:
             raise ValueError("threshold_low must be less than threshold_high")
@@ -165,7 +324,9 @@ class NeuralFirewall:
         self.rate_limit = rate_limit
 
         self._coherence_metric = CoherenceMetric(reference_freq=reference_freq)
-        self._signal_log: List[FilterResult] = []
+        self._signal_log = DecisionLog(
+            log_retention, log_spill_path, columns=_SIGNAL_LOG_COLUMNS
+        )
         self._callbacks: Dict[AlertLevel, List[Callable]] = {
             level: [] for level in AlertLevel
         }
@@ -187,25 +348,17 @@ class NeuralFirewall:
         if self.amplitude_bounds:
             min_amp, max_amp = self.amplitude_bounds
             if any(a < min_amp or a > max_amp for a in signal.amplitudes):
-                result = FilterResult(
-                    decision=Decision.REJECT,
-                    coherence=0.0,
-                    variances=VarianceComponents(phase=0, transport=0, gain=float('inf')),
-                    alert_level=AlertLevel.CRITICAL,
-                    reason=f"Amplitude outside hardware bounds [{min_amp}, {max_amp}]",
-                )
-                self._log_and_alert(result)
+                result = _bounds_rejection(self.amplitude_bounds)
+                self._log_and_alert(result, result.reason)
                 return result
 
-        # Calculate coherence
+        # Calculate variances once and build the score from them
+        # (the metric caches the transport term per factor set)
         variances = self._coherence_metric.calculate_variances(
             signal.arrival_times,
             signal.amplitudes,
         )
-        coherence = self._coherence_metric.calculate(
-            signal.arrival_times,
-            signal.amplitudes,
-        )
+        coherence = calculate_cs(variances)
 
         # Apply decision matrix
         decision, alert_level, reason = self._apply_decision_matrix(
@@ -217,10 +370,10 @@ class NeuralFirewall:
             coherence=coherence,
             variances=variances,
             alert_level=alert_level,
-            reason=reason,
+            reason=reason.format(coherence),
         )
 
-        self._log_and_alert(result)
+        self._log_and_alert(result, reason)
         return result
 
     def _apply_decision_matrix(
@@ -232,53 +385,100 @@ class NeuralFirewall:
         Apply the firewall decision matrix.
 
         Returns:
-            Tuple of (Decision, AlertLevel, reason_string)
+            Tuple of (Decision, AlertLevel, reason template)
         """
-        if coherence > self.threshold_high:
-            # High coherence
-            if authenticated:
-                return (
-                    Decision.ACCEPT,
-                    AlertLevel.ROUTINE,
-                    f"High coherence ({coherence:.3f}) with valid authentication",
-                )
-            else:
-                return (
-                    Decision.REJECT,
-                    AlertLevel.ALERT,
-                    f"High coherence ({coherence:.3f}) but missing authentication",
-                )
-
-        elif coherence > self.threshold_low:
-            # Medium coherence
-            if authenticated:
-                return (
-                    Decision.ACCEPT_FLAG,
-                    AlertLevel.ENHANCED,
-                    f"Medium coherence ({coherence:.3f}), flagged for review",
-                )
-            else:
-                return (
-                    Decision.REJECT,
-                    AlertLevel.ALERT,
-                    f"Medium coherence ({coherence:.3f}) without authentication",
-                )
+        return _decision_matrix(
+            coherence, authenticated, self.threshold_high, self.threshold_low
+        )
 
-        else:
-            # Low coherence - reject regardless of authentication
-            return (
-                Decision.REJECT,
-                AlertLevel.CRITICAL,
-                f"Low coherence ({coherence:.3f}), signal incoherent",
-            )
+    def _apply_decision_matrix_batch(
+        self,
+        coherence: "np.ndarray",
+        authenticated: "np.ndarray",
+    ) -> tuple:
+        """
+        Apply the firewall decision matrix to arrays of signals.
+
+        Returns:
+            Tuple of (decision values, alert level values) as int8 arrays
+        """
+        high = coherence > self.threshold_high
+        # Written as "not above" so that NaN scores land in the low band,
+        # as they do in _decision_matrix
+        low = ~(coherence > self.threshold_low)
+
+        decision = np.full(len(coherence), Decision.REJECT.value, dtype=np.int8)
+        decision[high & authenticated] = Decision.ACCEPT.value
+        decision[~high & ~low & authenticated] = Decision.ACCEPT_FLAG.value
+
+        alert_level = np.select(
+            [low, ~authenticated, high],
+            [
+                AlertLevel.CRITICAL.value,
+                AlertLevel.ALERT.value,
+                AlertLevel.ROUTINE.value,
+            ],
+            AlertLevel.ENHANCED.value,
+        ).astype(np.int8)
+        return decision, alert_level
+
+    def _log_and_alert(self, result: FilterResult, reason: str):
+        """Log the result, with its reason template, and trigger callbacks."""
+        log = self._signal_log
+        log.append(
+            result.decision.value,
+            result.alert_level.value,
+            result.coherence,
+            result.timestamp,
+            phase=result.variances.phase,
+            transport=result.variances.transport,
+            gain=result.variances.gain,
+            reason=log.intern(reason),
+        )
+        self._trigger_callbacks(result)
+
+    def _log_batch_and_alert(self, batch: BatchFilterResult):
+        """Log a batch and trigger callbacks for the rows that reach them."""
+        log = self._signal_log
+        # Reason template per row, picked as in _decision_matrix
+        threshold_high, threshold_low = batch.thresholds
+        high = batch.coherence > threshold_high
+        low = ~(batch.coherence > threshold_low)
+        templates = [
+            _LOW,
+            _HIGH_AUTHENTICATED,
+            _HIGH_UNAUTHENTICATED,
+            _MEDIUM_AUTHENTICATED,
+            _MEDIUM_UNAUTHENTICATED,
+        ]
+        codes = np.array([log.intern(t) for t in templates], dtype=np.int16)
+        auth = batch.authenticated
+        reason = codes[np.select([low, high & auth, high, auth], [0, 1, 2, 3], 4)]
+        if not batch.in_bounds.all():
+            bounds = log.intern(_bounds_reason(batch.amplitude_bounds))
+            reason[~batch.in_bounds] = bounds
+        log.extend(
+            batch.decision,
+            batch.alert_level,
+            batch.coherence,
+            batch.timestamp,
+            phase=batch.variances.phase,
+            transport=batch.variances.transport,
+            gain=batch.variances.gain,
+            reason=reason,
+        )
 
-    def _log_and_alert(self, result: FilterResult):
-        """Log the result and trigger any registered callbacks."""
-        self._signal_log.append(result)
+        levels = [level.value for level in AlertLevel if self._callbacks.get(level)]
+        if not levels:
+            return
+        # Only rows at or above the lowest registered level become FilterResults
+        for i in np.flatnonzero(batch.alert_level >= min(levels)):
+            self._trigger_callbacks(batch.result(i))
 
-        # Trigger callbacks for this alert level and above
+    def _trigger_callbacks(self, result):
+        """Call the callbacks registered at or below the result's alert level."""
         for level in AlertLevel:
-            if level.value >= result.alert_level.value:
+            if level.value <= result.alert_level.value:
                 for callback in self._callbacks.get(level, []):
                     callback(result)
 
@@ -311,6 +511,188 @@ class NeuralFirewall:
         """
         return [self.filter(signal) for signal in signals]
 
+    def filter_arrays(
+        self,
+        arrival_times: "np.ndarray",
+        amplitudes: "np.ndarray",
+        authenticated: "np.ndarray",
+        lengths: Optional["np.ndarray"] = None,
+        mask: Optional["np.ndarray"] = None,
+    ) -> BatchFilterResult:
+        """
+        Filter many signals given as arrays (columnar filter_batch).
+
+        Bounds checks, coherence and the decision matrix run on whole
+        arrays, BATCH_CHUNK_SIZE rows at a time. The batch is logged as
+        one entry; FilterResults are only built for rows that trigger a
+        registered callback.
+
+        Args:
+            arrival_times: (N, T) arrival times, or a (T,) row shared by all signals
+            amplitudes: (N, T) amplitudes
+            authenticated: (N,) authentication flags, or one flag for all
+            lengths: Optional (N,) count of real leading samples per row
+            mask: Optional (N, T) boolean mask of real samples
+
+        Returns:
+            BatchFilterResult with one row per signal, in input order
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the array shapes do not match
+        """
+        if np is None:
+            raise ImportError("filter_arrays requires NumPy (pip install numpy)")
+
+        amps = np.asarray(amplitudes, dtype=float)
+        if amps.ndim != 2:
+            raise ValueError(f"amplitudes must have shape (N, T), got {amps.shape}")
+        times = np.asarray(arrival_times, dtype=float)
+        n = len(amps)
+        auth = np.asarray(authenticated, dtype=bool)
+        if auth.shape not in ((), (n,)):
+            raise ValueError(
+                f"authenticated shape {auth.shape} does not match {n} signals"
+            )
+        auth = np.broadcast_to(auth, (n,))
+        lengths = None if lengths is None else np.asarray(lengths)
+        mask = None if mask is None else np.asarray(mask, dtype=bool)
+
+        phase = np.zeros(n)
+        gain = np.zeros(n)
+        in_bounds = np.ones(n, dtype=bool)
+        transport = 0.0
+        for start in range(0, n, BATCH_CHUNK_SIZE):
+            rows = slice(start, start + BATCH_CHUNK_SIZE)
+            chunk = amps[rows]
+            chunk_lengths = None if lengths is None else lengths[rows]
+            chunk_mask = None if mask is None else mask[rows]
+
+            variances = self._coherence_metric.calculate_variances_batch(
+                times if times.ndim == 1 else times[rows],
+                chunk,
+                lengths=chunk_lengths,
+                mask=chunk_mask,
+            )
+            phase[rows] = variances.phase
+            gain[rows] = variances.gain
+            transport = variances.transport
+
+            if self.amplitude_bounds:
+                min_amp, max_amp = self.amplitude_bounds
+                outside = (chunk < min_amp) | (chunk > max_amp)
+                valid = _valid_samples(chunk.shape, chunk_lengths, chunk_mask)
+                if valid is not None:
+                    outside &= valid
+                in_bounds[rows] = ~outside.any(axis=1)
+
+        variances = VarianceComponents(phase=phase, transport=transport, gain=gain)
+        return self._finish_batch(variances, in_bounds, auth)
+
+    def stream(
+        self,
+        n_channels: int,
+        window: int = 64,
+        recompute_every: int = 4096,
+    ) -> StreamingCoherence:
+        """
+        Create a per-channel streaming scorer for filter_stream.
+
+        The stream uses this firewall's reference frequency and
+        transport factors.
+
+        Args:
+            n_channels: Number of channels
+            window: Samples per channel in the scoring window
+            recompute_every: Samples between exact rebuilds of the running sums
+
+        Returns:
+            Empty StreamingCoherence; feed it with update() or extend()
+        """
+        metric = self._coherence_metric
+        return StreamingCoherence(
+            n_channels=n_channels,
+            window=window,
+            reference_freq=metric.reference_freq,
+            transport_factors=metric.transport_factors,
+            expected_amplitude=metric.expected_amplitude,
+            recompute_every=recompute_every,
+        )
+
+    def filter_stream(
+        self,
+        stream: StreamingCoherence,
+        authenticated: "np.ndarray",
+    ) -> BatchFilterResult:
+        """
+        Filter the current window of every channel of a stream.
+
+        Scores come from the stream's running sums, so this can run at
+        any stride (e.g. every few samples of a 1 kHz feed) without
+        rescanning the windows. The result is logged and alerted like a
+        filter_arrays batch, one row per channel.
+
+        Args:
+            stream: Stream created by stream() (or a compatible one)
+            authenticated: Per-channel authentication flags, or one flag for all
+
+        Returns:
+            BatchFilterResult with one row per channel
+        """
+        n = stream.n_channels
+        auth = np.asarray(authenticated, dtype=bool)
+        if auth.shape not in ((), (n,)):
+            raise ValueError(
+                f"authenticated shape {auth.shape} does not match {n} channels"
+            )
+
+        in_bounds = np.ones(n, dtype=bool)
+        if self.amplitude_bounds:
+            min_amp, max_amp = self.amplitude_bounds
+            low, high = stream.amplitude_range()
+            in_bounds = ~((low < min_amp) | (high > max_amp))
+
+        auth = np.broadcast_to(auth, (n,))
+        return self._finish_batch(stream.variances(), in_bounds, auth)
+
+    def _finish_batch(
+        self,
+        variances: VarianceComponents,
+        in_bounds: "np.ndarray",
+        authenticated: "np.ndarray",
+    ) -> BatchFilterResult:
+        """Score, decide, log and alert rows given their variances."""
+        phase = np.array(variances.phase, dtype=float)
+        gain = np.array(variances.gain, dtype=float)
+        transport = variances.transport
+
+        # Out-of-bounds rows score as in filter: zero phase, infinite gain
+        phase[~in_bounds] = 0.0
+        gain[~in_bounds] = np.inf
+        total = phase + transport + gain
+        if (total < 0).any():
+            raise ValueError(f"Total variance cannot be negative: {total.min()}")
+        coherence = np.exp(-total)
+
+        decision, alert_level = self._apply_decision_matrix_batch(
+            coherence, authenticated
+        )
+        decision[~in_bounds] = Decision.REJECT.value
+        alert_level[~in_bounds] = AlertLevel.CRITICAL.value
+
+        batch = BatchFilterResult(
+            decision=decision,
+            coherence=coherence,
+            variances=VarianceComponents(phase=phase, transport=transport, gain=gain),
+            alert_level=alert_level,
+            authenticated=authenticated.copy(),
+            in_bounds=in_bounds,
+            thresholds=(self.threshold_high, self.threshold_low),
+            amplitude_bounds=self.amplitude_bounds,
+        )
+        self._log_batch_and_alert(batch)
+        return batch
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get firewall statistics.
@@ -318,7 +700,9 @@ class NeuralFirewall:
         Returns:
             Dict with accept/reject counts, average coherence, etc.
         """
-        if not self._signal_log:
+        log = self._signal_log
+        total = log.total
+        if not total:
             return {
                 "total": 0,
                 "accepted": 0,
@@ -327,21 +711,24 @@ class NeuralFirewall:
                 "avg_coherence": 0.0,
             }
 
-        accepted = sum(1 for r in self._signal_log if r.accepted)
-        rejected = sum(1 for r in self._signal_log if r.rejected)
-        flagged = sum(1 for r in self._signal_log if r.flagged)
-        avg_coherence = sum(r.coherence for r in self._signal_log) / len(self._signal_log)
+        # Running counters of the decision log; O(1) in the traffic seen
+        flagged = log.decision_count(Decision.ACCEPT_FLAG.value)
+        accepted = log.decision_count(Decision.ACCEPT.value) + flagged
+        rejected = log.decision_count(Decision.REJECT.value)
+        p05, p50, p95 = log.quantiles([0.05, 0.5, 0.95])
 
         return {
-            "total": len(self._signal_log),
+            "total": total,
+            "retained": len(log),
             "accepted": accepted,
             "rejected": rejected,
             "flagged": flagged,
-            "accept_rate": accepted / len(self._signal_log),
-            "reject_rate": rejected / len(self._signal_log),
-            "avg_coherence": avg_coherence,
+            "accept_rate": accepted / total,
+            "reject_rate": rejected / total,
+            "avg_coherence": log.coherence_mean,
+            "coherence_quantiles": {"p05": p05, "p50": p50, "p95": p95},
             "alerts": {
-                level.name: sum(1 for r in self._signal_log if r.alert_level == level)
+                level.name: log.alert_count(level.value)
                 for level in AlertLevel
             },
         }
@@ -352,5 +739,38 @@ class NeuralFirewall:
 
     @property
     def log(self) -> List[FilterResult]:
-        """Access the signal log (read-only copy)."""
-        return list(self._signal_log)
+        """Retained signal results, rebuilt from the log columns (a copy)."""
+        log = self._signal_log
+        rows = log.columns()
+        return [
+            FilterResult(
+                decision=Decision(rows["decision"][i]),
+                coherence=rows["coherence"][i],
+                variances=VarianceComponents(
+                    phase=rows["phase"][i],
+                    transport=rows["transport"][i],
+                    gain=rows["gain"][i],
+                ),
+                alert_level=AlertLevel(rows["alert_level"][i]),
+                reason=log.label(rows["reason"][i]).format(rows["coherence"][i]),
+                timestamp=timestamp_from_ns(rows["timestamp"][i]),
+            )
+            for i in range(len(log))
+        ]
+
+    @property
+    def decision_log(self) -> DecisionLog:
+        """Columnar decision log (running stats, columns, history)."""
+        return self._signal_log
+
+    def close(self):
+        """Flush and close the log spill file (reopened on the next spill)."""
+        self._signal_log.close()
+
+    def __enter__(self) -> "NeuralFirewall":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -5,6 +5,7 @@ import pytest
 
 from oni.coherence import (
     CoherenceMetric,
+    StreamingCoherence,
     VarianceComponents,
     calculate_cs,
     quick_coherence,
@@ -120,6 +121,20 @@ class TestCoherenceMetric:
         # But ln(1.0) = 0, so it should be exactly 0
         assert variances.transport == pytest.approx(0.0, abs=1e-10)
 
+    def test_transport_variance_cached_per_factor_set(self):
+        """Transport variance is reused until the factors change."""
+        metric = CoherenceMetric(transport_factors={'electrode': 0.9})
+        times, amplitudes = [0.0, 0.025], [100, 100]
+
+        first = metric.calculate_variances(times, amplitudes).transport
+        assert metric.calculate_variances(times, amplitudes).transport == first
+        assert len(metric._transport_cache) == 1
+
+        metric.transport_factors['electrode'] = 0.5
+        assert metric.calculate_variances(times, amplitudes).transport == pytest.approx(-math.log(0.5))
+        override = metric.calculate_variances(times, amplitudes, {'a': 0.9, 'b': 0.9})
+        assert override.transport == pytest.approx(-2 * math.log(0.9))
+
     def test_calculate_returns_valid_range(self):
         """Coherence score should be in [0, 1]."""
         metric = CoherenceMetric()
@@ -158,6 +173,125 @@ class TestCoherenceMetric:
         assert metric.get_band() == "theta"
 
 
+class TestCalculateBatch:
+    """Tests for array inputs and batch scoring."""
+
+    def _signals(self, n=20, width=80, seed=0):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(seed)
+        times = np.sort(rng.uniform(0, 0.5, (n, width)), axis=1)
+        amplitudes = rng.normal(100, 10, (n, width))
+        return times, amplitudes
+
+    def test_array_input_matches_list_input(self):
+        """ndarray inputs give the same score as Python lists."""
+        times, amplitudes = self._signals(n=1)
+        metric = CoherenceMetric()
+        assert metric.calculate(times[0], amplitudes[0]) == pytest.approx(
+            metric.calculate(times[0].tolist(), amplitudes[0].tolist()), rel=1e-12
+        )
+
+    def test_batch_matches_per_signal_scores(self):
+        """Each batch score equals calculate() on its row."""
+        times, amplitudes = self._signals()
+        metric = CoherenceMetric(expected_amplitude=95.0)
+        scores = metric.calculate_batch(times, amplitudes)
+        expected = [metric.calculate(t.tolist(), a.tolist()) for t, a in zip(times, amplitudes)]
+        assert scores.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_ragged_batch_with_lengths_or_mask(self):
+        """Padding beyond each row's length is ignored."""
+        np = pytest.importorskip("numpy")
+        times, amplitudes = self._signals()
+        lengths = np.arange(len(times)) % 10 + 1
+        amplitudes[np.arange(times.shape[1]) >= lengths[:, None]] = np.nan
+        metric = CoherenceMetric()
+
+        by_lengths = metric.calculate_batch(times, amplitudes, lengths=lengths)
+        by_mask = metric.calculate_batch(
+            times, amplitudes, mask=np.arange(times.shape[1]) < lengths[:, None]
+        )
+        expected = [
+            metric.calculate(t[:k].tolist(), a[:k].tolist())
+            for t, a, k in zip(times, amplitudes, lengths)
+        ]
+        assert by_lengths.tolist() == pytest.approx(expected, rel=1e-12)
+        assert by_mask.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_shared_time_base(self):
+        """A 1-D time row is shared by every signal."""
+        times, amplitudes = self._signals()
+        metric = CoherenceMetric()
+        shared = metric.calculate_batch(times[0], amplitudes)
+        expected = [metric.calculate(times[0].tolist(), a.tolist()) for a in amplitudes]
+        assert shared.tolist() == pytest.approx(expected, rel=1e-12)
+
+    def test_shape_mismatch_raises(self):
+        """Times must match the amplitude matrix or one of its rows."""
+        times, amplitudes = self._signals()
+        with pytest.raises(ValueError):
+            CoherenceMetric().calculate_batch(times[:, :5], amplitudes)
+
+
+class TestStreamingCoherence:
+    """Tests for sliding-window streaming scores."""
+
+    def _stream_data(self, steps=300, channels=4, seed=0):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(seed)
+        # Jittered 40 Hz arrivals per channel
+        times = np.arange(steps)[:, None] * 0.025 + rng.normal(0, 0.002, (steps, channels))
+        amplitudes = rng.normal(100, 10, (steps, channels))
+        return times, amplitudes
+
+    def test_update_matches_window_scores(self):
+        """Each score equals calculate() on the channel's last window."""
+        times, amplitudes = self._stream_data()
+        stream = StreamingCoherence(n_channels=4, window=32, recompute_every=100)
+        metric = CoherenceMetric()
+        for i in range(len(times)):
+            stream.update(times[i], amplitudes[i])
+            if i in (0, 1, 20, 31, 150, 299):
+                start = max(0, i + 1 - 32)
+                expected = [
+                    metric.calculate(times[start:i + 1, c].tolist(), amplitudes[start:i + 1, c].tolist())
+                    for c in range(4)
+                ]
+                assert stream.score().tolist() == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+    def test_extend_matches_update(self):
+        """Blocks of any size give the same scores as single samples."""
+        times, amplitudes = self._stream_data()
+        single = StreamingCoherence(n_channels=4, window=32, expected_amplitude=100.0)
+        blocked = StreamingCoherence(n_channels=4, window=32, expected_amplitude=100.0)
+        for i in range(len(times)):
+            single.update(times[i], amplitudes[i])
+        for start, stop in [(0, 5), (5, 60), (60, 61), (61, 300)]:
+            blocked.extend(times[start:stop], amplitudes[start:stop])
+        assert blocked.n_samples == single.n_samples == 32
+        assert blocked.score().tolist() == pytest.approx(single.score().tolist(), rel=1e-9)
+
+    def test_recompute_bounds_drift(self):
+        """Running sums stay exact over long streams with large offsets."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(1)
+        stream = StreamingCoherence(n_channels=2, window=16, recompute_every=500)
+        amplitudes = 1e6 + rng.normal(0, 1, (5000, 2))
+        stream.extend(np.arange(5000) * 0.025, amplitudes)
+        for i in range(5000, 7000):
+            stream.update(i * 0.025, amplitudes[i % 5000])
+        gain = stream.variances().gain
+        window = amplitudes[np.arange(6984, 7000) % 5000]
+        expected = ((window - window.mean(axis=0)) ** 2).mean(axis=0) / window.mean(axis=0) ** 2
+        assert gain.tolist() == pytest.approx(expected.tolist(), rel=1e-6)
+
+    def test_shape_mismatch_raises(self):
+        """Blocks must carry one column per channel."""
+        times, amplitudes = self._stream_data()
+        with pytest.raises(ValueError):
+            StreamingCoherence(n_channels=3).extend(times, amplitudes)
+
+
 class TestQuickCoherence:
     """Tests for the quick_coherence convenience function."""
 
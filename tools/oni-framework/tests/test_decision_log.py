@@ -0,0 +1,108 @@
+"""Tests for the decision log module."""
+
+import math
+from datetime import datetime
+
+import pytest
+
+from oni.decision_log import DecisionLog, read_spill, timestamp_from_ns
+
+
+def _rows(n, seed=0):
+    """Deterministic (decision, alert_level, coherence) rows."""
+    return [((i + seed) % 3 + 1, (i * 7 + seed) % 5 + 1, ((i * 37 + seed) % 100) / 100) for i in range(n)]
+
+
+class TestDecisionLog:
+    """Tests for the bounded columnar log."""
+
+    def test_retention_bounds_rows_not_stats(self):
+        """Only the newest rows are kept, but statistics cover every row."""
+        log = DecisionLog(retention=10, columns={"row": "i"})
+        rows = _rows(25)
+        for i, (decision, alert, coherence) in enumerate(rows):
+            log.append(decision, alert, coherence, datetime.now(), row=i)
+
+        assert len(log) == 10
+        assert log.total == 25
+        assert log.columns()["row"] == list(range(15, 25))
+        assert log.columns()["coherence"] == [r[2] for r in rows[15:]]
+        assert log.decision_count(1) == sum(1 for r in rows if r[0] == 1)
+        assert log.alert_count(5) == sum(1 for r in rows if r[1] == 5)
+        assert log.coherence_mean == pytest.approx(sum(r[2] for r in rows) / 25)
+
+    def test_extend_matches_append(self):
+        """Bulk inserts keep the same rows and counters as single ones."""
+        rows = _rows(40)
+        single = DecisionLog(retention=16)
+        bulk = DecisionLog(retention=16)
+        stamp = datetime.now()
+        for decision, alert, coherence in rows:
+            single.append(decision, alert, coherence, stamp)
+        for start, stop in [(0, 3), (3, 20), (20, 21), (21, 40)]:
+            chunk = rows[start:stop]
+            bulk.extend([r[0] for r in chunk], [r[1] for r in chunk], [r[2] for r in chunk], stamp)
+
+        assert bulk.columns() == single.columns()
+        assert bulk.total == single.total
+        assert [bulk.alert_count(c) for c in range(1, 6)] == [single.alert_count(c) for c in range(1, 6)]
+
+    def test_extra_columns_and_labels(self):
+        """Extra columns ride along with their rows; labels are stored once."""
+        log = DecisionLog(retention=4, columns={"reason": "h"})
+        stamp = datetime(2024, 5, 1, 12, 30, 15, 123456)
+        log.extend([1, 2, 3], [1, 1, 5], [0.9, 0.5, 0.1], stamp, reason=log.intern("batch"))
+        log.append(3, 5, 0.0, stamp, reason=log.intern("single"))
+        log.append(1, 1, 0.8, stamp, reason=log.intern("batch"))
+
+        assert [log.label(code) for code in log.columns()["reason"]] == [
+            "batch", "batch", "single", "batch"
+        ]
+        assert log.intern("single") == 1
+        assert [row[:3] for row in log.history()] == [
+            (2, 1, 0.5), (3, 5, 0.1), (3, 5, 0.0), (1, 1, 0.8)
+        ]
+        assert timestamp_from_ns(log.columns()["timestamp"][0]) == stamp
+        with pytest.raises(TypeError):
+            log.append(1, 1, 0.5, stamp)
+        with pytest.raises(ValueError):
+            DecisionLog(columns={"coherence": "d"})
+
+    def test_quantiles_and_nan_rows(self):
+        """Quantiles come from the histogram; unscored rows are skipped."""
+        log = DecisionLog(quantile_bins=100)
+        for i in range(101):
+            log.append(1, 1, i / 100, datetime.now())
+        log.append(3, 5, math.nan, datetime.now())
+
+        p05, p50, p95 = log.quantiles([0.05, 0.5, 0.95])
+        assert p05 == pytest.approx(0.05, abs=0.01)
+        assert p50 == pytest.approx(0.5, abs=0.01)
+        assert p95 == pytest.approx(0.95, abs=0.01)
+        assert log.coherence_count == 101
+        assert log.coherence_mean == pytest.approx(0.5)
+        assert math.isnan(DecisionLog().quantiles([0.5])[0])
+
+    def test_spill_keeps_full_history(self, tmp_path):
+        """Evicted rows go to the spill file, in order."""
+        path = str(tmp_path / "decisions.bin")
+        log = DecisionLog(retention=8, spill_path=path)
+        rows = _rows(30)
+        log.extend([r[0] for r in rows[:5]], [r[1] for r in rows[:5]], [r[2] for r in rows[:5]], datetime.now())
+        for decision, alert, coherence in rows[5:20]:
+            log.append(decision, alert, coherence, datetime.now())
+        log.extend([r[0] for r in rows[20:]], [r[1] for r in rows[20:]], [r[2] for r in rows[20:]], datetime.now())
+
+        assert [row[:3] for row in log.history()] == rows
+        log.close()
+        assert [row[:3] for row in read_spill(path)] == rows[:22]
+
+    def test_clear_resets_stats(self):
+        """Clearing drops rows and counters."""
+        log = DecisionLog(retention=4)
+        log.append(1, 2, 0.9, datetime.now())
+        log.clear()
+        assert len(log) == 0
+        assert log.total == 0
+        assert log.decision_count(1) == 0
+        assert log.coherence_mean == 0.0
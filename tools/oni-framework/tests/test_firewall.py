@@ -167,6 +167,22 @@ class TestNeuralFirewall:
         assert len(results) == 2
         assert all(isinstance(r, FilterResult) for r in results)
 
+    def test_filter_scores_from_single_variance_pass(self):
+        """Filter coherence equals the metric score, computed from one variance pass."""
+        fw = NeuralFirewall()
+        metric = fw._coherence_metric
+        signal = Signal([0.0, 0.020, 0.049, 0.075], [100, 90, 104, 99], authenticated=True)
+
+        calls = []
+        original = metric.calculate_variances
+        metric.calculate_variances = lambda *args: calls.append(args) or original(*args)
+        result = fw.filter(signal)
+
+        assert len(calls) == 1
+        assert result.coherence == pytest.approx(
+            metric.calculate(signal.arrival_times, signal.amplitudes)
+        )
+
     def test_stats_tracking(self):
         """Should track filtering statistics."""
         fw = NeuralFirewall()
@@ -205,3 +221,147 @@ class TestNeuralFirewall:
 
         # Callback should have been called
         assert len(callback_results) >= 0  # May or may not trigger depending on coherence
+
+
+class TestFilterArrays:
+    """Tests for columnar batch filtering."""
+
+    def _signals(self, n=60, width=16, seed=0):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(seed)
+        jitter = rng.uniform(0, 0.01, (n, 1))
+        times = np.arange(width) * 0.025 + rng.normal(0, 1, (n, width)) * jitter
+        amplitudes = 100 + rng.normal(0, 1, (n, width)) * rng.uniform(0, 60, (n, 1))
+        authenticated = rng.random(n) < 0.7
+        return times, amplitudes, authenticated
+
+    def test_matches_filter(self):
+        """Each row should get the decision, alert and score of filter."""
+        times, amplitudes, authenticated = self._signals()
+        batched = NeuralFirewall(amplitude_bounds=(0, 200))
+        single = NeuralFirewall(amplitude_bounds=(0, 200))
+
+        batch = batched.filter_arrays(times, amplitudes, authenticated)
+        results = single.filter_batch([
+            Signal(list(t), list(a), bool(auth))
+            for t, a, auth in zip(times, amplitudes, authenticated)
+        ])
+
+        assert len(batch) == len(results)
+        assert not batch.in_bounds.all()
+        for row, expected in zip(batch, results):
+            assert row.decision == expected.decision
+            assert row.alert_level == expected.alert_level
+            assert row.reason == expected.reason
+            assert row.coherence == pytest.approx(expected.coherence)
+        assert batch.accepted.sum() == sum(r.accepted for r in results)
+        assert batch.flagged.sum() == sum(r.flagged for r in results)
+        stats, expected_stats = batched.get_stats(), single.get_stats()
+        assert stats["alerts"] == expected_stats["alerts"]
+        assert stats["avg_coherence"] == pytest.approx(expected_stats["avg_coherence"])
+
+    def test_padded_rows(self):
+        """Samples past a row's length should be ignored."""
+        np = pytest.importorskip("numpy")
+        fw = NeuralFirewall(amplitude_bounds=(0, 200))
+        times = np.array([[0.0, 0.025, 0.050, 0.0], [0.0, 0.025, 0.050, 0.075]])
+        amplitudes = np.array([[100.0, 98.0, 102.0, 999.0], [100.0, 98.0, 102.0, 99.0]])
+
+        batch = fw.filter_arrays(times, amplitudes, True, lengths=[3, 4])
+
+        assert batch.in_bounds.all()
+        expected = NeuralFirewall().filter(Signal([0.0, 0.025, 0.050], [100, 98, 102], True))
+        assert batch.coherence[0] == pytest.approx(expected.coherence)
+
+    def test_callbacks_only_for_alerting_rows(self):
+        """Callbacks should see only the rows at or above their level."""
+        times, amplitudes, authenticated = self._signals()
+        fw = NeuralFirewall()
+        critical = []
+        fw.register_callback(AlertLevel.CRITICAL, critical.append)
+
+        batch = fw.filter_arrays(times, amplitudes, authenticated)
+
+        assert len(critical) == (batch.alert_level == AlertLevel.CRITICAL.value).sum()
+        assert all(r.alert_level == AlertLevel.CRITICAL for r in critical)
+        assert len(fw.log) == len(batch)
+
+    def test_mismatched_authentication_raises(self):
+        """Should reject an authentication vector of the wrong length."""
+        times, amplitudes, authenticated = self._signals()
+        with pytest.raises(ValueError):
+            NeuralFirewall().filter_arrays(times, amplitudes, authenticated[:-1])
+
+    def test_filter_stream_matches_filter_arrays(self):
+        """Stream scores of each channel's window match array filtering."""
+        np = pytest.importorskip("numpy")
+        times, amplitudes, _ = self._signals(n=4, width=100)
+        fw = NeuralFirewall(amplitude_bounds=(0, 200))
+        stream = fw.stream(n_channels=4, window=32)
+        for i in range(times.shape[1]):
+            stream.update(times[:, i], amplitudes[:, i])
+
+        streamed = fw.filter_stream(stream, [True, True, False, True])
+        batch = fw.filter_arrays(
+            times[:, -32:], amplitudes[:, -32:], np.array([True, True, False, True])
+        )
+
+        assert streamed.decision.tolist() == batch.decision.tolist()
+        assert streamed.in_bounds.tolist() == batch.in_bounds.tolist()
+        assert streamed.coherence.tolist() == pytest.approx(batch.coherence.tolist())
+        assert len(fw.log) == 8
+
+    def test_log_retention_keeps_running_stats(self):
+        """The log is bounded while stats cover all traffic."""
+        pytest.importorskip("numpy")
+        times, amplitudes, authenticated = self._signals(n=50)
+        fw = NeuralFirewall(log_retention=20)
+        for t, a, auth in zip(times[:10], amplitudes[:10], authenticated[:10]):
+            fw.filter(Signal(list(t), list(a), bool(auth)))
+        batch = fw.filter_arrays(times[10:], amplitudes[10:], authenticated[10:])
+
+        stats = fw.get_stats()
+        assert stats["total"] == 50
+        assert stats["retained"] == 20
+        assert len(fw.log) == 20
+        assert fw.log == list(batch)[-20:]
+        assert stats["rejected"] == fw.decision_log.decision_count(Decision.REJECT.value)
+        assert 0.0 <= stats["coherence_quantiles"]["p50"] <= 1.0
+
+        # Retained rows are columns, not FilterResult objects
+        import tracemalloc
+
+        signal = Signal(list(times[0]), list(amplitudes[0]), bool(authenticated[0]))
+        fw = NeuralFirewall(log_retention=8000)
+        first = fw.filter(signal)
+        for _ in range(2000):  # Fill the interpreter's free lists first
+            fw.filter(signal)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(4000):
+                fw.filter(signal)
+            per_row = (tracemalloc.get_traced_memory()[0] - before) / 4000
+        finally:
+            tracemalloc.stop()
+        assert per_row < 100
+        assert fw.log[0] == first
+
+    def test_close_writes_spill_file(self, tmp_path):
+        """Closing the firewall flushes evicted decisions to the spill file."""
+        from oni.decision_log import read_spill
+
+        path = str(tmp_path / "decisions.bin")
+        signal = Signal(arrival_times=[0.0, 0.025], amplitudes=[100.0, 100.0], authenticated=True)
+        with NeuralFirewall(log_retention=2, log_spill_path=path) as fw:
+            for _ in range(5):
+                fw.filter(signal)
+
+        spilled = list(read_spill(path))
+        assert len(spilled) == 3
+        assert all(row[0] == Decision.ACCEPT.value for row in spilled)
+
+        # Reopened on the next spill, appending to the same file
+        fw.filter(signal)
+        fw.close()
+        assert len(list(read_spill(path))) == 4
@@ -0,0 +1,59 @@
+"""
+Benchmark: time-stepped vs. event-driven simulation of a sparse LIF network.
+
+Runs RecurrentNetwork.create_balanced() with sparse Poisson background
+input through SimulationEngine in TIME_STEPPED and EVENT_DRIVEN mode
+(recording off) and reports wall time, spikes and processed events.
+
+Usage:
+    python benchmarks/bench_event_driven.py --neurons 1000 --duration 200
+"""
+
+import argparse
+import time
+
+from tara_mvp.simulation import (
+    RecurrentNetwork, SimulationEngine, SimulationConfig, SimulationMode,
+)
+
+
+def bench(mode: SimulationMode, args) -> dict:
+    """Build and run one network, returning timings."""
+    network = RecurrentNetwork.create_balanced(
+        n_neurons=args.neurons,
+        seed=args.seed,
+        external_rate=args.rate / 1000.0,
+        external_weight=args.weight,
+    )
+    config = SimulationConfig(
+        duration=args.duration, mode=mode, record=False, verbose=False, seed=args.seed
+    )
+    start = time.perf_counter()
+    result = SimulationEngine(network, config).run()
+    return {
+        "mode": mode.value,
+        "run_s": time.perf_counter() - start,
+        "rate_hz": result.mean_firing_rate,
+        "events": (result.metrics or {}).get("events_processed", "-"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=200.0, help="Simulated ms")
+    parser.add_argument("--rate", type=float, default=100.0, help="Background input rate (Hz)")
+    parser.add_argument("--weight", type=float, default=80.0, help="Background input weight")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rows = [bench(mode, args) for mode in (SimulationMode.TIME_STEPPED, SimulationMode.EVENT_DRIVEN)]
+
+    print(f"{'mode':<14}{'run s':>10}{'rate Hz':>10}{'events':>10}")
+    for row in rows:
+        print(f"{row['mode']:<14}{row['run_s']:>10.2f}{row['rate_hz']:>10.2f}{row['events']:>10}")
+    print(f"speedup: {rows[0]['run_s'] / rows[1]['run_s']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: NeuralFirewall.filter per-signal latency.
+
+Filters random signals of a few lengths through NeuralFirewall.filter
+(with and without amplitude bounds) and reports the mean latency per
+signal, next to the cost of the coherence variances alone. The last
+columns give the throughput of filter_arrays on the same signals as
+(signals, samples) matrices, with per-signal arrival times and with
+one time base shared by all signals. "stats us" is one get_stats()
+call once the firewall has logged every signal of the run.
+
+Usage:
+    python benchmarks/bench_firewall.py --signals 20000 --samples 8 64
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.core.firewall import NeuralFirewall, Signal
+
+
+def per_signal(fn, items):
+    """Mean wall time (us) of ``fn`` over ``items``."""
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--signals", type=int, default=20000)
+    parser.add_argument("--samples", type=int, nargs="+", default=[8, 64])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'samples':>8}{'variances us':>14}{'filter us':>11}{'bounded us':>12}"
+        f"{'arrays sig/s':>14}{'shared sig/s':>14}{'stats us':>10}"
+    )
+    for width in args.samples:
+        time_matrix = np.sort(rng.uniform(0, 0.5, (args.signals, width)), axis=1)
+        amplitude_matrix = rng.normal(100, 10, (args.signals, width))
+        authenticated = np.arange(args.signals) % 2 == 1
+        times = time_matrix.tolist()
+        amplitudes = amplitude_matrix.tolist()
+        signals = [
+            Signal(arrival_times=t, amplitudes=a, authenticated=bool(i % 2))
+            for i, (t, a) in enumerate(zip(times, amplitudes))
+        ]
+
+        firewall = NeuralFirewall()
+        metric = firewall._coherence_metric
+        t_var = per_signal(lambda s: metric.calculate_variances(s.arrival_times, s.amplitudes), signals)
+        t_filter = per_signal(firewall.filter, signals)
+        bounded = NeuralFirewall(amplitude_bounds=(0.0, 1000.0))
+        t_bounded = per_signal(bounded.filter, signals)
+
+        batched = NeuralFirewall(amplitude_bounds=(0.0, 1000.0))
+        t_arrays = per_signal(
+            lambda t: batched.filter_arrays(t, amplitude_matrix, authenticated), [time_matrix]
+        )
+        t_shared = per_signal(
+            lambda t: batched.filter_arrays(t, amplitude_matrix, authenticated), [time_matrix[0]]
+        )
+        t_stats = per_signal(lambda _: batched.get_stats(), range(100))
+        print(
+            f"{width:>8}{t_var:>14.2f}{t_filter:>11.2f}{t_bounded:>12.2f}"
+            f"{args.signals / t_arrays * 1e6:>14.0f}{args.signals / t_shared * 1e6:>14.0f}"
+            f"{t_stats:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
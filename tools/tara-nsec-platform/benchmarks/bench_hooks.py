@@ -0,0 +1,64 @@
+"""
+Benchmark: per-step/per-spike callbacks vs batched hooks.
+
+Times a population-backend run with no instrumentation, with one
+on_step callback plus one per-spike network on_spike callback (called
+every dt / every spike), and with the batched equivalents: an on_steps
+hook with a stride and an on_spikes hook receiving arrays.
+
+Usage:
+    python benchmarks/bench_hooks.py --neurons 1000 --duration 500 --every 100
+"""
+
+import argparse
+import time
+
+from tara_mvp.simulation import RecurrentNetwork, NetworkBackend
+from tara_mvp.simulation.engine import SimulationEngine, SimulationConfig
+
+
+def run(args, instrument):
+    """Wall time (s) and callback calls of one run instrumented by ``instrument``."""
+    network = RecurrentNetwork.create_balanced(
+        n_neurons=args.neurons, seed=1, backend=NetworkBackend.POPULATION, external_weight=20.0,
+    )
+    engine = SimulationEngine(network, SimulationConfig(
+        duration=args.duration, record=False, verbose=False,
+    ))
+    counter = [0]
+    instrument(engine, counter)
+    start = time.perf_counter()
+    engine.run()
+    return time.perf_counter() - start, counter[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=500.0, help="ms")
+    parser.add_argument("--every", type=int, default=100, help="on_steps stride")
+    args = parser.parse_args()
+
+    def none(engine, counter):
+        pass
+
+    def per_call(engine, counter):
+        def count(*_):
+            counter[0] += 1
+        engine.on_step(count)
+        engine.network.on_spike(count)
+
+    def batched(engine, counter):
+        def count(*_):
+            counter[0] += 1
+        engine.on_steps(count, every=args.every)
+        engine.network.on_spikes(count)
+
+    print(f"{'hooks':>10}{'wall s':>10}{'calls':>8}")
+    for name, instrument in [("none", none), ("per-call", per_call), ("batched", batched)]:
+        wall, seen = run(args, instrument)
+        print(f"{name:>10}{wall:>10.3f}{seen:>8}")
+
+
+if __name__ == "__main__":
+    main()
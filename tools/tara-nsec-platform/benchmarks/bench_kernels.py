@@ -0,0 +1,73 @@
+"""
+Benchmark: scalar Neuron.step vs. NumPy and numba population kernels.
+
+Steps 10k-neuron populations of LIF, Izhikevich and Hodgkin-Huxley
+neurons with a constant drive and reports microseconds per simulated
+step for per-object stepping, the NumPy kernels and (if installed)
+the numba kernels.
+
+Usage:
+    python benchmarks/bench_kernels.py --neurons 10000 --steps 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation.neurons import (
+    LIFNeuron, IzhikevichNeuron, HodgkinHuxleyNeuron,
+    create_populations, is_numba_available,
+)
+
+MODELS = {
+    "lif": (LIFNeuron, 3.0),
+    "izhikevich": (IzhikevichNeuron, 10.0),
+    "hodgkin_huxley": (HodgkinHuxleyNeuron, 10.0),
+}
+
+
+def bench_objects(cls, drive: float, n_neurons: int, n_steps: int) -> float:
+    """Seconds per step for scalar Neuron.step on every neuron."""
+    neurons = [cls() for _ in range(n_neurons)]
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        for neuron in neurons:
+            neuron.receive_input(drive, input_type="external")
+            neuron.step(record_history=False)
+    return (time.perf_counter() - start) / n_steps
+
+
+def bench_population(cls, drive: float, n_neurons: int, n_steps: int, backend: str) -> float:
+    """Seconds per step for one population with the given kernels."""
+    (population,) = create_populations([cls() for _ in range(n_neurons)], kernels=backend)
+    drive = np.full(n_neurons, drive)
+    # First call compiles numba kernels; keep it out of the timing
+    population.I_ext[:] = drive
+    population.step(record_history=False)
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        population.I_ext[:] = drive
+        population.step(record_history=False)
+    return (time.perf_counter() - start) / n_steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, default=10000)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--object-steps", type=int, default=10, help="Steps for the slow scalar path")
+    args = parser.parse_args()
+
+    numba = is_numba_available()
+    print(f"{'model':<16}{'object us':>12}{'numpy us':>12}{'numba us':>12}{'numpy x':>10}")
+    for name, (cls, drive) in MODELS.items():
+        t_obj = bench_objects(cls, drive, args.neurons, args.object_steps)
+        t_np = bench_population(cls, drive, args.neurons, args.steps, "numpy")
+        t_nb = bench_population(cls, drive, args.neurons, args.steps, "numba") if numba else None
+        nb = f"{1e6 * t_nb:>12.1f}" if t_nb is not None else f"{'unavailable':>12}"
+        print(f"{name:<16}{1e6 * t_obj:>12.1f}{1e6 * t_np:>12.1f}{nb}{t_obj / t_np:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
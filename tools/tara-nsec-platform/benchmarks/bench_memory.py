@@ -0,0 +1,82 @@
+"""
+Benchmark: memory footprint of neuron, synapse and event state.
+
+Uses tracemalloc to measure bytes allocated per NeuronState,
+per SynapseState and per queued Poisson INPUT event, and bytes per
+neuron and per synapse of a whole balanced network for both backends.
+
+Usage:
+    python benchmarks/bench_memory.py --count 100000 --neurons 2000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from tara_mvp.simulation import RecurrentNetwork, SmallWorldNetwork, NetworkBackend
+from tara_mvp.simulation.neurons.base import NeuronState
+from tara_mvp.simulation.synapses.base import SynapseState
+from tara_mvp.simulation.engine.events import EventQueue, PoissonInputGenerator
+
+
+def measure(build):
+    """Bytes still allocated after ``build()`` returns, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000, help="states/events per measurement")
+    parser.add_argument("--neurons", type=int, default=2000, help="network size")
+    args = parser.parse_args()
+    n = args.count
+
+    print(f"{'object':>22}{'bytes each':>12}")
+    used, _ = measure(lambda: [NeuronState() for _ in range(n)])
+    print(f"{'NeuronState':>22}{used / n:>12.1f}")
+    used, _ = measure(lambda: [SynapseState() for _ in range(n)])
+    print(f"{'SynapseState':>22}{used / n:>12.1f}")
+
+    def events():
+        queue = EventQueue()
+        targets = [f"n{i}" for i in range(100)]
+        # 100 targets at 10 Hz: n events over n ms
+        PoissonInputGenerator(targets, rate=10.0, end_time=float(n)).generate_events(queue)
+        return queue
+
+    used, queue = measure(events)
+    print(f"{'INPUT event':>22}{used / len(queue):>12.1f}")
+
+    print()
+    print(f"{'network':>22}{'neurons':>9}{'synapses':>10}{'B/neuron':>11}{'B/synapse':>11}")
+    builders = [
+        ("balanced/object", lambda: RecurrentNetwork.create_balanced(
+            n_neurons=args.neurons, seed=1, backend=NetworkBackend.OBJECT)),
+        ("balanced/population", lambda: RecurrentNetwork.create_balanced(
+            n_neurons=args.neurons, seed=1, backend=NetworkBackend.POPULATION)),
+        # Synapse objects (with SynapseState) instead of projection arrays
+        ("small-world/object", lambda: SmallWorldNetwork.create_watts_strogatz(
+            n=args.neurons, k=10, seed=1)),
+    ]
+    for name, create in builders:
+        def build():
+            network = create()
+            network.step()  # Populations and matrices are built on first step
+            return network
+        used, network = measure(build)
+        # Neuron-side and synapse-side memory are not separable in a
+        # whole network; both columns divide the same total
+        print(
+            f"{name:>22}{network.n_neurons:>9}{network.n_synapses:>10}"
+            f"{used / network.n_neurons:>11.0f}{used / max(network.n_synapses, 1):>11.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
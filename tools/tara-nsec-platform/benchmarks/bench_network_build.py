@@ -0,0 +1,72 @@
+"""
+Benchmark: recurrent network construction.
+
+Builds RecurrentNetworks of increasing size with uniform connection
+probability and times construction (vectorized edge sampling into
+array-backed projections), building the synapse matrix on the first
+step, and one regular step. The previous per-pair construction is
+estimated from a short run of the old nested loop.
+
+Usage:
+    python benchmarks/bench_network_build.py --sizes 1000 10000 --p 0.1
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation import RecurrentNetwork, LIFNeuron, ChemicalSynapse
+from tara_mvp.simulation.networks.recurrent import RecurrentNetworkParameters
+from tara_mvp.simulation.synapses import ChemicalSynapseParameters
+
+
+def timed(fn) -> float:
+    """Wall time of one call in seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def legacy_estimate(n: int, p: float, rows: int = 20) -> float:
+    """Per-pair draw + one ChemicalSynapse per edge, extrapolated from ``rows`` sources."""
+    neurons = [LIFNeuron() for _ in range(n)]
+    params = ChemicalSynapseParameters()
+
+    def build():
+        for pre in neurons[:rows]:
+            for post in neurons:
+                if pre is not post and np.random.random() < p:
+                    ChemicalSynapse(pre, post, params)
+
+    return timed(build) * n / rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--p", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8}{'synapses':>12}{'build s':>10}{'1st step s':>12}"
+          f"{'step ms':>10}{'legacy s':>10}")
+    for n in args.sizes:
+        n_exc = int(0.8 * n)
+        params = RecurrentNetworkParameters(
+            n_excitatory=n_exc, n_inhibitory=n - n_exc,
+            p_ee=args.p, p_ei=args.p, p_ie=args.p, p_ii=args.p,
+            seed=args.seed,
+        )
+        holder = {}
+        build = timed(lambda: holder.setdefault("net", RecurrentNetwork(params)))
+        net = holder["net"]
+        first = timed(net.step)
+        step = timed(net.step) * 1e3
+        legacy = legacy_estimate(n, args.p)
+        print(f"{n:>8}{net.n_synapses:>12,}{build:>10.2f}{first:>12.2f}"
+              f"{step:>10.1f}{legacy:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
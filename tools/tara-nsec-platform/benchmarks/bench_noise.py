@@ -0,0 +1,65 @@
+"""
+Benchmark: scalar vs block-drawn membrane noise.
+
+Times one step of noisy LIF neurons (no input) with a scalar
+``np.random.normal`` call per neuron (the previous LIFNeuron path), with
+the object path drawing from the neuron's buffered generator, and with
+LIFPopulation pre-drawing (noise_chunk, n) normal blocks.
+
+Usage:
+    python benchmarks/bench_noise.py --neurons 1000 10000 --noise 2.0
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation.neurons import LIFNeuron, LIFParameters, LIFPopulation
+
+
+def per_step(fn, steps):
+    """Mean wall time (ms) of ``fn`` over ``steps`` calls."""
+    start = time.perf_counter()
+    for _ in range(steps):
+        fn()
+    return (time.perf_counter() - start) / steps * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--noise", type=float, default=2.0, help="noise_std (mV)")
+    parser.add_argument("--steps", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8}{'scalar draw ms':>16}{'buffered ms':>13}{'population ms':>15}")
+    for n in args.neurons:
+        neurons = [LIFNeuron(LIFParameters(noise_std=args.noise)) for _ in range(n)]
+        rng = np.random.default_rng(0)
+        for neuron in neurons:
+            neuron.rng = rng
+        scale = args.noise * np.sqrt(neurons[0].params.dt)
+
+        def scalar():
+            for _ in neurons:
+                np.random.normal(0, scale)
+
+        def buffered():
+            for neuron in neurons:
+                neuron._standard_normal()
+
+        t_scalar = per_step(scalar, args.steps)
+        t_buffered = per_step(buffered, args.steps)
+
+        population = LIFPopulation(
+            [LIFNeuron(LIFParameters(noise_std=args.noise)) for _ in range(n)]
+        )
+        population.rng = np.random.default_rng(0)
+        t_population = per_step(lambda: population.step(record_history=False), args.steps)
+
+        print(f"{n:>8}{t_scalar:>16.3f}{t_buffered:>13.3f}{t_population:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: per-neuron vs streaming Poisson background input.
+
+Times one step of background input for a population with a Python loop
+of per-neuron random draws (the previous RecurrentNetwork path) and
+with PoissonSource (one vectorized draw, scatter-add into the
+population backend's I_syn), and compares precomputing event-mode
+input with PoissonInputGenerator against streaming it window by window.
+
+Usage:
+    python benchmarks/bench_poisson_input.py --neurons 1000 10000 --rate 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation import RecurrentNetwork, NetworkBackend
+from tara_mvp.simulation.engine import EventQueue, PoissonSource
+from tara_mvp.simulation.engine.events import PoissonInputGenerator
+
+
+def per_step(fn, steps):
+    """Mean wall time (ms) of ``fn`` over ``steps`` calls."""
+    start = time.perf_counter()
+    for _ in range(steps):
+        fn()
+    return (time.perf_counter() - start) / steps * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rate", type=float, default=10.0, help="Input rate (Hz)")
+    parser.add_argument("--duration", type=float, default=10000.0, help="Event-mode span (ms)")
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8}{'loop ms':>10}{'source ms':>11}"
+          f"{'precompute s':>14}{'queued':>10}{'stream s':>10}{'peak queued':>13}")
+    for n in args.neurons:
+        net = RecurrentNetwork.create_balanced(
+            n_neurons=n, p_ee=0.0, p_ei=0.0, p_ie=0.0, p_ii=0.0,
+            backend=NetworkBackend.POPULATION,
+        )
+        neurons = list(net.neurons.values())
+        p = args.rate * net.params.dt / 1000
+
+        def loop():
+            for neuron in neurons:
+                if np.random.random() < p:
+                    neuron.receive_input(0.5)
+
+        source = PoissonSource(list(net.neurons), rate=args.rate, weight=0.5)
+        t_loop = per_step(loop, args.steps)
+        t_source = per_step(lambda: source.apply(net, 0.0), args.steps)
+
+        queue = EventQueue()
+        start = time.perf_counter()
+        PoissonInputGenerator(list(net.neurons), rate=args.rate, end_time=args.duration) \
+            .generate_events(queue)
+        t_pre, queued = time.perf_counter() - start, len(queue)
+
+        queue = EventQueue()
+        start = time.perf_counter()
+        source.schedule(queue, 0.0, args.duration)
+        peak = len(queue)
+        while len(queue):
+            queue.pop().execute()
+            peak = max(peak, len(queue))
+        t_stream = time.perf_counter() - start
+
+        print(f"{n:>8}{t_loop:>10.3f}{t_source:>11.3f}"
+              f"{t_pre:>14.2f}{queued:>10}{t_stream:>10.2f}{peak:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: recorder memory and cost over a long simulation.
+
+Runs a population-backed RecurrentNetwork through SimulationEngine
+with recording to memory and to disk (output_dir, chunked .npy
+flushes) and reports wall time, bytes held by the recorder and the
+Python heap peak (tracemalloc) for each.
+
+Usage:
+    python benchmarks/bench_recorder.py --neurons 1000 --duration 2000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from tara_mvp.simulation import (
+    NetworkBackend, RecurrentNetwork, RecordingConfig, SimulationConfig, SimulationEngine,
+)
+
+
+def bench(args, output_dir=None) -> dict:
+    """Run one recorded simulation and return timings and memory use."""
+    network = RecurrentNetwork.create_balanced(n_neurons=args.neurons, seed=args.seed)
+    network.params.backend = NetworkBackend.POPULATION
+    config = SimulationConfig(
+        duration=args.duration,
+        verbose=False,
+        seed=args.seed,
+        recording_config=RecordingConfig(output_dir=output_dir, flush_interval=args.chunk),
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    engine = SimulationEngine(network, config)
+    engine.run()
+    run_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "mode": "disk" if output_dir else "memory",
+        "run_s": run_time,
+        "samples": engine.recorder.n_samples,
+        "recorder_mb": engine.recorder.memory_bytes / 1e6,
+        "peak_mb": peak / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=2000.0, help="Simulated ms")
+    parser.add_argument("--chunk", type=int, default=1000, help="Rows per flushed chunk")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rows = [bench(args)]
+    with tempfile.TemporaryDirectory() as output_dir:
+        rows.append(bench(args, output_dir))
+
+    print(f"{'mode':<8}{'run s':>9}{'samples':>10}{'recorder MB':>13}{'peak MB':>10}")
+    for row in rows:
+        print(
+            f"{row['mode']:<8}{row['run_s']:>9.2f}{row['samples']:>10}"
+            f"{row['recorder_mb']:>13.1f}{row['peak_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
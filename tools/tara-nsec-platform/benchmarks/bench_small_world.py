@@ -0,0 +1,45 @@
+"""
+Benchmark: small-world construction and topology metrics.
+
+Builds Watts-Strogatz SmallWorldNetworks of increasing size and times
+construction (set-based rejection rewiring), the sparse clustering
+coefficient and the bit-parallel path-length estimate.
+
+Usage:
+    python benchmarks/bench_small_world.py --sizes 5000 50000 --sources 1000
+"""
+
+import argparse
+import time
+
+from tara_mvp.simulation import SmallWorldNetwork
+
+
+def timed(fn):
+    """Result and wall time (s) of one call."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 50000])
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--p", type=float, default=0.1)
+    parser.add_argument("--sources", type=int, default=1000, help="Path-length sample size")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8}{'build s':>10}{'clustering':>12}{'s':>8}"
+          f"{'path length':>13}{'s':>8}")
+    for n in args.sizes:
+        net, build = timed(lambda: SmallWorldNetwork.create_watts_strogatz(
+            n=n, k=args.k, p=args.p, seed=args.seed))
+        C, t_c = timed(net.compute_clustering_coefficient)
+        L, t_l = timed(lambda: net.compute_path_length(sample_size=args.sources))
+        print(f"{n:>8}{build:>10.2f}{C:>12.3f}{t_c:>8.2f}{L:>13.2f}{t_l:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
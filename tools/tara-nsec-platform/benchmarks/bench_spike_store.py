@@ -0,0 +1,79 @@
+"""
+Benchmark: spike analysis on the shared spike store.
+
+Fills a SpikeStore with random spikes (time-ordered, as a simulation
+would) and times per-neuron trains, raster data, sliding-window firing
+rates and the population rate, against the previous dict-of-lists
+implementation of the same analysis.
+
+Usage:
+    python benchmarks/bench_spike_store.py --spikes 1000000 --neurons 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation.neurons.spikes import SpikeStore, sort_by_neuron, window_counts
+
+
+def timed(fn) -> float:
+    """Wall time of one call in milliseconds."""
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def build(args) -> SpikeStore:
+    rng = np.random.default_rng(args.seed)
+    store = SpikeStore()
+    for i in range(args.neurons):
+        store.register(f"n{i}")
+    times = np.sort(rng.uniform(0, args.duration, args.spikes))
+    store.extend(rng.integers(0, args.neurons, args.spikes), times)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--spikes", type=int, default=1_000_000)
+    parser.add_argument("--neurons", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=10000.0, help="Simulated ms")
+    parser.add_argument("--window", type=float, default=100.0)
+    parser.add_argument("--step", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    store = build(args)
+    n = args.neurons
+    centers = np.arange(args.window / 2, args.duration - args.window / 2, args.step)
+    starts, ends = centers - args.window / 2, centers + args.window / 2
+
+    rows = [
+        ("trains", timed(lambda: sort_by_neuron(store.times, store.neurons, n))),
+        ("raster", timed(lambda: (store.times.copy(), store.neurons.copy()))),
+        ("firing rates", timed(lambda: window_counts(store.times, store.neurons, n, starts, ends))),
+        ("population rate", timed(lambda: np.histogram(
+            store.times, bins=int(args.duration / args.window), range=(0, args.duration)))),
+    ]
+
+    # Previous layout: one Python list per neuron
+    lists = {nid: [] for nid in store.ids}
+    for i, t in zip(store.neurons.tolist(), store.times.tolist()):
+        lists[store.ids[i]].append(t)
+    legacy = timed(lambda: {
+        nid: np.array([
+            np.sum((np.array(s) >= a) & (np.array(s) < b)) for a, b in zip(starts[:10], ends[:10])
+        ]) for nid, s in lists.items()
+    }) * len(starts) / 10
+
+    print(f"{len(store):,} spikes, {n} neurons, {len(starts)} rate windows")
+    print(f"{'analysis':<18}{'ms':>10}")
+    for name, ms in rows:
+        print(f"{name:<18}{ms:>10.1f}")
+    print(f"{'rates (lists, est)':<18}{legacy:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
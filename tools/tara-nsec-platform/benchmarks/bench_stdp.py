@@ -0,0 +1,53 @@
+"""
+Benchmark: per-object STDP vs trace-array STDP.
+
+Builds a plastic RecurrentNetwork (STDP on E -> E) and times stepping
+it with per-object STDPSynapse callbacks (object backend) and with
+the population backend, where STDPPlasticity keeps per-neuron traces
+and only updates the synapses of neurons that spiked.
+
+Usage:
+    python benchmarks/bench_stdp.py --neurons 500 2000 --steps 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.simulation import RecurrentNetwork, NetworkBackend
+
+
+def run(backend, n_neurons, steps, seed):
+    """Wall time (s) per step and final mean weight."""
+    net = RecurrentNetwork.create_plastic(
+        n_neurons=n_neurons, seed=seed, backend=backend, external_weight=20.0,
+    )
+    np.random.seed(seed)
+    net.step()
+    start = time.perf_counter()
+    for _ in range(steps):
+        net.step()
+    elapsed = (time.perf_counter() - start) / steps
+    plastic = [s.weight for s in net.synapses if hasattr(s, "stdp_state")]
+    return elapsed, len(plastic), float(np.mean(plastic))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neurons", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'neurons':>8}{'stdp syn':>10}{'object ms':>11}{'arrays ms':>11}"
+          f"{'speedup':>9}{'|dw mean|':>11}")
+    for n in args.neurons:
+        t_obj, n_syn, w_obj = run(NetworkBackend.OBJECT, n, args.steps, args.seed)
+        t_pop, _, w_pop = run(NetworkBackend.POPULATION, n, args.steps, args.seed)
+        print(f"{n:>8}{n_syn:>10}{t_obj * 1e3:>11.2f}{t_pop * 1e3:>11.2f}"
+              f"{t_obj / t_pop:>9.1f}{abs(w_obj - w_pop):>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: streaming vs windowed coherence on a live multichannel feed.
+
+Feeds a (samples, channels) feed one time step at a time and scores
+every channel every ``--stride`` steps, once with StreamingCoherence
+(running sums) and once by rescoring each window with calculate_batch.
+Reports the cost per time step and the sample rate one core sustains.
+
+Usage:
+    python benchmarks/bench_streaming.py --channels 64 --window 64 --stride 1 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tara_mvp.core.coherence import CoherenceMetric, StreamingCoherence
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--channels", type=int, default=64)
+    parser.add_argument("--window", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument("--stride", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    times = np.arange(args.steps)[:, None] * 0.025 + rng.normal(0, 0.002, (args.steps, args.channels))
+    amplitudes = rng.normal(100, 10, (args.steps, args.channels))
+    metric = CoherenceMetric()
+
+    print(f"{'stride':>7}{'stream us/step':>16}{'stream Hz':>11}{'rescore us/step':>17}{'rescore Hz':>12}")
+    for stride in args.stride:
+        stream = StreamingCoherence(n_channels=args.channels, window=args.window)
+        start = time.perf_counter()
+        for i in range(args.steps):
+            stream.update(times[i], amplitudes[i])
+            if i % stride == 0:
+                stream.score()
+        t_stream = (time.perf_counter() - start) / args.steps
+
+        start = time.perf_counter()
+        for i in range(args.steps):
+            if i % stride == 0:
+                lo = max(0, i + 1 - args.window)
+                metric.calculate_batch(times[lo:i + 1].T, amplitudes[lo:i + 1].T)
+        t_rescore = (time.perf_counter() - start) / args.steps
+
+        print(
+            f"{stride:>7}{t_stream * 1e6:>16.1f}{1 / t_stream:>11.0f}"
+            f"{t_rescore * 1e6:>17.1f}{1 / t_rescore:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ Produces time series data that can be injected into simulations.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 import numpy as np
 
 from .patterns import AttackPattern, AttackType
@@ -54,13 +54,15 @@ class AttackGenerator:
         >>> print(f"Generated {signal.n_samples} samples")
     """
 
-    def __init__(self, dt: float = 0.1, seed: Optional[int] = None):
+    def __init__(
+        self, dt: float = 0.1, seed: Optional[Union[int, np.random.Generator]] = None
+    ):
         """
         Initialize the attack generator.
 
         Args:
             dt: Time step for signal generation (ms)
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (a Generator is used as is)
         """
         self.dt = dt
         self.rng = np.random.default_rng(seed)
@@ -6,7 +6,7 @@ and scenarios against neural networks.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Union
 from datetime import datetime
 import numpy as np
 
@@ -82,17 +82,19 @@ class AttackSimulator:
     def __init__(
         self,
         dt: float = 0.1,
-        seed: Optional[int] = None,
+        seed: Optional[Union[int, np.random.Generator]] = None,
     ):
         """
         Initialize the attack simulator.
 
         Args:
             dt: Time step (ms)
-            seed: Random seed for reproducibility
+            seed: Random seed (or Generator) for reproducibility; signal
+                generation and detection share one generator
         """
         self.dt = dt
-        self.generator = AttackGenerator(dt=dt, seed=seed)
+        self.rng = np.random.default_rng(seed)
+        self.generator = AttackGenerator(dt=dt, seed=self.rng)
 
         # Callbacks for detection simulation
         self._detection_callbacks: List[Callable] = []
@@ -264,10 +266,10 @@ class AttackSimulator:
                 detection_prob = max(detection_prob, custom_detection)
 
         # Simulate detection
-        detected = np.random.random() < detection_prob
+        detected = self.rng.random() < detection_prob
 
         # If detected, simulate blocking (80% of detected attacks blocked)
-        blocked = detected and (np.random.random() < 0.8)
+        blocked = detected and (self.rng.random() < 0.8)
 
         return detected, blocked
 
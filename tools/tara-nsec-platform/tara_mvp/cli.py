@@ -7,6 +7,7 @@ Provides CLI access to TARA functionality:
 - Launch web dashboard
 - Run simulations
 - Execute attack scenarios
+- Run parameter sweeps in parallel
 - Monitor neural signals
 """
 
@@ -115,6 +116,37 @@ def create_parser() -> argparse.ArgumentParser:
         help="Output file for attack report",
     )
 
+    # Sweep command
+    sweep_parser = subparsers.add_parser("sweep", help="Run a parallel parameter sweep")
+    sweep_parser.add_argument(
+        "target",
+        choices=["simulate", "attack"],
+        help="What each run executes",
+    )
+    sweep_parser.add_argument(
+        "--param", "-p",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Parameter values to sweep (repeat for a grid), e.g. -p g=3,4,5",
+    )
+    sweep_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Worker processes (default: CPU count, 1 = no subprocesses)",
+    )
+    sweep_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Root seed; every run derives its own generator from it (default: 0)",
+    )
+    sweep_parser.add_argument(
+        "--output", "-o",
+        type=str,
+        help="Results file (JSON lines); an existing file is resumed",
+    )
+
     # Monitor command
     monitor_parser = subparsers.add_parser("monitor", help="Monitor neural signals")
     monitor_parser.add_argument(
@@ -288,6 +320,57 @@ def cmd_attack(args):
         sys.exit(1)
 
 
+def _parse_value(text: str):
+    """Parse a CLI parameter value as int, float or string."""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def cmd_sweep(args):
+    """Run a parameter sweep."""
+    from tara_mvp.simulation.engine.sweep import SweepRunner, simulate_network, run_attack
+
+    grid = {}
+    for item in args.param:
+        name, sep, values = item.partition("=")
+        if not sep or not values:
+            print(f"Error: invalid --param '{item}' (expected NAME=V1,V2,...)")
+            sys.exit(1)
+        grid[name.strip()] = [_parse_value(v.strip()) for v in values.split(",")]
+
+    fn = simulate_network if args.target == "simulate" else run_attack
+    runner = SweepRunner(fn, grid, root_seed=args.seed, workers=args.workers, path=args.output)
+    print(f"Running {args.target} sweep: {runner.n_runs} runs")
+    if args.output:
+        print(f"  Results: {args.output}")
+
+    def report(record):
+        params = ", ".join(f"{k}={v}" for k, v in record["params"].items())
+        if record["status"] == "ok":
+            metrics = ", ".join(
+                f"{k}={v:.4g}" if isinstance(v, float) else f"{k}={v}"
+                for k, v in record["metrics"].items()
+            )
+            print(f"  [{record['run']:>4}] {params} | {metrics}")
+        else:
+            print(f"  [{record['run']:>4}] {params} | {record['error']}")
+
+    runner.on_result(report)
+    try:
+        results = runner.run()
+    except ValueError as e:
+        print(f"Sweep error: {e}")
+        sys.exit(1)
+
+    summary = results.to_dict()
+    print(f"\nCompleted: {summary['n_completed']}/{runner.n_runs} "
+          f"(failed: {summary['n_failed']})")
+
+
 def cmd_monitor(args):
     """Run neural monitoring."""
     print("Starting TARA neural monitor...")
@@ -410,6 +493,7 @@ def main(argv: Optional[List[str]] = None):
         "ui": cmd_ui,
         "simulate": cmd_simulate,
         "attack": cmd_attack,
+        "sweep": cmd_sweep,
         "monitor": cmd_monitor,
         "list": cmd_list,
     }
@@ -8,14 +8,16 @@ Security validation and ONI Framework components:
 - Scale-frequency invariant
 """
 
-from .coherence import CoherenceMetric, calculate_cs, VarianceComponents
+from .coherence import CoherenceMetric, StreamingCoherence, calculate_cs, VarianceComponents
 from .layers import ONIStack, Layer, Domain
-from .firewall import NeuralFirewall, Signal, FilterResult, Decision, AlertLevel
+from .firewall import NeuralFirewall, Signal, FilterResult, BatchFilterResult, Decision, AlertLevel
+from .decision_log import DecisionLog
 from .scale_freq import ScaleFrequencyInvariant
 
 __all__ = [
     # Coherence
     "CoherenceMetric",
+    "StreamingCoherence",
     "calculate_cs",
     "VarianceComponents",
     # Layers
@@ -26,8 +28,10 @@ __all__ = [
     "NeuralFirewall",
     "Signal",
     "FilterResult",
+    "BatchFilterResult",
     "Decision",
     "AlertLevel",
+    "DecisionLog",
     # Scale-Frequency
     "ScaleFrequencyInvariant",
 ]
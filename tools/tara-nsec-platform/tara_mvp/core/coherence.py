@@ -38,13 +38,40 @@ Reference: TechDoc-Coherence_Metric_Detailed.md
 
 import math
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 import warnings
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring requires it
+    np = None
+
+# A Python list of floats or a 1-D NumPy array
+Samples = Union[Sequence[float], "np.ndarray"]
+
+# Inputs at least this long are summed with NumPy when it is installed;
+# shorter Python lists are cheaper to sum directly
+VECTORIZE_MIN_SAMPLES = 128
+
+# Distinct transport-factor sets remembered per CoherenceMetric
+TRANSPORT_CACHE_SIZE = 64
+
+
+def _vectorize(values: Samples) -> bool:
+    """Whether to process ``values`` with NumPy."""
+    return np is not None and (
+        isinstance(values, np.ndarray) or len(values) >= VECTORIZE_MIN_SAMPLES
+    )
+
 
 @dataclass
 class VarianceComponents:
-    """Container for the three variance components of coherence."""
+    """
+    Container for the three variance components of coherence.
+
+    Batch methods (CoherenceMetric.calculate_variances_batch) fill
+    ``phase`` and ``gain`` with one value per signal.
+    """
     phase: float      # σ²φ - timing jitter
     transport: float  # σ²τ - pathway integrity
     gain: float       # σ²γ - amplitude stability
@@ -69,6 +96,9 @@ class CoherenceMetric:
         >>> signal_amplitudes = [100, 98, 102, 99, 101]  # μV
         >>> cs = metric.calculate(signal_times, signal_amplitudes)
         >>> print(f"Coherence: {cs:.3f}")
+
+        >>> # Many signals at once (NumPy arrays, one signal per row)
+        >>> scores = metric.calculate_batch(times_2d, amplitudes_2d)
     """
 
     # Neural oscillation bands (Hz)
@@ -116,38 +146,44 @@ class CoherenceMetric:
         self.transport_factors = transport_factors or self.DEFAULT_TRANSPORT_FACTORS
         self.expected_amplitude = expected_amplitude
 
+        # Transport variance per factor set (keyed by the factor items)
+        self._transport_cache: Dict[tuple, float] = {}
+
     def calculate(
         self,
-        arrival_times: List[float],
-        amplitudes: List[float],
+        arrival_times: Samples,
+        amplitudes: Samples,
         transport_factors: Optional[dict] = None,
     ) -> float:
         """
         Calculate the coherence score Cₛ for a signal.
 
         Args:
-            arrival_times: List of signal arrival times in seconds
-            amplitudes: List of signal amplitudes (same units as expected_amplitude)
+            arrival_times: Signal arrival times in seconds (list or array;
+                float64 arrays are used without copying)
+            amplitudes: Signal amplitudes (same units as expected_amplitude)
             transport_factors: Optional override for pathway reliabilities
 
         Returns:
             Coherence score Cₛ in range [0, 1]
         """
-        variances = self.calculate_variances(arrival_times, amplitudes, transport_factors)
+        variances = self.calculate_variances(
+            arrival_times, amplitudes, transport_factors
+        )
         return calculate_cs(variances)
 
     def calculate_variances(
         self,
-        arrival_times: List[float],
-        amplitudes: List[float],
+        arrival_times: Samples,
+        amplitudes: Samples,
         transport_factors: Optional[dict] = None,
     ) -> VarianceComponents:
         """
         Calculate individual variance components.
 
         Args:
-            arrival_times: List of signal arrival times in seconds
-            amplitudes: List of signal amplitudes
+            arrival_times: Signal arrival times in seconds (list or array)
+            amplitudes: Signal amplitudes (list or array)
             transport_factors: Optional override for pathway reliabilities
 
         Returns:
@@ -163,7 +199,119 @@ class CoherenceMetric:
             gain=gain_var,
         )
 
-    def _calculate_phase_variance(self, arrival_times: List[float]) -> float:
+    def calculate_batch(
+        self,
+        arrival_times: "np.ndarray",
+        amplitudes: "np.ndarray",
+        lengths: Optional["np.ndarray"] = None,
+        mask: Optional["np.ndarray"] = None,
+        transport_factors: Optional[dict] = None,
+    ) -> "np.ndarray":
+        """
+        Calculate coherence scores of many signals in one vectorized pass.
+
+        Row i holds signal i. Signals of different lengths are padded to
+        a common width; ``lengths`` or ``mask`` marks the real samples
+        and padding values are ignored. Each score equals calculate() on
+        that row's samples (up to floating-point rounding).
+
+        Args:
+            arrival_times: Arrival times in seconds, shape (N, T), or
+                shape (T,) when all signals share one time base
+            amplitudes: Amplitudes, shape (N, T)
+            lengths: Number of leading valid samples per row, shape (N,)
+            mask: True for valid samples, shape (N, T)
+            transport_factors: Optional override for pathway reliabilities
+
+        Returns:
+            Coherence scores Cₛ, shape (N,)
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If shapes do not match
+        """
+        variances = self.calculate_variances_batch(
+            arrival_times, amplitudes, lengths, mask, transport_factors
+        )
+        total = variances.total
+        if (total < 0).any():
+            raise ValueError(f"Total variance cannot be negative: {total.min()}")
+        return np.exp(-total)
+
+    def calculate_variances_batch(
+        self,
+        arrival_times: "np.ndarray",
+        amplitudes: "np.ndarray",
+        lengths: Optional["np.ndarray"] = None,
+        mask: Optional["np.ndarray"] = None,
+        transport_factors: Optional[dict] = None,
+    ) -> VarianceComponents:
+        """
+        Calculate variance components of many signals (see calculate_batch).
+
+        Returns:
+            VarianceComponents whose phase and gain are arrays of shape
+            (N,); transport is shared by all signals
+        """
+        if np is None:
+            raise ImportError("calculate_batch requires NumPy (pip install numpy)")
+
+        amps = np.asarray(amplitudes, dtype=float)
+        if amps.ndim != 2:
+            raise ValueError(f"amplitudes must have shape (N, T), got {amps.shape}")
+        times = np.asarray(arrival_times, dtype=float)
+        if times.shape not in (amps.shape, amps.shape[1:]):
+            raise ValueError(
+                f"arrival_times shape {times.shape} does not match "
+                f"amplitudes {amps.shape}"
+            )
+        valid = _valid_samples(amps.shape, lengths, mask)
+        n = np.full(len(amps), amps.shape[1]) if valid is None else valid.sum(axis=1)
+        scored = n >= 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Phase: sin/cos sums; a shared time base is evaluated once
+            phases = (2 * math.pi * self.reference_freq) * times
+            sin, cos = np.sin(phases), np.cos(phases)
+            if times.ndim == 1 and valid is None:
+                sin_sum = np.full(len(amps), sin.sum())
+                cos_sum = np.full(len(amps), cos.sum())
+            elif times.ndim == 1:
+                weights = valid.astype(float)
+                sin_sum, cos_sum = weights @ sin, weights @ cos
+            elif valid is None:
+                sin_sum, cos_sum = sin.sum(axis=1), cos.sum(axis=1)
+            else:
+                sin_sum = np.where(valid, sin, 0.0).sum(axis=1)
+                cos_sum = np.where(valid, cos, 0.0).sum(axis=1)
+            # Rounding can put R a hair above 1 for phase-locked rows
+            R = np.minimum(np.hypot(sin_sum / n, cos_sum / n), 1.0)
+            phase = np.where(scored, (1 - R) * (math.pi ** 2), 0.0)
+
+            # Gain: normalized squared deviations from the baseline
+            if valid is not None:
+                amps = np.where(valid, amps, 0.0)
+            if self.expected_amplitude:
+                baseline = np.full(len(amps), float(self.expected_amplitude))
+            else:
+                baseline = amps.sum(axis=1) / n
+            centered = amps - baseline[:, None]
+            if valid is not None:
+                centered[~valid] = 0.0
+            gain = np.einsum("ij,ij->i", centered, centered) / (n * baseline ** 2)
+
+        zero = scored & (baseline == 0)
+        if zero.any():
+            warnings.warn("Zero baseline amplitude, returning infinite gain variance")
+        gain = np.where(zero, np.inf, np.where(scored, gain, 0.0))
+
+        return VarianceComponents(
+            phase=phase,
+            transport=self._calculate_transport_variance(transport_factors),
+            gain=gain,
+        )
+
+    def _calculate_phase_variance(self, arrival_times: Samples) -> float:
         """
         Calculate phase variance σ²φ.
 
@@ -176,16 +324,23 @@ class CoherenceMetric:
         if len(arrival_times) < 2:
             return 0.0
 
-        # Convert times to phase angles
-        phases = [
-            (2 * math.pi * self.reference_freq * t) % (2 * math.pi)
-            for t in arrival_times
-        ]
+        if _vectorize(arrival_times):
+            # sin/cos are periodic, so the mod 2π is not needed here
+            omega = 2 * math.pi * self.reference_freq
+            phases = omega * np.asarray(arrival_times, dtype=float)
+            sin_sum = float(np.sin(phases).sum())
+            cos_sum = float(np.cos(phases).sum())
+        else:
+            # Convert times to phase angles
+            phases = [
+                (2 * math.pi * self.reference_freq * t) % (2 * math.pi)
+                for t in arrival_times
+            ]
 
-        # Use circular mean for phase data
-        sin_sum = sum(math.sin(p) for p in phases)
-        cos_sum = sum(math.cos(p) for p in phases)
-        n = len(phases)
+            # Use circular mean for phase data
+            sin_sum = sum(math.sin(p) for p in phases)
+            cos_sum = sum(math.cos(p) for p in phases)
+        n = len(arrival_times)
 
         # Circular mean direction
         mean_phase = math.atan2(sin_sum / n, cos_sum / n)
@@ -209,12 +364,19 @@ class CoherenceMetric:
         Formula: σ²τ = −Σᵢ ln(pᵢ)
 
         Where pᵢ is the reliability probability of each pathway component.
+        The result only depends on the factors, so it is computed once per
+        factor set and then served from a cache.
         """
         factors = transport_factors or self.transport_factors
 
         if not factors:
             return 0.0
 
+        key = tuple(factors.items())
+        cached = self._transport_cache.get(key)
+        if cached is not None:
+            return cached
+
         total = 0.0
         for name, reliability in factors.items():
             if reliability <= 0 or reliability > 1:
@@ -223,9 +385,12 @@ class CoherenceMetric:
                 )
             total += -math.log(reliability)
 
+        if len(self._transport_cache) >= TRANSPORT_CACHE_SIZE:
+            self._transport_cache.clear()
+        self._transport_cache[key] = total
         return total
 
-    def _calculate_gain_variance(self, amplitudes: List[float]) -> float:
+    def _calculate_gain_variance(self, amplitudes: Samples) -> float:
         """
         Calculate gain variance σ²γ.
 
@@ -236,13 +401,21 @@ class CoherenceMetric:
         if len(amplitudes) < 2:
             return 0.0
 
-        # Use expected amplitude if set, otherwise use mean
-        baseline = self.expected_amplitude or (sum(amplitudes) / len(amplitudes))
+        vectorized = _vectorize(amplitudes)
+        if vectorized:
+            amplitudes = np.asarray(amplitudes, dtype=float)
+            baseline = self.expected_amplitude or float(amplitudes.mean())
+        else:
+            # Use expected amplitude if set, otherwise use mean
+            baseline = self.expected_amplitude or (sum(amplitudes) / len(amplitudes))
 
         if baseline == 0:
             warnings.warn("Zero baseline amplitude, returning infinite gain variance")
             return float('inf')
 
+        if vectorized:
+            return float(np.mean(((amplitudes - baseline) / baseline) ** 2))
+
         # Normalized squared deviations
         squared_devs = [((a - baseline) / baseline) ** 2 for a in amplitudes]
         return sum(squared_devs) / len(squared_devs)
@@ -272,6 +445,294 @@ class CoherenceMetric:
             return ("LOW", "Signal is incoherent, reject or investigate")
 
 
+class StreamingCoherence:
+    """
+    Sliding-window coherence scores of live multichannel sample streams.
+
+    Keeps the last ``window`` samples of every channel in a ring buffer
+    together with running sums of sin φ, cos φ, amplitude and
+    amplitude², so a new sample costs O(1) per channel instead of a
+    pass over the whole window. Scores can be read at any stride with
+    score(); each equals CoherenceMetric.calculate() on that channel's
+    current window (up to floating-point rounding). The sums are rebuilt
+    exactly from the buffer every ``recompute_every`` samples to bound
+    drift. Amplitudes are summed relative to a per-channel offset, reset
+    on each rebuild, which keeps amplitude² sums well conditioned.
+
+    All channels advance together, one sample per channel per step.
+
+    Example:
+        >>> stream = StreamingCoherence(n_channels=64, window=64)
+        >>> for t, frame in samples:          # frame: 64 amplitudes
+        ...     stream.update(t, frame)
+        >>> scores = stream.score()           # shape (64,)
+
+        >>> # Blocks of samples, one row per time step
+        >>> stream.extend(times_block, amplitudes_block)
+    """
+
+    def __init__(
+        self,
+        n_channels: int = 1,
+        window: int = 64,
+        reference_freq: float = 40.0,
+        transport_factors: Optional[dict] = None,
+        expected_amplitude: Optional[float] = None,
+        recompute_every: int = 4096,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            n_channels: Number of channels scored side by side
+            window: Samples per channel in the scoring window
+            reference_freq: Reference oscillation frequency in Hz
+            transport_factors: Dict of pathway component reliabilities (0-1)
+            expected_amplitude: Expected baseline signal amplitude
+            recompute_every: Samples between exact rebuilds of the sums
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If a size is not positive
+        """
+        if np is None:
+            raise ImportError("StreamingCoherence requires NumPy (pip install numpy)")
+        if n_channels < 1 or window < 1 or recompute_every < 1:
+            raise ValueError("n_channels, window and recompute_every must be positive")
+
+        self.n_channels = n_channels
+        self.window = window
+        self.recompute_every = recompute_every
+        self.metric = CoherenceMetric(
+            reference_freq=reference_freq,
+            transport_factors=transport_factors,
+            expected_amplitude=expected_amplitude,
+        )
+        self.reset()
+
+    def reset(self):
+        """Drop all samples."""
+        shape = (self.window, self.n_channels)
+        # Unfilled slots stay zero, so evicting them subtracts nothing
+        self._sin = np.zeros(shape)
+        self._cos = np.zeros(shape)
+        self._amp = np.zeros(shape)  # Amplitude minus _offset
+        self._offset = np.zeros(self.n_channels)
+        self._sin_sum = np.zeros(self.n_channels)
+        self._cos_sum = np.zeros(self.n_channels)
+        self._amp_sum = np.zeros(self.n_channels)
+        self._amp_sq_sum = np.zeros(self.n_channels)
+        self._pos = 0
+        self._count = 0
+        self._since_recompute = 0
+        self.samples_seen = 0
+
+    @property
+    def n_samples(self) -> int:
+        """Samples per channel currently in the window."""
+        return self._count
+
+    def update(self, time: Union[float, "np.ndarray"], amplitudes: Samples):
+        """
+        Add one sample per channel.
+
+        Args:
+            time: Arrival time in seconds, shared or one per channel
+            amplitudes: One amplitude per channel
+        """
+        amps = np.asarray(amplitudes, dtype=float)
+        if amps.shape != (self.n_channels,):
+            raise ValueError(
+                f"Expected {self.n_channels} amplitudes, got shape {amps.shape}"
+            )
+        if self._count == 0:
+            self._offset = amps.copy()
+
+        omega = 2 * math.pi * self.metric.reference_freq
+        phase = omega * np.asarray(time, dtype=float)
+        sin, cos = np.sin(phase), np.cos(phase)
+        shifted = amps - self._offset
+
+        # Single-slot version of extend
+        pos = self._pos
+        self._sin_sum += sin - self._sin[pos]
+        self._cos_sum += cos - self._cos[pos]
+        evicted = self._amp[pos]
+        self._amp_sum += shifted - evicted
+        self._amp_sq_sum += shifted * shifted - evicted * evicted
+        self._sin[pos] = sin
+        self._cos[pos] = cos
+        self._amp[pos] = shifted
+
+        self._pos = (pos + 1) % self.window
+        if self._count < self.window:
+            self._count += 1
+        self.samples_seen += 1
+        self._since_recompute += 1
+        if self._since_recompute >= self.recompute_every:
+            self.recompute()
+
+    def extend(self, times: "np.ndarray", amplitudes: "np.ndarray"):
+        """
+        Add a block of samples, one row per time step.
+
+        Args:
+            times: Arrival times in seconds, shape (K,) shared by all
+                channels or (K, n_channels)
+            amplitudes: Amplitudes, shape (K, n_channels)
+
+        Raises:
+            ValueError: If shapes do not match
+        """
+        amps = np.asarray(amplitudes, dtype=float)
+        if amps.ndim != 2 or amps.shape[1] != self.n_channels:
+            raise ValueError(
+                f"amplitudes must have shape (K, {self.n_channels}), got {amps.shape}"
+            )
+        times = np.asarray(times, dtype=float)
+        if times.ndim == 2 and times.shape[1] == 1:
+            times = times[:, 0]
+        if times.shape not in (amps.shape, amps.shape[:1]):
+            raise ValueError(
+                f"times shape {times.shape} does not match amplitudes {amps.shape}"
+            )
+        k = len(amps)
+        if k == 0:
+            return
+        if times.ndim == 1:
+            times = times[:, None]
+        if self._count == 0:
+            self._offset = amps[0].copy()
+
+        self.samples_seen += k
+        self._since_recompute += k
+        if k >= self.window:
+            # The block replaces the whole window
+            self._store(
+                slice(0, self.window), times[-self.window:], amps[-self.window:]
+            )
+            self._pos = 0
+            self._count = self.window
+            self.recompute()
+            return
+
+        slots = (self._pos + np.arange(k)) % self.window
+        phases = (2 * math.pi * self.metric.reference_freq) * times
+        sin, cos = np.sin(phases), np.cos(phases)
+        shifted = amps - self._offset
+
+        self._sin_sum += sin.sum(axis=0) - self._sin[slots].sum(axis=0)
+        self._cos_sum += cos.sum(axis=0) - self._cos[slots].sum(axis=0)
+        evicted = self._amp[slots]
+        self._amp_sum += shifted.sum(axis=0) - evicted.sum(axis=0)
+        self._amp_sq_sum += (shifted ** 2).sum(axis=0) - (evicted ** 2).sum(axis=0)
+        self._sin[slots] = sin
+        self._cos[slots] = cos
+        self._amp[slots] = shifted
+
+        self._pos = (self._pos + k) % self.window
+        self._count = min(self._count + k, self.window)
+        if self._since_recompute >= self.recompute_every:
+            self.recompute()
+
+    def _store(self, slots, times: "np.ndarray", amps: "np.ndarray"):
+        """Write samples into ``slots`` without touching the sums."""
+        phases = (2 * math.pi * self.metric.reference_freq) * times
+        self._sin[slots] = np.sin(phases)
+        self._cos[slots] = np.cos(phases)
+        self._amp[slots] = amps - self._offset
+
+    def recompute(self):
+        """Rebuild the running sums exactly from the buffered samples."""
+        # Before the window first fills, samples occupy the leading slots
+        filled = slice(0, self._count)
+        amps = self._amp[filled] + self._offset
+        if self._count:
+            self._offset = amps.mean(axis=0)
+        self._amp[filled] = amps - self._offset
+
+        self._sin_sum = self._sin[filled].sum(axis=0)
+        self._cos_sum = self._cos[filled].sum(axis=0)
+        self._amp_sum = self._amp[filled].sum(axis=0)
+        self._amp_sq_sum = (self._amp[filled] ** 2).sum(axis=0)
+        self._since_recompute = 0
+
+    def amplitude_range(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Per-channel (min, max) amplitude in the window."""
+        if not self._count:
+            empty = np.full(self.n_channels, np.nan)
+            return empty, empty.copy()
+        amps = self._amp[:self._count]
+        return amps.min(axis=0) + self._offset, amps.max(axis=0) + self._offset
+
+    def variances(self) -> VarianceComponents:
+        """
+        Variance components of each channel's current window.
+
+        Returns:
+            VarianceComponents whose phase and gain have shape
+            (n_channels,); transport is shared
+        """
+        n = self._count
+        transport = self.metric._calculate_transport_variance()
+        if n < 2:
+            zeros = np.zeros(self.n_channels)
+            return VarianceComponents(
+                phase=zeros, transport=transport, gain=zeros.copy()
+            )
+
+        R = np.minimum(np.hypot(self._sin_sum / n, self._cos_sum / n), 1.0)
+        phase = (1 - R) * (math.pi ** 2)
+
+        # Squared deviations from the baseline via the shifted sums:
+        # Σ(a − b)² = Σd² − 2cΣd + nc², with d = a − offset, c = b − offset
+        if self.metric.expected_amplitude:
+            baseline = np.full(self.n_channels, float(self.metric.expected_amplitude))
+            c = baseline - self._offset
+            squared = self._amp_sq_sum - 2 * c * self._amp_sum + n * c ** 2
+        else:
+            mean = self._amp_sum / n
+            baseline = self._offset + mean
+            squared = self._amp_sq_sum - self._amp_sum * mean
+        squared = np.maximum(squared, 0.0)
+
+        zero = baseline == 0
+        if zero.any():
+            warnings.warn("Zero baseline amplitude, returning infinite gain variance")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gain = np.where(zero, np.inf, squared / (n * baseline ** 2))
+        return VarianceComponents(phase=phase, transport=transport, gain=gain)
+
+    def score(self) -> "np.ndarray":
+        """Coherence score Cₛ of each channel's current window, shape (n_channels,)."""
+        return np.exp(-self.variances().total)
+
+
+def _valid_samples(
+    shape: Tuple[int, int],
+    lengths: Optional["np.ndarray"],
+    mask: Optional["np.ndarray"],
+) -> Optional["np.ndarray"]:
+    """Boolean (N, T) mask of real samples, or None if all are real."""
+    if lengths is not None and mask is not None:
+        raise ValueError("Pass either lengths or mask, not both")
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != shape:
+            raise ValueError(
+                f"mask shape {mask.shape} does not match amplitudes {shape}"
+            )
+        return mask
+    if lengths is not None:
+        lengths = np.asarray(lengths)
+        if lengths.shape != shape[:1]:
+            raise ValueError(
+                f"lengths shape {lengths.shape} does not match {shape[0]} signals"
+            )
+        return np.arange(shape[1]) < lengths[:, None]
+    return None
+
+
 def calculate_cs(variances: VarianceComponents) -> float:
     """
     Calculate coherence score from variance components.
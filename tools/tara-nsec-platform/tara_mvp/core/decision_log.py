@@ -0,0 +1,440 @@
+"""
+Decision Log Module
+
+Bounded, columnar log of firewall decisions.
+
+Each decision is stored as one row of four columns (decision code, alert
+level code, coherence score, timestamp in int64 nanoseconds) in a ring
+buffer of fixed retention, so memory stays flat however long the
+firewall runs. Counters, the coherence sum and a coherence histogram
+are updated on insert, which makes statistics O(1) in the number of
+decisions logged. Rows pushed out of the ring can be spilled to an
+append-only file to keep the full history.
+
+Callers may add typed columns of their own (e.g. the variance components
+and a reason code of each decision), so that a full result can be
+rebuilt from a row instead of being kept alive with it. Labels that
+repeat across rows, such as reason templates, are stored once and
+referenced from a column by code (see intern and label).
+
+Only the standard library is required; NumPy arrays are accepted (and
+inserted without per-row Python loops) when NumPy is installed.
+"""
+
+import math
+import struct
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; lists are handled row by row
+    np = None
+
+# Rows kept in memory by default
+DEFAULT_RETENTION = 100_000
+
+# Coherence histogram bins over [0, 1]; quantiles are exact to half a bin
+QUANTILE_BINS = 1000
+
+# Spill file record: decision, alert level, coherence, timestamp (ns)
+SPILL_RECORD = struct.Struct("<bbdq")
+
+# Core column name -> array typecode (the spilled fields)
+_COLUMNS = {
+    "decision": "b",
+    "alert_level": "b",
+    "coherence": "d",
+    "timestamp": "q",
+}
+_DTYPES = {
+    "b": "int8",
+    "B": "uint8",
+    "h": "int16",
+    "i": "int32",
+    "d": "float64",
+    "q": "int64",
+}
+
+
+def timestamp_ns(timestamp: datetime) -> int:
+    """Nanoseconds since the epoch (microsecond resolution)."""
+    return round(timestamp.timestamp() * 1_000_000) * 1000
+
+
+def timestamp_from_ns(ns: int) -> datetime:
+    """Local datetime of a timestamp_ns value (inverse of timestamp_ns)."""
+    return datetime.fromtimestamp(ns // 1_000_000_000).replace(
+        microsecond=ns // 1000 % 1_000_000
+    )
+
+
+def _column(values, typecode: str, n: int) -> array:
+    """``values`` (sequence, ndarray or scalar) as an array of ``n`` rows."""
+    if np is not None and not isinstance(values, (list, tuple)):
+        values = np.broadcast_to(np.asarray(values, dtype=_DTYPES[typecode]), (n,))
+        return array(typecode, np.ascontiguousarray(values).tobytes())
+    if isinstance(values, (list, tuple)):
+        return array(typecode, values)
+    return array(typecode, [values]) * n
+
+
+class DecisionLog:
+    """
+    Ring buffer of firewall decisions with running statistics.
+
+    Statistics (counts, mean coherence, coherence quantiles) cover every
+    row logged since the last clear(), including rows already evicted
+    from the ring; columns() and len() cover the retained rows.
+
+    Extra columns declared at construction are retained with each row
+    and returned by columns(); they are not spilled.
+
+    Example:
+        >>> log = DecisionLog(retention=10_000)
+        >>> log.append(decision=1, alert_level=2, coherence=0.82,
+        ...            timestamp=datetime.now())
+        >>> log.decision_count(1), log.quantiles([0.5])
+    """
+
+    def __init__(
+        self,
+        retention: int = DEFAULT_RETENTION,
+        spill_path: Optional[str] = None,
+        quantile_bins: int = QUANTILE_BINS,
+        columns: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the log.
+
+        Args:
+            retention: Maximum rows kept in memory
+            spill_path: Optional file that evicted rows are appended to
+                (see read_spill)
+            quantile_bins: Coherence histogram resolution
+            columns: Extra columns retained with each row, as name ->
+                array typecode (one of b, B, h, i, d, q)
+
+        Raises:
+            ValueError: If retention or quantile_bins is not positive, or
+                an extra column clashes with a core one
+        """
+        if retention < 1 or quantile_bins < 1:
+            raise ValueError("retention and quantile_bins must be positive")
+        extra = dict(columns or {})
+        if set(extra) & set(_COLUMNS) or not set(extra.values()) <= set(_DTYPES):
+            raise ValueError(f"invalid extra columns: {extra}")
+        self._types = {**_COLUMNS, **extra}
+        self.retention = retention
+        self.spill_path = spill_path
+        self.quantile_bins = quantile_bins
+        self._spill = None
+        self.clear()
+
+    def clear(self):
+        """
+        Drop all rows and reset the statistics.
+
+        The spill file is append-only and is not truncated.
+        """
+        self._columns = {name: array(code) for name, code in self._types.items()}
+        self._labels: List[Hashable] = []
+        self._label_codes: Dict[Hashable, int] = {}
+        self._pos = 0  # Oldest row once the ring is full
+        self.total = 0
+        self._decision_counts: Dict[int, int] = {}
+        self._alert_counts: Dict[int, int] = {}
+        self._coherence_sum = 0.0
+        self._histogram = [0] * self.quantile_bins
+        self._quantile_cache: Tuple[Any, List[float]] = (None, [])
+
+    def __len__(self) -> int:
+        return len(self._columns["decision"])
+
+    @property
+    def full(self) -> bool:
+        """Whether new rows evict old ones."""
+        return len(self) == self.retention
+
+    def append(
+        self,
+        decision: int,
+        alert_level: int,
+        coherence: float,
+        timestamp: datetime,
+        **extra,
+    ):
+        """
+        Log one decision.
+
+        Args:
+            decision: Decision code (Decision.value)
+            alert_level: Alert level code (AlertLevel.value)
+            coherence: Coherence score (NaN if not scored)
+            timestamp: When the decision was made
+            **extra: Value of each extra column
+        """
+        ts = timestamp_ns(timestamp)
+        row = (decision, alert_level, coherence, ts, *self._extra(extra))
+        if self.full:
+            pos = self._pos
+            if self.spill_path:
+                self._write_spill(SPILL_RECORD.pack(*self._row(pos)))
+            for column, value in zip(self._columns.values(), row):
+                column[pos] = value
+            self._pos = (pos + 1) % self.retention
+        else:
+            for column, value in zip(self._columns.values(), row):
+                column.append(value)
+
+        self.total += 1
+        self._decision_counts[decision] = self._decision_counts.get(decision, 0) + 1
+        self._alert_counts[alert_level] = self._alert_counts.get(alert_level, 0) + 1
+        if coherence == coherence:  # Not NaN
+            self._coherence_sum += coherence
+            self._histogram[self._bin(coherence)] += 1
+
+    def extend(
+        self,
+        decisions: Sequence[int],
+        alert_levels: Sequence[int],
+        coherences: Sequence[float],
+        timestamp: datetime,
+        **extra,
+    ):
+        """
+        Log many decisions made at one time (e.g. a filter_arrays batch).
+
+        Args:
+            decisions: Decision codes, one per row
+            alert_levels: Alert level codes, one per row
+            coherences: Coherence scores, one per row
+            timestamp: When the decisions were made
+            **extra: Values of each extra column, one per row (or a
+                scalar shared by the rows)
+        """
+        n = len(decisions)
+        if n == 0:
+            return
+        values = (decisions, alert_levels, coherences, timestamp_ns(timestamp))
+        rows = {
+            name: _column(value, self._types[name], n)
+            for name, value in zip(self._types, values + self._extra(extra))
+        }
+        for name, column in rows.items():
+            if len(column) != n:
+                raise ValueError(f"{name} has {len(column)} rows, expected {n}")
+        self._count(rows)
+
+        if n >= self.retention:
+            # The batch replaces the whole ring; spill in time order
+            skip = n - self.retention
+            if self.spill_path:
+                pos = self._pos
+                self._write_spill(self._pack(self._columns, pos, len(self)))
+                self._write_spill(self._pack(self._columns, 0, pos))
+                self._write_spill(self._pack(rows, 0, skip))
+            self._columns = {name: column[skip:] for name, column in rows.items()}
+            self._pos = 0
+            return
+
+        start = 0
+        while start < n:
+            if not self.full:
+                stop = min(n, start + self.retention - len(self))
+                for name, column in self._columns.items():
+                    column.extend(rows[name][start:stop])
+            else:
+                pos = self._pos
+                stop = min(n, start + self.retention - pos)
+                end = pos + stop - start
+                if self.spill_path:
+                    self._write_spill(self._pack(self._columns, pos, end))
+                for name, column in self._columns.items():
+                    column[pos:end] = rows[name][start:stop]
+                self._pos = end % self.retention
+            start = stop
+
+    def _extra(self, values: Dict[str, Any]) -> tuple:
+        """Extra column values in column order."""
+        if values.keys() != self._types.keys() - _COLUMNS.keys():
+            expected = [name for name in self._types if name not in _COLUMNS]
+            raise TypeError(f"expected values for the extra columns {expected}")
+        return tuple(values[name] for name in self._types if name not in _COLUMNS)
+
+    def _count(self, rows: Dict[str, array]):
+        """Update the running statistics with new rows."""
+        self.total += len(rows["decision"])
+        for counts, column in (
+            (self._decision_counts, rows["decision"]),
+            (self._alert_counts, rows["alert_level"]),
+        ):
+            if np is not None:
+                # Codes are small enum values; shift so negatives count too
+                codes = np.frombuffer(column, dtype=np.int8).astype(np.int64) + 128
+                tally = np.bincount(codes, minlength=256)
+                pairs = [
+                    (code - 128, int(tally[code]))
+                    for code in np.flatnonzero(tally).tolist()
+                ]
+            else:
+                pairs = ((code, column.count(code)) for code in set(column))
+            for code, hits in pairs:
+                counts[code] = counts.get(code, 0) + hits
+
+        if np is not None:
+            coherence = np.frombuffer(rows["coherence"], dtype=np.float64)
+            coherence = coherence[~np.isnan(coherence)]
+            self._coherence_sum += float(coherence.sum())
+            bins = np.minimum(
+                (np.clip(coherence, 0.0, 1.0) * self.quantile_bins).astype(np.int64),
+                self.quantile_bins - 1,
+            )
+            hits = np.bincount(bins, minlength=self.quantile_bins)
+            for index in np.flatnonzero(hits).tolist():
+                self._histogram[index] += int(hits[index])
+        else:
+            for value in rows["coherence"]:
+                if value == value:
+                    self._coherence_sum += value
+                    self._histogram[self._bin(value)] += 1
+
+    def _bin(self, coherence: float) -> int:
+        """Histogram bin of a coherence score."""
+        return min(max(int(coherence * self.quantile_bins), 0), self.quantile_bins - 1)
+
+    def _row(self, i: int) -> Tuple[int, int, float, int]:
+        """Core fields of the row at ring index ``i``."""
+        return tuple(self._columns[name][i] for name in _COLUMNS)
+
+    @staticmethod
+    def _pack(columns: Dict[str, array], start: int, stop: int) -> bytes:
+        """Spill records of rows ``start:stop`` of ``columns``."""
+        return b"".join(
+            SPILL_RECORD.pack(*row)
+            for row in zip(*(columns[name][start:stop] for name in _COLUMNS))
+        )
+
+    def _write_spill(self, data: bytes):
+        if self._spill is None:
+            self._spill = open(self.spill_path, "ab")
+        self._spill.write(data)
+
+    def flush(self):
+        """Flush buffered spill records to disk."""
+        if self._spill is not None:
+            self._spill.flush()
+
+    def close(self):
+        """Close the spill file (it is reopened on the next spill)."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def decision_count(self, code: int) -> int:
+        """Rows logged with decision ``code``."""
+        return self._decision_counts.get(code, 0)
+
+    def alert_count(self, code: int) -> int:
+        """Rows logged with alert level ``code``."""
+        return self._alert_counts.get(code, 0)
+
+    @property
+    def coherence_count(self) -> int:
+        """Rows logged with a coherence score."""
+        return sum(self._histogram)
+
+    @property
+    def coherence_mean(self) -> float:
+        """Mean coherence of the scored rows (0.0 if none)."""
+        count = self.coherence_count
+        return self._coherence_sum / count if count else 0.0
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """
+        Coherence quantiles from the histogram.
+
+        Args:
+            qs: Quantiles in [0, 1]
+
+        Returns:
+            One value per quantile (bin centres; NaN if nothing was scored)
+        """
+        # Repeated reads without new rows (e.g. dashboard reruns) are cached
+        key = (self.total, tuple(qs))
+        if self._quantile_cache[0] == key:
+            return list(self._quantile_cache[1])
+        count = self.coherence_count
+        if not count:
+            return [math.nan for _ in qs]
+        targets = sorted((q * (count - 1), i) for i, q in enumerate(qs))
+        values = [0.0] * len(qs)
+        seen = 0
+        t = 0
+        for index, hits in enumerate(self._histogram):
+            seen += hits
+            while t < len(targets) and targets[t][0] < seen:
+                values[targets[t][1]] = (index + 0.5) / self.quantile_bins
+                t += 1
+            if t == len(targets):
+                break
+        self._quantile_cache = (key, values)
+        return list(values)
+
+    def columns(self) -> Dict[str, List]:
+        """Retained rows as columns, oldest first."""
+        pos = self._pos
+        return {
+            name: column[pos:].tolist() + column[:pos].tolist()
+            for name, column in self._columns.items()
+        }
+
+    def intern(self, label: Hashable) -> int:
+        """
+        Code of a label repeated across rows, for storing in a column.
+
+        Each distinct label is kept once until clear(), so labels should
+        come from a small set (e.g. reason templates, not formatted text).
+        """
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self._labels)
+            self._labels.append(label)
+        return code
+
+    def label(self, code: int) -> Hashable:
+        """Label of a code returned by intern()."""
+        return self._labels[code]
+
+    def history(self) -> Iterator[Tuple[int, int, float, int]]:
+        """
+        Every row since the spill file was started, oldest first.
+
+        Spilled rows come first, then the retained ones. Without a spill
+        path this is just the retained rows. Rows are the core fields only,
+        as in read_spill.
+        """
+        if self.spill_path:
+            self.flush()
+            try:
+                yield from read_spill(self.spill_path)
+            except FileNotFoundError:
+                pass
+        columns = self.columns()
+        yield from zip(*(columns[name] for name in _COLUMNS))
+
+
+def read_spill(path: str) -> Iterator[Tuple[int, int, float, int]]:
+    """
+    Rows of a DecisionLog spill file.
+
+    Yields:
+        (decision, alert_level, coherence, timestamp_ns) tuples
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(SPILL_RECORD.size * 4096)
+            if not chunk:
+                return
+            yield from SPILL_RECORD.iter_unpack(chunk)
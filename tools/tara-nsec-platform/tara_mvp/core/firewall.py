@@ -58,9 +58,36 @@ Reference: TechDoc-Neural_Firewall_Architecture.md
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import List, Optional, Callable, Dict, Any, Set
-
-from .coherence import CoherenceMetric, VarianceComponents
+from typing import List, Optional, Callable, Dict, Any, Iterator, NamedTuple, Set
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array and stream filtering require it
+    np = None
+
+from .coherence import (
+    CoherenceMetric,
+    StreamingCoherence,
+    VarianceComponents,
+    calculate_cs,
+    _valid_samples,
+)
+from .decision_log import DecisionLog, DEFAULT_RETENTION, timestamp_from_ns
+
+# Rows scored per pass by filter_arrays; bounds the (rows, samples)
+# temporaries to a few MB whatever the batch size
+BATCH_CHUNK_SIZE = 4096
+
+# Decision matrix reasons, formatted with the coherence score. The signal
+# log stores each row's template as a code and rebuilds the reason on read.
+_HIGH_AUTHENTICATED = "High coherence ({:.3f}) with valid authentication"
+_HIGH_UNAUTHENTICATED = "High coherence ({:.3f}) but missing authentication"
+_MEDIUM_AUTHENTICATED = "Medium coherence ({:.3f}), flagged for review"
+_MEDIUM_UNAUTHENTICATED = "Medium coherence ({:.3f}) without authentication"
+_LOW = "Low coherence ({:.3f}), signal incoherent"
+
+# Signal log columns beyond the decision, alert level, score and time
+_SIGNAL_LOG_COLUMNS = {"phase": "d", "transport": "d", "gain": "d", "reason": "h"}
 
 
 class Decision(Enum):
@@ -141,6 +168,133 @@ class FilterResult:
         return self.decision == Decision.ACCEPT_FLAG
 
 
+def _decision_matrix(
+    coherence: float,
+    authenticated: bool,
+    threshold_high: float,
+    threshold_low: float,
+) -> tuple:
+    """
+    Apply the firewall decision matrix to one signal.
+
+    Returns:
+        Tuple of (Decision, AlertLevel, reason template); the reason is
+        the template formatted with the coherence score
+    """
+    if coherence > threshold_high:
+        # High coherence
+        if authenticated:
+            return Decision.ACCEPT, AlertLevel.ROUTINE, _HIGH_AUTHENTICATED
+        else:
+            return Decision.REJECT, AlertLevel.ALERT, _HIGH_UNAUTHENTICATED
+
+    elif coherence > threshold_low:
+        # Medium coherence
+        if authenticated:
+            return Decision.ACCEPT_FLAG, AlertLevel.ENHANCED, _MEDIUM_AUTHENTICATED
+        else:
+            return Decision.REJECT, AlertLevel.ALERT, _MEDIUM_UNAUTHENTICATED
+
+    else:
+        # Low coherence - reject regardless of authentication
+        return Decision.REJECT, AlertLevel.CRITICAL, _LOW
+
+
+def _bounds_reason(amplitude_bounds: tuple) -> str:
+    """Reason of a rejection by the amplitude bounds."""
+    min_amp, max_amp = amplitude_bounds
+    return f"Amplitude outside hardware bounds [{min_amp}, {max_amp}]"
+
+
+def _bounds_rejection(
+    amplitude_bounds: tuple, timestamp: Optional[datetime] = None
+) -> FilterResult:
+    """FilterResult of a signal with an amplitude outside the hardware bounds."""
+    return FilterResult(
+        decision=Decision.REJECT,
+        coherence=0.0,
+        variances=VarianceComponents(phase=0, transport=0, gain=float('inf')),
+        alert_level=AlertLevel.CRITICAL,
+        reason=_bounds_reason(amplitude_bounds),
+        timestamp=timestamp or datetime.now(),
+    )
+
+
+@dataclass
+class BatchFilterResult:
+    """
+    Columnar result of NeuralFirewall.filter_arrays, one row per signal.
+
+    Decisions and alert levels are stored as their enum values, so the
+    accepted/rejected/flagged masks are plain array comparisons.
+    result(i) rebuilds the FilterResult of a single row.
+
+    Attributes:
+        decision: Decision value per row (int8)
+        coherence: Calculated coherence score per row
+        variances: Variance components (phase and gain per row)
+        alert_level: AlertLevel value per row (int8)
+        authenticated: Authentication flag per row
+        in_bounds: False for rows rejected by the amplitude bounds
+        thresholds: (threshold_high, threshold_low) the rows were judged by
+        amplitude_bounds: Amplitude bounds in force, if any
+        timestamp: When the batch was filtered
+    """
+    decision: "np.ndarray"
+    coherence: "np.ndarray"
+    variances: VarianceComponents
+    alert_level: "np.ndarray"
+    authenticated: "np.ndarray"
+    in_bounds: "np.ndarray"
+    thresholds: tuple
+    amplitude_bounds: Optional[tuple] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    def __len__(self) -> int:
+        return len(self.decision)
+
+    def __iter__(self) -> Iterator[FilterResult]:
+        return (self.result(i) for i in range(len(self)))
+
+    @property
+    def accepted(self) -> "np.ndarray":
+        """Mask of accepted rows (with or without flag)."""
+        return self.decision != Decision.REJECT.value
+
+    @property
+    def rejected(self) -> "np.ndarray":
+        """Mask of rejected rows."""
+        return self.decision == Decision.REJECT.value
+
+    @property
+    def flagged(self) -> "np.ndarray":
+        """Mask of rows flagged for review."""
+        return self.decision == Decision.ACCEPT_FLAG.value
+
+    def result(self, i: int) -> FilterResult:
+        """FilterResult of row ``i``, with its decision reason."""
+        if not self.in_bounds[i]:
+            return _bounds_rejection(self.amplitude_bounds, self.timestamp)
+
+        coherence = float(self.coherence[i])
+        decision, alert_level, reason = _decision_matrix(
+            coherence, bool(self.authenticated[i]), *self.thresholds
+        )
+        reason = reason.format(coherence)
+        return FilterResult(
+            decision=decision,
+            coherence=coherence,
+            variances=VarianceComponents(
+                phase=float(self.variances.phase[i]),
+                transport=float(self.variances.transport),
+                gain=float(self.variances.gain[i]),
+            ),
+            alert_level=alert_level,
+            reason=reason,
+            timestamp=self.timestamp,
+        )
+
+
 @dataclass
 class StimulationCommand:
     """
@@ -213,6 +367,121 @@ class StimulationResult:
         return all(self.safety_checks.values())
 
 
+# Stimulation safety checks, in StimulationResult.safety_checks order; the
+# stimulation log stores the ones that passed as a bitmask
+_SAFETY_CHECKS = (
+    "authenticated",
+    "region_authorized",
+    "amplitude_in_bounds",
+    "frequency_in_bounds",
+    "pulse_width_in_bounds",
+    "charge_density_safe",
+    "rate_limit_ok",
+)
+
+# Stimulation log columns: the passed checks, the command values quoted by
+# the reason, the commands counted by the rate limit and the limits' code
+_STIMULATION_LOG_COLUMNS = {
+    "checks": "B",
+    "amplitude_uA": "d",
+    "frequency_Hz": "d",
+    "pulse_width_us": "d",
+    "recent": "i",
+    "limits": "h",
+}
+
+
+class _StimulationLimits(NamedTuple):
+    """Target and safety limits a stimulation command was checked against."""
+    target_region: str
+    regions_configured: bool
+    amplitude_bounds: tuple
+    frequency_bounds: tuple
+    pulse_width_bounds: tuple
+    charge_density_limit: float
+    rate_limit: Optional[int]
+
+
+def _stimulation_result(
+    safety_checks: Dict[str, bool],
+    limits: _StimulationLimits,
+    amplitude_uA: float,
+    frequency_Hz: float,
+    pulse_width_us: float,
+    recent: int,
+    timestamp: Optional[datetime] = None,
+) -> StimulationResult:
+    """
+    StimulationResult of a command's safety checks, with its reason.
+
+    Args:
+        safety_checks: Outcome of each of the _SAFETY_CHECKS
+        limits: Target and limits the command was checked against
+        amplitude_uA: Command amplitude
+        frequency_Hz: Command frequency
+        pulse_width_us: Command pulse width
+        recent: Commands within the rate limit window before this one
+        timestamp: When the decision was made (default: now)
+    """
+    failed_checks = []
+    if not safety_checks["authenticated"]:
+        failed_checks.append("missing authentication")
+    if not safety_checks["region_authorized"]:
+        if limits.regions_configured:
+            failed_checks.append(f"unauthorized region: {limits.target_region}")
+        else:
+            failed_checks.append("no authorized regions configured")
+    if not safety_checks["amplitude_in_bounds"]:
+        min_amp, max_amp = limits.amplitude_bounds
+        failed_checks.append(
+            f"amplitude {amplitude_uA} uA outside bounds [{min_amp}, {max_amp}]"
+        )
+    if not safety_checks["frequency_in_bounds"]:
+        min_freq, max_freq = limits.frequency_bounds
+        failed_checks.append(
+            f"frequency {frequency_Hz} Hz outside bounds [{min_freq}, {max_freq}]"
+        )
+    if not safety_checks["pulse_width_in_bounds"]:
+        min_pw, max_pw = limits.pulse_width_bounds
+        failed_checks.append(
+            f"pulse width {pulse_width_us} us outside bounds [{min_pw}, {max_pw}]"
+        )
+    if not safety_checks["charge_density_safe"]:
+        charge_per_phase = amplitude_uA * pulse_width_us / 1000.0 / 1000.0  # uC
+        failed_checks.append(
+            f"charge density {charge_per_phase:.2f} uC exceeds limit "
+            f"{limits.charge_density_limit}"
+        )
+    if not safety_checks["rate_limit_ok"]:
+        failed_checks.append(f"rate limit exceeded: {recent} >= {limits.rate_limit}/s")
+
+    if not failed_checks:
+        return StimulationResult(
+            decision=Decision.ACCEPT,
+            alert_level=AlertLevel.ROUTINE,
+            reason="All safety checks passed",
+            safety_checks=safety_checks,
+            timestamp=timestamp or datetime.now(),
+        )
+
+    # Determine severity based on which checks failed
+    failed = str(failed_checks)
+    if any(c in failed for c in ["unauthorized region", "charge density", "amplitude"]):
+        alert_level = AlertLevel.CRITICAL
+    elif "authentication" in failed:
+        alert_level = AlertLevel.ALERT
+    else:
+        alert_level = AlertLevel.ENHANCED
+
+    return StimulationResult(
+        decision=Decision.REJECT,
+        alert_level=alert_level,
+        reason=f"Safety check(s) failed: {'; '.join(failed_checks)}",
+        safety_checks=safety_checks,
+        timestamp=timestamp or datetime.now(),
+    )
+
+
 class NeuralFirewall:
     """
     Zero-trust neural signal firewall operating at ONI Layer 8.
@@ -252,6 +521,10 @@ class NeuralFirewall:
         charge_density_limit: Optional[float] = None,
         authorized_regions: Optional[Set[str]] = None,
         stim_rate_limit: Optional[int] = None,
+        # Decision logs
+        log_retention: int = DEFAULT_RETENTION,
+        log_spill_path: Optional[str] = None,
+        stimulation_log_spill_path: Optional[str] = None,
     ):
         """
         Initialize the neural firewall.
@@ -270,6 +543,13 @@ class NeuralFirewall:
             charge_density_limit: Maximum charge density in uC/cm^2/phase
             authorized_regions: Set of authorized brain region identifiers
             stim_rate_limit: Maximum stimulation commands per second
+
+            Decision logs:
+            log_retention: Decisions kept in memory by each log
+            log_spill_path: Optional file receiving read decisions evicted
+                from the log, to keep the full history
+            stimulation_log_spill_path: Same for stimulation decisions
+            (spill files stay open until close())
         """
         if threshold_low >= threshold_high:
             raise ValueError("threshold_low must be less than threshold_high")
@@ -291,8 +571,13 @@ class NeuralFirewall:
         self.stim_rate_limit = stim_rate_limit
 
         self._coherence_metric = CoherenceMetric(reference_freq=reference_freq)
-        self._signal_log: List[FilterResult] = []
-        self._stimulation_log: List[StimulationResult] = []
+        self._signal_log = DecisionLog(
+            log_retention, log_spill_path, columns=_SIGNAL_LOG_COLUMNS
+        )
+        self._stimulation_log = DecisionLog(
+            log_retention, stimulation_log_spill_path, columns=_STIMULATION_LOG_COLUMNS
+        )
+        self._failed_check_counts: Dict[str, int] = {}
         self._callbacks: Dict[AlertLevel, List[Callable]] = {
             level: [] for level in AlertLevel
         }
@@ -316,25 +601,17 @@ class NeuralFirewall:
         if self.amplitude_bounds:
             min_amp, max_amp = self.amplitude_bounds
             if any(a < min_amp or a > max_amp for a in signal.amplitudes):
-                result = FilterResult(
-                    decision=Decision.REJECT,
-                    coherence=0.0,
-                    variances=VarianceComponents(phase=0, transport=0, gain=float('inf')),
-                    alert_level=AlertLevel.CRITICAL,
-                    reason=f"Amplitude outside hardware bounds [{min_amp}, {max_amp}]",
-                )
-                self._log_and_alert(result)
+                result = _bounds_rejection(self.amplitude_bounds)
+                self._log_and_alert(result, result.reason)
                 return result
 
-        # Calculate coherence
+        # Calculate variances once and build the score from them
+        # (the metric caches the transport term per factor set)
         variances = self._coherence_metric.calculate_variances(
             signal.arrival_times,
             signal.amplitudes,
         )
-        coherence = self._coherence_metric.calculate(
-            signal.arrival_times,
-            signal.amplitudes,
-        )
+        coherence = calculate_cs(variances)
 
         # Apply decision matrix
         decision, alert_level, reason = self._apply_decision_matrix(
@@ -346,10 +623,10 @@ class NeuralFirewall:
             coherence=coherence,
             variances=variances,
             alert_level=alert_level,
-            reason=reason,
+            reason=reason.format(coherence),
         )
 
-        self._log_and_alert(result)
+        self._log_and_alert(result, reason)
         return result
 
     def _apply_decision_matrix(
@@ -361,53 +638,100 @@ class NeuralFirewall:
         Apply the firewall decision matrix.
 
         Returns:
-            Tuple of (Decision, AlertLevel, reason_string)
+            Tuple of (Decision, AlertLevel, reason template)
         """
-        if coherence > self.threshold_high:
-            # High coherence
-            if authenticated:
-                return (
-                    Decision.ACCEPT,
-                    AlertLevel.ROUTINE,
-                    f"High coherence ({coherence:.3f}) with valid authentication",
-                )
-            else:
-                return (
-                    Decision.REJECT,
-                    AlertLevel.ALERT,
-                    f"High coherence ({coherence:.3f}) but missing authentication",
-                )
+        return _decision_matrix(
+            coherence, authenticated, self.threshold_high, self.threshold_low
+        )
 
-        elif coherence > self.threshold_low:
-            # Medium coherence
-            if authenticated:
-                return (
-                    Decision.ACCEPT_FLAG,
-                    AlertLevel.ENHANCED,
-                    f"Medium coherence ({coherence:.3f}), flagged for review",
-                )
-            else:
-                return (
-                    Decision.REJECT,
-                    AlertLevel.ALERT,
-                    f"Medium coherence ({coherence:.3f}) without authentication",
-                )
+    def _apply_decision_matrix_batch(
+        self,
+        coherence: "np.ndarray",
+        authenticated: "np.ndarray",
+    ) -> tuple:
+        """
+        Apply the firewall decision matrix to arrays of signals.
 
-        else:
-            # Low coherence - reject regardless of authentication
-            return (
-                Decision.REJECT,
-                AlertLevel.CRITICAL,
-                f"Low coherence ({coherence:.3f}), signal incoherent",
-            )
+        Returns:
+            Tuple of (decision values, alert level values) as int8 arrays
+        """
+        high = coherence > self.threshold_high
+        # Written as "not above" so that NaN scores land in the low band,
+        # as they do in _decision_matrix
+        low = ~(coherence > self.threshold_low)
+
+        decision = np.full(len(coherence), Decision.REJECT.value, dtype=np.int8)
+        decision[high & authenticated] = Decision.ACCEPT.value
+        decision[~high & ~low & authenticated] = Decision.ACCEPT_FLAG.value
+
+        alert_level = np.select(
+            [low, ~authenticated, high],
+            [
+                AlertLevel.CRITICAL.value,
+                AlertLevel.ALERT.value,
+                AlertLevel.ROUTINE.value,
+            ],
+            AlertLevel.ENHANCED.value,
+        ).astype(np.int8)
+        return decision, alert_level
+
+    def _log_and_alert(self, result: FilterResult, reason: str):
+        """Log the result, with its reason template, and trigger callbacks."""
+        log = self._signal_log
+        log.append(
+            result.decision.value,
+            result.alert_level.value,
+            result.coherence,
+            result.timestamp,
+            phase=result.variances.phase,
+            transport=result.variances.transport,
+            gain=result.variances.gain,
+            reason=log.intern(reason),
+        )
+        self._trigger_callbacks(result)
+
+    def _log_batch_and_alert(self, batch: BatchFilterResult):
+        """Log a batch and trigger callbacks for the rows that reach them."""
+        log = self._signal_log
+        # Reason template per row, picked as in _decision_matrix
+        threshold_high, threshold_low = batch.thresholds
+        high = batch.coherence > threshold_high
+        low = ~(batch.coherence > threshold_low)
+        templates = [
+            _LOW,
+            _HIGH_AUTHENTICATED,
+            _HIGH_UNAUTHENTICATED,
+            _MEDIUM_AUTHENTICATED,
+            _MEDIUM_UNAUTHENTICATED,
+        ]
+        codes = np.array([log.intern(t) for t in templates], dtype=np.int16)
+        auth = batch.authenticated
+        reason = codes[np.select([low, high & auth, high, auth], [0, 1, 2, 3], 4)]
+        if not batch.in_bounds.all():
+            bounds = log.intern(_bounds_reason(batch.amplitude_bounds))
+            reason[~batch.in_bounds] = bounds
+        log.extend(
+            batch.decision,
+            batch.alert_level,
+            batch.coherence,
+            batch.timestamp,
+            phase=batch.variances.phase,
+            transport=batch.variances.transport,
+            gain=batch.variances.gain,
+            reason=reason,
+        )
 
-    def _log_and_alert(self, result: FilterResult):
-        """Log the result and trigger any registered callbacks."""
-        self._signal_log.append(result)
+        levels = [level.value for level in AlertLevel if self._callbacks.get(level)]
+        if not levels:
+            return
+        # Only rows at or above the lowest registered level become FilterResults
+        for i in np.flatnonzero(batch.alert_level >= min(levels)):
+            self._trigger_callbacks(batch.result(i))
 
-        # Trigger callbacks for this alert level and above
+    def _trigger_callbacks(self, result):
+        """Call the callbacks registered at or below the result's alert level."""
         for level in AlertLevel:
-            if level.value >= result.alert_level.value:
+            if level.value <= result.alert_level.value:
                 for callback in self._callbacks.get(level, []):
                     callback(result)
 
@@ -440,6 +764,188 @@ class NeuralFirewall:
         """
         return [self.filter(signal) for signal in signals]
 
+    def filter_arrays(
+        self,
+        arrival_times: "np.ndarray",
+        amplitudes: "np.ndarray",
+        authenticated: "np.ndarray",
+        lengths: Optional["np.ndarray"] = None,
+        mask: Optional["np.ndarray"] = None,
+    ) -> BatchFilterResult:
+        """
+        Filter many signals given as arrays (columnar filter_batch).
+
+        Bounds checks, coherence and the decision matrix run on whole
+        arrays, BATCH_CHUNK_SIZE rows at a time. The batch is logged as
+        one entry; FilterResults are only built for rows that trigger a
+        registered callback.
+
+        Args:
+            arrival_times: (N, T) arrival times, or a (T,) row shared by all signals
+            amplitudes: (N, T) amplitudes
+            authenticated: (N,) authentication flags, or one flag for all
+            lengths: Optional (N,) count of real leading samples per row
+            mask: Optional (N, T) boolean mask of real samples
+
+        Returns:
+            BatchFilterResult with one row per signal, in input order
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the array shapes do not match
+        """
+        if np is None:
+            raise ImportError("filter_arrays requires NumPy (pip install numpy)")
+
+        amps = np.asarray(amplitudes, dtype=float)
+        if amps.ndim != 2:
+            raise ValueError(f"amplitudes must have shape (N, T), got {amps.shape}")
+        times = np.asarray(arrival_times, dtype=float)
+        n = len(amps)
+        auth = np.asarray(authenticated, dtype=bool)
+        if auth.shape not in ((), (n,)):
+            raise ValueError(
+                f"authenticated shape {auth.shape} does not match {n} signals"
+            )
+        auth = np.broadcast_to(auth, (n,))
+        lengths = None if lengths is None else np.asarray(lengths)
+        mask = None if mask is None else np.asarray(mask, dtype=bool)
+
+        phase = np.zeros(n)
+        gain = np.zeros(n)
+        in_bounds = np.ones(n, dtype=bool)
+        transport = 0.0
+        for start in range(0, n, BATCH_CHUNK_SIZE):
+            rows = slice(start, start + BATCH_CHUNK_SIZE)
+            chunk = amps[rows]
+            chunk_lengths = None if lengths is None else lengths[rows]
+            chunk_mask = None if mask is None else mask[rows]
+
+            variances = self._coherence_metric.calculate_variances_batch(
+                times if times.ndim == 1 else times[rows],
+                chunk,
+                lengths=chunk_lengths,
+                mask=chunk_mask,
+            )
+            phase[rows] = variances.phase
+            gain[rows] = variances.gain
+            transport = variances.transport
+
+            if self.amplitude_bounds:
+                min_amp, max_amp = self.amplitude_bounds
+                outside = (chunk < min_amp) | (chunk > max_amp)
+                valid = _valid_samples(chunk.shape, chunk_lengths, chunk_mask)
+                if valid is not None:
+                    outside &= valid
+                in_bounds[rows] = ~outside.any(axis=1)
+
+        variances = VarianceComponents(phase=phase, transport=transport, gain=gain)
+        return self._finish_batch(variances, in_bounds, auth)
+
+    def stream(
+        self,
+        n_channels: int,
+        window: int = 64,
+        recompute_every: int = 4096,
+    ) -> StreamingCoherence:
+        """
+        Create a per-channel streaming scorer for filter_stream.
+
+        The stream uses this firewall's reference frequency and
+        transport factors.
+
+        Args:
+            n_channels: Number of channels
+            window: Samples per channel in the scoring window
+            recompute_every: Samples between exact rebuilds of the running sums
+
+        Returns:
+            Empty StreamingCoherence; feed it with update() or extend()
+        """
+        metric = self._coherence_metric
+        return StreamingCoherence(
+            n_channels=n_channels,
+            window=window,
+            reference_freq=metric.reference_freq,
+            transport_factors=metric.transport_factors,
+            expected_amplitude=metric.expected_amplitude,
+            recompute_every=recompute_every,
+        )
+
+    def filter_stream(
+        self,
+        stream: StreamingCoherence,
+        authenticated: "np.ndarray",
+    ) -> BatchFilterResult:
+        """
+        Filter the current window of every channel of a stream.
+
+        Scores come from the stream's running sums, so this can run at
+        any stride (e.g. every few samples of a 1 kHz feed) without
+        rescanning the windows. The result is logged and alerted like a
+        filter_arrays batch, one row per channel.
+
+        Args:
+            stream: Stream created by stream() (or a compatible one)
+            authenticated: Per-channel authentication flags, or one flag for all
+
+        Returns:
+            BatchFilterResult with one row per channel
+        """
+        n = stream.n_channels
+        auth = np.asarray(authenticated, dtype=bool)
+        if auth.shape not in ((), (n,)):
+            raise ValueError(
+                f"authenticated shape {auth.shape} does not match {n} channels"
+            )
+
+        in_bounds = np.ones(n, dtype=bool)
+        if self.amplitude_bounds:
+            min_amp, max_amp = self.amplitude_bounds
+            low, high = stream.amplitude_range()
+            in_bounds = ~((low < min_amp) | (high > max_amp))
+
+        auth = np.broadcast_to(auth, (n,))
+        return self._finish_batch(stream.variances(), in_bounds, auth)
+
+    def _finish_batch(
+        self,
+        variances: VarianceComponents,
+        in_bounds: "np.ndarray",
+        authenticated: "np.ndarray",
+    ) -> BatchFilterResult:
+        """Score, decide, log and alert rows given their variances."""
+        phase = np.array(variances.phase, dtype=float)
+        gain = np.array(variances.gain, dtype=float)
+        transport = variances.transport
+
+        # Out-of-bounds rows score as in filter: zero phase, infinite gain
+        phase[~in_bounds] = 0.0
+        gain[~in_bounds] = np.inf
+        total = phase + transport + gain
+        if (total < 0).any():
+            raise ValueError(f"Total variance cannot be negative: {total.min()}")
+        coherence = np.exp(-total)
+
+        decision, alert_level = self._apply_decision_matrix_batch(
+            coherence, authenticated
+        )
+        decision[~in_bounds] = Decision.REJECT.value
+        alert_level[~in_bounds] = AlertLevel.CRITICAL.value
+
+        batch = BatchFilterResult(
+            decision=decision,
+            coherence=coherence,
+            variances=VarianceComponents(phase=phase, transport=transport, gain=gain),
+            alert_level=alert_level,
+            authenticated=authenticated.copy(),
+            in_bounds=in_bounds,
+            thresholds=(self.threshold_high, self.threshold_low),
+            amplitude_bounds=self.amplitude_bounds,
+        )
+        self._log_batch_and_alert(batch)
+        return batch
+
     # =========================================================================
     # Bidirectional BCI: Stimulation Filtering
     # =========================================================================
@@ -468,57 +974,40 @@ class NeuralFirewall:
             7. Rate limit - not exceeding commands per second
         """
         safety_checks = {}
-        failed_checks = []
 
         # 1. Authentication check
         safety_checks["authenticated"] = command.authenticated
-        if not command.authenticated:
-            failed_checks.append("missing authentication")
 
         # 2. Target region authorization
-        if self.authorized_regions:
-            safety_checks["region_authorized"] = command.target_region in self.authorized_regions
-            if not safety_checks["region_authorized"]:
-                failed_checks.append(f"unauthorized region: {command.target_region}")
-        else:
-            # If no regions configured, reject all (fail-closed)
-            safety_checks["region_authorized"] = False
-            failed_checks.append("no authorized regions configured")
+        # If no regions are configured, reject all (fail-closed)
+        safety_checks["region_authorized"] = (
+            command.target_region in self.authorized_regions
+        )
 
         # 3. Amplitude bounds
         min_amp, max_amp = self.stim_amplitude_bounds
-        safety_checks["amplitude_in_bounds"] = min_amp <= command.amplitude_uA <= max_amp
-        if not safety_checks["amplitude_in_bounds"]:
-            failed_checks.append(
-                f"amplitude {command.amplitude_uA} uA outside bounds [{min_amp}, {max_amp}]"
-            )
+        amplitude = command.amplitude_uA
+        safety_checks["amplitude_in_bounds"] = min_amp <= amplitude <= max_amp
 
         # 4. Frequency bounds
         min_freq, max_freq = self.stim_frequency_bounds
-        safety_checks["frequency_in_bounds"] = min_freq <= command.frequency_Hz <= max_freq
-        if not safety_checks["frequency_in_bounds"]:
-            failed_checks.append(
-                f"frequency {command.frequency_Hz} Hz outside bounds [{min_freq}, {max_freq}]"
-            )
+        frequency = command.frequency_Hz
+        safety_checks["frequency_in_bounds"] = min_freq <= frequency <= max_freq
 
         # 5. Pulse width bounds
         min_pw, max_pw = self.stim_pulse_width_bounds
-        safety_checks["pulse_width_in_bounds"] = min_pw <= command.pulse_width_us <= max_pw
-        if not safety_checks["pulse_width_in_bounds"]:
-            failed_checks.append(
-                f"pulse width {command.pulse_width_us} us outside bounds [{min_pw}, {max_pw}]"
-            )
+        pulse_width = command.pulse_width_us
+        safety_checks["pulse_width_in_bounds"] = min_pw <= pulse_width <= max_pw
 
         # 6. Charge density check (simplified - assumes 1 cm^2 electrode)
         # Real implementation would use actual electrode geometry
         charge_per_phase = command.charge_per_phase_nC / 1000.0  # Convert to uC
-        safety_checks["charge_density_safe"] = charge_per_phase <= self.charge_density_limit
-        if not safety_checks["charge_density_safe"]:
-            failed_checks.append(
-                f"charge density {charge_per_phase:.2f} uC exceeds limit {self.charge_density_limit}"
-            )
+        safety_checks["charge_density_safe"] = (
+            charge_per_phase <= self.charge_density_limit
+        )
 
         # 7. Rate limit check
+        recent = 0
         if self.stim_rate_limit:
             now = datetime.now()
             # Clean old entries (older than 1 second)
@@ -526,41 +1015,30 @@ class NeuralFirewall:
                 t for t in self._stim_count_window
                 if (now - t).total_seconds() < 1.0
             ]
-            safety_checks["rate_limit_ok"] = len(self._stim_count_window) < self.stim_rate_limit
-            if not safety_checks["rate_limit_ok"]:
-                failed_checks.append(
-                    f"rate limit exceeded: {len(self._stim_count_window)} >= {self.stim_rate_limit}/s"
-                )
+            recent = len(self._stim_count_window)
+            safety_checks["rate_limit_ok"] = recent < self.stim_rate_limit
             # Add current command to window
             self._stim_count_window.append(now)
         else:
             safety_checks["rate_limit_ok"] = True
 
-        # Determine result
-        if not failed_checks:
-            result = StimulationResult(
-                decision=Decision.ACCEPT,
-                alert_level=AlertLevel.ROUTINE,
-                reason="All safety checks passed",
-                safety_checks=safety_checks,
-            )
-        else:
-            # Determine severity based on which checks failed
-            if any(c in str(failed_checks) for c in ["unauthorized region", "charge density", "amplitude"]):
-                alert_level = AlertLevel.CRITICAL
-            elif "authentication" in str(failed_checks):
-                alert_level = AlertLevel.ALERT
-            else:
-                alert_level = AlertLevel.ENHANCED
-
-            result = StimulationResult(
-                decision=Decision.REJECT,
-                alert_level=alert_level,
-                reason=f"Safety check(s) failed: {'; '.join(failed_checks)}",
-                safety_checks=safety_checks,
-            )
-
-        self._log_stimulation_and_alert(result)
+        limits = _StimulationLimits(
+            target_region=command.target_region,
+            regions_configured=bool(self.authorized_regions),
+            amplitude_bounds=tuple(self.stim_amplitude_bounds),
+            frequency_bounds=tuple(self.stim_frequency_bounds),
+            pulse_width_bounds=tuple(self.stim_pulse_width_bounds),
+            charge_density_limit=self.charge_density_limit,
+            rate_limit=self.stim_rate_limit,
+        )
+        values = {
+            "amplitude_uA": command.amplitude_uA,
+            "frequency_Hz": command.frequency_Hz,
+            "pulse_width_us": command.pulse_width_us,
+            "recent": recent,
+        }
+        result = _stimulation_result(safety_checks, limits, **values)
+        self._log_stimulation_and_alert(result, limits, values)
         return result
 
     def filter_stimulation_batch(
@@ -596,16 +1074,36 @@ class NeuralFirewall:
         """
         self.authorized_regions.discard(region)
 
-    def _log_stimulation_and_alert(self, result: StimulationResult):
+    def _log_stimulation_and_alert(
+        self,
+        result: StimulationResult,
+        limits: _StimulationLimits,
+        values: Dict[str, float],
+    ):
         """Log the stimulation result and trigger callbacks."""
-        self._stimulation_log.append(result)
+        log = self._stimulation_log
+        checks = sum(
+            1 << bit
+            for bit, name in enumerate(_SAFETY_CHECKS)
+            if result.safety_checks[name]
+        )
+        # Stimulation is not coherence-scored
+        log.append(
+            result.decision.value,
+            result.alert_level.value,
+            float("nan"),
+            result.timestamp,
+            checks=checks,
+            limits=log.intern(limits),
+            **values,
+        )
+        for check_name, passed in result.safety_checks.items():
+            if not passed:
+                self._failed_check_counts[check_name] = (
+                    self._failed_check_counts.get(check_name, 0) + 1
+                )
         self._last_stim_time = result.timestamp
-
-        # Trigger callbacks for this alert level and above
-        for level in AlertLevel:
-            if level.value >= result.alert_level.value:
-                for callback in self._callbacks.get(level, []):
-                    callback(result)
+        self._trigger_callbacks(result)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -623,7 +1121,9 @@ class NeuralFirewall:
 
     def _get_read_stats(self) -> Dict[str, Any]:
         """Get statistics for read (recording) operations."""
-        if not self._signal_log:
+        log = self._signal_log
+        total = log.total
+        if not total:
             return {
                 "total": 0,
                 "accepted": 0,
@@ -632,28 +1132,33 @@ class NeuralFirewall:
                 "avg_coherence": 0.0,
             }
 
-        accepted = sum(1 for r in self._signal_log if r.accepted)
-        rejected = sum(1 for r in self._signal_log if r.rejected)
-        flagged = sum(1 for r in self._signal_log if r.flagged)
-        avg_coherence = sum(r.coherence for r in self._signal_log) / len(self._signal_log)
+        # Running counters of the decision log; O(1) in the traffic seen
+        flagged = log.decision_count(Decision.ACCEPT_FLAG.value)
+        accepted = log.decision_count(Decision.ACCEPT.value) + flagged
+        rejected = log.decision_count(Decision.REJECT.value)
+        p05, p50, p95 = log.quantiles([0.05, 0.5, 0.95])
 
         return {
-            "total": len(self._signal_log),
+            "total": total,
+            "retained": len(log),
             "accepted": accepted,
             "rejected": rejected,
             "flagged": flagged,
-            "accept_rate": accepted / len(self._signal_log),
-            "reject_rate": rejected / len(self._signal_log),
-            "avg_coherence": avg_coherence,
+            "accept_rate": accepted / total,
+            "reject_rate": rejected / total,
+            "avg_coherence": log.coherence_mean,
+            "coherence_quantiles": {"p05": p05, "p50": p50, "p95": p95},
             "alerts": {
-                level.name: sum(1 for r in self._signal_log if r.alert_level == level)
+                level.name: log.alert_count(level.value)
                 for level in AlertLevel
             },
         }
 
     def _get_stimulation_stats(self) -> Dict[str, Any]:
         """Get statistics for stimulation (write) operations."""
-        if not self._stimulation_log:
+        log = self._stimulation_log
+        total = log.total
+        if not total:
             return {
                 "total": 0,
                 "accepted": 0,
@@ -661,34 +1166,28 @@ class NeuralFirewall:
                 "authorized_regions": list(self.authorized_regions),
             }
 
-        accepted = sum(1 for r in self._stimulation_log if r.accepted)
-        rejected = sum(1 for r in self._stimulation_log if r.rejected)
-
-        # Count failed checks by type
-        failed_check_counts = {}
-        for result in self._stimulation_log:
-            for check_name, passed in result.safety_checks.items():
-                if not passed:
-                    failed_check_counts[check_name] = failed_check_counts.get(check_name, 0) + 1
+        accepted = log.decision_count(Decision.ACCEPT.value)
+        rejected = log.decision_count(Decision.REJECT.value)
 
         return {
-            "total": len(self._stimulation_log),
+            "total": total,
+            "retained": len(log),
             "accepted": accepted,
             "rejected": rejected,
-            "accept_rate": accepted / len(self._stimulation_log) if self._stimulation_log else 0,
-            "reject_rate": rejected / len(self._stimulation_log) if self._stimulation_log else 0,
+            "accept_rate": accepted / total,
+            "reject_rate": rejected / total,
             "authorized_regions": list(self.authorized_regions),
-            "failed_check_counts": failed_check_counts,
+            "failed_check_counts": dict(self._failed_check_counts),
             "alerts": {
-                level.name: sum(1 for r in self._stimulation_log if r.alert_level == level)
+                level.name: log.alert_count(level.value)
                 for level in AlertLevel
             },
         }
 
     def _determine_flow_direction(self) -> str:
         """Determine the predominant flow direction based on activity."""
-        has_read = len(self._signal_log) > 0
-        has_stim = len(self._stimulation_log) > 0
+        has_read = self._signal_log.total > 0
+        has_stim = self._stimulation_log.total > 0
 
         if has_read and has_stim:
             return FlowDirection.BIDIRECTIONAL.name
@@ -703,6 +1202,7 @@ class NeuralFirewall:
         """Clear all logs (read and stimulation)."""
         self._signal_log.clear()
         self._stimulation_log.clear()
+        self._failed_check_counts.clear()
         self._stim_count_window.clear()
 
     def clear_read_log(self):
@@ -712,14 +1212,70 @@ class NeuralFirewall:
     def clear_stimulation_log(self):
         """Clear only the stimulation log."""
         self._stimulation_log.clear()
+        self._failed_check_counts.clear()
         self._stim_count_window.clear()
 
     @property
     def log(self) -> List[FilterResult]:
-        """Access the read signal log (read-only copy)."""
-        return list(self._signal_log)
+        """Retained read results, rebuilt from the log columns (a copy)."""
+        log = self._signal_log
+        rows = log.columns()
+        return [
+            FilterResult(
+                decision=Decision(rows["decision"][i]),
+                coherence=rows["coherence"][i],
+                variances=VarianceComponents(
+                    phase=rows["phase"][i],
+                    transport=rows["transport"][i],
+                    gain=rows["gain"][i],
+                ),
+                alert_level=AlertLevel(rows["alert_level"][i]),
+                reason=log.label(rows["reason"][i]).format(rows["coherence"][i]),
+                timestamp=timestamp_from_ns(rows["timestamp"][i]),
+            )
+            for i in range(len(log))
+        ]
+
+    @property
+    def decision_log(self) -> DecisionLog:
+        """Columnar read decision log (running stats, columns, history)."""
+        return self._signal_log
 
     @property
     def stimulation_log(self) -> List[StimulationResult]:
-        """Access the stimulation log (read-only copy)."""
-        return list(self._stimulation_log)
+        """Retained stimulation results, rebuilt from the log columns (a copy)."""
+        log = self._stimulation_log
+        rows = log.columns()
+        return [
+            _stimulation_result(
+                {
+                    name: bool(rows["checks"][i] >> bit & 1)
+                    for bit, name in enumerate(_SAFETY_CHECKS)
+                },
+                log.label(rows["limits"][i]),
+                amplitude_uA=rows["amplitude_uA"][i],
+                frequency_Hz=rows["frequency_Hz"][i],
+                pulse_width_us=rows["pulse_width_us"][i],
+                recent=rows["recent"][i],
+                timestamp=timestamp_from_ns(rows["timestamp"][i]),
+            )
+            for i in range(len(log))
+        ]
+
+    @property
+    def stimulation_decision_log(self) -> DecisionLog:
+        """Columnar stimulation decision log (running stats, columns, history)."""
+        return self._stimulation_log
+
+    def close(self):
+        """Flush and close both logs' spill files (reopened on the next spill)."""
+        self._signal_log.close()
+        self._stimulation_log.close()
+
+    def __enter__(self) -> "NeuralFirewall":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
@@ -548,16 +548,41 @@ class MOABBAdapter:
         """
         # Average across channels to get a single time series
         mean_signal = np.mean(data, axis=0)
-        n_samples = len(mean_signal)
 
         # Generate arrival times based on sampling rate
-        arrival_times = np.arange(n_samples) / sampling_rate
+        arrival_times = np.arange(len(mean_signal)) / sampling_rate
 
-        # Use the signal amplitudes directly
-        amplitudes = mean_signal.tolist()
-        times = arrival_times.tolist()
+        return coherence_metric.calculate(arrival_times, mean_signal)
 
-        return coherence_metric.calculate(times, amplitudes)
+    def _calculate_batch_coherence(
+        self,
+        data: List[np.ndarray],
+        sampling_rates: List[float],
+        coherence_metric: Any,
+    ) -> List[float]:
+        """Coherence scores of many EEG arrays in one CoherenceMetric.calculate_batch call.
+
+        Channel means of different lengths are zero-padded to a common
+        width and scored with per-row lengths.
+
+        Args:
+            data: EEG data arrays (channels x samples)
+            sampling_rates: Sampling rate of each array in Hz
+            coherence_metric: CoherenceMetric instance
+
+        Returns:
+            Coherence scores (0-1), one per array
+        """
+        if not data:
+            return []
+        mean_signals = [np.mean(d, axis=0) for d in data]
+        lengths = np.array([len(m) for m in mean_signals])
+        amplitudes = np.zeros((len(mean_signals), lengths.max()))
+        for row, mean_signal in zip(amplitudes, mean_signals):
+            row[:len(mean_signal)] = mean_signal
+        arrival_times = np.arange(amplitudes.shape[1]) / np.asarray(sampling_rates, dtype=float)[:, None]
+
+        return coherence_metric.calculate_batch(arrival_times, amplitudes, lengths=lengths).tolist()
 
     def benchmark_coherence(
         self,
@@ -589,9 +614,11 @@ class MOABBAdapter:
         }
 
         # Analyze clean signals
-        for signal in signals:
-            score = self._calculate_signal_coherence(signal.data, signal.sampling_rate, coherence)
-            results["clean_signals"]["scores"].append(score)
+        results["clean_signals"]["scores"] = self._calculate_batch_coherence(
+            [signal.data for signal in signals],
+            [signal.sampling_rate for signal in signals],
+            coherence,
+        )
 
         results["clean_signals"]["mean_score"] = float(np.mean(results["clean_signals"]["scores"]))
         results["clean_signals"]["std_score"] = float(np.std(results["clean_signals"]["scores"]))
@@ -606,12 +633,12 @@ class MOABBAdapter:
                 "by_attack_type": {},
             }
 
-            for attacked in attacked_signals:
-                score = self._calculate_signal_coherence(
-                    attacked.attacked,
-                    attacked.original.sampling_rate,
-                    coherence
-                )
+            attacked_scores = self._calculate_batch_coherence(
+                [attacked.attacked for attacked in attacked_signals],
+                [attacked.original.sampling_rate for attacked in attacked_signals],
+                coherence,
+            )
+            for attacked, score in zip(attacked_signals, attacked_scores):
                 results["attacked_signals"]["scores"].append(score)
 
                 # Group by attack type
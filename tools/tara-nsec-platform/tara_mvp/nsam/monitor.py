@@ -12,6 +12,9 @@ from enum import Enum, auto
 import threading
 import time
 
+import numpy as np
+
+from ..core.coherence import StreamingCoherence
 from .events import EventStore, NeuralEvent, EventCategory, EventSeverity
 from .rules import RuleEngine, DetectionRule, RuleAction, PREDEFINED_RULES
 from .detector import AnomalyDetector, DetectionResult, DetectionMethod
@@ -82,6 +85,10 @@ class NeuralMonitor:
         ... }
         >>> monitor.process(metrics)
         >>>
+        >>> # Or score raw samples per channel (64 channels, every 32 samples):
+        >>> monitor.track_coherence(n_channels=64, stride=32)
+        >>> monitor.process_samples(times_block, amplitudes_block)
+        >>>
         >>> # When done:
         >>> session = monitor.stop()
         >>> print(f"Processed {session.samples_processed} samples")
@@ -127,6 +134,11 @@ class NeuralMonitor:
         self._current_metrics: Dict[str, float] = {}
         self._metric_history: Dict[str, List[float]] = {}
 
+        # Per-channel coherence of raw samples (see track_coherence)
+        self.coherence_stream: Optional[StreamingCoherence] = None
+        self.coherence_stride = 1
+        self._channel_coherence: Optional[np.ndarray] = None
+
         # Callbacks
         self._metrics_callbacks: List[Callable[[Dict[str, float]], None]] = []
         self._detection_callbacks: List[Callable[[DetectionResult], None]] = []
@@ -149,6 +161,11 @@ class NeuralMonitor:
         """Most recent metric values."""
         return self._current_metrics.copy()
 
+    @property
+    def channel_coherence(self) -> Optional[np.ndarray]:
+        """Most recent per-channel coherence scores (None before the first)."""
+        return None if self._channel_coherence is None else self._channel_coherence.copy()
+
     def start(self) -> MonitoringSession:
         """
         Start a monitoring session.
@@ -278,6 +295,94 @@ class NeuralMonitor:
 
             return result
 
+    def track_coherence(
+        self,
+        n_channels: int,
+        window: int = 64,
+        stride: int = 32,
+        reference_freq: float = 40.0,
+        **kwargs,
+    ) -> StreamingCoherence:
+        """
+        Score coherence per channel from raw samples fed to process_samples.
+
+        Args:
+            n_channels: Number of channels
+            window: Samples per channel in the scoring window
+            stride: Samples between scores (and process() calls)
+            reference_freq: Reference oscillation frequency in Hz
+            **kwargs: Further StreamingCoherence options
+
+        Returns:
+            The StreamingCoherence being fed
+        """
+        if stride < 1:
+            raise ValueError("stride must be positive")
+        with self._lock:
+            self.coherence_stream = StreamingCoherence(
+                n_channels=n_channels,
+                window=window,
+                reference_freq=reference_freq,
+                **kwargs,
+            )
+            self.coherence_stride = stride
+            self._channel_coherence = None
+        return self.coherence_stream
+
+    def process_samples(self, times, amplitudes) -> List[DetectionResult]:
+        """
+        Process raw samples through the coherence stream.
+
+        Every ``stride`` samples the channel scores are processed as
+        metrics: "coherence" is the worst channel and "coherence_mean"
+        the average, so the coherence rules and thresholds apply to the
+        weakest channel.
+
+        Args:
+            times: One sample time (shared or per channel), or a block of
+                shape (K,) or (K, n_channels)
+            amplitudes: One amplitude per channel, or a block of shape
+                (K, n_channels)
+
+        Returns:
+            DetectionResults of the anomalies detected, if any
+        """
+        stream = self.coherence_stream
+        if stream is None:
+            raise RuntimeError("Call track_coherence() before process_samples()")
+        if self._state != MonitorState.RUNNING:
+            return []
+
+        amplitudes = np.asarray(amplitudes, dtype=float)
+        times = np.asarray(times, dtype=float)
+        if amplitudes.ndim == 1:
+            amplitudes = amplitudes[None]
+            times = times[None]
+
+        detections = []
+        start = 0
+        while start < len(amplitudes):
+            # Feed up to the next stride boundary, then score
+            with self._lock:
+                stop = start + self.coherence_stride - stream.samples_seen % self.coherence_stride
+                if stop - start == 1:
+                    stream.update(times[start], amplitudes[start])
+                else:
+                    stream.extend(times[start:stop], amplitudes[start:stop])
+                start = min(stop, len(amplitudes))
+                if stream.samples_seen % self.coherence_stride:
+                    break
+                scores = stream.score()
+                self._channel_coherence = scores
+
+            result = self.process({
+                "coherence": float(scores.min()),
+                "coherence_mean": float(scores.mean()),
+            })
+            if result is not None:
+                detections.append(result)
+        return detections
+
     def _run_detection(self, metrics: Dict[str, float]) -> Optional[DetectionResult]:
         """Run anomaly detection on metrics."""
         result = self.detector.analyze(metrics)
@@ -423,8 +528,6 @@ class NeuralMonitor:
 
     def _calculate_summary(self) -> Dict[str, Dict[str, float]]:
         """Calculate summary statistics for session."""
-        import numpy as np
-
         summary = {}
         for name, values in self._metric_history.items():
             if not values:
@@ -480,6 +583,10 @@ class NeuralMonitor:
                 "sample_rate": session.sample_rate if session else 0,
             } if session else None,
             "current_metrics": self._current_metrics,
+            "channel_coherence": (
+                self._channel_coherence.tolist()
+                if self._channel_coherence is not None else None
+            ),
             "recent_events": [
                 e.to_dict() for e in self.event_store.get_recent(20)
             ],
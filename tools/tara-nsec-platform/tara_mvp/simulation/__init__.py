@@ -5,6 +5,7 @@ Neural network simulation components:
 - Neuron models (LIF, Izhikevich, Hodgkin-Huxley, Adaptive LIF)
 - Synapse models (Chemical, Electrical, STDP)
 - Network architectures (Layered, Recurrent, Small-World)
+- Vectorized population backend (opt-in via NetworkBackend.POPULATION)
 - Simulation engine
 """
 
@@ -31,12 +32,14 @@ from .networks import (
     LayeredNetwork,
     RecurrentNetwork,
     SmallWorldNetwork,
+    NetworkBackend,
 )
 
 # Engine
 from .engine import (
     SimulationEngine,
     SimulationConfig,
+    SimulationMode,
     Recorder,
     RecordingConfig,
 )
@@ -58,9 +61,11 @@ __all__ = [
     "LayeredNetwork",
     "RecurrentNetwork",
     "SmallWorldNetwork",
+    "NetworkBackend",
     # Engine
     "SimulationEngine",
     "SimulationConfig",
+    "SimulationMode",
     "Recorder",
     "RecordingConfig",
 ]
@@ -2,21 +2,44 @@
 NeuroSim Simulation Engine
 
 Provides the core simulation infrastructure:
-- SimulationEngine: Main simulation runner
+- SimulationEngine: Main simulation runner (blocking, chunked or asyncio)
 - EventQueue: Event-driven simulation support
+- PoissonSource: Streaming Poisson background input
+- EventDrivenSolver: Analytic LIF integration between events
 - Recorder: Data recording and export
+- analysis: Vectorized firing-rate and spike-train statistics
+- SweepRunner: Parallel, resumable parameter sweeps
+- SnapshotLibrary: Warm-start network checkpoints
 """
 
-from .simulator import SimulationEngine, SimulationConfig
+from .simulator import (
+    SimulationEngine, SimulationConfig, SimulationMode, SimulationChunk, StepWindow,
+)
 from .events import EventQueue, Event, EventType
+from .inputs import PoissonSource
+from .event_driven import EventDrivenSolver
 from .recorder import Recorder, RecordingConfig
+from .analysis import RateKernel
+from .sweep import SweepRunner, SweepResults
+from .checkpoint import SnapshotLibrary, save_checkpoint, load_checkpoint
 
 __all__ = [
     "SimulationEngine",
     "SimulationConfig",
+    "SimulationMode",
+    "SimulationChunk",
+    "StepWindow",
     "EventQueue",
     "Event",
     "EventType",
+    "PoissonSource",
+    "EventDrivenSolver",
     "Recorder",
     "RecordingConfig",
+    "RateKernel",
+    "SweepRunner",
+    "SweepResults",
+    "SnapshotLibrary",
+    "save_checkpoint",
+    "load_checkpoint",
 ]
@@ -0,0 +1,242 @@
+"""
+Spike Train Analysis
+
+Vectorized rate and variability statistics over (times, neurons)
+spike arrays, such as those of a SpikeStore or Recorder.
+
+Everything works on one binned count matrix (neurons x bins) built
+with a single ``np.bincount``:
+- Sliding-window rates (cumulative sums over the bins)
+- Kernel-smoothed rates (box, Gaussian or causal exponential kernel;
+  FFT convolution once the kernel is longer than ``FFT_THRESHOLD`` bins)
+- Fano factor and pairwise spike-count correlations
+- Coefficient of variation of inter-spike intervals
+"""
+
+from enum import Enum
+from typing import Tuple
+import numpy as np
+from scipy.signal import fftconvolve
+
+from ..neurons.spikes import sort_by_neuron, window_counts
+
+# Kernels longer than this many bins are applied by FFT convolution
+FFT_THRESHOLD = 64
+
+
+class RateKernel(Enum):
+    """Smoothing kernels for firing-rate estimation."""
+    BOX = "box"                       # Centered rectangular window
+    GAUSSIAN = "gaussian"             # Centered Gaussian (width = sigma)
+    EXPONENTIAL = "exponential"       # Causal exponential (width = tau)
+
+
+def bin_spikes(
+    times: np.ndarray,
+    neurons: np.ndarray,
+    n_neurons: int,
+    bin_size: float,
+    t_start: float = 0.0,
+    t_stop: float = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count spikes per neuron in bins ``[t_start + k * bin_size, ...)``.
+
+    Args:
+        times: Spike times (ms)
+        neurons: Neuron index of each spike
+        n_neurons: Number of neurons (rows)
+        bin_size: Bin width (ms)
+        t_start: Start of the first bin (ms)
+        t_stop: End of the last bin (ms); defaults to the last spike
+
+    Returns:
+        Tuple of (bin_edges, counts) with counts of shape (n_neurons, n_bins)
+    """
+    if t_stop is None:
+        t_stop = float(times.max()) + bin_size if times.size else t_start
+    n_bins = max(int(np.ceil((t_stop - t_start) / bin_size - 1e-9)), 0)
+    edges = t_start + bin_size * np.arange(n_bins + 1)
+
+    bins = np.floor((times - t_start) / bin_size).astype(np.int64)
+    keep = (bins >= 0) & (bins < n_bins)
+    flat = neurons[keep].astype(np.int64) * n_bins + bins[keep]
+    counts = np.bincount(flat, minlength=n_neurons * n_bins)
+    return edges, counts.reshape(n_neurons, n_bins)
+
+
+def make_kernel(kernel: RateKernel, width: float, bin_size: float) -> Tuple[np.ndarray, int]:
+    """
+    Sample a normalized smoothing kernel on the bin grid.
+
+    Args:
+        kernel: Kernel shape
+        width: Box width, Gaussian sigma or exponential tau (ms)
+        bin_size: Bin width (ms)
+
+    Returns:
+        Tuple of (weights summing to 1, lag of the first weight in bins)
+    """
+    kernel = RateKernel(kernel)
+    scale = width / bin_size
+    if kernel == RateKernel.BOX:
+        half = max(int(round(scale / 2)), 0)
+        lags = np.arange(-half, half + 1)
+        weights = np.ones(lags.size)
+    elif kernel == RateKernel.GAUSSIAN:
+        half = max(int(np.ceil(4 * scale)), 1)
+        lags = np.arange(-half, half + 1)
+        weights = np.exp(-0.5 * (lags / scale) ** 2)
+    else:
+        lags = np.arange(0, max(int(np.ceil(5 * scale)), 1) + 1)
+        weights = np.exp(-lags / scale)
+    return weights / weights.sum(), int(lags[0])
+
+
+def convolve_bins(counts: np.ndarray, weights: np.ndarray, first_lag: int) -> np.ndarray:
+    """
+    Convolve every row of a count matrix with a kernel.
+
+    ``out[:, t] = sum_l weights[l] * counts[:, t - first_lag - l]``;
+    short kernels are applied tap by tap, long ones by FFT.
+    """
+    n_bins = counts.shape[1]
+    if weights.size > FFT_THRESHOLD:
+        full = fftconvolve(counts, weights[None, :], mode="full", axes=1)
+    else:
+        full = np.zeros((counts.shape[0], n_bins + weights.size - 1))
+        for lag, w in enumerate(weights):
+            full[:, lag:lag + n_bins] += w * counts
+    return full[:, -first_lag:-first_lag + n_bins]
+
+
+def smoothed_rates(
+    counts: np.ndarray,
+    bin_size: float,
+    kernel: RateKernel = RateKernel.GAUSSIAN,
+    width: float = 10.0,
+) -> np.ndarray:
+    """
+    Kernel-smoothed firing rates of every neuron.
+
+    Args:
+        counts: (n_neurons, n_bins) spike counts (see bin_spikes)
+        bin_size: Bin width (ms)
+        kernel: Kernel shape
+        width: Box width, Gaussian sigma or exponential tau (ms)
+
+    Returns:
+        (n_neurons, n_bins) rates in Hz
+    """
+    weights, first_lag = make_kernel(kernel, width, bin_size)
+    return convolve_bins(counts.astype(np.float64), weights, first_lag) / (bin_size / 1000)
+
+
+def sliding_window_rates(
+    times: np.ndarray,
+    neurons: np.ndarray,
+    n_neurons: int,
+    t_stop: float,
+    window: float = 100.0,
+    step: float = 10.0,
+    time_sorted: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Firing rates in windows ``[c - window/2, c + window/2)``.
+
+    Window centers run from ``window / 2`` to ``t_stop - window / 2`` in
+    ``step`` increments. When ``window`` is a whole number of steps the
+    spikes are binned once at ``step`` resolution and each window is a
+    difference of cumulative bin counts; otherwise every window is
+    counted with a binary search (see window_counts).
+
+    Args:
+        times: Spike times (ms)
+        neurons: Neuron index of each spike
+        n_neurons: Number of neurons (rows)
+        t_stop: End of the analysed interval (ms)
+        window: Window width (ms)
+        step: Distance between window centers (ms)
+        time_sorted: Whether ``times`` is already non-decreasing
+
+    Returns:
+        Tuple of (window_centers, rates) with rates (n_neurons, n_windows) in Hz
+    """
+    centers = np.arange(window / 2, t_stop - window / 2, step)
+    per_window = window / step
+    if centers.size and abs(per_window - round(per_window)) < 1e-9:
+        k = int(round(per_window))
+        _, counts = bin_spikes(
+            times, neurons, n_neurons, step,
+            t_stop=centers[-1] + window / 2,
+        )
+        cumulative = np.zeros((n_neurons, counts.shape[1] + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=cumulative[:, 1:])
+        counts = cumulative[:, k:k + centers.size] - cumulative[:, :centers.size]
+    else:
+        counts = window_counts(
+            times, neurons, n_neurons,
+            centers - window / 2, centers + window / 2, time_sorted,
+        )
+    return centers, counts / (window / 1000)
+
+
+def fano_factor(counts: np.ndarray) -> np.ndarray:
+    """
+    Fano factor (variance / mean of the bin counts) of every neuron.
+
+    Neurons without spikes get NaN.
+    """
+    mean = counts.mean(axis=1)
+    var = counts.var(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(mean > 0, var / mean, np.nan)
+
+
+def isi_cv(
+    times: np.ndarray,
+    neurons: np.ndarray,
+    n_neurons: int,
+    time_sorted: bool = True,
+) -> np.ndarray:
+    """
+    Coefficient of variation of the inter-spike intervals of every neuron.
+
+    Neurons with fewer than three spikes (two intervals) get NaN.
+    """
+    offsets, sorted_times = sort_by_neuron(times, neurons, n_neurons, time_sorted)
+    counts = np.diff(offsets)
+    if sorted_times.size < 2:
+        return np.full(n_neurons, np.nan)
+
+    # Intervals within each neuron's train (drop those spanning two neurons)
+    owners = np.repeat(np.arange(n_neurons), counts)
+    within = owners[1:] == owners[:-1]
+    isi, owner = np.diff(sorted_times)[within], owners[1:][within]
+
+    n = np.bincount(owner, minlength=n_neurons)
+    total = np.bincount(owner, weights=isi, minlength=n_neurons)
+    total_sq = np.bincount(owner, weights=isi ** 2, minlength=n_neurons)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / n
+        std = np.sqrt(np.maximum(total_sq / n - mean ** 2, 0.0))
+        return np.where(n >= 2, std / mean, np.nan)
+
+
+def count_correlations(counts: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Pearson correlations of binned spike counts.
+
+    Args:
+        counts: (n_neurons, n_bins) spike counts
+
+    Returns:
+        (n_neurons, n_neurons) correlation matrix; rows of neurons with
+        constant counts are NaN
+    """
+    centered = counts - counts.mean(axis=1, keepdims=True)
+    norm = np.sqrt((centered ** 2).sum(axis=1))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        normalized = centered / norm[:, None]
+    normalized[norm == 0] = np.nan
+    return normalized @ normalized.T
@@ -0,0 +1,243 @@
+"""
+Simulation Checkpoints
+
+Saves the dynamic state of a network, and optionally of the engine
+running it, to one ``.npz`` file and restores it into a network built
+the same way:
+
+- NumPy arrays: membrane potentials and model variables, synaptic
+  conductances and weights, STDP traces, spikes in flight and recorded
+  spikes (see Network.get_state)
+- A small JSON header: format version, network layout (checked on
+  restore), the network's random generator state and engine progress
+
+Structure and parameters are not saved; restore into a network rebuilt
+by the same factory call. Neuron IDs may differ, so inputs and events
+are stored by neuron position.
+
+SnapshotLibrary keeps warmed-up networks on disk so that attack
+scenarios and sweeps can start from a steady state instead of
+re-running the warmup every time.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Callable, Union
+import json
+import os
+import numpy as np
+
+CHECKPOINT_VERSION = 1
+
+# Array holding the UTF-8 encoded JSON header
+_HEADER_KEY = "__header__"
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def network_layout(network) -> Dict[str, Any]:
+    """Structural summary of a network, compared on restore."""
+    models: Dict[str, int] = {}
+    for neuron in network:
+        name = type(neuron).__name__
+        models[name] = models.get(name, 0) + 1
+    return {
+        "model": type(network).__name__,
+        "n_neurons": network.n_neurons,
+        "neuron_models": models,
+        "backend": network.params.backend.value,
+    }
+
+
+def generator_state(rng: Optional[np.random.Generator]) -> Optional[Dict[str, Any]]:
+    """JSON-serializable state of a generator (None passes through)."""
+    return None if rng is None else rng.bit_generator.state
+
+
+def generator_from_state(state: Optional[Dict[str, Any]]) -> Optional[np.random.Generator]:
+    """Generator continuing from a state saved by generator_state."""
+    if state is None:
+        return None
+    bit_generator = getattr(np.random, state["bit_generator"])()
+    bit_generator.state = state
+    return np.random.Generator(bit_generator)
+
+
+def save_checkpoint(
+    path: PathLike,
+    network,
+    header: Optional[Dict[str, Any]] = None,
+    arrays: Optional[Dict[str, np.ndarray]] = None,
+    compress: bool = True,
+) -> str:
+    """
+    Write network state (plus extra header entries and arrays) to ``path``.
+
+    The file is written next to ``path`` and moved into place, so an
+    interrupted save never leaves a truncated checkpoint.
+
+    Args:
+        path: Output file (``.npz`` by convention)
+        network: Network to save
+        header: Extra JSON-serializable header entries (e.g. engine state)
+        arrays: Extra arrays, stored alongside the network state
+        compress: Use zip deflate compression
+
+    Returns:
+        Path written
+    """
+    state = network.get_state()
+    meta = {
+        "version": CHECKPOINT_VERSION,
+        "layout": network_layout(network),
+        "rng": generator_state(network.rng),
+    }
+    meta.update(header or {})
+    state.update(arrays or {})
+    state[_HEADER_KEY] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+    path = os.fspath(path)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **state)
+    os.replace(tmp, path)
+    return path
+
+
+def load_checkpoint(path: PathLike) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Read a checkpoint written by save_checkpoint.
+
+    Args:
+        path: Checkpoint file
+
+    Returns:
+        Tuple of (header, arrays)
+
+    Raises:
+        ValueError: If the file has an unsupported format version
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+    header = json.loads(arrays.pop(_HEADER_KEY).tobytes().decode("utf-8"))
+    if header.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {header.get('version')}")
+    return header, arrays
+
+
+def restore_network(network, header: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    """
+    Load checkpointed state into a network of the same layout.
+
+    Arrays outside the network state (prefixed ``engine/``) are ignored.
+    The network's generator continues from the saved state; it stays the
+    same object, so neurons and populations sharing it follow along.
+
+    Raises:
+        ValueError: If the network does not match the saved layout
+    """
+    layout = network_layout(network)
+    if header["layout"] != layout:
+        raise ValueError(
+            f"Checkpoint layout {header['layout']} does not match network {layout}"
+        )
+    network.set_state({
+        name: value for name, value in arrays.items() if not name.startswith("engine/")
+    })
+    network.rng.bit_generator.state = header["rng"]
+
+
+class SnapshotLibrary:
+    """
+    Directory of warm-start network snapshots, one checkpoint per name.
+
+    A snapshot is taken once, after running a freshly built network
+    into a steady state; later runs rebuild the same network and load
+    the snapshot instead of simulating the warmup again.
+
+    Usage:
+        >>> library = SnapshotLibrary("snapshots")
+        >>> network = RecurrentNetwork.create_balanced(n_neurons=200)
+        >>> library.warm("balanced_200", network, warmup=500.0)
+        >>> result = AttackSimulator(seed=0).run_scenario(scenario, network)
+    """
+
+    def __init__(self, directory: PathLike):
+        """
+        Initialize library.
+
+        Args:
+            directory: Snapshot directory (created if missing)
+        """
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        """File holding snapshot ``name``."""
+        return os.path.join(self.directory, f"{name}.npz")
+
+    def __contains__(self, name: str) -> bool:
+        return os.path.exists(self.path(name))
+
+    def names(self) -> List[str]:
+        """Names of stored snapshots."""
+        return sorted(
+            f[:-len(".npz")] for f in os.listdir(self.directory) if f.endswith(".npz")
+        )
+
+    def save(self, name: str, network) -> str:
+        """Store the current state of ``network`` as snapshot ``name``."""
+        return save_checkpoint(self.path(name), network)
+
+    def load(self, name: str, network):
+        """
+        Load snapshot ``name`` into ``network``.
+
+        Raises:
+            KeyError: If there is no such snapshot
+            ValueError: If the snapshot was taken from a different layout
+        """
+        if name not in self:
+            raise KeyError(f"No snapshot named {name!r} in {self.directory}")
+        restore_network(network, *load_checkpoint(self.path(name)))
+
+    def remove(self, name: str):
+        """Delete snapshot ``name`` if present."""
+        if name in self:
+            os.remove(self.path(name))
+
+    def warm(
+        self,
+        name: str,
+        network,
+        warmup: float = 500.0,
+        setup: Optional[Callable[[Any], None]] = None,
+    ) -> bool:
+        """
+        Bring ``network`` into its warmed-up state.
+
+        Loads snapshot ``name`` if it exists; otherwise simulates
+        ``warmup`` ms (without recording) and stores the result.
+
+        Args:
+            name: Snapshot name
+            network: Freshly built network
+            warmup: Warmup duration (ms)
+            setup: Called with the SimulationEngine before the warmup
+                run, e.g. to add background input
+
+        Returns:
+            True if the snapshot was loaded, False if it was created
+        """
+        if name in self:
+            self.load(name, network)
+            return True
+
+        from .simulator import SimulationEngine, SimulationConfig
+
+        engine = SimulationEngine(network, SimulationConfig(
+            duration=warmup, dt=network.params.dt, record=False, verbose=False,
+        ))
+        if setup is not None:
+            setup(engine)
+        engine.run()
+        self.save(name, network)
+        return False
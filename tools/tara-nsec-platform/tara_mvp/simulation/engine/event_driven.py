@@ -0,0 +1,389 @@
+"""
+Event-Driven LIF Solver
+
+Advances LIF neurons analytically between events instead of stepping
+them every dt. Used by SimulationEngine for SimulationMode.EVENT_DRIVEN
+and SimulationMode.HYBRID.
+
+Between events a LIF neuron with constant drive I relaxes exactly as
+
+    V(t) = V_inf + (V(t0) - V_inf) * exp(-(t - t0) / tau_m),
+    V_inf = V_rest + R_m * I
+
+so the EventQueue only has to hold:
+- Spike arrivals (EventType.SPIKE), one per presynaptic spike and delay
+- Predicted threshold crossings (EventType.THRESHOLD), solved in closed
+  form when V_inf lies above threshold
+- External inputs and constant stimulus on/offsets already queued by
+  the engine
+
+Synaptic events are treated as instantaneous voltage jumps carrying
+the full charge of the double-exponential conductance, evaluated at the
+voltage on arrival (same sign convention as
+ChemicalSynapse._compute_current). Cost is O(events), not
+O(neurons x steps).
+
+Eligible neurons are noiseless LIFNeurons whose incoming synapses are
+all plain ChemicalSynapses and that are not coupled by gap junctions
+or driven by time-varying stimuli; other neurons are stepped (HYBRID).
+"""
+
+from typing import Optional, Dict, Any, List, Set, Tuple, TYPE_CHECKING
+import numpy as np
+
+from .events import EventQueue, Event, EventType, StimulusProtocol
+from ..neurons.lif import LIFNeuron
+from ..synapses.base import SynapseType
+from ..synapses.chemical import ChemicalSynapse
+from ..synapses.electrical import ElectricalSynapse
+
+if TYPE_CHECKING:
+    from ..neurons.base import Neuron
+    from ..synapses.base import Synapse
+
+
+def find_event_driven_neurons(
+    network,
+    protocols: Optional[List[StimulusProtocol]] = None
+) -> List["Neuron"]:
+    """
+    Select the neurons of a network that can be simulated event-driven.
+
+    Args:
+        network: Network to inspect
+        protocols: Stimulus protocols applied during the run
+
+    Returns:
+        Eligible neurons in network order
+    """
+    excluded: Set[str] = set()
+
+    for synapse in network.synapses:
+        if isinstance(synapse, ElectricalSynapse):
+            excluded.update((synapse.pre.id, synapse.post.id))
+        elif type(synapse) is not ChemicalSynapse or synapse.params.use_stp:
+            excluded.add(synapse.post.id)
+
+    for protocol in protocols or []:
+        if not protocol.is_constant:
+            excluded.update(protocol.target_ids)
+
+    return [
+        neuron for neuron in network
+        if type(neuron) is LIFNeuron
+        and neuron.params.noise_std == 0
+        and neuron.id not in excluded
+    ]
+
+
+class EventDrivenSolver:
+    """
+    Analytic event-driven integration of LIF neurons.
+
+    Usage:
+        >>> solver = EventDrivenSolver(network, engine.event_queue, dt=0.1)
+        >>> solver.attach()
+        >>> solver.run_until(100.0)     # process all events up to 100 ms
+        >>> solver.sync_all(100.0)      # bring neuron objects up to date
+        >>> solver.detach()
+    """
+
+    def __init__(
+        self,
+        network,
+        queue: EventQueue,
+        dt: float,
+        neurons: Optional[List["Neuron"]] = None,
+        engine=None
+    ):
+        """
+        Initialize solver.
+
+        Args:
+            network: Network being simulated
+            queue: Event queue shared with the engine
+            dt: Engine time step (used for INPUT event charge)
+            neurons: Neurons to integrate (default: all eligible)
+            engine: Engine passed to event callbacks
+        """
+        self.network = network
+        self.queue = queue
+        self.dt = dt
+        self.engine = engine
+
+        self.neurons: List["Neuron"] = (
+            neurons if neurons is not None else find_event_driven_neurons(network)
+        )
+        self.index: Dict[str, int] = {n.id: i for i, n in enumerate(self.neurons)}
+
+        n = len(self.neurons)
+        params = [neuron.params for neuron in self.neurons]
+        self.V_rest = np.array([p.V_rest for p in params], dtype=np.float64)
+        self.R_m = np.array([p.R_m for p in params], dtype=np.float64)
+        self.tau_m = np.array([p.tau_m for p in params], dtype=np.float64)
+        self.theta = np.array([p.V_threshold for p in params], dtype=np.float64)
+        self.V_reset = np.array([p.V_reset for p in params], dtype=np.float64)
+        self.t_ref = np.array([p.t_refractory for p in params], dtype=np.float64)
+
+        self.V = np.zeros(n)
+        self.t_last = np.zeros(n)
+        self.ref_until = np.zeros(n)
+        self.I_drive = np.zeros(n)
+        self._version = np.zeros(n, dtype=np.int64)
+
+        # Neurons that fired since mark_fired()
+        self._fired: List[int] = []
+        self._marked: List[int] = []
+
+        self._build_channels()
+        self._attached = False
+        self.n_events = 0
+
+    # --- Construction ---
+
+    def _build_channels(self):
+        """Group synapses onto event-driven neurons by (pre, delay)."""
+        self.synapses: List["Synapse"] = [
+            s for s in self.network.synapses if s.post.id in self.index
+        ]
+
+        groups: Dict[Tuple[str, float], List["Synapse"]] = {}
+        for synapse in self.synapses:
+            groups.setdefault((synapse.pre.id, synapse.params.delay), []).append(synapse)
+
+        self._channels: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._outgoing: Dict[str, List[Tuple[float, int]]] = {}
+        self._pre_neurons: Dict[str, "Neuron"] = {}
+
+        for (pre_id, delay), synapses in groups.items():
+            post = np.array([self.index[s.post.id] for s in synapses], dtype=np.int64)
+            charge = np.array([
+                s.params.g_max * s.params.weight * (s.params.tau_decay - s.params.tau_rise)
+                * (-1.0 if s.params.synapse_type == SynapseType.INHIBITORY else 1.0)
+                for s in synapses
+            ])
+            E_rev = np.array([s.params.E_rev for s in synapses])
+            coef = charge * self.R_m[post] / self.tau_m[post]
+
+            self._outgoing.setdefault(pre_id, []).append((delay, len(self._channels)))
+            self._channels.append((post, coef, E_rev))
+            self._pre_neurons[pre_id] = synapses[0].pre
+
+    def attach(self):
+        """
+        Take over spike transmission of synapses onto event-driven neurons.
+
+        Their per-object callbacks are replaced by the solver's until
+        detach() is called.
+        """
+        if self._attached:
+            return
+        self._detached: List["Synapse"] = []
+        for synapse in self.synapses:
+            callbacks = synapse.pre._spike_callbacks
+            if synapse._on_pre_spike in callbacks:
+                callbacks.remove(synapse._on_pre_spike)
+                self._detached.append(synapse)
+        for neuron in self._pre_neurons.values():
+            neuron.on_spike(self._on_pre_spike)
+        self._attached = True
+
+    def detach(self):
+        """Restore per-object synapse callbacks."""
+        if not self._attached:
+            return
+        for neuron in self._pre_neurons.values():
+            neuron._spike_callbacks.remove(self._on_pre_spike)
+        for synapse in self._detached:
+            synapse.pre.on_spike(synapse._on_pre_spike)
+        self._detached = []
+        self._attached = False
+
+    def load_state(self, t: float):
+        """
+        Initialize solver arrays from the neuron objects at time t.
+
+        Args:
+            t: Current simulation time (ms)
+        """
+        for i, neuron in enumerate(self.neurons):
+            self.V[i] = neuron.state.V
+            self.ref_until[i] = t + max(neuron.state.refractory_remaining, 0.0)
+        self.t_last[:] = t
+        self.I_drive[:] = 0.0
+        self._predict(np.arange(len(self.neurons)), t)
+
+    # --- Dynamics ---
+
+    def _V_inf(self, idx) -> np.ndarray:
+        return self.V_rest[idx] + self.R_m[idx] * self.I_drive[idx]
+
+    def _advance(self, idx, t: float):
+        """Relax neurons ``idx`` analytically up to time t."""
+        start = np.maximum(self.t_last[idx], self.ref_until[idx])
+        elapsed = np.maximum(t - start, 0.0)
+        V_inf = self._V_inf(idx)
+        self.V[idx] = V_inf + (self.V[idx] - V_inf) * np.exp(-elapsed / self.tau_m[idx])
+        self.t_last[idx] = t
+
+    def _predict(self, idx: np.ndarray, t: float):
+        """Invalidate old predictions and schedule the next threshold crossings."""
+        self._version[idx] += 1
+
+        V_inf = self._V_inf(idx)
+        crossing = V_inf > self.theta[idx]
+        if not crossing.any():
+            return
+
+        idx = idx[crossing]
+        V_inf = V_inf[crossing]
+        start = np.maximum(t, self.ref_until[idx])
+        ratio = (self.V[idx] - V_inf) / (self.theta[idx] - V_inf)
+        t_cross = start + self.tau_m[idx] * np.log(np.maximum(ratio, 1.0))
+
+        for i, tc in zip(idx.tolist(), t_cross.tolist()):
+            self.queue.push(Event(
+                time=tc,
+                event_type=EventType.THRESHOLD,
+                target_id=self.neurons[i].id,
+                payload=int(self._version[i]),
+            ))
+
+    def _kick(self, idx: np.ndarray, dV: np.ndarray, t: float):
+        """
+        Apply voltage jumps at time t, firing neurons that reach threshold.
+
+        Neurons ``idx`` must already be advanced to t.
+        """
+        active = self.ref_until[idx] <= t
+        if not active.any():
+            return
+        idx, dV = idx[active], dV[active]
+        np.add.at(self.V, idx, dV)
+
+        idx = np.unique(idx)
+        spiking = self.V[idx] >= self.theta[idx]
+        for i in idx[spiking].tolist():
+            self._fire(i, t)
+        self._predict(idx[~spiking], t)
+
+    def _fire(self, i: int, t: float):
+        """Emit a spike from neuron i at time t."""
+        neuron = self.neurons[i]
+        self.V[i] = self.V_reset[i]
+        self.t_last[i] = t
+        self.ref_until[i] = t + self.t_ref[i]
+        self._fired.append(i)
+
+        neuron.state.V = self.V_reset[i]
+        neuron.state.spike_times.append(t)
+        for callback in neuron._spike_callbacks:
+            callback(neuron, t)
+
+        self._predict(np.array([i]), t)
+
+    def _on_pre_spike(self, neuron: "Neuron", spike_time: float):
+        """Schedule arrivals of a presynaptic spike on event-driven targets."""
+        for delay, channel in self._outgoing.get(neuron.id, ()):
+            self.queue.push(Event(
+                time=spike_time + delay,
+                event_type=EventType.SPIKE,
+                payload=channel,
+            ))
+
+    # --- Event processing ---
+
+    def run_until(self, t: float) -> int:
+        """
+        Process all queued events with time <= t.
+
+        Args:
+            t: Time up to which to process (ms)
+
+        Returns:
+            Number of events processed
+        """
+        count = 0
+        queue = self.queue
+        while queue and queue.peek().time <= t:
+            self._handle(queue.pop())
+            count += 1
+        self.n_events += count
+        return count
+
+    def _handle(self, event: Event):
+        """Dispatch one event."""
+        t = event.time
+        kind = event.event_type
+
+        if kind == EventType.THRESHOLD:
+            i = self.index[event.target_id]
+            if event.payload == self._version[i]:
+                self._advance(np.array([i]), t)
+                self._fire(i, t)
+
+        elif kind == EventType.SPIKE and event.payload >= 0:
+            post, coef, E_rev = self._channels[event.payload]
+            self._advance(post, t)
+            self._kick(post, coef * (self.V[post] - E_rev), t)
+
+        elif kind == EventType.INPUT:
+            weight = event.data.get("weight", 1.0)
+            i = self.index.get(event.target_id)
+            if i is not None:
+                # Same charge as receive_input(weight) for one step
+                dV = self.R_m[i] * weight / self.tau_m[i] * self.dt
+                idx = np.array([i])
+                self._advance(idx, t)
+                self._kick(idx, np.array([dV]), t)
+            else:
+                neuron = self.network.neurons.get(event.target_id)
+                if neuron:
+                    neuron.receive_input(weight)
+
+        elif kind in (EventType.STIMULUS_ON, EventType.STIMULUS_OFF):
+            if event.data.get("pattern") == "constant":
+                idx = np.array([
+                    self.index[nid] for nid in event.data.get("target_ids", [])
+                    if nid in self.index
+                ], dtype=np.int64)
+                if idx.size:
+                    self._advance(idx, t)
+                    amplitude = event.data.get("amplitude", 0.0)
+                    sign = 1.0 if kind == EventType.STIMULUS_ON else -1.0
+                    np.add.at(self.I_drive, idx, sign * amplitude)
+                    self._predict(idx, t)
+
+        event.execute(self.engine)
+
+    # --- Synchronization with neuron objects ---
+
+    def sync(self, idx: np.ndarray, t: float):
+        """Write the analytic state of neurons ``idx`` at time t to the objects."""
+        self._advance(idx, t)
+        for i in np.atleast_1d(idx).tolist():
+            state = self.neurons[i].state
+            state.V = float(self.V[i])
+            state.refractory_remaining = max(float(self.ref_until[i]) - t, 0.0)
+            state.t = t
+
+    def sync_all(self, t: float):
+        """Write the analytic state of all neurons at time t to the objects."""
+        self.sync(np.arange(len(self.neurons)), t)
+
+    def mark_fired(self):
+        """Set ``state.fired`` on neurons that spiked since the last call."""
+        for i in self._marked:
+            self.neurons[i].state.fired = False
+        for i in self._fired:
+            self.neurons[i].state.fired = True
+        self._marked, self._fired = self._fired, []
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize solver contents."""
+        return {
+            "neurons": len(self.neurons),
+            "synapses": len(self.synapses),
+            "channels": len(self._channels),
+            "events": self.n_events,
+        }
@@ -7,17 +7,22 @@ simulation. Events can include:
 - External input events
 - Recording triggers
 - Custom user events
+
+Bulk input (Poisson background, restored checkpoints) is queued as a
+typed record array (EVENT_DTYPE) instead of one Event object per input.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Callable, Union
+from typing import Optional, Dict, Any, List, Callable, Union, Sequence
 from enum import Enum
+import functools
 import heapq
+import numpy as np
 
 
 class EventType(Enum):
     """Types of simulation events."""
     SPIKE = "spike"                   # Neuron spike
+    THRESHOLD = "threshold"           # Predicted threshold crossing
     INPUT = "input"                   # External input
     STIMULUS_ON = "stimulus_on"       # Stimulus onset
     STIMULUS_OFF = "stimulus_off"     # Stimulus offset
@@ -26,29 +31,80 @@ class EventType(Enum):
     CUSTOM = "custom"                 # User-defined event
 
 
-@dataclass(order=True)
+# Record "type" codes index this tuple
+EVENT_TYPES = tuple(EventType)
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+
+#: Layout of events queued as records (see EventQueue.push_inputs)
+EVENT_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("type", np.uint8),      # Position in EVENT_TYPES
+    ("target", np.int32),    # Index into EventQueue.targets (-1 = none)
+    ("payload", np.int64),   # INPUT: index into EventQueue.values
+])
+
+
+@functools.total_ordering
 class Event:
     """
     A simulation event.
 
     Events are ordered by time for priority queue operations.
+    Slotted; the ``data`` dict is only allocated when first used, and
+    frequent internal events carry an integer ``payload`` instead
+    (e.g. the prediction version of a THRESHOLD event).
     """
-    time: float
-    event_type: EventType = field(compare=False)
-    target_id: Optional[str] = field(default=None, compare=False)
-    data: Dict[str, Any] = field(default_factory=dict, compare=False)
-    callback: Optional[Callable] = field(default=None, compare=False)
 
-    def __post_init__(self):
-        # Ensure data is always a dict
-        if self.data is None:
-            self.data = {}
+    __slots__ = ("time", "event_type", "target_id", "payload", "callback", "_data")
+
+    def __init__(
+        self,
+        time: float,
+        event_type: EventType,
+        target_id: Optional[str] = None,
+        data: Optional[Dict[str, Any]] = None,
+        callback: Optional[Callable] = None,
+        payload: int = -1,
+    ):
+        self.time = time
+        self.event_type = event_type
+        self.target_id = target_id
+        self.payload = payload
+        self.callback = callback
+        self._data = data
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Event data (created empty on first access)."""
+        if self._data is None:
+            self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[Dict[str, Any]]):
+        self._data = value
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.time == other.time
+
+    def __lt__(self, other: "Event") -> bool:
+        return self.time < other.time
+
+    __hash__ = None
 
     def execute(self, engine: "SimulationEngine" = None):
         """Execute event callback if present."""
         if self.callback:
             self.callback(self, engine)
 
+    def __repr__(self) -> str:
+        return (
+            f"Event(time={self.time}, event_type={self.event_type}, "
+            f"target_id={self.target_id!r}, payload={self.payload})"
+        )
+
 
 class EventQueue:
     """
@@ -57,17 +113,38 @@ class EventQueue:
     Maintains events sorted by time for efficient retrieval
     of the next event to process.
 
+    Event objects live in a heap. Bulk INPUT events are kept as a
+    time-sorted EVENT_DTYPE record array (24 bytes per event) whose
+    targets and weights index the ``targets`` and ``values`` tables;
+    pop()/peek()/pop_until() turn records into Event objects on the
+    way out, and pop_records() hands them over without doing so.
+
     Usage:
         >>> queue = EventQueue()
         >>> queue.push(Event(10.0, EventType.INPUT, data={"current": 5.0}))
         >>> queue.push(Event(5.0, EventType.SPIKE, target_id="neuron_1"))
         >>> event = queue.pop()  # Returns the 5.0 spike event
+        >>> queue.push_inputs(np.array([1.0, 2.0]), ["n0", "n1"], np.array([0, 1]), weight=0.5)
     """
 
+    # Consumed records are dropped once this many have accumulated
+    _compact_after = 4096
+
+    # Records converted to tuples per refill of the pop() cache
+    _cache_block = 256
+
     def __init__(self):
         """Initialize empty event queue."""
         self._heap: List[Event] = []
         self._event_count = 0
+        self._records = np.empty(0, dtype=EVENT_DTYPE)
+        self._head = 0              # Records before this were popped
+        self._cache: List[tuple] = []
+        self._cache_start = 0
+        self.targets: List[str] = []
+        self.values: List[float] = []
+        self._target_index: Dict[str, int] = {}
+        self._value_index: Dict[float, int] = {}
 
     def push(self, event: Event):
         """
@@ -79,6 +156,105 @@ class EventQueue:
         heapq.heappush(self._heap, event)
         self._event_count += 1
 
+    def intern_target(self, target_id: str) -> int:
+        """Index of ``target_id`` in ``targets`` (added if new)."""
+        index = self._target_index.get(target_id)
+        if index is None:
+            index = self._target_index[target_id] = len(self.targets)
+            self.targets.append(target_id)
+        return index
+
+    def intern_value(self, value: float) -> int:
+        """Index of ``value`` in ``values`` (added if new)."""
+        index = self._value_index.get(value)
+        if index is None:
+            index = self._value_index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def push_inputs(
+        self,
+        times: np.ndarray,
+        target_ids: Sequence[str],
+        targets: np.ndarray,
+        weight: Union[float, np.ndarray] = 1.0,
+    ):
+        """
+        Add INPUT events as records.
+
+        Args:
+            times: Event times (ms)
+            target_ids: Neuron IDs referred to by ``targets``
+            targets: Position in target_ids of each event's target
+            weight: Input weight, shared or one per event
+        """
+        times = np.asarray(times, dtype=np.float64)
+        if times.size == 0:
+            return
+        records = np.empty(times.size, dtype=EVENT_DTYPE)
+        records["time"] = times
+        records["type"] = _TYPE_CODES[EventType.INPUT]
+        index = np.array([self.intern_target(t) for t in target_ids], dtype=np.int32)
+        records["target"] = index[np.asarray(targets, dtype=np.int64)]
+        if np.ndim(weight) == 0:
+            records["payload"] = self.intern_value(float(weight))
+        else:
+            unique, inverse = np.unique(np.asarray(weight, dtype=np.float64), return_inverse=True)
+            codes = np.array([self.intern_value(w) for w in unique.tolist()], dtype=np.int64)
+            records["payload"] = codes[inverse.ravel()]
+        self.push_records(records)
+
+    def push_records(self, records: np.ndarray):
+        """
+        Merge EVENT_DTYPE records (targets and payloads already interned).
+
+        Args:
+            records: Records in any order
+        """
+        pending = self._records[self._head:]
+        merged = np.concatenate([pending, records]) if pending.size else records.copy()
+        self._records = merged[np.argsort(merged["time"], kind="stable")]
+        self._head = 0
+        self._cache = []
+        self._event_count += records.size
+
+    def _next_record(self) -> Optional[tuple]:
+        """Fields of the next record if it precedes the heap (heap wins ties)."""
+        if self._head >= len(self._records):
+            return None
+        i = self._head - self._cache_start
+        if not 0 <= i < len(self._cache):
+            # Fields of upcoming records as Python tuples, a block at a time
+            self._cache = self._records[self._head:self._head + self._cache_block].tolist()
+            self._cache_start, i = self._head, 0
+        fields = self._cache[i]
+        if self._heap and fields[0] >= self._heap[0].time:
+            return None
+        return fields
+
+    def _record_event(self, time: float, code: int, target: int, payload: int) -> Event:
+        """Event built from the fields of one record."""
+        event_type = EVENT_TYPES[code]
+        return Event(
+            time=time,
+            event_type=event_type,
+            target_id=self.targets[target] if target >= 0 else None,
+            data={"weight": self.values[payload]} if event_type == EventType.INPUT else None,
+            payload=payload,
+        )
+
+    def to_event(self, record) -> Event:
+        """Event equivalent to one EVENT_DTYPE record."""
+        return self._record_event(*record.item())
+
+    def _advance(self, n: int):
+        """Mark the next n records as consumed."""
+        self._head += n
+        if self._head >= self._compact_after and 2 * self._head >= len(self._records):
+            self._records = self._records[self._head:].copy()
+            self._head = 0
+            self._cache = []
+
     def pop(self) -> Optional[Event]:
         """
         Remove and return earliest event.
@@ -86,6 +262,10 @@ class EventQueue:
         Returns:
             Next event or None if queue is empty
         """
+        fields = self._next_record()
+        if fields is not None:
+            self._advance(1)
+            return self._record_event(*fields)
         if self._heap:
             return heapq.heappop(self._heap)
         return None
@@ -97,10 +277,31 @@ class EventQueue:
         Returns:
             Next event or None if queue is empty
         """
+        fields = self._next_record()
+        if fields is not None:
+            return self._record_event(*fields)
         if self._heap:
             return self._heap[0]
         return None
 
+    def pop_records(self, t: float) -> np.ndarray:
+        """
+        Pop all records up to and including time t.
+
+        Event objects in the heap are left in place (see pop_until).
+
+        Args:
+            t: Time threshold
+
+        Returns:
+            EVENT_DTYPE records with time <= t, sorted by time
+        """
+        times = self._records["time"]
+        end = int(np.searchsorted(times, t, side="right"))
+        records = self._records[self._head:max(end, self._head)].copy()
+        self._advance(records.size)
+        return records
+
     def pop_until(self, t: float) -> List[Event]:
         """
         Pop all events up to and including time t.
@@ -114,19 +315,32 @@ class EventQueue:
         events = []
         while self._heap and self._heap[0].time <= t:
             events.append(heapq.heappop(self._heap))
+        records = self.pop_records(t)
+        if records.size:
+            events.extend(self._record_event(*fields) for fields in records.tolist())
+            events.sort()
         return events
 
+    def events(self) -> List[Event]:
+        """All queued events, unordered and without removing them."""
+        return self._heap + [
+            self._record_event(*fields) for fields in self._records[self._head:].tolist()
+        ]
+
     def clear(self):
         """Clear all events."""
         self._heap = []
+        self._records = np.empty(0, dtype=EVENT_DTYPE)
+        self._head = 0
+        self._cache = []
 
     def __len__(self) -> int:
         """Number of events in queue."""
-        return len(self._heap)
+        return len(self._heap) + len(self._records) - self._head
 
     def __bool__(self) -> bool:
         """True if queue has events."""
-        return len(self._heap) > 0
+        return len(self) > 0
 
 
 class StimulusProtocol:
@@ -145,7 +359,8 @@ class StimulusProtocol:
         amplitude: float = 1.0,
         frequency: float = 0.0,      # For oscillating stimuli
         noise_std: float = 0.0,      # Noise level
-        pattern: str = "constant"    # constant, pulse, ramp, sine
+        pattern: str = "constant",   # constant, pulse, ramp, sine
+        rng: Optional[np.random.Generator] = None
     ):
         """
         Initialize stimulus protocol.
@@ -158,6 +373,8 @@ class StimulusProtocol:
             frequency: Oscillation frequency (Hz) for sine pattern
             noise_std: Standard deviation of noise
             pattern: Stimulus pattern type
+            rng: Noise generator (None = the generator passed to
+                get_current)
         """
         if isinstance(target_ids, str):
             target_ids = [target_ids]
@@ -169,19 +386,24 @@ class StimulusProtocol:
         self.frequency = frequency
         self.noise_std = noise_std
         self.pattern = pattern
+        self.rng = rng
+
+    @property
+    def is_constant(self) -> bool:
+        """True if the current is a noiseless step between onset and offset."""
+        return self.pattern == "constant" and self.noise_std == 0
 
-    def get_current(self, t: float) -> float:
+    def get_current(self, t: float, rng: Optional[np.random.Generator] = None) -> float:
         """
         Get stimulus current at time t.
 
         Args:
             t: Current time (ms)
+            rng: Noise generator used if the protocol has none of its own
 
         Returns:
             Current value (nA)
         """
-        import numpy as np
-
         # Check if within stimulus window
         if t < self.onset or t > self.onset + self.duration:
             return 0.0
@@ -209,7 +431,11 @@ class StimulusProtocol:
 
         # Add noise
         if self.noise_std > 0:
-            current += np.random.normal(0, self.noise_std)
+            if self.rng is not None:
+                rng = self.rng
+            elif rng is None:
+                rng = self.rng = np.random.default_rng()
+            current += self.noise_std * rng.standard_normal()
 
         return current
 
@@ -238,6 +464,8 @@ class StimulusProtocol:
             event_type=EventType.STIMULUS_OFF,
             data={
                 "target_ids": self.target_ids,
+                "amplitude": self.amplitude,
+                "pattern": self.pattern,
             }
         )
         queue.push(offset_event)
@@ -247,8 +475,9 @@ class PoissonInputGenerator:
     """
     Generates Poisson-distributed spike inputs.
 
-    Useful for simulating background synaptic input
-    or sensory input with variable rate.
+    All input events are created up front; for long-running
+    background input prefer the streaming PoissonSource
+    (engine/inputs.py).
     """
 
     def __init__(
@@ -257,7 +486,8 @@ class PoissonInputGenerator:
         rate: float = 10.0,          # Spikes per second per target
         weight: float = 0.5,         # Input weight
         start_time: float = 0.0,
-        end_time: float = 1000.0
+        end_time: float = 1000.0,
+        rng: Optional[np.random.Generator] = None
     ):
         """
         Initialize Poisson generator.
@@ -268,6 +498,8 @@ class PoissonInputGenerator:
             weight: Input weight (nA equivalent)
             start_time: When to start generating (ms)
             end_time: When to stop generating (ms)
+            rng: Random generator (None = the generator passed to
+                generate_events)
         """
         if isinstance(target_ids, str):
             target_ids = [target_ids]
@@ -277,30 +509,38 @@ class PoissonInputGenerator:
         self.weight = weight
         self.start_time = start_time
         self.end_time = end_time
+        self.rng = rng
 
-    def generate_events(self, queue: EventQueue):
+    def generate_events(self, queue: EventQueue, rng: Optional[np.random.Generator] = None):
         """
         Generate Poisson input events.
 
         Args:
             queue: Event queue to add events to
+            rng: Random generator used if the generator has none of its own
         """
-        import numpy as np
-
-        for target_id in self.target_ids:
+        if self.rng is not None:
+            rng = self.rng
+        elif rng is None:
+            rng = self.rng = np.random.default_rng()
+
+        # Inter-spike intervals are exponential; draw them in blocks
+        # sized to cover the window with high probability
+        mean_isi = 1000 / max(self.rate, 1e-6)
+        expected = max(self.end_time - self.start_time, 0.0) / mean_isi
+        block = int(expected + 4 * np.sqrt(expected + 1)) + 16
+
+        all_times, targets = [], []
+        for i in range(len(self.target_ids)):
             t = self.start_time
-
-            # Generate spike times using Poisson process
             while t < self.end_time:
-                # Inter-spike interval from exponential distribution
-                isi = np.random.exponential(1000 / max(self.rate, 1e-6))
-                t += isi
-
-                if t < self.end_time:
-                    event = Event(
-                        time=t,
-                        event_type=EventType.INPUT,
-                        target_id=target_id,
-                        data={"weight": self.weight}
-                    )
-                    queue.push(event)
+                times = t + np.cumsum(rng.exponential(mean_isi, block))
+                kept = times[times < self.end_time]
+                all_times.append(kept)
+                targets.append(np.full(kept.size, i))
+                t = float(times[-1])
+
+        if all_times:
+            queue.push_inputs(
+                np.concatenate(all_times), self.target_ids, np.concatenate(targets), self.weight,
+            )
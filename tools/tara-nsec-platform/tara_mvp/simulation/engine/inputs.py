@@ -0,0 +1,239 @@
+"""
+Streaming Input Sources
+
+Background input drawn step by step instead of precomputed as events:
+
+- PoissonSource: independent Poisson spike trains onto a population.
+  Each step draws the spike counts of all targets with one
+  ``Generator.poisson`` call and adds ``count * weight`` to their
+  synaptic input; with the population backend this is a single
+  scatter-add into the shared I_syn array.
+
+In event-driven modes, where input must arrive as events, a source
+schedules its INPUT events one window at a time (see schedule), so the
+queue holds at most two windows of background spikes.
+
+Precomputed event lists (StimulusProtocol, PoissonInputGenerator) are
+meant for explicitly timestamped stimuli.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Union
+import numpy as np
+
+from .events import EventQueue, Event, EventType
+
+
+class PoissonSource:
+    """
+    Poisson background input to a set of neurons, drawn per time step.
+
+    Usage:
+        >>> source = PoissonSource(list(network.neurons), rate=1000.0, weight=0.5)
+        >>> for step in range(n_steps):
+        ...     source.apply(network, network.state.t)
+        ...     network.step()
+    """
+
+    def __init__(
+        self,
+        target_ids: Union[str, List[str]],
+        rate: float = 10.0,          # Spikes per second per target
+        weight: float = 0.5,         # Input per spike
+        start_time: float = 0.0,
+        end_time: float = np.inf,
+        window: float = 10.0,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Initialize Poisson source.
+
+        Args:
+            target_ids: Neuron(s) to receive input
+            rate: Firing rate of each input train (Hz)
+            weight: Synaptic input per input spike (nA equivalent)
+            start_time: When to start (ms)
+            end_time: When to stop (ms)
+            window: Length of the event batches queued by schedule() (ms)
+            rng: Random generator (None = the generator passed to each
+                call, e.g. the network's in apply())
+        """
+        if isinstance(target_ids, str):
+            target_ids = [target_ids]
+
+        self.target_ids = list(target_ids)
+        self.rate = rate
+        self.weight = weight
+        self.start_time = start_time
+        self.end_time = end_time
+        self.window = window
+        self.rng = rng
+
+        # Targets resolved for the last (network, backend) pair
+        self._bound = None
+        self._neurons: List = []
+        self._positions = np.empty(0, dtype=np.int64)
+
+    @property
+    def n_targets(self) -> int:
+        """Number of target neurons."""
+        return len(self.target_ids)
+
+    def _generator(self, rng: Optional[np.random.Generator]) -> np.random.Generator:
+        """The source's own generator, else ``rng``, else a freshly seeded one."""
+        if self.rng is not None:
+            return self.rng
+        if rng is None:
+            rng = self.rng = np.random.default_rng()
+        return rng
+
+    def draw(self, dt: float, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Input spike counts of every target in one step.
+
+        Args:
+            dt: Step length (ms)
+            rng: Generator used if the source has none of its own
+
+        Returns:
+            Integer counts, one per target
+        """
+        return self._generator(rng).poisson(self.rate * dt / 1000.0, self.n_targets)
+
+    def _bind(self, network):
+        """Resolve targets to neuron objects and backend array positions."""
+        backend = network._backend
+        key = (id(network), id(backend), network.n_neurons)
+        if self._bound == key:
+            return
+
+        neurons = network.neurons
+        self._neurons = [neurons.get(nid) for nid in self.target_ids]
+        index = backend.index if backend is not None else {}
+        self._positions = np.array(
+            [index.get(nid, -1) for nid in self.target_ids], dtype=np.int64
+        )
+        self._bound = key
+
+    def apply(self, network, t: float):
+        """
+        Draw one step of input and inject it into the network.
+
+        Targets stepped by the population backend receive the input
+        directly in its I_syn array; other targets via receive_input().
+        Without a generator of its own the source draws from
+        ``network.rng``.
+
+        Args:
+            network: Network containing the targets
+            t: Current time (ms)
+        """
+        if not (self.start_time <= t < self.end_time):
+            return
+
+        counts = self.draw(network.params.dt, network.rng)
+        hit = np.flatnonzero(counts)
+        if hit.size == 0:
+            return
+
+        self._bind(network)
+        current = counts[hit] * self.weight
+        positions = self._positions[hit]
+        in_arrays = positions >= 0
+        if in_arrays.any():
+            np.add.at(network._backend.I_syn, positions[in_arrays], current[in_arrays])
+        for i, value in zip(hit[~in_arrays].tolist(), current[~in_arrays].tolist()):
+            neuron = self._neurons[i]
+            if neuron is not None:
+                neuron.receive_input(value)
+
+    def _draw_events(
+        self, start: float, end: float, rng: Optional[np.random.Generator]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Times and target positions of the input in ``[start, end)``, sorted by time."""
+        start = max(start, self.start_time)
+        end = min(end, self.end_time)
+        if end <= start:
+            return np.empty(0), np.empty(0, dtype=np.int64)
+
+        rng = self._generator(rng)
+        counts = rng.poisson(self.rate * (end - start) / 1000.0, self.n_targets)
+        targets = np.repeat(np.arange(self.n_targets), counts)
+        times = start + (end - start) * rng.random(targets.size)
+        order = np.argsort(times, kind="stable")
+        return times[order], targets[order]
+
+    def events(
+        self, start: float, end: float, rng: Optional[np.random.Generator] = None
+    ) -> List[Event]:
+        """
+        INPUT events of all targets in ``[start, end)``.
+
+        Args:
+            start: Window start (ms)
+            end: Window end (ms)
+            rng: Generator used if the source has none of its own
+
+        Returns:
+            Events sorted by time
+        """
+        times, targets = self._draw_events(start, end, rng)
+        return [
+            Event(
+                time=time,
+                event_type=EventType.INPUT,
+                target_id=self.target_ids[i],
+                data={"weight": self.weight},
+            )
+            for time, i in zip(times.tolist(), targets.tolist())
+        ]
+
+    def schedule(
+        self,
+        queue: EventQueue,
+        start: float,
+        end: float,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Stream the input into an event queue one window at a time.
+
+        The first window's INPUT events are queued now (as records, see
+        EventQueue.push_inputs); a CUSTOM event at the start of each
+        window queues the events of the next one, so the queue holds at
+        most two windows of input.
+
+        Args:
+            queue: Event queue to add events to
+            start: Start time (ms)
+            end: End time (ms)
+            rng: Generator used if the source has none of its own
+        """
+        start = max(start, self.start_time)
+        end = min(end, self.end_time)
+        if end <= start:
+            return
+
+        def fill(window_start: float):
+            window_end = min(window_start + self.window, end)
+            times, targets = self._draw_events(window_start, window_end, rng)
+            queue.push_inputs(times, self.target_ids, targets, self.weight)
+            if window_end < end:
+                queue.push(Event(
+                    time=window_start, event_type=EventType.CUSTOM,
+                    callback=lambda event, engine=None: fill(window_end),
+                ))
+
+        fill(start)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize source."""
+        return {
+            "n_targets": self.n_targets,
+            "rate": self.rate,
+            "weight": self.weight,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+        }
+
+    def __repr__(self) -> str:
+        return f"PoissonSource(targets={self.n_targets}, rate={self.rate}Hz, weight={self.weight})"
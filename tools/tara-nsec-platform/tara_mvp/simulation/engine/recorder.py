@@ -7,6 +7,11 @@ Handles recording of simulation data including:
 - Synaptic currents
 - Network activity metrics
 
+Sampled variables are stored column-wise in preallocated float32
+buffers and, when an output directory is configured, streamed to
+appendable .npy files in fixed-size chunks. Spike times are read from
+the network's SpikeStore rather than copied.
+
 Supports various output formats for analysis and visualization.
 """
 
@@ -15,6 +20,12 @@ from typing import Optional, Dict, Any, List, Set, Callable
 import numpy as np
 from enum import Enum
 import json
+import os
+import struct
+
+from ..neurons.spikes import SpikeStore, sort_by_neuron
+from . import analysis
+from .analysis import RateKernel
 
 
 class RecordingVariable(Enum):
@@ -55,27 +66,53 @@ class RecordingConfig:
     output_dir: Optional[str] = None
     output_format: str = "numpy"      # numpy, json, csv
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "variables": [v.value for v in self.variables],
+            "neuron_ids": None if self.neuron_ids is None else list(self.neuron_ids),
+            "synapse_ids": None if self.synapse_ids is None else list(self.synapse_ids),
+            "sample_every": self.sample_every,
+            "downsample_voltage": self.downsample_voltage,
+            "max_samples": self.max_samples,
+            "flush_interval": self.flush_interval,
+            "output_dir": None if self.output_dir is None else str(self.output_dir),
+            "output_format": self.output_format,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecordingConfig":
+        """Create config from to_dict output."""
+        data = dict(data)
+        data["variables"] = [RecordingVariable(v) for v in data["variables"]]
+        return cls(**data)
+
 
 @dataclass
 class RecordedData:
-    """Container for recorded simulation data."""
+    """
+    Container for recorded simulation data.
+
+    Sampled variables are columns of the recorder's column buffers
+    (memory-mapped when flushed to disk) and spike trains are arrays
+    built from the spike store; both are refreshed by Recorder.get_data().
+    """
 
     # Time vector
-    t: List[float] = field(default_factory=list)
+    t: np.ndarray = field(default_factory=lambda: np.empty(0))
 
     # Neuron data
-    voltages: Dict[str, List[float]] = field(default_factory=dict)
-    spike_times: Dict[str, List[float]] = field(default_factory=dict)
-    currents: Dict[str, List[float]] = field(default_factory=dict)
+    voltages: Dict[str, np.ndarray] = field(default_factory=dict)
+    spike_times: Dict[str, np.ndarray] = field(default_factory=dict)
+    currents: Dict[str, np.ndarray] = field(default_factory=dict)
     firing_rates: Dict[str, List[float]] = field(default_factory=dict)
 
     # Synapse data
-    conductances: Dict[str, List[float]] = field(default_factory=dict)
-    weights: Dict[str, List[float]] = field(default_factory=dict)
+    conductances: Dict[str, np.ndarray] = field(default_factory=dict)
+    weights: Dict[str, np.ndarray] = field(default_factory=dict)
 
     # Network-level metrics
     population_rates: Dict[str, List[float]] = field(default_factory=dict)
-    total_spikes: List[int] = field(default_factory=list)
+    total_spikes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
 
     # Metadata
     duration: float = 0.0
@@ -83,12 +120,130 @@ class RecordedData:
     n_steps: int = 0
 
 
+# Fixed .npy header size, so the header can be rewritten in place as rows are appended
+_NPY_HEADER_BYTES = 128
+
+
+def _write_npy_header(f, shape: tuple, dtype: np.dtype):
+    """Write a fixed-size .npy (v1.0) header at the start of ``f``."""
+    header = repr({
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": tuple(shape),
+    })
+    header = header.ljust(_NPY_HEADER_BYTES - 11) + "\n"
+    f.seek(0)
+    f.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1"))
+
+
+class ColumnBuffer:
+    """
+    Append-only array of fixed-width rows.
+
+    In memory the buffer is preallocated (``capacity`` rows) and grows
+    by doubling. With ``path`` set it holds one chunk of ``chunk_rows``
+    rows; full chunks are appended to a .npy file whose header is
+    updated on every flush, so memory stays constant and the file can
+    be memory-mapped at any time.
+
+    Usage:
+        >>> buf = ColumnBuffer((n_neurons,), path="out/voltages.npy")
+        >>> buf.append(V)
+        >>> traces = buf.array()   # (rows, n_neurons) memmap
+    """
+
+    def __init__(
+        self,
+        row_shape: tuple = (),
+        dtype=np.float32,
+        capacity: int = 1024,
+        chunk_rows: int = 10000,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize buffer.
+
+        Args:
+            row_shape: Shape of one row (``()`` for scalars)
+            dtype: Element type
+            capacity: Initial in-memory rows (ignored when ``path`` is set)
+            chunk_rows: Rows per flushed chunk (disk mode)
+            path: .npy file to append chunks to (None = keep in memory)
+        """
+        self.row_shape = tuple(row_shape)
+        self.dtype = np.dtype(dtype)
+        self.path = path
+        rows = chunk_rows if path else capacity
+        self._buffer = np.empty((max(rows, 1),) + self.row_shape, dtype=self.dtype)
+        self._n_buffered = 0
+        self._n_flushed = 0
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def __len__(self) -> int:
+        return self._n_flushed + self._n_buffered
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in memory."""
+        return self._buffer.nbytes
+
+    def append(self, row):
+        """Append one row."""
+        if self._n_buffered == len(self._buffer):
+            if self.path:
+                self.flush()
+            else:
+                grown = np.empty((2 * len(self._buffer),) + self.row_shape, dtype=self.dtype)
+                grown[:self._n_buffered] = self._buffer
+                self._buffer = grown
+        self._buffer[self._n_buffered] = row
+        self._n_buffered += 1
+
+    def flush(self):
+        """Append buffered rows to the file (disk mode only)."""
+        if not self.path or self._n_buffered == 0:
+            return
+        mode = "r+b" if os.path.exists(self.path) else "w+b"
+        with open(self.path, mode) as f:
+            f.seek(_NPY_HEADER_BYTES + self._n_flushed * self._row_nbytes)
+            f.write(self._buffer[:self._n_buffered].tobytes())
+            self._n_flushed += self._n_buffered
+            self._n_buffered = 0
+            _write_npy_header(f, (self._n_flushed,) + self.row_shape, self.dtype)
+
+    @property
+    def _row_nbytes(self) -> int:
+        return self._buffer[0].nbytes
+
+    def array(self) -> np.ndarray:
+        """
+        All rows as one array.
+
+        Returns a read-only memmap in disk mode (flushing first) and a
+        view of the in-memory buffer otherwise.
+        """
+        if not self.path:
+            return self._buffer[:self._n_buffered]
+        self.flush()
+        if self._n_flushed == 0:
+            return np.empty((0,) + self.row_shape, dtype=self.dtype)
+        return np.load(self.path, mmap_mode="r")
+
+
 class Recorder:
     """
     Records simulation data for analysis.
 
-    Handles efficient storage of neural data and provides
-    methods for accessing and exporting recorded data.
+    Sampled variables are stored column-wise: one float32 row per
+    sample with one column per recorded neuron (or synapse), filled by
+    a single vectorized gather per step. When ``output_dir`` is set,
+    rows are flushed to appendable .npy files every ``flush_interval``
+    samples, so memory use stays constant however long the run is.
+
+    Spikes are not copied: the recorder remembers where the network's
+    SpikeStore stood when recording started and reads every spike
+    appended since then (including spikes between samples).
 
     Usage:
         >>> recorder = Recorder(config)
@@ -116,15 +271,32 @@ class Recorder:
         self._record_neurons: Set[str] = set()
         self._record_synapses: Set[str] = set()
 
+        # Column order of the buffers
+        self.neuron_ids: List[str] = []
+        self.synapse_ids: List[str] = []
+        self._neurons: List[Any] = []
+        self._synapses: List[Any] = []
+        self._buffers: Dict[str, ColumnBuffer] = {}
+        self._capacity = 1024
+
+        # Vectorized gather from the population backend (rebuilt if it changes)
+        self._backend = None
+        self._backend_idx: Optional[np.ndarray] = None
+
+        # Spikes recorded = store entries from _spike_start on
+        self._spikes = SpikeStore()
+        self._spike_start = 0
+
         # Callbacks for custom recording
         self._callbacks: List[Callable] = []
 
-    def setup(self, network):
+    def setup(self, network, n_steps: Optional[int] = None):
         """
         Configure recorder for a network.
 
         Args:
             network: Network to record from
+            n_steps: Expected number of steps (preallocates in-memory buffers)
         """
         # Determine which neurons to record
         if self.config.neuron_ids is None:
@@ -133,17 +305,6 @@ class Recorder:
         else:
             self._record_neurons = set(self.config.neuron_ids)
 
-        # Initialize data structures
-        for nid in self._record_neurons:
-            if RecordingVariable.VOLTAGE in self.config.variables:
-                self.data.voltages[nid] = []
-            if RecordingVariable.SPIKE_TIMES in self.config.variables:
-                self.data.spike_times[nid] = []
-            if RecordingVariable.CURRENT in self.config.variables:
-                self.data.currents[nid] = []
-            if RecordingVariable.FIRING_RATE in self.config.variables:
-                self.data.firing_rates[nid] = []
-
         # Setup synapse recording if specified
         if self.config.synapse_ids is not None:
             if len(self.config.synapse_ids) == 0:
@@ -152,11 +313,77 @@ class Recorder:
             else:
                 self._record_synapses = set(self.config.synapse_ids)
 
-            for sid in self._record_synapses:
-                if RecordingVariable.CONDUCTANCE in self.config.variables:
-                    self.data.conductances[sid] = []
-                if RecordingVariable.WEIGHT in self.config.variables:
-                    self.data.weights[sid] = []
+        # Columns follow network order
+        self._neurons = [n for n in network if n.id in self._record_neurons]
+        self.neuron_ids = [n.id for n in self._neurons]
+        self._synapses = [
+            s for s in network.synapses if s.id in self._record_synapses
+        ] if self._record_synapses else []
+        self.synapse_ids = [s.id for s in self._synapses]
+        self._backend = None
+
+        self._spikes = network.state.spikes
+        for nid in self.neuron_ids:
+            self._spikes.register(nid)
+        self._spike_start = len(self._spikes)
+
+        if n_steps is not None:
+            self._capacity = n_steps // self.config.sample_every + 1
+
+        if self.config.output_dir:
+            os.makedirs(self.config.output_dir, exist_ok=True)
+            with open(os.path.join(self.config.output_dir, "columns.json"), "w") as f:
+                json.dump({"neurons": self.neuron_ids, "synapses": self.synapse_ids}, f)
+
+        self._init_buffers()
+
+    def _init_buffers(self):
+        """Create column buffers."""
+        variables = self.config.variables
+        n, m = len(self.neuron_ids), len(self.synapse_ids)
+
+        self._buffers = {"t": self._buffer("t", (), np.float64)}
+        self._buffers["total_spikes"] = self._buffer("total_spikes", (), np.int32)
+        if RecordingVariable.VOLTAGE in variables:
+            self._buffers["voltages"] = self._buffer("voltages", (n,))
+        if RecordingVariable.CURRENT in variables:
+            self._buffers["currents"] = self._buffer("currents", (n,))
+        if m and RecordingVariable.CONDUCTANCE in variables:
+            self._buffers["conductances"] = self._buffer("conductances", (m,))
+        if m and RecordingVariable.WEIGHT in variables:
+            self._buffers["weights"] = self._buffer("weights", (m,))
+
+    def _buffer(self, name: str, row_shape: tuple, dtype=np.float32) -> ColumnBuffer:
+        path = None
+        if self.config.output_dir:
+            path = os.path.join(self.config.output_dir, f"{name}.npy")
+        return ColumnBuffer(
+            row_shape, dtype,
+            capacity=self._capacity,
+            chunk_rows=self.config.flush_interval,
+            path=path,
+        )
+
+    def _gather(self, network) -> tuple:
+        """Gather (V, fired) of the recorded neurons in column order."""
+        backend = getattr(network, "_backend", None)
+        if backend is not None and backend is not self._backend:
+            self._backend = backend
+            index = backend.index
+            if all(nid in index for nid in self.neuron_ids):
+                self._backend_idx = np.array([index[nid] for nid in self.neuron_ids], dtype=np.intp)
+            else:
+                self._backend_idx = None
+        if backend is None:
+            self._backend = None
+
+        if self._backend is not None and self._backend_idx is not None:
+            return backend.V[self._backend_idx], backend.fired[self._backend_idx]
+
+        count = len(self._neurons)
+        V = np.fromiter((n.state.V for n in self._neurons), dtype=np.float64, count=count)
+        fired = np.fromiter((n.state.fired for n in self._neurons), dtype=bool, count=count)
+        return V, fired
 
     def record_step(self, t: float, network):
         """
@@ -172,43 +399,29 @@ class Recorder:
         if self._step_count % self.config.sample_every != 0:
             return
 
-        # Record time
-        self.data.t.append(t)
-
-        # Record neuron data
-        for nid in self._record_neurons:
-            neuron = network.neurons.get(nid)
-            if neuron is None:
-                continue
+        buffers = self._buffers
+        V, fired = self._gather(network)
 
-            if RecordingVariable.VOLTAGE in self.config.variables:
-                self.data.voltages[nid].append(neuron.state.V)
+        buffers["t"].append(t)
+        if "voltages" in buffers:
+            buffers["voltages"].append(V)
+        if "currents" in buffers:
+            buffers["currents"].append(np.fromiter(
+                (getattr(n.state, "I_total", n.state.I_syn + n.state.I_ext) for n in self._neurons),
+                dtype=np.float64, count=len(self._neurons),
+            ))
 
-            if RecordingVariable.SPIKE_TIMES in self.config.variables:
-                # Check for new spikes
-                if neuron.state.fired:
-                    self.data.spike_times[nid].append(t)
-
-            if RecordingVariable.CURRENT in self.config.variables:
-                self.data.currents[nid].append(neuron.state.I_total)
+        buffers["total_spikes"].append(np.count_nonzero(fired))
 
         # Record synapse data
-        for synapse in network.synapses:
-            if synapse.id not in self._record_synapses:
-                continue
-
-            if RecordingVariable.CONDUCTANCE in self.config.variables:
-                self.data.conductances[synapse.id].append(synapse.state.g)
-
-            if RecordingVariable.WEIGHT in self.config.variables:
-                self.data.weights[synapse.id].append(synapse.weight)
-
-        # Record network-level metrics
-        total_spikes = sum(
-            1 for nid in self._record_neurons
-            if network.neurons.get(nid) and network.neurons[nid].state.fired
-        )
-        self.data.total_spikes.append(total_spikes)
+        if "conductances" in buffers:
+            buffers["conductances"].append(np.fromiter(
+                (s.state.g for s in self._synapses), dtype=np.float64, count=len(self._synapses)
+            ))
+        if "weights" in buffers:
+            buffers["weights"].append(np.fromiter(
+                (s.weight for s in self._synapses), dtype=np.float64, count=len(self._synapses)
+            ))
 
         # Run custom callbacks
         for callback in self._callbacks:
@@ -222,14 +435,15 @@ class Recorder:
         """
         Record a spike event directly.
 
+        The spike is appended to the spike store, so after setup() it
+        also shows up in the neuron's ``state.spike_times``.
+
         Args:
             neuron_id: ID of spiking neuron
             spike_time: Time of spike
         """
         if neuron_id in self._record_neurons:
-            if neuron_id not in self.data.spike_times:
-                self.data.spike_times[neuron_id] = []
-            self.data.spike_times[neuron_id].append(spike_time)
+            self._spikes.append(self._spikes.register(neuron_id), spike_time)
 
     def add_callback(self, callback: Callable):
         """
@@ -243,45 +457,111 @@ class Recorder:
     def _maybe_flush(self):
         """Flush data to disk if configured."""
         if self.config.output_dir:
-            # TODO: Implement incremental flushing
-            pass
+            self.flush()
         self._last_flush = self._step_count
 
+    def flush(self):
+        """Write all buffered rows to disk (no-op without output_dir)."""
+        for buffer in self._buffers.values():
+            buffer.flush()
+
+    @property
+    def n_samples(self) -> int:
+        """Number of recorded samples."""
+        return len(self._buffers["t"]) if self._buffers else 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the column buffers."""
+        return sum(b.nbytes for b in self._buffers.values())
+
+    def _columns(self, name: str, ids: List[str]) -> Dict[str, np.ndarray]:
+        """Split a (samples, n) buffer into per-ID column views."""
+        if name not in self._buffers:
+            return {}
+        matrix = self._buffers[name].array()
+        return {key: matrix[:, i] for i, key in enumerate(ids)}
+
     def get_data(self) -> RecordedData:
-        """Get recorded data."""
+        """Get recorded data (array fields are views of the column buffers)."""
+        if self._buffers:
+            self.data.t = self._buffers["t"].array()
+            self.data.total_spikes = self._buffers["total_spikes"].array()
+            self.data.voltages = self._columns("voltages", self.neuron_ids)
+            self.data.currents = self._columns("currents", self.neuron_ids)
+            self.data.conductances = self._columns("conductances", self.synapse_ids)
+            self.data.weights = self._columns("weights", self.synapse_ids)
+        if RecordingVariable.SPIKE_TIMES in self.config.variables:
+            self.data.spike_times = self.get_spike_trains()
         return self.data
 
+    def get_voltage_matrix(self) -> np.ndarray:
+        """
+        Get voltages as a (samples, neurons) float32 array.
+
+        Columns follow ``neuron_ids``; memory-mapped when output_dir is set.
+        """
+        if "voltages" not in self._buffers:
+            return np.empty((0, len(self.neuron_ids)), dtype=np.float32)
+        return self._buffers["voltages"].array()
+
+    def samples_since(self, start: int) -> tuple:
+        """
+        Samples recorded at or after sample ``start`` (copies).
+
+        Returns:
+            Tuple of (t, voltages), voltages (samples, neurons) with
+            columns following ``neuron_ids`` (no columns if voltages
+            are not recorded)
+        """
+        if not self._buffers:
+            return np.empty(0), np.empty((0, 0), dtype=np.float32)
+        t = np.array(self._buffers["t"].array()[start:])
+        if "voltages" not in self._buffers:
+            return t, np.empty((len(t), 0), dtype=np.float32)
+        return t, np.array(self._buffers["voltages"].array()[start:])
+
     def get_voltage_traces(self) -> Dict[str, np.ndarray]:
-        """Get voltage traces as numpy arrays."""
-        return {
-            nid: np.array(v) for nid, v in self.data.voltages.items()
-        }
+        """Get voltage traces as column views (memory-mapped when on disk)."""
+        return self._columns("voltages", self.neuron_ids)
+
+    def _recorded_spikes(self) -> tuple:
+        """
+        Recorded spikes with neuron indices mapped to recorder columns.
+
+        Returns:
+            Tuple of (spike_times, column_indices), spikes of neurons
+            outside ``neuron_ids`` dropped
+        """
+        times, neurons = self._spikes.since(self._spike_start)
+        column = np.full(self._spikes.n_neurons, -1, dtype=np.int32)
+        for i, nid in enumerate(self.neuron_ids):
+            column[self._spikes.register(nid)] = i
+        columns = column[neurons]
+        keep = columns >= 0
+        return times[keep], columns[keep]
 
     def get_spike_trains(self) -> Dict[str, np.ndarray]:
         """Get spike trains as numpy arrays."""
+        times, columns = self._recorded_spikes()
+        offsets, sorted_times = sort_by_neuron(
+            times, columns, len(self.neuron_ids), self._spikes.time_sorted
+        )
         return {
-            nid: np.array(times) for nid, times in self.data.spike_times.items()
+            nid: sorted_times[offsets[i]:offsets[i + 1]]
+            for i, nid in enumerate(self.neuron_ids)
         }
 
     def get_raster_data(self) -> tuple:
         """
         Get data for raster plot.
 
+        Neuron indices follow ``neuron_ids``.
+
         Returns:
             Tuple of (spike_times, neuron_indices)
         """
-        times = []
-        indices = []
-        neuron_ids = list(self._record_neurons)
-        id_to_idx = {nid: i for i, nid in enumerate(neuron_ids)}
-
-        for nid, spike_times in self.data.spike_times.items():
-            idx = id_to_idx.get(nid, -1)
-            for t in spike_times:
-                times.append(t)
-                indices.append(idx)
-
-        return np.array(times), np.array(indices)
+        return self._recorded_spikes()
 
     def compute_firing_rates(
         self,
@@ -298,27 +578,94 @@ class Recorder:
         Returns:
             Dictionary mapping neuron IDs to rate arrays
         """
-        if not self.data.t:
+        if self.n_samples == 0:
             return {}
 
-        t_max = max(self.data.t)
-        t_centers = np.arange(window / 2, t_max - window / 2, step)
-        rates = {}
+        t_max = float(self._buffers["t"].array().max())
+        times, columns = self._recorded_spikes()
+        _, rates = analysis.sliding_window_rates(
+            times, columns, len(self.neuron_ids), t_max,
+            window, step, self._spikes.time_sorted,
+        )
+
+        return {nid: rates[i] for i, nid in enumerate(self.neuron_ids)}
 
-        for nid, spikes in self.data.spike_times.items():
-            spikes = np.array(spikes)
-            neuron_rates = []
+    def get_binned_spikes(self, bin_size: float = 10.0) -> tuple:
+        """
+        Bin recorded spikes into a (neurons, bins) count matrix.
 
-            for t_center in t_centers:
-                t_start = t_center - window / 2
-                t_end = t_center + window / 2
-                n_spikes = np.sum((spikes >= t_start) & (spikes < t_end))
-                rate = n_spikes / (window / 1000)  # Convert to Hz
-                neuron_rates.append(rate)
+        Rows follow ``neuron_ids``; bins cover ``[0, t_max)``.
 
-            rates[nid] = np.array(neuron_rates)
+        Args:
+            bin_size: Bin width (ms)
 
-        return rates
+        Returns:
+            Tuple of (bin_edges, counts)
+        """
+        t_max = float(self._buffers["t"].array().max()) if self.n_samples else 0.0
+        times, columns = self._recorded_spikes()
+        return analysis.bin_spikes(
+            times, columns, len(self.neuron_ids), bin_size, t_stop=t_max
+        )
+
+    def compute_smoothed_rates(
+        self,
+        kernel: RateKernel = RateKernel.GAUSSIAN,
+        width: float = 10.0,
+        bin_size: float = 1.0,
+    ) -> tuple:
+        """
+        Compute kernel-smoothed firing rates of all recorded neurons.
+
+        Args:
+            kernel: Smoothing kernel (box, gaussian or exponential)
+            width: Box width, Gaussian sigma or exponential tau (ms)
+            bin_size: Bin width (ms)
+
+        Returns:
+            Tuple of (bin_centers, rates) with rates (neurons, bins) in Hz
+        """
+        edges, counts = self.get_binned_spikes(bin_size)
+        rates = analysis.smoothed_rates(counts, bin_size, kernel, width)
+        return (edges[:-1] + edges[1:]) / 2, rates
+
+    def compute_fano_factors(self, bin_size: float = 100.0) -> Dict[str, float]:
+        """
+        Compute spike-count Fano factors (NaN for silent neurons).
+
+        Args:
+            bin_size: Counting window (ms)
+
+        Returns:
+            Dictionary mapping neuron IDs to Fano factors
+        """
+        _, counts = self.get_binned_spikes(bin_size)
+        fano = analysis.fano_factor(counts)
+        return {nid: float(fano[i]) for i, nid in enumerate(self.neuron_ids)}
+
+    def compute_isi_cv(self) -> Dict[str, float]:
+        """
+        Compute the coefficient of variation of inter-spike intervals.
+
+        Returns:
+            Dictionary mapping neuron IDs to ISI CVs (NaN below 3 spikes)
+        """
+        times, columns = self._recorded_spikes()
+        cv = analysis.isi_cv(times, columns, len(self.neuron_ids), self._spikes.time_sorted)
+        return {nid: float(cv[i]) for i, nid in enumerate(self.neuron_ids)}
+
+    def compute_count_correlations(self, bin_size: float = 10.0) -> np.ndarray:
+        """
+        Compute pairwise spike-count correlations.
+
+        Args:
+            bin_size: Counting window (ms)
+
+        Returns:
+            (neurons, neurons) correlation matrix ordered like ``neuron_ids``
+        """
+        _, counts = self.get_binned_spikes(bin_size)
+        return analysis.count_correlations(counts)
 
     def compute_population_rate(
         self,
@@ -335,23 +682,25 @@ class Recorder:
         Returns:
             Tuple of (time_centers, population_rate)
         """
-        if not self.data.t:
+        if self.n_samples == 0:
             return np.array([]), np.array([])
 
-        ids = neuron_ids or list(self._record_neurons)
-        t_max = max(self.data.t)
+        ids = neuron_ids or self.neuron_ids
+        t_max = float(self._buffers["t"].array().max())
         n_bins = int(t_max / window)
 
-        # Collect all spikes
-        all_spikes = []
-        for nid in ids:
-            if nid in self.data.spike_times:
-                all_spikes.extend(self.data.spike_times[nid])
+        # Select spikes of the requested neurons
+        times, columns = self._recorded_spikes()
+        if neuron_ids is not None:
+            selected = np.zeros(len(self.neuron_ids), dtype=bool)
+            column = {nid: i for i, nid in enumerate(self.neuron_ids)}
+            selected[[column[nid] for nid in ids if nid in column]] = True
+            times = times[selected[columns]]
 
-        if not all_spikes:
+        if times.size == 0:
             return np.arange(0, t_max, window), np.zeros(n_bins)
 
-        all_spikes = np.array(all_spikes)
+        all_spikes = times
 
         # Bin spikes
         hist, bin_edges = np.histogram(all_spikes, bins=n_bins, range=(0, t_max))
@@ -364,12 +713,13 @@ class Recorder:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert recorded data to dictionary."""
+        data = self.get_data()
         return {
-            "t": list(self.data.t),
-            "voltages": {k: list(v) for k, v in self.data.voltages.items()},
-            "spike_times": {k: list(v) for k, v in self.data.spike_times.items()},
-            "currents": {k: list(v) for k, v in self.data.currents.items()},
-            "total_spikes": list(self.data.total_spikes),
+            "t": data.t.tolist(),
+            "voltages": {k: v.tolist() for k, v in data.voltages.items()},
+            "spike_times": {k: np.asarray(v).tolist() for k, v in data.spike_times.items()},
+            "currents": {k: v.tolist() for k, v in data.currents.items()},
+            "total_spikes": data.total_spikes.tolist(),
             "metadata": {
                 "duration": self.data.duration,
                 "dt": self.data.dt,
@@ -397,20 +747,21 @@ class Recorder:
 
     def _save_numpy(self, filename: str):
         """Save data as numpy archive."""
+        data = self.get_data()
         save_dict = {
-            "t": np.array(self.data.t),
-            "total_spikes": np.array(self.data.total_spikes),
+            "t": np.asarray(data.t),
+            "total_spikes": np.asarray(data.total_spikes),
         }
 
         # Add voltage traces
-        for nid, v in self.data.voltages.items():
-            save_dict[f"V_{nid}"] = np.array(v)
+        for nid, v in data.voltages.items():
+            save_dict[f"V_{nid}"] = np.asarray(v)
 
         # Add spike times (as object array)
-        spike_ids = list(self.data.spike_times.keys())
+        spike_ids = list(data.spike_times.keys())
         save_dict["spike_neuron_ids"] = np.array(spike_ids, dtype=object)
-        for nid, times in self.data.spike_times.items():
-            save_dict[f"spikes_{nid}"] = np.array(times)
+        for nid, times in data.spike_times.items():
+            save_dict[f"spikes_{nid}"] = np.asarray(times)
 
         np.savez(f"{filename}.npz", **save_dict)
 
@@ -422,20 +773,17 @@ class Recorder:
 
     def _save_csv(self, filename: str):
         """Save voltage traces as CSV."""
-        if not self.data.voltages:
+        if "voltages" not in self._buffers or not self.neuron_ids:
             return
 
         # Create header
-        neuron_ids = list(self.data.voltages.keys())
+        neuron_ids = self.neuron_ids
         header = "t," + ",".join(neuron_ids)
 
         # Create data matrix
-        n_samples = len(self.data.t)
-        data_matrix = np.zeros((n_samples, len(neuron_ids) + 1))
-        data_matrix[:, 0] = self.data.t
-
-        for i, nid in enumerate(neuron_ids):
-            data_matrix[:, i + 1] = self.data.voltages[nid]
+        data_matrix = np.column_stack([
+            self._buffers["t"].array(), self.get_voltage_matrix()
+        ])
 
         np.savetxt(
             f"{filename}_voltages.csv",
@@ -450,10 +798,8 @@ class Recorder:
         self.data = RecordedData()
         self._step_count = 0
         self._last_flush = 0
+        self._backend = None
+        self._spike_start = len(self._spikes)
 
         # Re-initialize data structures
-        for nid in self._record_neurons:
-            if RecordingVariable.VOLTAGE in self.config.variables:
-                self.data.voltages[nid] = []
-            if RecordingVariable.SPIKE_TIMES in self.config.variables:
-                self.data.spike_times[nid] = []
+        self._init_buffers()
@@ -6,23 +6,39 @@ Coordinates the simulation of neural networks with:
 - External input handling
 - Progress reporting
 - Data recording
+- Incremental runs (iter_run / arun yield results chunk by chunk)
+- Checkpoints (see checkpoint.py)
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Callable, Union
+from typing import Optional, Dict, Any, List, Callable, Union, Iterator, Tuple
 import numpy as np
 from enum import Enum
+import asyncio
+import inspect
+import threading
 import time
 
-from .events import EventQueue, Event, EventType, StimulusProtocol, PoissonInputGenerator
+from .checkpoint import (
+    save_checkpoint, load_checkpoint, restore_network,
+    generator_state, generator_from_state, PathLike,
+)
+from .events import (
+    EventQueue, Event, EventType, StimulusProtocol, PoissonInputGenerator, EVENT_TYPES,
+)
+from .inputs import PoissonSource
 from .recorder import Recorder, RecordingConfig
+from .event_driven import EventDrivenSolver, find_event_driven_neurons
+
+# Record type code of INPUT events (see EVENT_DTYPE)
+_INPUT_CODE = EVENT_TYPES.index(EventType.INPUT)
 
 
 class SimulationMode(Enum):
     """Simulation modes."""
     TIME_STEPPED = "time_stepped"     # Fixed time step
-    EVENT_DRIVEN = "event_driven"     # Event-driven (not yet implemented)
-    HYBRID = "hybrid"                 # Combination of both
+    EVENT_DRIVEN = "event_driven"     # Analytic LIF updates between events
+    HYBRID = "hybrid"                 # Event-driven LIF, stepped everything else
 
 
 @dataclass
@@ -45,7 +61,7 @@ class SimulationConfig:
     report_interval: float = 100.0    # Progress report every N ms
     verbose: bool = True
 
-    # Random seed
+    # Random seed (replaces the network's generator when set)
     seed: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Any]:
@@ -55,9 +71,23 @@ class SimulationConfig:
             "warmup": self.warmup,
             "mode": self.mode.value,
             "record": self.record,
+            "recording_config": (
+                None if self.recording_config is None else self.recording_config.to_dict()
+            ),
+            "report_interval": self.report_interval,
+            "verbose": self.verbose,
             "seed": self.seed,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SimulationConfig":
+        """Create config from to_dict output."""
+        data = dict(data)
+        data["mode"] = SimulationMode(data["mode"])
+        if data.get("recording_config") is not None:
+            data["recording_config"] = RecordingConfig.from_dict(data["recording_config"])
+        return cls(**data)
+
 
 @dataclass
 class SimulationResult:
@@ -80,13 +110,76 @@ class SimulationResult:
     # Recorded data (if recording enabled)
     t: np.ndarray = None
     voltages: Dict[str, np.ndarray] = None
-    spike_times: Dict[str, List[float]] = None
+    spike_times: Dict[str, np.ndarray] = None
     spike_counts: Dict[str, int] = None
 
     # Additional metrics
     metrics: Dict[str, Any] = None
 
 
+@dataclass
+class StepWindow:
+    """The steps since a hook's previous call (see SimulationEngine.on_steps)."""
+
+    network: Any                      # Simulated network
+    step: int                         # Steps completed in the run
+    t: np.ndarray                     # Engine time of each step in the window (ms)
+
+    # Spikes emitted during the window (views valid until the next step)
+    spike_times: np.ndarray = field(default_factory=lambda: np.empty(0))
+    spike_neurons: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+
+    @property
+    def n_steps(self) -> int:
+        """Number of steps in the window."""
+        return len(self.t)
+
+    @property
+    def V(self) -> np.ndarray:
+        """Membrane potentials after the last step, in network order (gathered on access)."""
+        return self.network.get_voltages()
+
+
+@dataclass
+class _StepHook:
+    """Strided step callback registered with SimulationEngine.on_steps."""
+    callback: Callable[[StepWindow], None]
+    every: int
+    countdown: int = 0        # Steps until the next call
+    step: int = 0             # First step of the current window
+    position: int = 0         # Spike store length at the window start
+
+
+@dataclass
+class SimulationChunk:
+    """Activity of one chunk of an incremental run (see SimulationEngine.iter_run)."""
+
+    # Position in the run
+    t_start: float                    # Engine time of the chunk's first step (ms)
+    t_end: float                      # Engine time after its last step (ms)
+    step: int                         # Steps completed so far
+    n_steps: int                      # Steps in the whole run
+
+    # Spikes emitted during the chunk
+    spike_times: np.ndarray = field(default_factory=lambda: np.empty(0))
+    spike_neurons: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    population_rate: float = 0.0      # Mean firing rate over the chunk (Hz)
+
+    # Samples recorded during the chunk (empty without recorder or during warmup)
+    t: np.ndarray = field(default_factory=lambda: np.empty(0))
+    voltages: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the run completed."""
+        return self.step / max(self.n_steps, 1)
+
+    @property
+    def n_spikes(self) -> int:
+        """Number of spikes in the chunk."""
+        return len(self.spike_times)
+
+
 class SimulationEngine:
     """
     Main simulation engine for NeuroSim.
@@ -114,6 +207,14 @@ class SimulationEngine:
 
         >>> # Analyze results
         >>> print(f"Total spikes: {result.total_spikes}")
+
+        >>> # Stream results while the run progresses
+        >>> for chunk in engine.iter_run(chunk_ms=50):
+        ...     print(f"{chunk.t_end:.0f}ms: {chunk.population_rate:.1f} Hz")
+
+        >>> # Save mid-run, continue later in a rebuilt network
+        >>> engine.checkpoint("run.npz")
+        >>> engine = SimulationEngine.restore("run.npz", LayeredNetwork.create_simple(n_layers=3))
     """
 
     def __init__(
@@ -131,36 +232,49 @@ class SimulationEngine:
         self.network = network
         self.config = config or SimulationConfig()
 
-        # Set random seed
+        # Reseed the network's generator (noise, input and stimuli draw from it)
         if self.config.seed is not None:
-            np.random.seed(self.config.seed)
+            self.network.set_rng(np.random.default_rng(self.config.seed))
 
         # Synchronize dt between network and config
         self.network.params.dt = self.config.dt
 
         # Initialize event queue
         self.event_queue = EventQueue()
+        self._n_steps = int(self.config.duration / self.config.dt)
 
         # Initialize recorder
         if self.config.record:
             rec_config = self.config.recording_config or RecordingConfig()
             self.recorder = Recorder(rec_config)
-            self.recorder.setup(network)
+            self.recorder.setup(network, n_steps=self._n_steps)
         else:
             self.recorder = None
 
         # Stimulus protocols
         self._stimulus_protocols: List[StimulusProtocol] = []
         self._input_generators: List[PoissonInputGenerator] = []
+        self._poisson_sources: List[PoissonSource] = []
 
         # Progress callbacks
         self._progress_callbacks: List[Callable] = []
         self._step_callbacks: List[Callable] = []
+        self._step_hooks: List[_StepHook] = []
 
         # State
         self._running = False
-        self._paused = False
+        self._resumed = threading.Event()   # Cleared while paused
+        self._resumed.set()
         self._t = 0.0
+        self._step = 0                # Next time step of the current run
+        self._recording_started = False
+        self._events_processed = 0
+
+        # Result of the last completed run
+        self.result: Optional[SimulationResult] = None
+
+        # Event-driven solver (EVENT_DRIVEN / HYBRID runs only)
+        self._solver: Optional[EventDrivenSolver] = None
 
     @property
     def t(self) -> float:
@@ -177,15 +291,22 @@ class SimulationEngine:
         self._stimulus_protocols.append(protocol)
         protocol.generate_events(self.event_queue)
 
-    def add_poisson_input(self, generator: PoissonInputGenerator):
+    def add_poisson_input(self, generator: Union[PoissonSource, PoissonInputGenerator]):
         """
-        Add Poisson spike input generator.
+        Add Poisson spike input.
+
+        A PoissonSource is drawn step by step (streamed as events in
+        event-driven modes); a PoissonInputGenerator precomputes all
+        its input events now.
 
         Args:
-            generator: Input generator to add
+            generator: Input source or generator to add
         """
+        if isinstance(generator, PoissonSource):
+            self._poisson_sources.append(generator)
+            return
         self._input_generators.append(generator)
-        generator.generate_events(self.event_queue)
+        generator.generate_events(self.event_queue, self.network.rng)
 
     def add_input_current(
         self,
@@ -226,95 +347,447 @@ class SimulationEngine:
 
     def on_step(self, callback: Callable[[float, dict], None]):
         """
-        Register step callback.
+        Register step callback, called after every step.
 
         Args:
             callback: Function(time, network)
         """
         self._step_callbacks.append(callback)
 
+    def on_steps(self, callback: Callable[[StepWindow], None], every: int = 1):
+        """
+        Register a strided step callback.
+
+        ``callback(window)`` runs once every ``every`` steps (and after
+        the last step) with the times and spikes of the steps since its
+        previous call as arrays, so instrumentation costs one call per
+        window instead of one per step. Unlike on_step callbacks, these
+        hooks do not force pure event-driven runs to step every dt.
+
+        Args:
+            callback: Function(StepWindow)
+            every: Stride in steps
+        """
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        self._step_hooks.append(_StepHook(callback, every))
+
+    def _start_step_hooks(self):
+        """Open the first window of every step hook at the current step."""
+        position = len(self.network.state.spikes)
+        for hook in self._step_hooks:
+            hook.countdown = hook.every
+            hook.step = self._step
+            hook.position = position
+
+    def _run_step_hooks(self, n_steps: int = 1, final: bool = False):
+        """Call the step hooks due after ``n_steps`` more steps (all if ``final``)."""
+        spikes = self.network.state.spikes
+        end = len(spikes)
+        for hook in self._step_hooks:
+            hook.countdown -= n_steps
+            if hook.countdown > 0 and not (final and self._step > hook.step):
+                continue
+            times, neurons = spikes.since(min(hook.position, end))
+            window = StepWindow(
+                network=self.network,
+                step=self._step,
+                t=np.arange(hook.step, self._step) * self.config.dt,
+                spike_times=times,
+                spike_neurons=neurons,
+            )
+            hook.countdown = hook.every
+            hook.step = self._step
+            hook.position = end
+            hook.callback(window)
+
     def run(self) -> SimulationResult:
         """
         Run the simulation.
 
+        A run that was stopped or checkpointed part way continues from
+        its next step; otherwise the run starts at t = 0.
+
         Returns:
             SimulationResult with recorded data and metrics
         """
-        self._running = True
-        self._paused = False
+        for _ in self.iter_run(chunk_ms=None):
+            pass
+        return self.result
 
+    def iter_run(self, chunk_ms: Optional[float] = 100.0) -> Iterator[SimulationChunk]:
+        """
+        Run the simulation incrementally, yielding results as it goes.
+
+        The run advances ``chunk_ms`` of simulated time per iteration
+        and yields that chunk's spikes, population rate and recorded
+        samples. When the generator is exhausted, ``self.result`` holds
+        the SimulationResult of the whole run. Closing it early ends
+        the run like stop().
+
+        While paused (pause() from another thread), the current chunk
+        ends early and the next one starts after resume().
+
+        Args:
+            chunk_ms: Simulated time per chunk (ms); None = one chunk
+
+        Yields:
+            SimulationChunk per chunk
+        """
         config = self.config
+        self._running = True
+        self._resumed.set()
         start_wall_time = time.time()
 
         # Calculate number of steps
         n_steps = int(config.duration / config.dt)
         report_steps = int(config.report_interval / config.dt)
+        chunk_steps = max(int(round(chunk_ms / config.dt)), 1) if chunk_ms else max(n_steps, 1)
 
-        # Track warmup
-        warmup_steps = int(config.warmup / config.dt)
-        recording_started = config.warmup <= 0
+        event_driven = config.mode != SimulationMode.TIME_STEPPED
+        if event_driven or not 0 < self._step < n_steps:
+            self._step = 0
+            # Track warmup
+            self._recording_started = config.warmup <= 0
+        self._start_step_hooks()
 
         if config.verbose:
             print(f"Starting simulation: {config.duration}ms, dt={config.dt}ms")
             print(f"Network: {self.network.n_neurons} neurons, {self.network.n_synapses} synapses")
 
-        # Main simulation loop
-        for step in range(n_steps):
+        loop = (self._run_events if event_driven else self._run_stepped)(
+            n_steps, report_steps, chunk_steps
+        )
+        try:
+            start = self._chunk_start()
+            for _ in loop:
+                yield self._chunk(start, n_steps)
+                start = self._chunk_start()
+        finally:
+            loop.close()
+            self._running = False
+
+        if self._step_hooks:
+            self._run_step_hooks(0, final=True)
+        if self.recorder:
+            self.recorder.flush()
+
+        # Compute results
+        wall_time = time.time() - start_wall_time
+        result = self._compile_results(wall_time)
+        if event_driven:
+            result.metrics = {"events_processed": self._events_processed}
+
+        if config.verbose:
+            print(f"Simulation complete: {wall_time:.2f}s wall time")
+            print(f"Total spikes: {result.total_spikes}")
+            print(f"Mean firing rate: {result.mean_firing_rate:.2f} Hz")
+
+        self.result = result
+
+    async def arun(
+        self,
+        chunk_ms: Optional[float] = 100.0,
+        on_chunk: Optional[Callable[[SimulationChunk], Any]] = None,
+    ) -> SimulationResult:
+        """
+        Run the simulation without blocking the asyncio event loop.
+
+        Chunks are computed in a worker thread, one at a time, so the
+        event loop stays responsive; step callbacks run in that thread.
+        ``on_chunk`` (a function or coroutine function) is called on
+        the event loop with each chunk before the next one starts.
+
+        Cancelling the task stops the run: the chunk being computed
+        ends after its current step and the worker thread is waited
+        for before the run is closed.
+
+        Args:
+            chunk_ms: Simulated time per chunk (ms); None = one chunk
+            on_chunk: Chunk consumer
+
+        Returns:
+            SimulationResult of the whole run
+        """
+        chunks = self.iter_run(chunk_ms)
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+                chunk = await asyncio.shield(pending)
+                pending = None
+                if chunk is None:
+                    break
+                if on_chunk is not None:
+                    handled = on_chunk(chunk)
+                    if inspect.isawaitable(handled):
+                        await handled
+        finally:
+            if pending is not None:
+                # The worker is still inside the generator; let it return first
+                self.stop()
+                while not pending.done():
+                    try:
+                        await asyncio.wait({pending})
+                    except asyncio.CancelledError:
+                        pass
+                if not pending.cancelled():
+                    pending.exception()  # Retrieved; the original error propagates
+            chunks.close()
+        return self.result
+
+    def _chunk_start(self) -> Tuple[int, int, int]:
+        """(step, spike store length, recorder samples) at the start of a chunk."""
+        samples = self.recorder.n_samples if self.recorder and self._recording_started else 0
+        return self._step, len(self.network.state.spikes), samples
+
+    def _chunk(self, start: Tuple[int, int, int], n_steps: int) -> SimulationChunk:
+        """Collect the activity since ``start`` (see _chunk_start)."""
+        dt = self.config.dt
+        step, spike_start, sample_start = start
+        times, neurons = self.network.state.spikes.since(spike_start)
+        duration = (self._step - step) * dt
+        rate = 0.0
+        if duration > 0 and self.network.n_neurons > 0:
+            rate = len(times) / self.network.n_neurons / (duration / 1000)
+
+        chunk = SimulationChunk(
+            t_start=step * dt,
+            t_end=self._step * dt,
+            step=self._step,
+            n_steps=n_steps,
+            spike_times=times.copy(),
+            spike_neurons=neurons.copy(),
+            population_rate=rate,
+        )
+        if self.recorder and self._recording_started:
+            chunk.t, chunk.voltages = self.recorder.samples_since(sample_start)
+        return chunk
+
+    def _run_stepped(self, n_steps: int, report_steps: int, chunk_steps: int) -> Iterator[None]:
+        """
+        Time-stepped main loop: every neuron and synapse each dt.
+
+        Yields after every ``chunk_steps`` steps, when paused and at the end.
+        """
+        config = self.config
+        emitted = self._step
+
+        while self._running and self._step < n_steps:
+            self._resumed.wait()
             if not self._running:
                 break
-
-            while self._paused:
-                time.sleep(0.01)
+            step = self._step
 
             self._t = step * config.dt
+            self._start_recording(self._t)
 
             # Process events for this timestep
             self._process_events(self._t)
+            for source in self._poisson_sources:
+                source.apply(self.network, self._t)
 
             # Apply stimulus currents
             self._apply_stimuli(self._t)
 
-            # Step the network
-            spikes = self.network.step(record_history=self.config.record)
+            # Step the network (the recorder keeps the voltage traces)
+            spikes = self.network.step(record_history=False)
+            self._step = step + 1
 
-            # Record data (after warmup)
-            if self._t >= config.warmup:
-                if not recording_started:
-                    recording_started = True
-                    if self.recorder:
-                        self.recorder.reset()
-                        self.recorder.setup(self.network)
-
-                if self.recorder:
-                    self.recorder.record_step(self._t, self.network)
+            self._record(self._t)
 
             # Step callbacks
             for callback in self._step_callbacks:
                 callback(self._t, self.network)
+            if self._step_hooks:
+                self._run_step_hooks()
 
-            # Progress reporting
-            if config.verbose and step > 0 and step % report_steps == 0:
-                progress = (step / n_steps) * 100
-                print(f"Progress: {progress:.1f}% ({self._t:.1f}ms)")
+            self._report(step, n_steps, report_steps)
 
-                for callback in self._progress_callbacks:
-                    callback(self._t, config.duration)
+            if self._step - emitted >= chunk_steps or not self._resumed.is_set():
+                emitted = self._step
+                yield
 
-        # Compute results
-        wall_time = time.time() - start_wall_time
-        result = self._compile_results(wall_time)
+        if self._step > emitted:
+            yield
+
+    def _run_events(self, n_steps: int, report_steps: int, chunk_steps: int) -> Iterator[None]:
+        """
+        Event-driven main loop (EVENT_DRIVEN and HYBRID modes).
+
+        LIF neurons are handled by an EventDrivenSolver. In HYBRID mode
+        the remaining neurons and their synapses are stepped every dt;
+        otherwise, without recorder or step callbacks, the solver jumps
+        from event to event and the cost no longer scales with n_steps.
+
+        Yields after every ``chunk_steps`` steps (rounded up to whole
+        report intervals when jumping), when paused and at the end; the
+        number of events processed is left in ``_events_processed``.
+        """
+        config = self.config
+        network = self.network
+        dt = config.dt
+
+        from ..networks.base import NetworkBackend
+        if network.params.backend != NetworkBackend.OBJECT:
+            raise ValueError(f"{config.mode.value} mode requires the object network backend")
+
+        # Spikes are transmitted per synapse object in these modes
+        network.materialize_projections()
+
+        neurons = find_event_driven_neurons(network, self._stimulus_protocols)
+        if config.mode == SimulationMode.EVENT_DRIVEN and len(neurons) < network.n_neurons:
+            raise ValueError(
+                f"{network.n_neurons - len(neurons)} neurons cannot be simulated "
+                "event-driven (only noiseless LIF neurons without gap junctions, "
+                "plastic synapses or time-varying stimuli); use SimulationMode.HYBRID"
+            )
+
+        solver = EventDrivenSolver(network, self.event_queue, dt, neurons, engine=self)
+        stepped_neurons = [n for n in network if n.id not in solver.index]
+        stepped_synapses = [s for s in network.synapses if s.post.id not in solver.index]
+
+        record_idx = np.array([], dtype=np.int64)
+        if self.recorder:
+            record_idx = np.array([
+                solver.index[nid] for nid in self.recorder._record_neurons
+                if nid in solver.index
+            ], dtype=np.int64)
+
+        network.schedule_external_input(self.event_queue, 0.0, n_steps * dt)
+        for source in self._poisson_sources:
+            source.schedule(self.event_queue, 0.0, n_steps * dt, rng=self.network.rng)
+
+        self._solver = solver
+        solver.load_state(0.0)
+        solver.attach()
+        end = 0.0
+        emitted = 0
+
+        try:
+            if stepped_neurons or self.recorder or self._step_callbacks:
+                while self._running and self._step < n_steps:
+                    self._resumed.wait()
+                    if not self._running:
+                        break
+                    step = self._step
+
+                    self._t = end = step * dt
+                    self._start_recording(self._t)
+                    solver.run_until(self._t)
+
+                    if stepped_neurons:
+                        self._apply_stimuli(self._t)
+                        for neuron in stepped_neurons:
+                            neuron.step(record_history=False)
+                        network._delay_buffer.deliver()
+                        for synapse in stepped_synapses:
+                            synapse.step(self._t)
+
+                    network.state.t += dt
+                    network.state.step_count += 1
+                    self._step = step + 1
+                    if network._spike_hooks:
+                        network._run_spike_hooks()
+
+                    if self.recorder:
+                        solver.mark_fired()
+                        if record_idx.size:
+                            solver.sync(record_idx, self._t)
+                    self._record(self._t)
+
+                    for callback in self._step_callbacks:
+                        callback(self._t, network)
+                    if self._step_hooks:
+                        self._run_step_hooks()
+
+                    self._report(step, n_steps, report_steps)
+
+                    if self._step - emitted >= chunk_steps or not self._resumed.is_set():
+                        emitted = self._step
+                        yield
+            else:
+                # Pure event-driven: advance one report interval (or chunk,
+                # or step hook window) at a time
+                stride = max(min([report_steps, chunk_steps] + [h.every for h in self._step_hooks]), 1)
+                while self._running and self._step < n_steps:
+                    self._resumed.wait()
+                    if not self._running:
+                        break
+                    step = min(self._step + stride, n_steps)
+                    self._t = end = (step - 1) * dt
+                    solver.run_until(self._t)
+                    advanced = step - self._step
+                    network.state.t += advanced * dt
+                    network.state.step_count += advanced
+                    self._step = step
+                    if network._spike_hooks:
+                        network._run_spike_hooks(advanced)
+                    if self._step_hooks:
+                        self._run_step_hooks(advanced)
+                    self._report(step, n_steps, report_steps)
+
+                    if self._step - emitted >= chunk_steps or not self._resumed.is_set():
+                        emitted = self._step
+                        yield
+
+            if self._step > emitted:
+                yield
+        finally:
+            solver.sync_all(end)
+            solver.detach()
+            self._solver = None
+            self._events_processed = solver.n_events
 
         if config.verbose:
-            print(f"Simulation complete: {wall_time:.2f}s wall time")
-            print(f"Total spikes: {result.total_spikes}")
-            print(f"Mean firing rate: {result.mean_firing_rate:.2f} Hz")
+            print(f"Events processed: {solver.n_events}")
 
-        self._running = False
-        return result
+    def _start_recording(self, t: float):
+        """
+        Restart the recorder when the warmup period ends.
+
+        Called before the network steps, so the recorder's spike window
+        starts with the first recorded step's spikes.
+        """
+        if self._recording_started or t < self.config.warmup:
+            return
+
+        self._recording_started = True
+        if self.recorder:
+            self.recorder.reset()
+            self.recorder.setup(self.network, n_steps=self._n_steps)
+
+    def _record(self, t: float):
+        """Record the current step once the warmup period has passed."""
+        if self._recording_started and self.recorder:
+            self.recorder.record_step(t, self.network)
+
+    def _report(self, step: int, n_steps: int, report_steps: int):
+        """Print progress and notify progress callbacks."""
+        if self.config.verbose and step > 0 and step % report_steps == 0:
+            progress = (step / n_steps) * 100
+            print(f"Progress: {progress:.1f}% ({self._t:.1f}ms)")
+
+            for callback in self._progress_callbacks:
+                callback(self._t, self.config.duration)
 
     def _process_events(self, t: float):
         """Process events up to current time."""
-        events = self.event_queue.pop_until(t)
+        queue = self.event_queue
+        records = queue.pop_records(t)
+        if records.size:
+            # Bulk INPUT records are applied without building Event objects
+            neurons = self.network.neurons
+            is_input = records["type"] == _INPUT_CODE
+            inputs = records[is_input]
+            for target, payload in zip(inputs["target"].tolist(), inputs["payload"].tolist()):
+                neuron = neurons.get(queue.targets[target])
+                if neuron:
+                    neuron.receive_input(queue.values[payload])
+            events = [queue.to_event(record) for record in records[~is_input]]
+            events += queue.pop_until(t)
+        else:
+            events = queue.pop_until(t)
 
         for event in events:
             if event.event_type == EventType.INPUT:
@@ -338,9 +811,11 @@ class SimulationEngine:
     def _apply_stimuli(self, t: float):
         """Apply stimulus currents to neurons."""
         for protocol in self._stimulus_protocols:
-            current = protocol.get_current(t)
+            current = protocol.get_current(t, self.network.rng)
             if abs(current) > 1e-12:
                 for target_id in protocol.target_ids:
+                    if self._solver is not None and target_id in self._solver.index:
+                        continue
                     neuron = self.network.neurons.get(target_id)
                     if neuron:
                         neuron.receive_input(current)
@@ -358,19 +833,20 @@ class SimulationEngine:
 
         # Compile spike data
         if self.recorder:
+            # Column views (memory-mapped when recording to disk), not copies
             data = self.recorder.get_data()
-            result.t = np.array(data.t)
-            result.voltages = {k: np.array(v) for k, v in data.voltages.items()}
+            result.t = data.t
+            result.voltages = data.voltages
             result.spike_times = dict(data.spike_times)
 
         # Count spikes
-        result.spike_counts = {}
-        result.total_spikes = 0
-
-        for neuron_id, neuron in self.network.neurons.items():
-            count = len(neuron.state.spike_times)
-            result.spike_counts[neuron_id] = count
-            result.total_spikes += count
+        spikes = self.network.state.spikes
+        counts = spikes.counts()
+        result.spike_counts = {
+            neuron_id: int(counts[spikes.index[neuron_id]])
+            for neuron_id in self.network.neurons
+        }
+        result.total_spikes = sum(result.spike_counts.values())
 
         # Compute firing rate
         effective_duration = self.config.duration - self.config.warmup
@@ -384,22 +860,147 @@ class SimulationEngine:
         return result
 
     def pause(self):
-        """Pause simulation."""
-        self._paused = True
+        """Pause simulation (the running loop blocks until resume or stop)."""
+        self._resumed.clear()
 
     def resume(self):
         """Resume simulation."""
-        self._paused = False
+        self._resumed.set()
+
+    @property
+    def paused(self) -> bool:
+        """True while paused."""
+        return not self._resumed.is_set()
 
     def stop(self):
         """Stop simulation."""
         self._running = False
+        self._resumed.set()
+
+    def checkpoint(self, path: PathLike) -> str:
+        """
+        Save network and engine state to a checkpoint file.
+
+        Can be called between runs or from a step callback; an engine
+        created by restore() then continues with the next step. Saved
+        alongside the network state: progress, config, stimulus
+        protocols, Poisson sources and pending INPUT events. Events with
+        callbacks are not saved, and recorded data stays with this
+        engine's recorder.
+
+        Args:
+            path: Output file (``.npz`` by convention)
+
+        Returns:
+            Path written
+
+        Raises:
+            RuntimeError: During an event-driven run
+        """
+        if self._solver is not None:
+            raise RuntimeError("Cannot checkpoint during an event-driven run")
+
+        position = {nid: i for i, nid in enumerate(self.network.neurons)}
+        stimuli = [
+            {
+                "targets": [position[nid] for nid in p.target_ids if nid in position],
+                "onset": p.onset, "duration": p.duration, "amplitude": p.amplitude,
+                "frequency": p.frequency, "noise_std": p.noise_std, "pattern": p.pattern,
+                "rng": generator_state(p.rng),
+            }
+            for p in self._stimulus_protocols
+        ]
+        sources = [
+            {
+                "targets": [position[nid] for nid in s.target_ids if nid in position],
+                "rate": s.rate, "weight": s.weight, "start_time": s.start_time,
+                "end_time": s.end_time, "window": s.window, "rng": generator_state(s.rng),
+            }
+            for s in self._poisson_sources
+        ]
+        inputs = [
+            e for e in self.event_queue.events()
+            if e.event_type == EventType.INPUT and e.callback is None and e.target_id in position
+        ]
+        header = {"engine": {
+            "step": self._step,
+            "recording_started": self._recording_started,
+            "config": self.config.to_dict(),
+            "stimuli": stimuli,
+            "poisson_sources": sources,
+        }}
+        arrays = {
+            "engine/inputs/time": np.array([e.time for e in inputs], dtype=np.float64),
+            "engine/inputs/target": np.array([position[e.target_id] for e in inputs], dtype=np.int64),
+            "engine/inputs/weight": np.array(
+                [e.data.get("weight", 1.0) for e in inputs], dtype=np.float64
+            ),
+        }
+        return save_checkpoint(path, self.network, header, arrays)
+
+    @classmethod
+    def restore(
+        cls,
+        path: PathLike,
+        network,
+        config: Optional[SimulationConfig] = None,
+    ) -> "SimulationEngine":
+        """
+        Create an engine continuing from a checkpoint.
+
+        Args:
+            path: Checkpoint written by checkpoint() (or a network-only
+                snapshot, which yields an engine at step 0)
+            network: Network built the same way as the saved one
+            config: Overrides the saved config (its seed is ignored;
+                the saved generator state is restored)
+
+        Returns:
+            SimulationEngine; run() continues the saved run
+
+        Raises:
+            ValueError: If the network does not match the checkpoint
+        """
+        header, arrays = load_checkpoint(path)
+        saved = header.get("engine")
+        if config is None:
+            config = SimulationConfig.from_dict(saved["config"]) if saved else SimulationConfig()
+
+        engine = cls(network, config)
+        restore_network(network, header, arrays)
+        if saved is None:
+            return engine
+
+        ids = list(network.neurons)
+        for p in saved["stimuli"]:
+            engine.add_stimulus(StimulusProtocol(
+                target_ids=[ids[i] for i in p["targets"]],
+                onset=p["onset"], duration=p["duration"], amplitude=p["amplitude"],
+                frequency=p["frequency"], noise_std=p["noise_std"], pattern=p["pattern"],
+                rng=generator_from_state(p["rng"]),
+            ))
+        for s in saved["poisson_sources"]:
+            engine.add_poisson_input(PoissonSource(
+                [ids[i] for i in s["targets"]],
+                rate=s["rate"], weight=s["weight"], start_time=s["start_time"],
+                end_time=s["end_time"], window=s["window"], rng=generator_from_state(s["rng"]),
+            ))
+        engine.event_queue.push_inputs(
+            arrays["engine/inputs/time"], ids,
+            arrays["engine/inputs/target"], arrays["engine/inputs/weight"],
+        )
+
+        engine._step = saved["step"]
+        engine._t = max(engine._step - 1, 0) * config.dt
+        engine._recording_started = saved["recording_started"]
+        return engine
 
     def reset(self):
         """Reset simulation state."""
         self._t = 0.0
+        self._step = 0
         self._running = False
-        self._paused = False
+        self._resumed.set()
         self.network.reset()
         self.event_queue.clear()
 
@@ -410,7 +1011,7 @@ class SimulationEngine:
         for protocol in self._stimulus_protocols:
             protocol.generate_events(self.event_queue)
         for generator in self._input_generators:
-            generator.generate_events(self.event_queue)
+            generator.generate_events(self.event_queue, self.network.rng)
 
 
 def run_simulation(
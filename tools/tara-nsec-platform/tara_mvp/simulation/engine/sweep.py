@@ -0,0 +1,367 @@
+"""
+Parameter Sweeps
+
+Runs one function over a parameter grid, in parallel worker processes:
+
+- Every run gets its own ``np.random.Generator``, seeded from child
+  ``spawn_key=(run,)`` of a root ``np.random.SeedSequence``, so results
+  depend only on the root seed and the run's position in the grid,
+  never on which worker ran it or in what order
+- The built-in run functions draw only from that generator; user code
+  that still draws from the global ``np.random`` state is seeded from
+  the same child sequence inside the worker (and the caller's global
+  state is restored in serial runs)
+- Results are streamed to an append-only JSON-lines file as runs
+  finish; rerunning the sweep with the same file skips completed runs
+- SweepResults exposes the runs as a columnar table (one NumPy array
+  per parameter / metric)
+
+Built-in run functions: simulate_network (network simulations) and
+run_attack (attack scenarios).
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Optional, Dict, Any, List, Callable, Sequence, Union
+import json
+import os
+import time
+import numpy as np
+
+# Signature of run functions: fn(params, rng) -> metrics
+RunFunction = Callable[[Dict[str, Any], np.random.Generator], Dict[str, Any]]
+
+
+def expand_grid(grid: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of parameter values.
+
+    Args:
+        grid: Mapping of parameter name -> values
+
+    Returns:
+        One parameter dict per combination (last parameter varies fastest)
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in product(*(grid[n] for n in names))]
+
+
+def run_seed(root_seed: int, run: int) -> np.random.SeedSequence:
+    """Seed sequence of one run (child ``run`` of the root sequence)."""
+    return np.random.SeedSequence(root_seed, spawn_key=(run,))
+
+
+def _execute(fn: RunFunction, params: Dict[str, Any], run: int, root_seed: int) -> Dict[str, Any]:
+    """Run one grid point (in a worker process or inline)."""
+    seed = run_seed(root_seed, run)
+    saved = np.random.get_state()
+    np.random.seed(seed.generate_state(4))
+    start = time.perf_counter()
+    record: Dict[str, Any] = {"run": run, "params": params}
+    try:
+        record["metrics"] = dict(fn(dict(params), np.random.default_rng(seed)))
+        record["status"] = "ok"
+    except Exception as e:
+        record["metrics"] = {}
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        np.random.set_state(saved)
+    record["wall_time"] = time.perf_counter() - start
+    return record
+
+
+def _json_value(value):
+    """Convert NumPy scalars for JSON output."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class SweepResults:
+    """
+    Records of a parameter sweep, viewable as columns.
+
+    Usage:
+        >>> results = SweepResults.load("sweep.jsonl")
+        >>> cols = results.columns()
+        >>> cols["g"], cols["mean_firing_rate"]
+    """
+
+    def __init__(self, records: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize results.
+
+        Args:
+            records: Run records (see SweepRunner)
+        """
+        self.records: List[Dict[str, Any]] = list(records or [])
+
+    @classmethod
+    def load(cls, path: str) -> "SweepResults":
+        """
+        Read a results file; a truncated last line is ignored.
+
+        Args:
+            path: JSON-lines file written by SweepRunner
+
+        Returns:
+            SweepResults with the latest record of every run
+        """
+        latest: Dict[int, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    latest[record["run"]] = record
+        return cls([latest[run] for run in sorted(latest)])
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, record: Dict[str, Any]):
+        """Add one run record."""
+        self.records.append(record)
+
+    @property
+    def completed(self) -> Dict[int, Dict[str, Any]]:
+        """Successful runs by run index."""
+        return {r["run"]: r for r in self.records if r["status"] == "ok"}
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Results as one array per field, rows sorted by run.
+
+        Columns are ``run``, ``status``, ``wall_time`` and every
+        parameter and metric name. Numeric columns are float arrays
+        (NaN where a run lacks the value); others are object arrays.
+        """
+        records = sorted(self.records, key=lambda r: r["run"])
+        rows = [
+            {"run": r["run"], "status": r["status"], "wall_time": r["wall_time"],
+             **r["params"], **r["metrics"]}
+            for r in records
+        ]
+        names: Dict[str, None] = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+
+        columns = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            present = [v for v in values if v is not None]
+            if present and all(
+                isinstance(v, (int, float)) and not isinstance(v, bool) for v in present
+            ):
+                column = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+                if name == "run":
+                    column = column.astype(np.int64)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            columns[name] = column
+        return columns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize results."""
+        return {
+            "n_runs": len(self.records),
+            "n_completed": len(self.completed),
+            "n_failed": sum(r["status"] != "ok" for r in self.records),
+        }
+
+
+class SweepRunner:
+    """
+    Fan a run function out over a parameter grid.
+
+    ``fn(params, rng)`` must be a module-level function (it is pickled
+    to worker processes) returning a dict of scalar metrics.
+
+    Usage:
+        >>> runner = SweepRunner(simulate_network, {"g": [3.0, 4.0, 5.0]},
+        ...                      root_seed=1, workers=4, path="sweep.jsonl")
+        >>> results = runner.run()
+    """
+
+    def __init__(
+        self,
+        fn: RunFunction,
+        grid: Union[Dict[str, Sequence], List[Dict[str, Any]]],
+        root_seed: int = 0,
+        workers: Optional[int] = None,
+        path: Optional[str] = None
+    ):
+        """
+        Initialize sweep.
+
+        Args:
+            fn: Run function ``fn(params, rng) -> metrics``
+            grid: Mapping of parameter -> values (expanded with
+                expand_grid) or an explicit list of parameter dicts
+            root_seed: Entropy of the root SeedSequence
+            workers: Worker processes (None = CPU count, <= 1 = run inline)
+            path: JSON-lines results file (None = keep in memory only);
+                completed runs found in it are not run again
+        """
+        self.fn = fn
+        self.points: List[Dict[str, Any]] = (
+            expand_grid(grid) if isinstance(grid, dict) else [dict(p) for p in grid]
+        )
+        self.root_seed = root_seed
+        self.workers = workers
+        self.path = path
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+
+    @property
+    def n_runs(self) -> int:
+        """Number of grid points."""
+        return len(self.points)
+
+    def on_result(self, callback: Callable[[Dict[str, Any]], None]):
+        """Register a callback receiving every finished run record."""
+        self._callbacks.append(callback)
+
+    def _load_completed(self) -> SweepResults:
+        """Completed runs of a previous (interrupted) sweep."""
+        if self.path is None:
+            return SweepResults()
+
+        done = SweepResults.load(self.path).completed
+        for run, record in done.items():
+            if run >= self.n_runs or record["params"] != self._json_params(run):
+                raise ValueError(f"{self.path} holds results of a different sweep (run {run})")
+        return SweepResults(list(done.values()))
+
+    def _json_params(self, run: int) -> Dict[str, Any]:
+        """Parameters of a run as they round-trip through JSON."""
+        return json.loads(json.dumps(self.points[run], default=_json_value))
+
+    def run(self) -> SweepResults:
+        """
+        Run all grid points that have no successful result yet.
+
+        Returns:
+            SweepResults with one record per grid point
+        """
+        results = self._load_completed()
+        pending = [run for run in range(self.n_runs) if run not in results.completed]
+
+        log = None
+        if self.path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            log = open(self.path, "a")
+
+        def collect(record: Dict[str, Any]):
+            results.append(record)
+            if log is not None:
+                log.write(json.dumps(record, default=_json_value) + "\n")
+                log.flush()
+            for callback in self._callbacks:
+                callback(record)
+
+        try:
+            if self.workers is not None and self.workers <= 1:
+                for run in pending:
+                    collect(_execute(self.fn, self.points[run], run, self.root_seed))
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    futures = [
+                        pool.submit(_execute, self.fn, self.points[run], run, self.root_seed)
+                        for run in pending
+                    ]
+                    for future in as_completed(futures):
+                        collect(future.result())
+        finally:
+            if log is not None:
+                log.close()
+
+        results.records.sort(key=lambda r: r["run"])
+        return results
+
+
+# --- Built-in run functions ---
+
+def simulate_network(params: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Build and simulate one network.
+
+    Params:
+        network: "recurrent" (default), "small-world" or "oni"
+        neurons: Number of neurons (default 200)
+        duration: Simulation duration in ms (default 200)
+        dt: Time step in ms (default 0.1)
+        Any other key is passed to the network factory
+        (e.g. ``g`` or ``external_rate`` for recurrent networks)
+
+    Without a ``seed`` param the network draws connectivity, input and
+    noise from ``rng``.
+
+    Returns:
+        Spike and timing metrics of the run
+    """
+    from ..networks import RecurrentNetwork, SmallWorldNetwork, LayeredNetwork
+    from .simulator import run_simulation
+
+    params = dict(params)
+    kind = params.pop("network", "recurrent")
+    n = int(params.pop("neurons", 200))
+    duration = float(params.pop("duration", 200.0))
+    dt = float(params.pop("dt", 0.1))
+
+    params.setdefault("seed", rng)
+
+    if kind == "recurrent":
+        network = RecurrentNetwork.create_balanced(n_neurons=n, **params)
+    elif kind == "small-world":
+        network = SmallWorldNetwork.create_watts_strogatz(n=n, **params)
+    elif kind == "oni":
+        network = LayeredNetwork.create_oni_model(neurons_per_layer=max(n // 14, 1), **params)
+    else:
+        raise ValueError(f"Unknown network type: {kind}")
+
+    result = run_simulation(network, duration=duration, dt=dt, record=False)
+    return {
+        "n_neurons": result.n_neurons,
+        "n_synapses": result.n_synapses,
+        "total_spikes": result.total_spikes,
+        "mean_firing_rate": result.mean_firing_rate,
+        "sim_wall_time": result.wall_time,
+    }
+
+
+def run_attack(params: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+    """
+    Run one attack scenario.
+
+    Params:
+        scenario: Predefined scenario name (default "ransomware")
+        intensity: Overrides the intensity of every stage pattern (0-1)
+
+    Returns:
+        Detection and blocking metrics of the run
+    """
+    from dataclasses import replace
+    from ...attacks import AttackSimulator
+    from ...attacks.scenarios import get_scenario
+
+    scenario = get_scenario(params.get("scenario", "ransomware"))
+    if "intensity" in params:
+        intensity = float(params["intensity"])
+        scenario = replace(scenario, stages=[
+            replace(stage, pattern=replace(stage.pattern, intensity=intensity))
+            for stage in scenario.stages
+        ])
+
+    simulator = AttackSimulator(seed=rng)
+    result = simulator.run_scenario(scenario)
+    return {
+        "total_attacks": result.total_attacks,
+        "detected": result.detected_count,
+        "blocked": result.blocked_count,
+        "detection_rate": result.detection_rate,
+        "block_rate": result.block_rate,
+    }
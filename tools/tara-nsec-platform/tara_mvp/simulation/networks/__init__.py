@@ -6,9 +6,11 @@ Implements various network architectures for neural simulations:
 - LayeredNetwork: Feedforward layered architecture (maps to ONI 14-layer model)
 - RecurrentNetwork: Networks with feedback connections
 - SmallWorldNetwork: Networks with small-world topology
+- PopulationBackend: Vectorized stepping backend (opt-in)
 """
 
-from .base import Network, NetworkParameters, ConnectionPattern
+from .base import Network, NetworkParameters, ConnectionPattern, NetworkBackend
+from .backend import PopulationBackend
 from .layered import LayeredNetwork, LayeredNetworkParameters
 from .recurrent import RecurrentNetwork, RecurrentNetworkParameters
 from .small_world import SmallWorldNetwork, SmallWorldParameters
@@ -17,6 +19,8 @@ __all__ = [
     "Network",
     "NetworkParameters",
     "ConnectionPattern",
+    "NetworkBackend",
+    "PopulationBackend",
     "LayeredNetwork",
     "LayeredNetworkParameters",
     "RecurrentNetwork",
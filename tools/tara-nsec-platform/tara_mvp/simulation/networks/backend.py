@@ -0,0 +1,300 @@
+"""
+Population Backend for Networks
+
+Opt-in execution backend that steps a network as a handful of
+vectorized neuron populations instead of one Python call per neuron
+and per synapse.
+
+- LIF, Adaptive LIF, Izhikevich and Hodgkin-Huxley neurons are grouped
+  into NeuronPopulation objects sharing contiguous V / I_syn / I_ext
+  arrays (HodgkinHuxleyPopulation runs each neuron's own integrator)
+- Plain ChemicalSynapse, STDPSynapse and ElectricalSynapse connections
+  between population neurons, and SynapseProjections, are folded into
+  a sparse SynapseMatrix
+- Folded STDP synapses learn through STDPPlasticity engines (per-neuron
+  trace arrays, updates only for the synapses of spiking neurons)
+- Every other neuron or synapse keeps its per-object step()
+
+Model-specific variables of population neurons (Adaptive LIF ``w``,
+Izhikevich ``u``, Hodgkin-Huxley ``m``/``h``/``n``) live in the
+population arrays while the backend is active; neuron objects expose
+V, spikes and inputs through their state.
+
+Enable with ``NetworkParameters(backend=NetworkBackend.POPULATION)``.
+"""
+
+from typing import Dict, Any, List, TYPE_CHECKING
+import numpy as np
+from scipy import sparse
+
+from ..neurons.population import NeuronPopulation, create_populations
+from ..synapses.matrix import SynapseMatrix, supports_matrix
+from ..synapses.plasticity import STDPPlasticity, create_plasticity
+from ..synapses.stdp import STDPSynapse
+
+if TYPE_CHECKING:
+    from ..neurons.base import Neuron
+    from ..synapses.base import Synapse
+    from .base import Network
+
+
+def _is_foldable(synapse: "Synapse", index: Dict[str, int]) -> bool:
+    """Check whether a synapse can be folded into the synapse matrix."""
+    return (
+        supports_matrix(synapse)
+        and synapse.pre.id in index
+        and synapse.post.id in index
+    )
+
+
+class PopulationBackend:
+    """
+    Vectorized stepping backend for a Network.
+
+    Neurons are re-indexed population by population so that each
+    population's arrays are contiguous slices of the backend arrays.
+    ``index`` maps neuron IDs to positions in those arrays.
+
+    Usage:
+        >>> backend = PopulationBackend(network)
+        >>> spikes = backend.step(t=0.0)
+    """
+
+    def __init__(self, network: "Network"):
+        """
+        Build populations and the synapse matrix for a network.
+
+        Args:
+            network: Network whose neurons and synapses are compiled
+        """
+        neurons = list(network.neurons.values())
+        self.populations: List[NeuronPopulation] = create_populations(neurons)
+
+        pop_neurons = [n for pop in self.populations for n in pop.neurons]
+        self.index: Dict[str, int] = {n.id: i for i, n in enumerate(pop_neurons)}
+        self.object_neurons: List["Neuron"] = [
+            n for n in neurons if n.id not in self.index
+        ]
+
+        # Shared contiguous state
+        n = len(pop_neurons)
+        self.V = np.zeros(n)
+        self.I_syn = np.zeros(n)
+        self.I_ext = np.zeros(n)
+        self.fired = np.zeros(n, dtype=bool)
+
+        self._slices: List[slice] = []
+        offset = 0
+        for pop in self.populations:
+            sl = slice(offset, offset + pop.size)
+            pop.bind(self.V[sl], self.I_syn[sl], self.I_ext[sl])
+            pop.attach_spike_store(network.state.spikes)
+            self._slices.append(sl)
+            offset += pop.size
+
+        # Projections onto object-stepped neurons need per-object synapses
+        if not all(proj.covers(self.index) for proj in network.projections):
+            network.materialize_projections()
+
+        # Fold plain chemical, STDP and electrical synapses between population neurons
+        synapses = network._synapses
+        folded = [s for s in synapses if _is_foldable(s, self.index)]
+        folded_ids = {id(s) for s in folded}
+        self.object_synapses: List["Synapse"] = [
+            s for s in synapses if id(s) not in folded_ids
+        ]
+        self._delay_buffer = network._delay_buffer
+        self.matrix = SynapseMatrix(
+            folded, self.index, n, start_step=network.state.step_count,
+            projections=network.projections,
+        )
+        self.plasticity: List[STDPPlasticity] = create_plasticity(
+            [s for s in folded if isinstance(s, STDPSynapse)], self.matrix
+        )
+
+        # Folded synapses no longer queue spikes themselves
+        for neuron in pop_neurons:
+            neuron._spike_callbacks = [
+                cb for cb in neuron._spike_callbacks
+                if id(getattr(cb, "__self__", None)) not in folded_ids
+            ]
+
+        self._ids = [n.id for n in pop_neurons]
+
+        # Network order of the population and object neurons (get_voltages)
+        position = {nid: i for i, nid in enumerate(network.neurons)}
+        self._network_order = np.array([position[nid] for nid in self._ids], dtype=np.int64)
+        self._object_order = np.array(
+            [position[n.id] for n in self.object_neurons], dtype=np.int64
+        )
+
+    @property
+    def n_folded_synapses(self) -> int:
+        """Number of synapses stepped by the synapse matrix."""
+        return self.matrix.n_synapses
+
+    def step(self, t: float, record_history: bool = True) -> Dict[str, bool]:
+        """
+        Advance all neurons and synapses by one time step.
+
+        Args:
+            t: Current network time (ms)
+            record_history: Whether to record voltage history
+
+        Returns:
+            Dictionary mapping neuron IDs to spike status
+        """
+        for pop, sl in zip(self.populations, self._slices):
+            self.fired[sl] = pop.step(record_history)
+
+        for neuron in self.object_neurons:
+            neuron.step(record_history)
+
+        # Weight changes take effect for spikes delivered in this step,
+        # as with per-object spike callbacks
+        for engine in self.plasticity:
+            engine.step(self.fired)
+
+        self.matrix.step(self.fired, self.V, self.I_syn)
+
+        self._delay_buffer.deliver()
+        for synapse in self.object_synapses:
+            synapse.step(t)
+
+        spikes = dict(zip(self._ids, self.fired.tolist()))
+        for neuron in self.object_neurons:
+            spikes[neuron.id] = neuron.fired
+        return spikes
+
+    def get_voltages(self) -> np.ndarray:
+        """Membrane potentials of all network neurons, in network order."""
+        V = np.empty(len(self._network_order) + len(self._object_order))
+        V[self._network_order] = self.V
+        if self.object_neurons:
+            V[self._object_order] = [n.state.V for n in self.object_neurons]
+        return V
+
+    def reset(self):
+        """Reset populations, object neurons and all synapse state."""
+        for pop in self.populations:
+            pop.reset()
+        for neuron in self.object_neurons:
+            neuron.reset()
+        self.fired[:] = False
+        self.matrix.reset()
+        for engine in self.plasticity:
+            engine.reset()
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Population, synapse matrix and plasticity state for checkpoints.
+
+        Keys are prefixed ``populations/<i>/``, ``matrix/`` and
+        ``plasticity/<i>/``; object neurons and synapses are saved by
+        the network.
+        """
+        state = {"I_syn": self.I_syn.copy(), "I_ext": self.I_ext.copy()}
+        for i, pop in enumerate(self.populations):
+            for name, value in pop.get_state().items():
+                state[f"populations/{i}/{name}"] = value
+        for name, value in self.matrix.get_state().items():
+            state[f"matrix/{name}"] = value
+        for i, engine in enumerate(self.plasticity):
+            for name, value in engine.get_state().items():
+                state[f"plasticity/{i}/{name}"] = value
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Load state saved by get_state from a backend of the same layout.
+
+        Args:
+            state: Arrays keyed as in get_state
+        """
+        groups: Dict[str, Dict[str, np.ndarray]] = {}
+        for key, value in state.items():
+            prefix, _, name = key.rpartition("/")
+            groups.setdefault(prefix, {})[name] = value
+
+        self.I_syn[:] = groups[""]["I_syn"]
+        self.I_ext[:] = groups[""]["I_ext"]
+        for i, (pop, sl) in enumerate(zip(self.populations, self._slices)):
+            pop.set_state(groups[f"populations/{i}"])
+            self.fired[sl] = pop.fired
+        self.matrix.set_state(groups["matrix"])
+        for i, engine in enumerate(self.plasticity):
+            engine.set_state(groups[f"plasticity/{i}"])
+
+    def inherit(self, old: "PopulationBackend"):
+        """
+        Take over the dynamic state of a backend this one replaces.
+
+        Called by the network when it rebuilds the backend after a
+        topology change, so that adding or removing a neuron, synapse or
+        projection mid-run does not reset the state of the others.
+        Population, synapse matrix and plasticity state is matched by
+        neuron ID and synapse object.
+
+        Args:
+            old: Backend built before the topology change
+        """
+        previous = {
+            neuron.id: (pop, i)
+            for pop in old.populations for i, neuron in enumerate(pop.neurons)
+        }
+        for pop, sl in zip(self.populations, self._slices):
+            pop.inherit(previous)
+            self.fired[sl] = pop.fired
+
+        position = np.array([self.index.get(nid, -1) for nid in old._ids], dtype=np.int64)
+        self.matrix.inherit(old.matrix, position)
+        for engine in self.plasticity:
+            engine.inherit(old.plasticity, position)
+
+    def get_connectivity(self, ids: List[str]) -> sparse.csr_matrix:
+        """
+        Sparse weight matrix over all network synapses.
+
+        Args:
+            ids: Neuron IDs defining row/column order
+
+        Returns:
+            (pre x post) CSR matrix, parallel synapses summed
+        """
+        n = len(ids)
+        position = {nid: i for i, nid in enumerate(ids)}
+        perm = np.array([position[nid] for nid in self._ids], dtype=np.int64)
+
+        m = self.matrix
+        pre = [perm[m.pre]]
+        post = [perm[m.post]]
+        weight = [m.weight]
+        extra = [
+            (position[s.pre.id], position[s.post.id], s.weight)
+            for s in self.object_synapses
+            if s.pre.id in position and s.post.id in position
+        ]
+        if extra:
+            e_pre, e_post, e_w = zip(*extra)
+            pre.append(np.array(e_pre, dtype=np.int64))
+            post.append(np.array(e_post, dtype=np.int64))
+            weight.append(np.array(e_w, dtype=np.float64))
+
+        W = sparse.csr_matrix(
+            (np.concatenate(weight), (np.concatenate(pre), np.concatenate(post))),
+            shape=(n, n),
+        )
+        W.sum_duplicates()
+        return W
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize backend layout."""
+        return {
+            "populations": {
+                type(pop).__name__: pop.size for pop in self.populations
+            },
+            "object_neurons": len(self.object_neurons),
+            "folded_synapses": self.n_folded_synapses,
+            "plastic_synapses": sum(e.n_synapses for e in self.plasticity),
+            "object_synapses": len(self.object_synapses),
+        }
@@ -3,6 +3,11 @@ Base Network Model
 
 Abstract base class for neural network architectures.
 Manages collections of neurons and synapses.
+
+Connections are either Synapse objects or array-backed
+SynapseProjections (see connect_bulk). Projections are sampled and
+stepped as arrays; ``network.synapses`` lists them through per-edge
+views created on first access.
 """
 
 from abc import ABC, abstractmethod
@@ -15,9 +20,17 @@ from enum import Enum
 import uuid
 import numpy as np
 
+from ..neurons.spikes import SpikeStore
+from ..synapses.delay import DelayBuffer
+from ..synapses.projection import SynapseProjection
+from .connectivity import random_edges, distance_edges
+
 if TYPE_CHECKING:
     from ..neurons.base import Neuron
     from ..synapses.base import Synapse
+    from ..synapses.chemical import ChemicalSynapseParameters
+    from ..synapses.matrix import SynapseMatrix
+    from .backend import PopulationBackend
 
 
 class ConnectionPattern(Enum):
@@ -29,6 +42,12 @@ class ConnectionPattern(Enum):
     SMALL_WORLD = "small_world"       # High clustering, short path length
 
 
+class NetworkBackend(Enum):
+    """Execution backends for stepping a network."""
+    OBJECT = "object"                  # One step() call per neuron/synapse
+    POPULATION = "population"          # Vectorized neuron populations
+
+
 @dataclass
 class NetworkParameters:
     """Base parameters for networks."""
@@ -40,8 +59,12 @@ class NetworkParameters:
     # Simulation
     dt: float = 0.1  # Time step (ms)
 
-    # Random seed for reproducibility
-    seed: Optional[int] = None
+    # Random seed for reproducibility (an int, np.random.SeedSequence or
+    # np.random.Generator; see Network.rng)
+    seed: Optional[Union[int, np.random.SeedSequence, np.random.Generator]] = None
+
+    # Execution backend
+    backend: NetworkBackend = NetworkBackend.OBJECT
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -49,34 +72,127 @@ class NetworkParameters:
             "network_id": self.network_id,
             "name": self.name,
             "dt": self.dt,
-            "seed": self.seed,
+            "seed": self.seed if isinstance(self.seed, (int, type(None))) else None,
+            "backend": self.backend.value,
         }
 
 
 @dataclass
 class NetworkState:
-    """Current state of a network."""
+    """
+    Current state of a network.
+
+    All spikes of the network live in ``spikes``; ``spike_times`` and
+    ``spike_counts`` are derived from it.
+    """
 
     # Timing
     t: float = 0.0               # Current simulation time
     step_count: int = 0          # Number of steps taken
 
     # Activity tracking
-    spike_times: List[Tuple[str, float]] = field(default_factory=list)
-    spike_counts: Dict[str, int] = field(default_factory=dict)
+    spikes: SpikeStore = field(default_factory=SpikeStore)
 
     # Population activity
     firing_rates: Dict[str, float] = field(default_factory=dict)
 
+    @property
+    def spike_times(self) -> List[Tuple[str, float]]:
+        """All spikes as (neuron_id, time) tuples in emission order."""
+        ids = self.spikes.ids
+        neurons, times = self.spikes.neurons.tolist(), self.spikes.times.tolist()
+        return [(ids[i], t) for i, t in zip(neurons, times)]
+
+    @property
+    def spike_counts(self) -> Dict[str, int]:
+        """Spike count of every neuron that fired."""
+        counts = self.spikes.counts()
+        return {self.spikes.ids[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
     def reset(self):
         """Reset network state."""
         self.t = 0.0
         self.step_count = 0
-        self.spike_times = []
-        self.spike_counts = {}
+        self.spikes.clear()
         self.firing_rates = {}
 
 
+@dataclass
+class SpikeHook:
+    """Batched spike callback registered with Network.on_spikes."""
+    callback: Callable[[np.ndarray, np.ndarray], None]
+    every: int = 1            # Call every N steps
+    position: int = 0         # Spike store length at the previous call
+    countdown: int = 1        # Steps until the next call
+
+
+def _add_prefixed(state: Dict[str, np.ndarray], prefix: str, values: Dict[str, np.ndarray]):
+    """Add ``values`` to ``state`` under ``<prefix>/<name>`` keys."""
+    for name, value in values.items():
+        state[f"{prefix}/{name}"] = value
+
+
+def _split_prefixed(state: Dict[str, np.ndarray]) -> Dict[str, Dict[str, np.ndarray]]:
+    """Group ``<prefix>/<rest>`` keys by their first component."""
+    groups: Dict[str, Dict[str, np.ndarray]] = {}
+    for key, value in state.items():
+        prefix, _, rest = key.partition("/")
+        if rest:
+            groups.setdefault(prefix, {})[rest] = value
+    return groups
+
+
+def _group_by_class(objects: List[Any]) -> Dict[str, List[Any]]:
+    """Objects grouped by class name, preserving order within each group."""
+    groups: Dict[str, List[Any]] = {}
+    for obj in objects:
+        groups.setdefault(type(obj).__name__, []).append(obj)
+    return groups
+
+
+def _object_state(objects: List[Any]) -> Dict[str, np.ndarray]:
+    """
+    ``state_variables`` of neurons or synapses as ``<Class>/<path>`` arrays.
+
+    Attributes an object does not have yet (e.g. lazily created ones)
+    are stored as NaN.
+    """
+    state = {}
+    for name, group in _group_by_class(objects).items():
+        for path in type(group[0]).state_variables:
+            values = []
+            for obj in group:
+                for attr in path.split("."):
+                    obj = getattr(obj, attr, np.nan)
+                values.append(obj)
+            state[f"{name}/{path}"] = np.array(values)
+    return state
+
+
+def _load_object_state(objects: List[Any], state: Dict[str, np.ndarray]):
+    """Inverse of _object_state; NaN entries remove the attribute."""
+    for name, group in _group_by_class(objects).items():
+        for path in type(group[0]).state_variables:
+            values = state[f"{name}/{path}"]
+            if len(values) != len(group):
+                raise ValueError("State was saved from a network with a different layout")
+            *parents, attr = path.split(".")
+            for obj, value in zip(group, values.tolist()):
+                for parent in parents:
+                    obj = getattr(obj, parent)
+                if isinstance(value, float) and np.isnan(value):
+                    # Unset instance attribute or slot; class defaults stay
+                    if hasattr(obj, "__dict__"):
+                        vars(obj).pop(attr, None)
+                    elif attr in getattr(type(obj), "__slots__", ()):
+                        try:
+                            delattr(obj, attr)
+                        except AttributeError:
+                            pass
+                else:
+                    setattr(obj, attr, value)
+
+
 class Network(ABC):
     """
     Abstract base class for neural networks.
@@ -108,18 +224,35 @@ class Network(ABC):
         # Synapse storage
         self._synapses: List["Synapse"] = []
         self._synapse_map: Dict[Tuple[str, str], List["Synapse"]] = {}
+        self._projections: List[SynapseProjection] = []
+
+        # Matrix stepping projections on the object backend (built lazily)
+        self._projection_matrix: Optional["SynapseMatrix"] = None
+
+        # Shared delay line for per-object synapses
+        self._delay_buffer = DelayBuffer()
 
-        # Random state
-        if self.params.seed is not None:
-            np.random.seed(self.params.seed)
+        # Random state: one generator for connectivity, input and noise
+        self.rng = np.random.default_rng(self.params.seed)
 
-        # Callbacks
+        # Callbacks: batched hooks run after each step; per-spike
+        # callbacks are dispatched from one of them
         self._spike_callbacks: List[Callable] = []
+        self._spike_hooks: List[SpikeHook] = []
+
+        # Vectorized backend (built lazily when enabled)
+        self._backend: Optional["PopulationBackend"] = None
+        # Backend and projection matrix replaced by the next rebuild
+        self._stale_backend: Optional["PopulationBackend"] = None
+        self._stale_projection_matrix: Optional["SynapseMatrix"] = None
 
         # Build network
         self._create_neurons()
         self._create_synapses()
 
+        if self.params.backend == NetworkBackend.POPULATION:
+            self.use_population_backend()
+
     @property
     def id(self) -> str:
         """Unique identifier."""
@@ -132,8 +265,22 @@ class Network(ABC):
 
     @property
     def synapses(self) -> List["Synapse"]:
-        """All synapses in the network."""
-        return self._synapses
+        """
+        All synapses in the network.
+
+        Projection edges are listed as views (see SynapseProjection.views),
+        created on first access.
+        """
+        if not self._projections:
+            return self._synapses
+        return self._synapses + [
+            view for projection in self._projections for view in projection.views()
+        ]
+
+    @property
+    def projections(self) -> List[SynapseProjection]:
+        """Array-backed projections of the network."""
+        return self._projections
 
     @property
     def n_neurons(self) -> int:
@@ -142,8 +289,8 @@ class Network(ABC):
 
     @property
     def n_synapses(self) -> int:
-        """Number of synapses."""
-        return len(self._synapses)
+        """Number of synapses (objects and projection edges)."""
+        return len(self._synapses) + sum(len(proj) for proj in self._projections)
 
     @abstractmethod
     def _create_neurons(self):
@@ -164,9 +311,11 @@ class Network(ABC):
             group: Optional group name for organization
         """
         self._neurons[neuron.id] = neuron
+        neuron.rng = self.rng
 
-        # Register spike callback
-        neuron.on_spike(self._on_neuron_spike)
+        # Spike times are recorded in the network's spike store
+        self.state.spikes.bind(neuron)
+        self._invalidate_backend()
 
         # Add to group
         if group:
@@ -196,6 +345,8 @@ class Network(ABC):
             synapse: Synapse to add
         """
         self._synapses.append(synapse)
+        synapse.attach_delay_buffer(self._delay_buffer)
+        self._invalidate_backend()
 
         # Index by pre/post pair
         key = (synapse.pre.id, synapse.post.id)
@@ -208,21 +359,54 @@ class Network(ABC):
         for synapse in synapses:
             self.add_synapse(synapse)
 
+    def add_projection(self, projection: SynapseProjection) -> SynapseProjection:
+        """
+        Add an array-backed projection to the network.
+
+        Args:
+            projection: Projection between neurons of this network
+
+        Returns:
+            The added projection
+        """
+        self._projections.append(projection)
+        self._invalidate_backend()
+        return projection
+
+    def materialize_projections(self):
+        """
+        Convert all projections into independent ChemicalSynapse objects.
+
+        Needed by code that steps or transmits spikes per synapse (the
+        event-driven engine modes). On the object backend, conductances
+        in flight on the projection matrix are not carried over.
+        """
+        projections, self._projections = self._projections, []
+        for projection in projections:
+            self.add_synapses(projection.release_synapses())
+        self._invalidate_backend()
+
     def get_synapses_between(
         self,
         pre_id: str,
         post_id: str
     ) -> List["Synapse"]:
         """Get all synapses between two neurons."""
-        return self._synapse_map.get((pre_id, post_id), [])
+        synapses = self._synapse_map.get((pre_id, post_id), [])
+        if not self._projections:
+            return synapses
+        return synapses + [
+            view for projection in self._projections for view in projection.views()
+            if view.pre.id == pre_id and view.post.id == post_id
+        ]
 
     def get_incoming_synapses(self, neuron_id: str) -> List["Synapse"]:
         """Get all synapses projecting to a neuron."""
-        return [s for s in self._synapses if s.post.id == neuron_id]
+        return [s for s in self.synapses if s.post.id == neuron_id]
 
     def get_outgoing_synapses(self, neuron_id: str) -> List["Synapse"]:
         """Get all synapses originating from a neuron."""
-        return [s for s in self._synapses if s.pre.id == neuron_id]
+        return [s for s in self.synapses if s.pre.id == neuron_id]
 
     def connect(
         self,
@@ -237,6 +421,10 @@ class Network(ABC):
         """
         Connect neurons using specified pattern.
 
+        Pairs are sampled with vectorized draws (see connectivity.py);
+        use connect_bulk() to keep plain chemical connections as arrays
+        instead of one Synapse object each.
+
         Args:
             source: Source neuron(s) or ID(s)
             target: Target neuron(s) or ID(s)
@@ -253,49 +441,121 @@ class Network(ABC):
         source_neurons = self._normalize_neurons(source)
         target_neurons = self._normalize_neurons(target)
 
-        created_synapses = []
+        pre, post = self._sample_connections(
+            source_neurons, target_neurons, pattern, p_connect
+        )
+        created_synapses = [
+            self._create_synapse(
+                source_neurons[i], target_neurons[j], synapse_class, weight, **synapse_kwargs
+            )
+            for i, j in zip(pre.tolist(), post.tolist())
+        ]
 
-        if pattern == ConnectionPattern.ALL_TO_ALL:
-            for pre in source_neurons:
-                for post in target_neurons:
-                    if pre.id != post.id:  # No self-connections
-                        syn = self._create_synapse(
-                            pre, post, synapse_class, weight, **synapse_kwargs
-                        )
-                        created_synapses.append(syn)
-
-        elif pattern == ConnectionPattern.ONE_TO_ONE:
-            for pre, post in zip(source_neurons, target_neurons):
-                syn = self._create_synapse(
-                    pre, post, synapse_class, weight, **synapse_kwargs
-                )
-                created_synapses.append(syn)
+        self.add_synapses(created_synapses)
+        return created_synapses
 
-        elif pattern == ConnectionPattern.RANDOM:
-            for pre in source_neurons:
-                for post in target_neurons:
-                    if pre.id != post.id and np.random.random() < p_connect:
-                        syn = self._create_synapse(
-                            pre, post, synapse_class, weight, **synapse_kwargs
-                        )
-                        created_synapses.append(syn)
+    def connect_bulk(
+        self,
+        source: Union[str, List[str], "Neuron", List["Neuron"]],
+        target: Union[str, List[str], "Neuron", List["Neuron"]],
+        params: "ChemicalSynapseParameters",
+        pattern: ConnectionPattern = ConnectionPattern.RANDOM,
+        p_connect: float = 1.0,
+        weights: Optional[np.ndarray] = None,
+        allow_autapses: bool = False
+    ) -> SynapseProjection:
+        """
+        Connect neurons with array-backed chemical synapses.
+
+        Samples the same connections as connect() but stores them as a
+        single SynapseProjection, so building and stepping cost O(edges)
+        array work with no per-synapse objects.
+
+        Args:
+            source: Source neuron(s) or ID(s)
+            target: Target neuron(s) or ID(s)
+            params: Parameters shared by all created synapses
+            pattern: Connection pattern
+            p_connect: Connection probability (for random patterns)
+            weights: Per-connection weights (default: params.weight)
+            allow_autapses: Whether a neuron may connect to itself
 
+        Returns:
+            The added projection
+
+        Usage:
+            >>> params = ChemicalSynapseParameters.from_receptor(ReceptorType.AMPA)
+            >>> proj = net.connect_bulk(exc_ids, inh_ids, params, p_connect=0.1)
+        """
+        source_neurons = self._normalize_neurons(source)
+        target_neurons = self._normalize_neurons(target)
+
+        pre, post = self._sample_connections(
+            source_neurons, target_neurons, pattern, p_connect, allow_autapses
+        )
+        projection = SynapseProjection(
+            source_neurons, target_neurons, pre, post, params, weights
+        )
+        return self.add_projection(projection)
+
+    def _sample_connections(
+        self,
+        source_neurons: List["Neuron"],
+        target_neurons: List["Neuron"],
+        pattern: ConnectionPattern,
+        p_connect: float,
+        allow_autapses: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample (source index, target index) pairs for a connection pattern.
+
+        Self-connections are dropped unless allowed (ONE_TO_ONE always
+        keeps its pairs).
+        """
+        n_pre, n_post = len(source_neurons), len(target_neurons)
+
+        if pattern == ConnectionPattern.ONE_TO_ONE:
+            pairs = np.arange(min(n_pre, n_post), dtype=np.int64)
+            return pairs, pairs.copy()
+
+        if pattern == ConnectionPattern.ALL_TO_ALL:
+            pre, post = random_edges(n_pre, n_post, 1.0)
+        elif pattern == ConnectionPattern.RANDOM:
+            pre, post = random_edges(n_pre, n_post, p_connect, self.rng)
         elif pattern == ConnectionPattern.DISTANCE_DEPENDENT:
-            # Use position if available
-            for pre in source_neurons:
-                for post in target_neurons:
-                    if pre.id == post.id:
-                        continue
-                    dist = self._compute_distance(pre, post)
-                    p = p_connect * np.exp(-dist / 100)  # 100 unit length scale
-                    if np.random.random() < p:
-                        syn = self._create_synapse(
-                            pre, post, synapse_class, weight, **synapse_kwargs
-                        )
-                        created_synapses.append(syn)
+            pre, post = distance_edges(
+                self._positions(source_neurons),
+                self._positions(target_neurons),
+                p_connect,
+                length_scale=100.0,  # 100 unit length scale
+                rng=self.rng,
+            )
+        else:
+            return random_edges(0, 0, 0.0)
 
-        self.add_synapses(created_synapses)
-        return created_synapses
+        if not allow_autapses:
+            codes: Dict[str, int] = {}
+            pre_code = np.array(
+                [codes.setdefault(n.id, len(codes)) for n in source_neurons], dtype=np.int64
+            )
+            post_code = np.array(
+                [codes.setdefault(n.id, len(codes)) for n in target_neurons], dtype=np.int64
+            )
+            distinct = pre_code[pre] != post_code[post]
+            pre, post = pre[distinct], post[distinct]
+
+        return pre, post
+
+    @staticmethod
+    def _positions(neurons: List["Neuron"]) -> np.ndarray:
+        """(n, 3) neuron positions; NaN rows for neurons without one."""
+        positions = np.full((len(neurons), 3), np.nan)
+        for k, neuron in enumerate(neurons):
+            position = neuron.params.position
+            if position:
+                positions[k, :len(position)] = position
+                positions[k, len(position):] = 0.0
+        return positions
 
     def _normalize_neurons(
         self,
@@ -340,21 +600,117 @@ class Network(ABC):
             return np.linalg.norm(p1 - p2)
         return 0.0
 
-    def _on_neuron_spike(self, neuron: "Neuron", spike_time: float):
-        """Handle spike from any neuron."""
-        self.state.spike_times.append((neuron.id, spike_time))
+    def on_spike(self, callback: Callable[["Neuron", float], None]):
+        """
+        Register callback for network spikes.
 
-        if neuron.id not in self.state.spike_counts:
-            self.state.spike_counts[neuron.id] = 0
-        self.state.spike_counts[neuron.id] += 1
+        Called once per spike, after the step that emitted it. Prefer
+        on_spikes, which receives a step's spikes as arrays.
+        """
+        if not self._spike_callbacks:
+            self.on_spikes(self._dispatch_spike_callbacks)
+        self._spike_callbacks.append(callback)
 
-        # Notify callbacks
-        for callback in self._spike_callbacks:
-            callback(neuron, spike_time)
+    def on_spikes(
+        self,
+        callback: Callable[[np.ndarray, np.ndarray], None],
+        every: int = 1,
+    ) -> SpikeHook:
+        """
+        Register a batched spike callback.
 
-    def on_spike(self, callback: Callable[["Neuron", float], None]):
-        """Register callback for network spikes."""
-        self._spike_callbacks.append(callback)
+        ``callback(neurons, times)`` runs every ``every`` steps with the
+        spikes emitted since its previous call: spike store indices
+        (network order, see ``state.spikes.ids``) and spike times, as
+        views valid until the next step. It is skipped when no neuron
+        fired, so the cost follows the number of calls and spikes
+        rather than the number of neurons.
+
+        Args:
+            callback: Function(neuron_indices, spike_times)
+            every: Stride in steps
+
+        Returns:
+            The registered hook (pass to remove_spike_hook)
+        """
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        hook = SpikeHook(callback, every, position=len(self.state.spikes), countdown=every)
+        self._spike_hooks.append(hook)
+        return hook
+
+    def remove_spike_hook(self, hook: SpikeHook):
+        """Unregister a hook returned by on_spikes."""
+        self._spike_hooks.remove(hook)
+
+    def _run_spike_hooks(self, n_steps: int = 1):
+        """Call the spike hooks that are due after ``n_steps`` more steps."""
+        spikes = self.state.spikes
+        end = len(spikes)
+        for hook in self._spike_hooks:
+            hook.countdown -= n_steps
+            if hook.countdown > 0:
+                continue
+            hook.countdown = hook.every
+            # The store may have been cleared since (reset, set_state)
+            start = min(hook.position, end)
+            hook.position = end
+            if end > start:
+                times, neurons = spikes.since(start)
+                hook.callback(neurons, times)
+
+    def _dispatch_spike_callbacks(self, neurons: np.ndarray, times: np.ndarray):
+        """Spike hook running the per-spike on_spike callbacks."""
+        ids = self.state.spikes.ids
+        for i, t in zip(neurons.tolist(), times.tolist()):
+            neuron = self._neurons.get(ids[i])
+            for callback in self._spike_callbacks:
+                callback(neuron, t)
+
+    def get_voltages(self) -> np.ndarray:
+        """Membrane potentials of all neurons, in network order."""
+        if self._backend is not None:
+            return self._backend.get_voltages()
+        return np.fromiter(
+            (n.state.V for n in self._neurons.values()), dtype=np.float64, count=len(self._neurons)
+        )
+
+    @property
+    def backend(self) -> NetworkBackend:
+        """Active execution backend."""
+        return self.params.backend
+
+    def use_population_backend(self):
+        """
+        Switch to the vectorized population backend.
+
+        LIF, Adaptive LIF and Izhikevich neurons are stepped as NumPy
+        populations; plain chemical synapses between them are folded
+        into per-receptor conductance arrays. Neuron objects stay
+        usable (their state becomes a view into the population arrays).
+        """
+        from .backend import PopulationBackend
+
+        previous = self._backend if self._backend is not None else self._stale_backend
+        self._backend = self._stale_backend = None
+        self.params.backend = NetworkBackend.POPULATION
+        self._backend = PopulationBackend(self)
+        if previous is not None:
+            self._backend.inherit(previous)
+
+    def _invalidate_backend(self):
+        """
+        Mark the population backend and projection matrix for rebuild after topology changes.
+
+        The replaced ones are kept until the rebuild, which takes over
+        their state (see PopulationBackend.inherit).
+        """
+        if getattr(self, "_backend", None) is not None:
+            self._stale_backend = self._backend
+            self._backend = None
+        if getattr(self, "_projection_matrix", None) is not None:
+            self._stale_projection_matrix = self._projection_matrix
+            self._projection_matrix = None
 
     def step(self, record_history: bool = True) -> Dict[str, bool]:
         """
@@ -366,6 +722,16 @@ class Network(ABC):
         Returns:
             Dictionary mapping neuron IDs to spike status
         """
+        if self.params.backend == NetworkBackend.POPULATION:
+            if self._backend is None:
+                self.use_population_backend()
+            spikes = self._backend.step(self.state.t, record_history)
+            self.state.t += self.params.dt
+            self.state.step_count += 1
+            if self._spike_hooks:
+                self._run_spike_hooks()
+            return spikes
+
         spikes = {}
 
         # Update all neurons
@@ -373,16 +739,68 @@ class Network(ABC):
             spiked = neuron.step(record_history)
             spikes[neuron_id] = spiked
 
-        # Update all synapses
+        # Deliver delayed spikes arriving this step, then update synapses
+        self._delay_buffer.deliver()
         for synapse in self._synapses:
             synapse.step(self.state.t)
+        if self._projections:
+            self._step_projections()
 
         # Update time
         self.state.t += self.params.dt
         self.state.step_count += 1
+        if self._spike_hooks:
+            self._run_spike_hooks()
 
         return spikes
 
+    def _build_projection_matrix(self) -> "SynapseMatrix":
+        """SynapseMatrix stepping the projections on the object backend."""
+        from ..synapses.matrix import SynapseMatrix
+
+        if self._projection_matrix is None:
+            index = {neuron.id: i for i, neuron in enumerate(self._neurons.values())}
+            self._projection_matrix = SynapseMatrix(
+                [], index, len(index),
+                start_step=self.state.step_count, projections=self._projections,
+            )
+            previous, self._stale_projection_matrix = self._stale_projection_matrix, None
+            if previous is not None:
+                # Neurons are only ever appended, so old positions are unchanged
+                position = np.arange(previous.n_neurons, dtype=np.int64)
+                self._projection_matrix.inherit(previous, position)
+        return self._projection_matrix
+
+    def _step_projections(self):
+        """Step array-backed projections through a SynapseMatrix (object backend)."""
+        neurons = list(self._neurons.values())
+        self._build_projection_matrix()
+
+        n = len(neurons)
+        fired = np.fromiter((neuron.fired for neuron in neurons), dtype=bool, count=n)
+        V = np.fromiter((neuron.V for neuron in neurons), dtype=np.float64, count=n)
+        I_syn = np.zeros(n)
+        self._projection_matrix.step(fired, V, I_syn)
+
+        for i in np.flatnonzero(np.abs(I_syn) > 1e-12).tolist():
+            neurons[i].receive_input(I_syn[i], input_type="synaptic")
+
+    def schedule_external_input(self, queue, start: float, end: float):
+        """
+        Push external input applied inside step() as events.
+
+        Event-driven engine modes do not call step(), so networks that
+        inject input there override this to queue equivalent
+        EventType.INPUT events between start and end (ms). The default
+        schedules nothing.
+
+        Args:
+            queue: EventQueue to push into
+            start: Start time (ms)
+            end: End time (ms)
+        """
+        return
+
     def simulate(
         self,
         duration: float,
@@ -431,48 +849,249 @@ class Network(ABC):
             for neuron_id, neuron in self._neurons.items():
                 results["neurons"][neuron_id] = {
                     "V": np.array(neuron.state.V_history),
-                    "spike_times": neuron.state.spike_times,
+                    "spike_times": np.array(neuron.state.spike_times),
                 }
 
         return results
 
+    def set_rng(self, rng: np.random.Generator):
+        """
+        Replace the network's random generator.
+
+        Neurons and populations draw their noise, and external input
+        sources their spikes, from the new generator afterwards.
+
+        Args:
+            rng: Generator (or anything np.random.default_rng accepts)
+        """
+        self.rng = np.random.default_rng(rng)
+        for neuron in self._neurons.values():
+            neuron.rng = self.rng
+        if self._backend is not None:
+            for population in self._backend.populations:
+                population.rng = self.rng
+
     def reset(self):
         """Reset network to initial state."""
         self.state.reset()
+        self._delay_buffer.reset()
 
-        for neuron in self._neurons.values():
-            neuron.reset()
+        if self._backend is not None:
+            self._backend.reset()
+        else:
+            self._stale_backend = None
+            for neuron in self._neurons.values():
+                neuron.reset()
 
         for synapse in self._synapses:
             synapse.reset()
+        if self._projection_matrix is not None:
+            self._projection_matrix.reset()
+        self._stale_projection_matrix = None
 
-    def get_connectivity_matrix(self) -> np.ndarray:
-        """Get weight matrix of connections."""
-        n = self.n_neurons
-        ids = list(self._neurons.keys())
-        id_to_idx = {nid: i for i, nid in enumerate(ids)}
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Dynamic state as flat, named arrays (see engine/checkpoint.py).
+
+        Holds time, recorded spikes, spikes in flight, synapse weights,
+        the ``state_variables`` of every per-object neuron and synapse
+        (grouped by class) and, with the population backend, the
+        backend arrays under ``backend/``. Structure and parameters are
+        not included: set_state expects a network built the same way.
+
+        Returns:
+            Mapping of name -> array
+        """
+        population = self.params.backend == NetworkBackend.POPULATION
+        if population and self._backend is None:
+            self.use_population_backend()
+
+        state: Dict[str, np.ndarray] = {
+            "t": np.array(self.state.t),
+            "step_count": np.array(self.state.step_count),
+            "population": np.array(population),
+            "n_projections": np.array(len(self._projections)),
+            "synapses/weight": np.array(
+                [s.params.weight for s in self._synapses], dtype=np.float64
+            ),
+        }
+        _add_prefixed(state, "spikes", self.state.spikes.get_state())
+        _add_prefixed(state, "delay", self._delay_buffer.get_state(self._synapses))
+
+        neurons = self._object_neurons()
+        _add_prefixed(state, "neurons", _object_state(neurons))
+        noise = [neuron._noise[neuron._noise_pos:] for neuron in neurons]
+        state["neurons/noise"] = np.array(
+            [x for buffered in noise for x in buffered], dtype=np.float64
+        )
+        state["neurons/noise_count"] = np.array([len(b) for b in noise], dtype=np.int64)
+
+        _add_prefixed(state, "synapses", _object_state(self._object_synapses()))
+        if self._backend is not None:
+            _add_prefixed(state, "backend", self._backend.get_state())
+        elif self._projection_matrix is not None:
+            _add_prefixed(state, "projections", self._projection_matrix.get_state())
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Load state saved by get_state into a network of the same layout.
+
+        The network must have the same neurons and synapses in the same
+        order (e.g. rebuilt by the same factory call); neuron IDs may
+        differ. Both must use the same backend.
+
+        Args:
+            state: Arrays keyed as in get_state
+
+        Raises:
+            ValueError: If the state does not fit this network
+        """
+        population = self.params.backend == NetworkBackend.POPULATION
+        if bool(state["population"]) != population:
+            raise ValueError(
+                f"State was saved with the {'population' if state['population'] else 'object'} "
+                f"backend, network uses {self.params.backend.value}"
+            )
+        if population and self._backend is None:
+            self.use_population_backend()
+
+        groups = _split_prefixed(state)
+        spiked = groups["spikes"]["neurons"]
+        if (len(state["synapses/weight"]) != len(self._synapses)
+                or int(state["n_projections"]) != len(self._projections)
+                or len(spiked) and int(spiked.max()) >= self.n_neurons):
+            raise ValueError("State was saved from a network with a different layout")
+
+        self.state.t = float(state["t"])
+        self.state.step_count = int(state["step_count"])
+        self.state.spikes.set_state(groups["spikes"])
+        self._delay_buffer.set_state(groups["delay"], self._synapses)
+        for synapse, weight in zip(self._synapses, state["synapses/weight"].tolist()):
+            synapse.params.weight = weight
+
+        neurons = self._object_neurons()
+        _load_object_state(neurons, groups["neurons"])
+        counts = groups["neurons"]["noise_count"]
+        buffered = (
+            np.split(groups["neurons"]["noise"], np.cumsum(counts)[:-1]) if len(counts) else []
+        )
+        for neuron, values in zip(neurons, buffered):
+            neuron._noise = values.tolist()
+            neuron._noise_pos = 0
+
+        _load_object_state(self._object_synapses(), groups["synapses"])
+        if self._backend is not None:
+            self._backend.set_state(groups["backend"])
+        elif "projections" in groups:
+            self._build_projection_matrix().set_state(groups["projections"])
+
+    def _object_neurons(self) -> List["Neuron"]:
+        """Neurons stepped as objects (all of them without the population backend)."""
+        if self._backend is not None:
+            return self._backend.object_neurons
+        return list(self._neurons.values())
+
+    def _object_synapses(self) -> List["Synapse"]:
+        """Synapses holding their own state (not folded into a SynapseMatrix)."""
+        return [s for s in self._synapses if s._matrix is None]
+
+    def apply_reward(self, reward: float):
+        """
+        Apply a reward signal to all reward-modulated STDP synapses.
+
+        With the population backend, synapses learning through an
+        STDPPlasticity engine are updated in one vectorized call.
+
+        Args:
+            reward: Reward signal (positive or negative)
+        """
+        if self.params.backend == NetworkBackend.POPULATION:
+            if self._backend is None:
+                self.use_population_backend()
+            for engine in self._backend.plasticity:
+                engine.apply_reward(reward)
 
-        W = np.zeros((n, n))
         for synapse in self._synapses:
-            i = id_to_idx.get(synapse.pre.id)
-            j = id_to_idx.get(synapse.post.id)
-            if i is not None and j is not None:
-                W[i, j] += synapse.weight
+            if hasattr(synapse, "apply_reward") and getattr(synapse, "_plasticity", None) is None:
+                synapse.apply_reward(reward)
+
+    def get_connectivity_matrix(self, sparse: bool = False):
+        """
+        Get weight matrix of connections.
 
-        return W
+        Args:
+            sparse: Return a scipy CSR matrix instead of a dense array
 
-    def get_spike_raster(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Get spike times and neuron indices for raster plot."""
+        Returns:
+            (pre x post) weight matrix in neuron insertion order
+        """
         ids = list(self._neurons.keys())
-        id_to_idx = {nid: i for i, nid in enumerate(ids)}
 
-        times = []
-        indices = []
-        for neuron_id, spike_time in self.state.spike_times:
-            times.append(spike_time)
-            indices.append(id_to_idx.get(neuron_id, -1))
+        if self._backend is not None:
+            W = self._backend.get_connectivity(ids)
+            return W if sparse else W.toarray()
 
-        return np.array(times), np.array(indices)
+        from scipy.sparse import csr_matrix
+
+        n = self.n_neurons
+        pre, post, weight, _ = self._edge_arrays(self._neuron_index())
+        W = csr_matrix((weight, (pre, post)), shape=(n, n))
+        W.sum_duplicates()
+        return W if sparse else W.toarray()
+
+    def _neuron_index(self) -> Dict[str, int]:
+        """Mapping of neuron ID -> position in insertion order."""
+        return {nid: i for i, nid in enumerate(self._neurons)}
+
+    def _edge_arrays(
+        self, index: Dict[str, int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Endpoints, weights and type of every synapse and projection edge.
+
+        Args:
+            index: Mapping of neuron ID -> position; synapses with an
+                endpoint outside it are skipped
+
+        Returns:
+            Tuple of (pre, post, weight, excitatory) arrays
+        """
+        from ..synapses.base import SynapseType
+
+        entries = [
+            (index[s.pre.id], index[s.post.id], s.weight,
+             s.params.synapse_type == SynapseType.EXCITATORY)
+            for s in self._synapses
+            if s.pre.id in index and s.post.id in index
+        ]
+        columns = list(zip(*entries)) if entries else [(), (), (), ()]
+        pre = [np.array(columns[0], dtype=np.int64)]
+        post = [np.array(columns[1], dtype=np.int64)]
+        weight = [np.array(columns[2], dtype=np.float64)]
+        excitatory = [np.array(columns[3], dtype=bool)]
+
+        for projection in self._projections:
+            if not projection.covers(index):
+                continue
+            proj_pre, proj_post = projection.positions(index)
+            pre.append(proj_pre)
+            post.append(proj_post)
+            weight.append(projection.weight)
+            excitatory.append(np.full(
+                len(projection), projection.params.synapse_type == SynapseType.EXCITATORY
+            ))
+
+        return (np.concatenate(pre), np.concatenate(post),
+                np.concatenate(weight), np.concatenate(excitatory))
+
+    def get_spike_raster(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get spike times and neuron indices for raster plot."""
+        id_to_idx = {nid: i for i, nid in enumerate(self._neurons)}
+        spikes = self.state.spikes
+        position = np.array([id_to_idx.get(nid, -1) for nid in spikes.ids], dtype=np.int64)
+
+        return spikes.times.copy(), position[spikes.neurons]
 
     def compute_firing_rates(self, window: float = 100.0) -> Dict[str, float]:
         """
@@ -484,16 +1103,14 @@ class Network(ABC):
         Returns:
             Dictionary mapping neuron IDs to firing rates (Hz)
         """
-        rates = {}
         t_current = self.state.t
+        spikes = self.state.spikes
+        counts = spikes.count_between(t_current - window, t_current)
 
-        for neuron_id, neuron in self._neurons.items():
-            # Count spikes in window
-            spikes_in_window = sum(
-                1 for st in neuron.state.spike_times
-                if t_current - window <= st <= t_current
-            )
-            rates[neuron_id] = spikes_in_window / (window / 1000)  # Convert to Hz
+        rates = {
+            neuron_id: counts[spikes.index[neuron_id]] / (window / 1000)  # Convert to Hz
+            for neuron_id in self._neurons
+        }
 
         self.state.firing_rates = rates
         return rates
@@ -509,7 +1126,7 @@ class Network(ABC):
             "state": {
                 "t": self.state.t,
                 "step_count": self.state.step_count,
-                "total_spikes": len(self.state.spike_times),
+                "total_spikes": len(self.state.spikes),
             },
         }
 
@@ -0,0 +1,129 @@
+"""
+Connectivity Sampling
+
+Vectorized edge sampling for network construction. Edges are returned
+as (pre, post) index arrays into the source and target neuron lists,
+so building a network costs O(edges) array work instead of one
+random draw per candidate pair:
+
+- random_edges: independent Bernoulli(p) edges over the pre x post
+  grid, sampled by geometric skipping (the gap to the next accepted
+  pair is geometrically distributed)
+- distance_edges: p * exp(-d / length_scale) edges; candidate pairs
+  come from a KD-tree radius search when the length scale is short
+  compared to the spatial extent, otherwise from thinning random
+  candidates
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Pairs whose connection probability falls below this are never
+# proposed by the KD-tree search in distance_edges
+DISTANCE_TOLERANCE = 1e-6
+
+
+def _empty_edges() -> Tuple[np.ndarray, np.ndarray]:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+def _geometric_positions(total: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    """Sorted positions in ``range(total)`` kept with probability ``p`` each."""
+    chunks = []
+    last = -1
+    while True:
+        remaining = total - last - 1
+        expected = remaining * p
+        size = int(expected + 4 * np.sqrt(expected + 1)) + 16
+        positions = last + np.cumsum(rng.geometric(p, size))
+        if positions[-1] >= total:
+            chunks.append(positions[positions < total])
+            break
+        chunks.append(positions)
+        last = int(positions[-1])
+    return np.concatenate(chunks)
+
+
+def random_edges(
+    n_pre: int,
+    n_post: int,
+    p: float,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample every (pre, post) pair independently with probability ``p``.
+
+    Args:
+        n_pre: Number of source neurons
+        n_post: Number of target neurons
+        p: Connection probability
+        rng: Random generator (None = freshly seeded)
+
+    Returns:
+        Tuple of (pre, post) index arrays, sorted by pre then post
+    """
+    total = n_pre * n_post
+    if total == 0 or p <= 0:
+        return _empty_edges()
+    if p >= 1:
+        flat = np.arange(total, dtype=np.int64)
+    else:
+        rng = rng if rng is not None else np.random.default_rng()
+        flat = _geometric_positions(total, p, rng)
+    return flat // n_post, flat % n_post
+
+
+def distance_edges(
+    pre_positions: np.ndarray,
+    post_positions: np.ndarray,
+    p: float,
+    length_scale: float = 100.0,
+    rng: Optional[np.random.Generator] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample pairs with probability ``p * exp(-distance / length_scale)``.
+
+    Rows of NaN mark neurons without a position; their distance to
+    every other neuron counts as 0.
+
+    Args:
+        pre_positions: (n_pre, n_dims) source positions
+        post_positions: (n_post, n_dims) target positions
+        p: Connection probability at distance 0
+        length_scale: Decay length of the connection probability
+        rng: Random generator (None = freshly seeded)
+
+    Returns:
+        Tuple of (pre, post) index arrays
+    """
+    n_pre, n_post = len(pre_positions), len(post_positions)
+    if n_pre == 0 or n_post == 0 or p <= 0:
+        return _empty_edges()
+
+    rng = rng if rng is not None else np.random.default_rng()
+    known = np.isfinite(pre_positions).all() and np.isfinite(post_positions).all()
+    radius = length_scale * np.log(p / DISTANCE_TOLERANCE) if p > DISTANCE_TOLERANCE else 0.0
+    if known:
+        points = np.vstack([pre_positions, post_positions])
+        extent = float(np.linalg.norm(points.max(axis=0) - points.min(axis=0)))
+    else:
+        extent = 0.0
+
+    if known and radius < extent:
+        # Only pairs closer than the cutoff radius can realistically connect
+        pairs = cKDTree(pre_positions).sparse_distance_matrix(
+            cKDTree(post_positions), radius, output_type="ndarray"
+        )
+        pre = pairs["i"].astype(np.int64)
+        post = pairs["j"].astype(np.int64)
+        prob = p * np.exp(-pairs["v"] / length_scale)
+    else:
+        # Thin Bernoulli(p) candidates by the distance factor
+        pre, post = random_edges(n_pre, n_post, p, rng)
+        diff = pre_positions[pre] - post_positions[post]
+        distance = np.nan_to_num(np.sqrt((diff ** 2).sum(axis=1)), nan=0.0)
+        prob = np.exp(-distance / length_scale) * max(p, 1.0)
+
+    keep = rng.random(pre.size) < prob
+    return pre[keep], post[keep]
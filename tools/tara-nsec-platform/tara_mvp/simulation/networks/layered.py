@@ -12,7 +12,7 @@ import numpy as np
 from .base import Network, NetworkParameters, ConnectionPattern
 from ..neurons.base import Neuron, NeuronType
 from ..neurons.lif import LIFNeuron, LIFParameters
-from ..synapses.chemical import ChemicalSynapse, ChemicalSynapseParameters, ReceptorType
+from ..synapses.chemical import ChemicalSynapseParameters, ReceptorType
 
 
 # ONI Framework 14-layer model mapping
@@ -232,62 +232,60 @@ class LayeredNetwork(Network):
         weight: float
     ):
         """Create connections between two layers."""
-        source_ids = self._layer_neurons[source_layer]
-        target_ids = self._layer_neurons[target_layer]
-
-        for pre_id in source_ids:
-            pre = self._neurons[pre_id]
-            for post_id in target_ids:
-                if np.random.random() < prob:
-                    post = self._neurons[post_id]
-
-                    # Determine synapse type based on presynaptic neuron
-                    if pre.params.neuron_type == NeuronType.INHIBITORY:
-                        params = ChemicalSynapseParameters.from_receptor(
-                            ReceptorType.GABA_A,
-                            weight=abs(weight),
-                            dt=self.params.dt
-                        )
-                    else:
-                        params = ChemicalSynapseParameters.from_receptor(
-                            ReceptorType.AMPA,
-                            weight=weight,
-                            dt=self.params.dt
-                        )
-
-                    synapse = ChemicalSynapse(pre, post, params)
-                    self.add_synapse(synapse)
+        self._connect_by_type(
+            self._layer_neurons[source_layer],
+            self._layer_neurons[target_layer],
+            prob,
+            excitatory_weight=weight,
+            inhibitory_weight=weight,
+        )
 
     def _create_lateral_connections(self, layer_idx: int):
         """Create lateral connections within a layer."""
         p = self.params
         neuron_ids = self._layer_neurons[layer_idx]
 
-        for pre_id in neuron_ids:
-            pre = self._neurons[pre_id]
-            for post_id in neuron_ids:
-                if pre_id == post_id:
-                    continue
-
-                if np.random.random() < p.lateral_prob:
-                    post = self._neurons[post_id]
-
-                    # Inhibitory neurons make inhibitory synapses
-                    if pre.params.neuron_type == NeuronType.INHIBITORY:
-                        params = ChemicalSynapseParameters.from_receptor(
-                            ReceptorType.GABA_A,
-                            weight=abs(p.lateral_inhibitory_weight),
-                            dt=self.params.dt
-                        )
-                    else:
-                        params = ChemicalSynapseParameters.from_receptor(
-                            ReceptorType.AMPA,
-                            weight=p.lateral_weight,
-                            dt=self.params.dt
-                        )
-
-                    synapse = ChemicalSynapse(pre, post, params)
-                    self.add_synapse(synapse)
+        # Inhibitory neurons make inhibitory synapses
+        self._connect_by_type(
+            neuron_ids,
+            neuron_ids,
+            p.lateral_prob,
+            excitatory_weight=p.lateral_weight,
+            inhibitory_weight=p.lateral_inhibitory_weight,
+        )
+
+    def _connect_by_type(
+        self,
+        source_ids: List[str],
+        target_ids: List[str],
+        prob: float,
+        excitatory_weight: float,
+        inhibitory_weight: float
+    ):
+        """
+        Randomly connect two neuron groups, one projection per source type.
+
+        Synapse type follows the presynaptic neuron: inhibitory sources
+        make GABA_A synapses (weight ``abs(inhibitory_weight)``), all
+        others AMPA synapses.
+        """
+        sources = [self._neurons[nid] for nid in source_ids]
+        targets = [self._neurons[nid] for nid in target_ids]
+        inhibitory = [n for n in sources if n.params.neuron_type == NeuronType.INHIBITORY]
+        excitatory = [n for n in sources if n.params.neuron_type != NeuronType.INHIBITORY]
+
+        for group, receptor, weight in (
+            (excitatory, ReceptorType.AMPA, excitatory_weight),
+            (inhibitory, ReceptorType.GABA_A, abs(inhibitory_weight)),
+        ):
+            if not group:
+                continue
+            params = ChemicalSynapseParameters.from_receptor(
+                receptor,
+                weight=weight,
+                dt=self.params.dt
+            )
+            self.connect_bulk(group, targets, params, p_connect=prob)
 
     def get_layer_neurons(self, layer_idx: int) -> List[Neuron]:
         """Get all neurons in a specific layer."""
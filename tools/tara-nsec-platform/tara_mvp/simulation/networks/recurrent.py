@@ -13,7 +13,7 @@ from .base import Network, NetworkParameters, ConnectionPattern
 from ..neurons.base import Neuron, NeuronType
 from ..neurons.lif import LIFNeuron
 from ..neurons.izhikevich import IzhikevichNeuron, IzhikevichType
-from ..synapses.chemical import ChemicalSynapse, ChemicalSynapseParameters, ReceptorType
+from ..synapses.chemical import ChemicalSynapseParameters, ReceptorType
 from ..synapses.stdp import STDPSynapse, STDPParameters
 
 
@@ -124,8 +124,8 @@ class RecurrentNetwork(Network):
 
             # Random position
             neuron.params.position = (
-                np.random.uniform(0, 100),
-                np.random.uniform(0, 100),
+                self.rng.uniform(0, 100),
+                self.rng.uniform(0, 100),
                 0
             )
 
@@ -141,8 +141,8 @@ class RecurrentNetwork(Network):
                 neuron = LIFNeuron.create_inhibitory()
 
             neuron.params.position = (
-                np.random.uniform(0, 100),
-                np.random.uniform(0, 100),
+                self.rng.uniform(0, 100),
+                self.rng.uniform(0, 100),
                 0
             )
 
@@ -191,44 +191,61 @@ class RecurrentNetwork(Network):
         receptor: ReceptorType,
         use_stdp: bool = False
     ):
-        """Create connections between two populations."""
-        for pre_id in source_ids:
-            pre = self._neurons[pre_id]
-            for post_id in target_ids:
-                if pre_id == post_id:
-                    continue  # No self-connections
-
-                if np.random.random() < prob:
-                    post = self._neurons[post_id]
-
-                    if use_stdp and receptor == ReceptorType.AMPA:
-                        # Use STDP synapse
-                        params = STDPParameters(
-                            receptor=receptor,
-                            weight=weight,
-                            dt=self.params.dt,
-                            learning_rate=self.params.stdp_lr
-                        )
-                        synapse = STDPSynapse(pre, post, params)
-                    else:
-                        # Regular chemical synapse
-                        params = ChemicalSynapseParameters.from_receptor(
-                            receptor,
-                            weight=weight,
-                            dt=self.params.dt
-                        )
-                        synapse = ChemicalSynapse(pre, post, params)
-
-                    self.add_synapse(synapse)
+        """
+        Create connections between two populations.
+
+        Plain chemical connections are stored as one array-backed
+        projection; STDP connections are sampled the same way but
+        created as individual STDPSynapse objects.
+        """
+        sources = [self._neurons[nid] for nid in source_ids]
+        targets = [self._neurons[nid] for nid in target_ids]
+
+        if use_stdp and receptor == ReceptorType.AMPA:
+            pre, post = self._sample_connections(
+                sources, targets, ConnectionPattern.RANDOM, prob
+            )
+            for i, j in zip(pre.tolist(), post.tolist()):
+                params = STDPParameters(
+                    receptor=receptor,
+                    weight=weight,
+                    dt=self.params.dt,
+                    learning_rate=self.params.stdp_lr
+                )
+                self.add_synapse(STDPSynapse(sources[i], targets[j], params))
+        else:
+            params = ChemicalSynapseParameters.from_receptor(
+                receptor,
+                weight=weight,
+                dt=self.params.dt
+            )
+            self.connect_bulk(sources, targets, params, p_connect=prob)
+
+    def _external_source(self):
+        """PoissonSource for the background input (rebuilt on changes)."""
+        from ..engine.inputs import PoissonSource
 
-    def apply_external_input(self):
-        """Apply Poisson-distributed external input."""
         p = self.params
+        source = getattr(self, "_external", None)
+        if (source is None or source.n_targets != len(self._neurons)
+                or source.rate != p.external_rate * 1000
+                or source.weight != p.external_weight):
+            source = self._external = PoissonSource(
+                list(self._neurons.keys()),
+                rate=p.external_rate * 1000,
+                weight=p.external_weight,
+            )
+        return source
+
+    def apply_external_input(self):
+        """Apply Poisson-distributed external input (one draw from self.rng for all neurons)."""
+        if self.params.external_rate > 0:
+            self._external_source().apply(self, self.state.t)
 
-        for neuron in self._neurons.values():
-            # Poisson spike arrival
-            if np.random.random() < p.external_rate * p.dt:
-                neuron.receive_input(p.external_weight)
+    def schedule_external_input(self, queue, start: float, end: float):
+        """Stream the Poisson external input as INPUT events."""
+        if self.params.external_rate > 0:
+            self._external_source().schedule(queue, start, end, rng=self.rng)
 
     def step(self, record_history: bool = True) -> Dict[str, bool]:
         """Step with external input."""
@@ -246,16 +263,11 @@ class RecurrentNetwork(Network):
             Dictionary with E and I rates
         """
         t_current = self.state.t
+        spikes = self.state.spikes
+        counts = spikes.count_between(t_current - window, t_current)
 
         def compute_rate(neuron_ids):
-            total_spikes = 0
-            for nid in neuron_ids:
-                neuron = self._neurons[nid]
-                spikes = sum(
-                    1 for st in neuron.state.spike_times
-                    if t_current - window <= st <= t_current
-                )
-                total_spikes += spikes
+            total_spikes = sum(int(counts[spikes.index[nid]]) for nid in neuron_ids)
             n_neurons = len(neuron_ids)
             if n_neurons == 0:
                 return 0.0
@@ -274,14 +286,9 @@ class RecurrentNetwork(Network):
             Dictionary with balance metrics
         """
         # Total synaptic weights
-        total_exc = 0.0
-        total_inh = 0.0
-
-        for synapse in self._synapses:
-            if synapse.params.synapse_type.value == "excitatory":
-                total_exc += synapse.weight
-            else:
-                total_inh += abs(synapse.weight)
+        _, _, weight, excitatory = self._edge_arrays(self._neuron_index())
+        total_exc = float(weight[excitatory].sum())
+        total_inh = float(np.abs(weight[~excitatory]).sum())
 
         balance = total_exc / (total_inh + 1e-10)
 
@@ -293,37 +300,26 @@ class RecurrentNetwork(Network):
 
     def get_weight_distribution(self) -> Dict[str, np.ndarray]:
         """Get distribution of synaptic weights."""
-        exc_weights = []
-        inh_weights = []
-
-        for synapse in self._synapses:
-            if synapse.params.synapse_type.value == "excitatory":
-                exc_weights.append(synapse.weight)
-            else:
-                inh_weights.append(synapse.weight)
+        _, _, weight, excitatory = self._edge_arrays(self._neuron_index())
 
         return {
-            "excitatory": np.array(exc_weights),
-            "inhibitory": np.array(inh_weights),
+            "excitatory": weight[excitatory],
+            "inhibitory": weight[~excitatory],
         }
 
     def get_connectivity_stats(self) -> Dict[str, Any]:
         """Get connectivity statistics."""
         # Count connections by type
-        n_ee = n_ei = n_ie = n_ii = 0
-
-        for synapse in self._synapses:
-            pre_exc = synapse.pre.id in self._exc_neurons
-            post_exc = synapse.post.id in self._exc_neurons
-
-            if pre_exc and post_exc:
-                n_ee += 1
-            elif pre_exc and not post_exc:
-                n_ei += 1
-            elif not pre_exc and post_exc:
-                n_ie += 1
-            else:
-                n_ii += 1
+        index = self._neuron_index()
+        pre, post, _, _ = self._edge_arrays(index)
+        is_exc = np.zeros(len(index), dtype=bool)
+        is_exc[[index[nid] for nid in self._exc_neurons]] = True
+        pre_exc, post_exc = is_exc[pre], is_exc[post]
+
+        n_ee = int(np.count_nonzero(pre_exc & post_exc))
+        n_ei = int(np.count_nonzero(pre_exc & ~post_exc))
+        n_ie = int(np.count_nonzero(~pre_exc & post_exc))
+        n_ii = int(np.count_nonzero(~pre_exc & ~post_exc))
 
         # Compute actual probabilities
         n_e = len(self._exc_neurons)
@@ -8,14 +8,20 @@ Implements networks with small-world topology, characterized by:
 This topology is observed in many biological neural networks and
 provides efficient information processing.
 
+Adjacency is kept as one set of target indices per neuron plus a
+cached sparse (CSR) matrix, so rewiring is O(1) per edge, clustering
+is a sparse matrix product and path lengths come from a bit-parallel
+breadth-first search (64 sources per machine word).
+
 Reference:
     Watts, D.J. & Strogatz, S.H. (1998). Collective dynamics of
     'small-world' networks. Nature, 393(6684), 440-442.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Set
 import numpy as np
+from scipy import sparse
 
 from .base import Network, NetworkParameters
 from ..neurons.base import Neuron, NeuronType
@@ -23,6 +29,65 @@ from ..neurons.lif import LIFNeuron
 from ..synapses.chemical import ChemicalSynapse, ChemicalSynapseParameters, ReceptorType
 from ..synapses.electrical import ElectricalSynapse, ElectricalSynapseParameters
 
+# Set bits per byte value
+_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.int64)
+
+# Spawn key of the path length sampling stream, a child of the network
+# seed that never collides with the small run indices used by sweeps
+_PATH_LENGTH_SPAWN_KEY = (0x5041_5448,)
+
+
+def multi_source_bfs(A: sparse.csr_matrix, sources: np.ndarray) -> Tuple[int, int]:
+    """
+    Sum of shortest-path lengths from several sources at once.
+
+    Every node holds one bit per source; each BFS level ORs the
+    frontier bits of all in-neighbors into a node with one
+    ``np.bitwise_or.reduceat`` over the edge list, so a level costs
+    O(edges * sources / 64).
+
+    Args:
+        A: Directed (pre x post) adjacency matrix
+        sources: Source node indices
+
+    Returns:
+        Tuple of (sum of distances, number of reachable (source, target)
+        pairs), excluding each source itself
+    """
+    n = A.shape[0]
+    n_words = (len(sources) + 63) // 64
+    if n == 0 or n_words == 0:
+        return 0, 0
+
+    # In-neighbors of every node that has any
+    incoming = A.T.tocsr()
+    has_in = np.flatnonzero(np.diff(incoming.indptr))
+    starts = incoming.indptr[has_in]
+
+    visited = np.zeros((n, n_words), dtype=np.uint64)
+    bits = np.arange(len(sources))
+    np.bitwise_or.at(
+        visited, (np.asarray(sources), bits // 64),
+        np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)),
+    )
+    frontier = visited.copy()
+
+    total = count = 0
+    level = 0
+    while True:
+        level += 1
+        reached = np.zeros_like(visited)
+        if has_in.size:
+            reached[has_in] = np.bitwise_or.reduceat(frontier[incoming.indices], starts, axis=0)
+        reached &= ~visited
+        new = int(_POPCOUNT[reached.view(np.uint8)].sum())
+        if new == 0:
+            return total, count
+        total += level * new
+        count += new
+        visited |= reached
+        frontier = reached
+
 
 @dataclass
 class SmallWorldParameters(NetworkParameters):
@@ -92,8 +157,10 @@ class SmallWorldNetwork(Network):
         Args:
             params: Network parameters
         """
-        self._adjacency: Dict[str, List[str]] = {}
+        # Out-neighbors of each neuron, by ring index
+        self._adjacency: List[Set[int]] = []
         self._neuron_indices: Dict[str, int] = {}
+        self._adjacency_matrix: Optional[sparse.csr_matrix] = None
         super().__init__(params or SmallWorldParameters())
 
     @property
@@ -129,58 +196,66 @@ class SmallWorldNetwork(Network):
             group = "excitatory" if i < n_exc else "inhibitory"
             self.add_neuron(neuron, group=group)
 
-            # Store index mapping
-            self._neuron_indices[neuron.id] = i
-            self._adjacency[neuron.id] = []
-
     def _create_synapses(self):
         """Create small-world connectivity using Watts-Strogatz algorithm."""
         p = self.params
         neuron_list = list(self._neurons.values())
         n = len(neuron_list)
 
-        # Step 1: Create ring lattice with k neighbors on each side
-        for i, neuron in enumerate(neuron_list):
-            for j in range(1, p.k + 1):
-                # Connect to neighbors on the right (mod n for wrapping)
-                target_idx = (i + j) % n
-                self._add_connection(neuron, neuron_list[target_idx])
-
-        # Step 2: Rewire edges with probability p
-        # For each edge, consider rewiring the target
-        edges_to_rewire = []
-        for i, neuron in enumerate(neuron_list):
-            for j in range(1, p.k + 1):
-                if np.random.random() < p.p_rewire:
-                    old_target_idx = (i + j) % n
-                    edges_to_rewire.append((i, old_target_idx))
-
-        # Perform rewiring
-        for source_idx, old_target_idx in edges_to_rewire:
-            source = neuron_list[source_idx]
-            old_target = neuron_list[old_target_idx]
-
-            # Remove old connection
-            self._remove_connection(source, old_target)
-
-            # Find new target (not self, not already connected)
-            available = [
-                k for k in range(n)
-                if k != source_idx
-                and neuron_list[k].id not in self._adjacency[source.id]
-            ]
-
-            if available:
-                new_target_idx = np.random.choice(available)
-                new_target = neuron_list[new_target_idx]
-                self._add_connection(source, new_target)
+        # Store index mapping
+        self._neuron_indices = {neuron.id: i for i, neuron in enumerate(neuron_list)}
+
+        # Step 1: Ring lattice with k neighbors on the right of each node
+        source = np.repeat(np.arange(n), p.k)
+        target = (source + np.tile(np.arange(1, p.k + 1), n)) % n
+        adjacency = [set() for _ in range(n)]
+        for i, j in zip(source.tolist(), target.tolist()):
+            adjacency[i].add(j)
+
+        # Step 2: Rewire each edge's target with probability p
+        rewire = np.flatnonzero(self.rng.random(source.size) < p.p_rewire)
+        for e in rewire.tolist():
+            i = int(source[e])
+            adjacency[i].discard(int(target[e]))
+            new_target = self._sample_new_target(i, adjacency[i], n)
+            target[e] = new_target
+            if new_target >= 0:
+                adjacency[i].add(new_target)
+
+        self._adjacency = adjacency
+        for i, j in zip(source.tolist(), target.tolist()):
+            if j >= 0:
+                self._add_connection(neuron_list[i], neuron_list[j])
+
+    def _sample_new_target(self, source: int, neighbors: Set[int], n: int) -> int:
+        """
+        Uniform random target that is neither ``source`` nor a neighbor.
+
+        Rejection-samples while most neurons are free, otherwise picks
+        from the explicit list of free targets.
+
+        Returns:
+            Target index, or -1 if every neuron is already a neighbor
+        """
+        n_free = n - 1 - len(neighbors)
+        if n_free <= 0:
+            return -1
+        if 2 * n_free >= n:
+            while True:
+                candidate = int(self.rng.integers(n))
+                if candidate != source and candidate not in neighbors:
+                    return candidate
+        taken = np.fromiter(neighbors, dtype=np.int64, count=len(neighbors))
+        free = np.setdiff1d(np.arange(n), np.append(taken, source))
+        return int(self.rng.choice(free))
 
     def _add_connection(self, pre: Neuron, post: Neuron):
         """Add a connection between two neurons."""
         p = self.params
 
         # Track adjacency
-        self._adjacency[pre.id].append(post.id)
+        self._adjacency[self._neuron_indices[pre.id]].add(self._neuron_indices[post.id])
+        self._adjacency_matrix = None
 
         # Compute delay based on distance if enabled
         if p.use_delays:
@@ -220,16 +295,21 @@ class SmallWorldNetwork(Network):
 
     def _remove_connection(self, pre: Neuron, post: Neuron):
         """Remove connection between neurons."""
-        if post.id in self._adjacency[pre.id]:
-            self._adjacency[pre.id].remove(post.id)
-
-        # Remove synapse
-        synapses_to_remove = self.get_synapses_between(pre.id, post.id)
-        for syn in synapses_to_remove:
-            self._synapses.remove(syn)
-            key = (pre.id, post.id)
-            if key in self._synapse_map:
-                self._synapse_map[key].remove(syn)
+        self._adjacency[self._neuron_indices[pre.id]].discard(self._neuron_indices[post.id])
+        self._adjacency_matrix = None
+
+        # Remove synapses
+        key = (pre.id, post.id)
+        removed = {id(syn) for syn in self._synapse_map.pop(key, [])}
+        if not removed:
+            return
+        self._synapses = [syn for syn in self._synapses if id(syn) not in removed]
+        # Stop queueing spikes for the removed synapses
+        pre._spike_callbacks = [
+            cb for cb in pre._spike_callbacks
+            if id(getattr(cb, "__self__", None)) not in removed
+        ]
+        self._invalidate_backend()
 
     def _compute_ring_distance(self, n1: Neuron, n2: Neuron) -> float:
         """Compute distance along the ring."""
@@ -239,88 +319,114 @@ class SmallWorldNetwork(Network):
             return np.linalg.norm(p1 - p2)
         return 0.0
 
+    def get_adjacency_matrix(self) -> sparse.csr_matrix:
+        """
+        Directed adjacency matrix (pre x post) in ring order.
+
+        Returns:
+            Cached (n x n) CSR matrix with 1 for every connection
+        """
+        if self._adjacency_matrix is None:
+            n = len(self._adjacency)
+            degrees = np.fromiter(
+                (len(neighbors) for neighbors in self._adjacency), dtype=np.int64, count=n
+            )
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(degrees, out=indptr[1:])
+            indices = np.fromiter(
+                (j for neighbors in self._adjacency for j in neighbors),
+                dtype=np.int64, count=int(indptr[-1]),
+            )
+            matrix = sparse.csr_matrix(
+                (np.ones(indices.size), indices, indptr), shape=(n, n)
+            )
+            matrix.sort_indices()
+            self._adjacency_matrix = matrix
+        return self._adjacency_matrix
+
     def compute_clustering_coefficient(self) -> float:
         """
         Compute global clustering coefficient.
 
         The clustering coefficient measures the degree to which
-        neighbors of a node are connected to each other.
+        neighbors of a node are connected to each other. Directed
+        links among the out-neighbors of node i are counted as
+        ``((A @ A) * A)[i].sum()``.
 
         Returns:
             Average clustering coefficient
         """
-        coefficients = []
-
-        for neuron_id in self._neurons:
-            neighbors = self._adjacency.get(neuron_id, [])
-            k = len(neighbors)
-
-            if k < 2:
-                continue
-
-            # Count edges between neighbors
-            edges = 0
-            for i, n1 in enumerate(neighbors):
-                for n2 in neighbors[i+1:]:
-                    if n2 in self._adjacency.get(n1, []):
-                        edges += 1
-                    if n1 in self._adjacency.get(n2, []):
-                        edges += 1
-
-            # Maximum possible edges between k neighbors
-            max_edges = k * (k - 1)
+        A = self.get_adjacency_matrix()
+        k = np.diff(A.indptr)
 
-            if max_edges > 0:
-                coefficients.append(edges / max_edges)
+        # Links a -> b with both a and b out-neighbors of the row node
+        edges = np.asarray((A @ A).multiply(A).sum(axis=1)).ravel()
 
-        return np.mean(coefficients) if coefficients else 0.0
-
-    def compute_path_length(self, sample_size: int = 100) -> float:
+        # Maximum possible edges between k neighbors
+        valid = k >= 2
+        if not valid.any():
+            return 0.0
+        return float(np.mean(edges[valid] / (k[valid] * (k[valid] - 1))))
+
+    def compute_path_length(
+        self,
+        sample_size: int = 100,
+        batch_size: int = 4096,
+        rng: Optional[np.random.Generator] = None,
+    ) -> float:
         """
         Estimate average shortest path length.
 
-        Uses BFS from a sample of nodes for efficiency.
+        Runs a bit-parallel BFS (see multi_source_bfs) from a sample
+        of source nodes, ``batch_size`` sources at a time.
+
+        Sources are drawn from ``rng`` or else from a child stream of
+        the network seed (see _path_length_rng), never from self.rng,
+        so measuring a network does not change how a seeded run goes.
 
         Args:
             sample_size: Number of source nodes to sample
+            batch_size: Sources searched together
+            rng: Generator for the source sample (default: seed child)
 
         Returns:
             Average shortest path length
         """
-        neuron_ids = list(self._neurons.keys())
-        n = len(neuron_ids)
+        n = self.n_neurons
 
         if n <= 1:
             return 0.0
 
-        sample_ids = np.random.choice(
-            neuron_ids,
-            size=min(sample_size, n),
-            replace=False
-        )
+        rng = rng if rng is not None else self._path_length_rng()
+        sources = rng.choice(n, size=min(sample_size, n), replace=False)
+        A = self.get_adjacency_matrix()
 
-        path_lengths = []
+        total = count = 0
+        for start in range(0, sources.size, batch_size):
+            batch_total, batch_count = multi_source_bfs(A, sources[start:start + batch_size])
+            total += batch_total
+            count += batch_count
 
-        for source_id in sample_ids:
-            # BFS for shortest paths
-            distances = {source_id: 0}
-            queue = [source_id]
+        return total / count if count else float('inf')
 
-            while queue:
-                current = queue.pop(0)
-                current_dist = distances[current]
-
-                for neighbor in self._adjacency.get(current, []):
-                    if neighbor not in distances:
-                        distances[neighbor] = current_dist + 1
-                        queue.append(neighbor)
-
-            # Collect distances to all reachable nodes
-            for target_id, dist in distances.items():
-                if target_id != source_id and dist > 0:
-                    path_lengths.append(dist)
+    def _path_length_rng(self) -> np.random.Generator:
+        """
+        Fresh generator on the path length child stream of the seed.
 
-        return np.mean(path_lengths) if path_lengths else float('inf')
+        Every call starts the stream over, so the estimate is a function
+        of the topology alone. Unseeded networks get fresh entropy.
+        """
+        seed = self.params.seed
+        if isinstance(seed, np.random.Generator):
+            # Generators expose their SeedSequence as seed_seq (NumPy >= 1.25)
+            seed = getattr(seed.bit_generator, "seed_seq", None)
+        if seed is None:
+            return np.random.default_rng()
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        return np.random.default_rng(np.random.SeedSequence(
+            seed.entropy, spawn_key=tuple(seed.spawn_key) + _PATH_LENGTH_SPAWN_KEY,
+        ))
 
     def compute_topology_metrics(self) -> Dict[str, float]:
         """
@@ -362,10 +468,10 @@ class SmallWorldNetwork(Network):
 
     def get_degree_distribution(self) -> Dict[str, Any]:
         """Get degree distribution statistics."""
-        degrees = [len(self._adjacency.get(nid, [])) for nid in self._neurons]
+        degrees = np.diff(self.get_adjacency_matrix().indptr)
 
         return {
-            "degrees": np.array(degrees),
+            "degrees": degrees,
             "mean": np.mean(degrees),
             "std": np.std(degrees),
             "min": np.min(degrees),
@@ -6,13 +6,31 @@ Implements various neuron models with increasing biological realism:
 - Adaptive LIF: LIF with spike-frequency adaptation
 - Izhikevich: Rich dynamics, computationally efficient
 - Hodgkin-Huxley: Biophysically detailed, ion channel dynamics
+
+Vectorized populations (LIF, Adaptive LIF, Izhikevich, Hodgkin-Huxley)
+step many neurons of one model with a single update per time step,
+using numba kernels when installed and NumPy otherwise.
+
+Spikes of networked neurons live in a shared SpikeStore; each neuron's
+``state.spike_times`` is a list-like SpikeTrain view into it.
 """
 
 from .base import Neuron, NeuronState, NeuronParameters
 from .lif import LIFNeuron, LIFParameters
 from .adaptive_lif import AdaptiveLIFNeuron, AdaptiveLIFParameters
 from .izhikevich import IzhikevichNeuron, IzhikevichParameters
-from .hodgkin_huxley import HodgkinHuxleyNeuron, HodgkinHuxleyParameters
+from .hodgkin_huxley import HodgkinHuxleyNeuron, HodgkinHuxleyParameters, HHIntegrator
+from .population import (
+    NeuronPopulation,
+    LIFPopulation,
+    AdaptiveLIFPopulation,
+    IzhikevichPopulation,
+    HodgkinHuxleyPopulation,
+    create_populations,
+)
+from .kernels import NeuronKernels, get_kernels, is_numba_available
+from .rate_tables import HHRateTable, get_rate_table
+from .spikes import SpikeStore, SpikeTrain
 
 __all__ = [
     "Neuron",
@@ -26,4 +44,18 @@ __all__ = [
     "IzhikevichParameters",
     "HodgkinHuxleyNeuron",
     "HodgkinHuxleyParameters",
+    "HHIntegrator",
+    "NeuronPopulation",
+    "LIFPopulation",
+    "AdaptiveLIFPopulation",
+    "IzhikevichPopulation",
+    "HodgkinHuxleyPopulation",
+    "create_populations",
+    "NeuronKernels",
+    "get_kernels",
+    "is_numba_available",
+    "HHRateTable",
+    "get_rate_table",
+    "SpikeStore",
+    "SpikeTrain",
 ]
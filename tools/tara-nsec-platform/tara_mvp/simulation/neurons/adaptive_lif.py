@@ -94,6 +94,8 @@ class AdaptiveLIFNeuron(Neuron):
         >>> # Note how firing rate decreases over time (adaptation)
     """
 
+    state_variables = Neuron.state_variables + ("w",)
+
     def __init__(self, params: Optional[AdaptiveLIFParameters] = None):
         """
         Initialize Adaptive LIF neuron.
@@ -151,7 +153,7 @@ class AdaptiveLIFNeuron(Neuron):
 
         # Add noise if specified
         if p.noise_std > 0:
-            dV += np.random.normal(0, p.noise_std * np.sqrt(dt))
+            dV += p.noise_std * np.sqrt(dt) * self._standard_normal()
 
         return dV
 
@@ -7,7 +7,7 @@ Provides common interface and utilities for simulation.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from enum import Enum
 import numpy as np
 import uuid
@@ -52,28 +52,62 @@ class NeuronParameters:
         }
 
 
-@dataclass
 class NeuronState:
     """
     Current state of a neuron.
 
     Tracks membrane potential, spike history, and other dynamic variables.
+    Slotted (no per-instance ``__dict__``); the spike time and voltage
+    history lists are only allocated once something reads or records
+    them.
     """
-    # Core state
-    V: float = 0.0  # Membrane potential (mV)
-    fired: bool = False  # Did neuron fire this timestep?
-    refractory_remaining: float = 0.0  # Remaining refractory time (ms)
 
-    # Accumulated inputs
-    I_syn: float = 0.0  # Synaptic current (nA)
-    I_ext: float = 0.0  # External input current (nA)
+    __slots__ = (
+        "V", "fired", "refractory_remaining", "I_syn", "I_ext",
+        "_spike_times", "_V_history", "t",
+    )
 
-    # History tracking
-    spike_times: List[float] = field(default_factory=list)
-    V_history: List[float] = field(default_factory=list)
+    def __init__(
+        self,
+        V: float = 0.0,                     # Membrane potential (mV)
+        fired: bool = False,                # Did neuron fire this timestep?
+        refractory_remaining: float = 0.0,  # Remaining refractory time (ms)
+        I_syn: float = 0.0,                 # Synaptic current (nA)
+        I_ext: float = 0.0,                 # External input current (nA)
+        spike_times: Optional[List[float]] = None,
+        V_history: Optional[List[float]] = None,
+        t: float = 0.0,                     # Current simulation time (ms)
+    ):
+        self.V = V
+        self.fired = fired
+        self.refractory_remaining = refractory_remaining
+        self.I_syn = I_syn
+        self.I_ext = I_ext
+        self._spike_times = spike_times
+        self._V_history = V_history
+        self.t = t
 
-    # Time tracking
-    t: float = 0.0  # Current simulation time (ms)
+    @property
+    def spike_times(self) -> List[float]:
+        """Spike times (ms), allocated on first access."""
+        if self._spike_times is None:
+            self._spike_times = []
+        return self._spike_times
+
+    @spike_times.setter
+    def spike_times(self, value: List[float]):
+        self._spike_times = value
+
+    @property
+    def V_history(self) -> List[float]:
+        """Recorded membrane potentials (allocated on first access)."""
+        if self._V_history is None:
+            self._V_history = []
+        return self._V_history
+
+    @V_history.setter
+    def V_history(self, value: List[float]):
+        self._V_history = value
 
     def reset(self, V_rest: float = 0.0):
         """Reset neuron state to initial conditions."""
@@ -82,8 +116,9 @@ class NeuronState:
         self.refractory_remaining = 0.0
         self.I_syn = 0.0
         self.I_ext = 0.0
-        self.spike_times = []
-        self.V_history = []
+        if self._spike_times is not None:
+            self._spike_times.clear()  # may be a SpikeTrain view (see spikes.py)
+        self._V_history = None
         self.t = 0.0
 
     @property
@@ -106,9 +141,12 @@ class NeuronState:
             "t": self.t,
             "spike_count": self.spike_count,
             "firing_rate": self.firing_rate,
-            "spike_times": self.spike_times[-100:],  # Last 100 spikes
+            "spike_times": list(self.spike_times[-100:]),  # Last 100 spikes
         }
 
+    def __repr__(self) -> str:
+        return f"NeuronState(V={self.V:.2f}, t={self.t}, spike_count={self.spike_count})"
+
 
 class Neuron(ABC):
     """
@@ -120,8 +158,26 @@ class Neuron(ABC):
     - Spike detection
     - History tracking
     - Serialization
+    - Noise draws from an explicit random generator (see rng)
     """
 
+    #: Standard normals drawn per refill of the noise buffer
+    noise_block: int = 256
+
+    #: Dynamic variables saved by checkpoints (attribute paths)
+    state_variables: Tuple[str, ...] = (
+        "state.V", "state.fired", "state.refractory_remaining",
+        "state.I_syn", "state.I_ext", "state.t",
+    )
+
+    #: Bumped by on_spike (lets populations cache which neurons have callbacks)
+    spike_callback_generation: int = 0
+
+    # Random generator (see rng) and buffered standard normals
+    _rng: Optional[np.random.Generator] = None
+    _noise: List[float] = []
+    _noise_pos: int = 0
+
     def __init__(self, params: Optional[NeuronParameters] = None):
         """
         Initialize neuron with parameters.
@@ -139,6 +195,33 @@ class Neuron(ABC):
         """Unique identifier for this neuron."""
         return self.params.neuron_id
 
+    @property
+    def rng(self) -> np.random.Generator:
+        """
+        Random generator for membrane noise.
+
+        Networks share their own generator with every neuron they
+        hold; a standalone neuron gets a freshly seeded one on first use.
+        """
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator):
+        self._rng = rng
+        self._noise = []
+        self._noise_pos = 0
+
+    def _standard_normal(self) -> float:
+        """Next standard normal, drawn noise_block at a time from rng."""
+        if self._noise_pos >= len(self._noise):
+            self._noise = self.rng.standard_normal(self.noise_block).tolist()
+            self._noise_pos = 0
+        value = self._noise[self._noise_pos]
+        self._noise_pos += 1
+        return value
+
     @property
     def V(self) -> float:
         """Current membrane potential."""
@@ -312,6 +395,7 @@ class Neuron(ABC):
     def on_spike(self, callback: Callable):
         """Register callback for spike events."""
         self._spike_callbacks.append(callback)
+        Neuron.spike_callback_generation += 1
 
     def reset(self):
         """Reset neuron to initial state."""
@@ -13,6 +13,12 @@ Equations:
 Where m, h, n are gating variables with first-order kinetics:
     dx/dt = α_x(V)(1-x) - β_x(V)x
 
+Integrators (HodgkinHuxleyParameters.integrator):
+    EULER              forward Euler (default; needs dt <= ~0.025 ms)
+    EXPONENTIAL_EULER  exact exponential update of gates and V; stable at dt = 0.1
+    RK4                classical Runge-Kutta; stable up to dt ~ 0.05 ms
+    RK45               adaptive Dormand-Prince substeps within each dt
+
 Reference:
     Hodgkin, A.L. & Huxley, A.F. (1952). A quantitative description
     of membrane current and its application to conduction and
@@ -20,10 +26,29 @@ Reference:
 """
 
 from dataclasses import dataclass
+from enum import Enum
 from typing import Optional, Dict, Any
+import math
 import numpy as np
 
 from .base import Neuron, NeuronParameters, NeuronType
+from .integrators import HHConstants, rk4, rk45
+from .rate_tables import HHRateTable, get_rate_table
+
+
+def _exponential_gate(x: float, alpha: float, beta: float, dt: float) -> float:
+    """Exact update of a gate over dt with its rates frozen (Rush-Larsen)."""
+    rate = alpha + beta
+    x_inf = alpha / rate
+    return x_inf + (x - x_inf) * math.exp(-rate * dt)
+
+
+class HHIntegrator(Enum):
+    """Numerical integration schemes for Hodgkin-Huxley dynamics."""
+    EULER = "euler"
+    EXPONENTIAL_EULER = "exponential_euler"
+    RK4 = "rk4"
+    RK45 = "rk45"
 
 
 @dataclass
@@ -53,10 +78,27 @@ class HodgkinHuxleyParameters(NeuronParameters):
     temperature: float = 6.3  # °C
     temp_factor: float = 1.0  # Q10 factor (computed)
 
+    # Numerical integration
+    integrator: HHIntegrator = HHIntegrator.EULER
+    rk45_rtol: float = 1e-4  # Relative error tolerance (RK45)
+    rk45_atol: float = 1e-4  # Absolute error tolerance (RK45)
+
+    # Interpolated rate lookup table (shared per temp_factor, see rate_tables.py)
+    rate_table: bool = False
+    rate_table_resolution: float = 0.01  # mV between entries
+
     def __post_init__(self):
         """Compute temperature factor."""
         # Q10 temperature correction
         self.temp_factor = 3.0 ** ((self.temperature - 6.3) / 10.0)
+        self.integrator = HHIntegrator(self.integrator)
+
+    def constants(self) -> HHConstants:
+        """Membrane and channel constants for the array integrators."""
+        return HHConstants(
+            self.C_m, self.g_Na, self.g_K, self.g_L,
+            self.E_Na, self.E_K, self.E_L, self.temp_factor,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -71,6 +113,8 @@ class HodgkinHuxleyParameters(NeuronParameters):
             "E_L": self.E_L,
             "V_init": self.V_init,
             "temperature": self.temperature,
+            "integrator": self.integrator.value,
+            "rate_table": self.rate_table,
         })
         return base
 
@@ -89,6 +133,8 @@ class HodgkinHuxleyNeuron(Neuron):
         >>> # Observe realistic action potential shapes
     """
 
+    state_variables = Neuron.state_variables + ("m", "h", "n", "_prev_V")
+
     def __init__(self, params: Optional[HodgkinHuxleyParameters] = None):
         """
         Initialize Hodgkin-Huxley neuron.
@@ -128,6 +174,14 @@ class HodgkinHuxleyNeuron(Neuron):
         """Get resting membrane potential."""
         return self.params.V_init
 
+    @property
+    def rate_table(self) -> Optional[HHRateTable]:
+        """Shared rate lookup table, or None when exact rates are used."""
+        p = self.params
+        if not p.rate_table:
+            return None
+        return get_rate_table(p.temp_factor, p.rate_table_resolution)
+
     # --- Rate functions for gating variables ---
     # These are the classic Hodgkin-Huxley rate equations
 
@@ -136,34 +190,34 @@ class HodgkinHuxleyNeuron(Neuron):
         V_shifted = V + 65  # Shift to original HH convention
         if abs(V_shifted - 25) < 1e-7:
             return 1.0
-        return 0.1 * (25 - V_shifted) / (np.exp((25 - V_shifted) / 10) - 1)
+        return 0.1 * (25 - V_shifted) / (math.exp((25 - V_shifted) / 10) - 1)
 
     def _beta_m(self, V: float) -> float:
         """Backward rate for Na activation (m)."""
         V_shifted = V + 65
-        return 4.0 * np.exp(-V_shifted / 18)
+        return 4.0 * math.exp(-V_shifted / 18)
 
     def _alpha_h(self, V: float) -> float:
         """Forward rate for Na inactivation (h)."""
         V_shifted = V + 65
-        return 0.07 * np.exp(-V_shifted / 20)
+        return 0.07 * math.exp(-V_shifted / 20)
 
     def _beta_h(self, V: float) -> float:
         """Backward rate for Na inactivation (h)."""
         V_shifted = V + 65
-        return 1.0 / (np.exp((30 - V_shifted) / 10) + 1)
+        return 1.0 / (math.exp((30 - V_shifted) / 10) + 1)
 
     def _alpha_n(self, V: float) -> float:
         """Forward rate for K activation (n)."""
         V_shifted = V + 65
         if abs(V_shifted - 10) < 1e-7:
             return 0.1
-        return 0.01 * (10 - V_shifted) / (np.exp((10 - V_shifted) / 10) - 1)
+        return 0.01 * (10 - V_shifted) / (math.exp((10 - V_shifted) / 10) - 1)
 
     def _beta_n(self, V: float) -> float:
         """Backward rate for K activation (n)."""
         V_shifted = V + 65
-        return 0.125 * np.exp(-V_shifted / 80)
+        return 0.125 * math.exp(-V_shifted / 80)
 
     # Steady-state values
     def _m_inf(self, V: float) -> float:
@@ -183,18 +237,31 @@ class HodgkinHuxleyNeuron(Neuron):
         Compute membrane potential change using HH dynamics.
         """
         p = self.params
+        if p.integrator is HHIntegrator.EXPONENTIAL_EULER:
+            return self._exponential_euler(I_total)
+        if p.integrator is not HHIntegrator.EULER:
+            return self._integrate_arrays(I_total)
+
         dt = p.dt
         V = self.state.V
         phi = p.temp_factor  # Temperature correction
 
         # Update gating variables (forward Euler)
-        dm = phi * (self._alpha_m(V) * (1 - self.m) - self._beta_m(V) * self.m) * dt
-        dh = phi * (self._alpha_h(V) * (1 - self.h) - self._beta_h(V) * self.h) * dt
-        dn = phi * (self._alpha_n(V) * (1 - self.n) - self._beta_n(V) * self.n) * dt
+        if p.rate_table:
+            # Rates come pre-scaled by phi
+            a_m, b_m, a_h, b_h, a_n, b_n = self.rate_table.lookup_scalar(V)
+            dm = (a_m * (1 - self.m) - b_m * self.m) * dt
+            dh = (a_h * (1 - self.h) - b_h * self.h) * dt
+            dn = (a_n * (1 - self.n) - b_n * self.n) * dt
+        else:
+            dm = phi * (self._alpha_m(V) * (1 - self.m) - self._beta_m(V) * self.m) * dt
+            dh = phi * (self._alpha_h(V) * (1 - self.h) - self._beta_h(V) * self.h) * dt
+            dn = phi * (self._alpha_n(V) * (1 - self.n) - self._beta_n(V) * self.n) * dt
 
-        self.m = np.clip(self.m + dm, 0, 1)
-        self.h = np.clip(self.h + dh, 0, 1)
-        self.n = np.clip(self.n + dn, 0, 1)
+        # Scalar clamp (np.clip on Python floats dominates the step cost)
+        self.m = min(max(self.m + dm, 0.0), 1.0)
+        self.h = min(max(self.h + dh, 0.0), 1.0)
+        self.n = min(max(self.n + dn, 0.0), 1.0)
 
         # Compute ionic currents
         I_Na = p.g_Na * (self.m ** 3) * self.h * (V - p.E_Na)
@@ -206,6 +273,59 @@ class HodgkinHuxleyNeuron(Neuron):
 
         return dV
 
+    def _exponential_euler(self, I_total: float) -> float:
+        """
+        Scalar exponential Euler step (see integrators.exponential_euler).
+
+        Same update as the array integrator, on floats with math.exp:
+        for a single neuron, 1-element arrays cost more than the step.
+        """
+        p = self.params
+        dt = p.dt
+        V = self.state.V
+
+        if p.rate_table:
+            # Rates come pre-scaled by phi
+            a_m, b_m, a_h, b_h, a_n, b_n = self.rate_table.lookup_scalar(V)
+        else:
+            phi = p.temp_factor
+            a_m, b_m = phi * self._alpha_m(V), phi * self._beta_m(V)
+            a_h, b_h = phi * self._alpha_h(V), phi * self._beta_h(V)
+            a_n, b_n = phi * self._alpha_n(V), phi * self._beta_n(V)
+
+        # Gates first, with the old V; then V with the new gates
+        self.m = _exponential_gate(self.m, a_m, b_m, dt)
+        self.h = _exponential_gate(self.h, a_h, b_h, dt)
+        self.n = _exponential_gate(self.n, a_n, b_n, dt)
+
+        g_Na = p.g_Na * (self.m ** 3) * self.h
+        g_K = p.g_K * (self.n ** 4)
+        g_total = g_Na + g_K + p.g_L
+        V_inf = (I_total + g_Na * p.E_Na + g_K * p.E_K + p.g_L * p.E_L) / g_total
+
+        # V relaxes towards V_inf; expm1 keeps the small-step increment exact
+        return (V - V_inf) * math.expm1(-g_total / p.C_m * dt)
+
+    def _integrate_arrays(self, I_total: float) -> float:
+        """Advance V and gates with one of the array integrators (RK4, RK45)."""
+        p = self.params
+        V0 = self.state.V
+        y = (np.array([V0]), np.array([self.m]), np.array([self.h]), np.array([self.n]))
+
+        table = self.rate_table
+
+        if p.integrator is HHIntegrator.RK4:
+            V, m, h, n = rk4(*y, I_total, p.constants(), p.dt, table)
+        else:
+            V, m, h, n, self._rk45_step = rk45(
+                *y, I_total, p.constants(), p.dt,
+                h_step=getattr(self, "_rk45_step", p.dt),
+                rtol=p.rk45_rtol, atol=p.rk45_atol, table=table,
+            )
+
+        self.m, self.h, self.n = float(m[0]), float(h[0]), float(n[0])
+        return float(V[0]) - V0
+
     def _check_spike(self) -> bool:
         """
         Check for spike using threshold crossing.
@@ -260,6 +380,8 @@ class HodgkinHuxleyNeuron(Neuron):
         self.I_K_history = []
         if hasattr(self, '_prev_V'):
             del self._prev_V
+        if hasattr(self, '_rk45_step'):
+            del self._rk45_step
 
     def simulate(
         self,
@@ -0,0 +1,226 @@
+"""
+Hodgkin-Huxley Integrators
+
+Array integrators for the HH state (V, m, h, n), used by
+HodgkinHuxleyPopulation and, as 1-element arrays, by the RK4/RK45 paths
+of HodgkinHuxleyNeuron (its exponential Euler step is scalar).
+
+- exponential Euler: each gate and V are linear ODEs once the other
+  variables are frozen, so they are advanced with their exact
+  exponential solution (Rush-Larsen for the gates). Unconditionally
+  stable; first-order accurate.
+- RK4: classical fourth-order Runge-Kutta on the coupled system.
+- RK45: Dormand-Prince 5(4) with adaptive substeps inside each dt.
+  The step size is shared by the whole population and controlled by
+  its worst scaled error, so one fast-spiking neuron refines the step
+  for all of them.
+
+Forward Euler with exact rates stays in kernels.py (it is the
+numba-compiled default); ``euler`` here is the variant that reads rates
+from a lookup table. Every integrator accepts an optional HHRateTable.
+"""
+
+from typing import NamedTuple, Optional, Tuple, Union
+import numpy as np
+
+from .kernels import _hh_rates_numpy
+from .rate_tables import HHRateTable
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class HHConstants(NamedTuple):
+    """Per-neuron HH constants (floats or arrays broadcastable with V)."""
+    C_m: ArrayLike
+    g_Na: ArrayLike
+    g_K: ArrayLike
+    g_L: ArrayLike
+    E_Na: ArrayLike
+    E_K: ArrayLike
+    E_L: ArrayLike
+    phi: ArrayLike
+
+    def take(self, index: np.ndarray) -> "HHConstants":
+        """Select a subset of neurons from array-valued constants."""
+        return HHConstants(*(
+            c[index] if isinstance(c, np.ndarray) else c for c in self
+        ))
+
+
+def scaled_rates(V: np.ndarray, c: HHConstants, table: Optional[HHRateTable] = None):
+    """Temperature-scaled rates, from the table if one is given."""
+    if table is not None:
+        return table.lookup(V)
+    return tuple(c.phi * r for r in _hh_rates_numpy(V))
+
+
+def hh_derivatives(
+    V: np.ndarray, m: np.ndarray, h: np.ndarray, n: np.ndarray,
+    I_total: np.ndarray, c: HHConstants, table: Optional[HHRateTable] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Right-hand side of the HH equations (per ms)."""
+    alpha_m, beta_m, alpha_h, beta_h, alpha_n, beta_n = scaled_rates(V, c, table)
+
+    I_Na = c.g_Na * (m ** 3) * h * (V - c.E_Na)
+    I_K = c.g_K * (n ** 4) * (V - c.E_K)
+    I_L = c.g_L * (V - c.E_L)
+
+    return (
+        (I_total - I_Na - I_K - I_L) / c.C_m,
+        alpha_m * (1 - m) - beta_m * m,
+        alpha_h * (1 - h) - beta_h * h,
+        alpha_n * (1 - n) - beta_n * n,
+    )
+
+
+def euler(V, m, h, n, I_total, c: HHConstants, dt: float, table: Optional[HHRateTable] = None):
+    """
+    One forward Euler step (same ordering as the kernel in kernels.py).
+
+    Returns:
+        Tuple of new (V, m, h, n) arrays
+    """
+    alpha_m, beta_m, alpha_h, beta_h, alpha_n, beta_n = scaled_rates(V, c, table)
+
+    m = np.clip(m + (alpha_m * (1 - m) - beta_m * m) * dt, 0, 1)
+    h = np.clip(h + (alpha_h * (1 - h) - beta_h * h) * dt, 0, 1)
+    n = np.clip(n + (alpha_n * (1 - n) - beta_n * n) * dt, 0, 1)
+
+    I_Na = c.g_Na * (m ** 3) * h * (V - c.E_Na)
+    I_K = c.g_K * (n ** 4) * (V - c.E_K)
+    I_L = c.g_L * (V - c.E_L)
+
+    return V + (I_total - I_Na - I_K - I_L) / c.C_m * dt, m, h, n
+
+
+def exponential_euler(
+    V, m, h, n, I_total, c: HHConstants, dt: float, table: Optional[HHRateTable] = None
+):
+    """
+    One exponential Euler step.
+
+    Gates are advanced with the old V; V is then advanced with the new
+    gates, mirroring the ordering of the forward Euler kernel.
+
+    Returns:
+        Tuple of new (V, m, h, n) arrays
+    """
+    alpha_m, beta_m, alpha_h, beta_h, alpha_n, beta_n = scaled_rates(V, c, table)
+
+    def gate(x, alpha, beta):
+        rate = alpha + beta
+        x_inf = alpha / rate
+        return x_inf + (x - x_inf) * np.exp(-rate * dt)
+
+    m = gate(m, alpha_m, beta_m)
+    h = gate(h, alpha_h, beta_h)
+    n = gate(n, alpha_n, beta_n)
+
+    g_Na = c.g_Na * (m ** 3) * h
+    g_K = c.g_K * (n ** 4)
+    g_total = g_Na + g_K + c.g_L
+    V_inf = (I_total + g_Na * c.E_Na + g_K * c.E_K + c.g_L * c.E_L) / g_total
+    V = V_inf + (V - V_inf) * np.exp(-g_total / c.C_m * dt)
+
+    return V, m, h, n
+
+
+def rk4(V, m, h, n, I_total, c: HHConstants, dt: float, table: Optional[HHRateTable] = None):
+    """
+    One classical Runge-Kutta step (input held constant over dt).
+
+    Returns:
+        Tuple of new (V, m, h, n) arrays
+    """
+    y = (V, m, h, n)
+    k1 = hh_derivatives(*y, I_total, c, table)
+    k2 = hh_derivatives(*(yi + 0.5 * dt * ki for yi, ki in zip(y, k1)), I_total, c, table)
+    k3 = hh_derivatives(*(yi + 0.5 * dt * ki for yi, ki in zip(y, k2)), I_total, c, table)
+    k4 = hh_derivatives(*(yi + dt * ki for yi, ki in zip(y, k3)), I_total, c, table)
+
+    V, m, h, n = (
+        yi + dt / 6 * (a + 2 * b + 2 * e + d)
+        for yi, a, b, e, d in zip(y, k1, k2, k3, k4)
+    )
+    return V, np.clip(m, 0, 1), np.clip(h, 0, 1), np.clip(n, 0, 1)
+
+
+# Dormand-Prince 5(4) tableau
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+_DP_B5 = (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0.0)
+_DP_B4 = (5179 / 57600, 0.0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+_DP_E = tuple(b5 - b4 for b5, b4 in zip(_DP_B5, _DP_B4))
+
+
+def rk45(
+    V, m, h, n, I_total, c: HHConstants, dt: float,
+    h_step: float, rtol: float = 1e-4, atol: float = 1e-4,
+    max_substeps: int = 1000, table: Optional[HHRateTable] = None,
+):
+    """
+    Advance by dt with adaptive Dormand-Prince substeps.
+
+    Args:
+        V, m, h, n: State arrays
+        I_total: Input current (held constant over dt)
+        c: HH constants
+        dt: Interval to cover (ms)
+        h_step: Initial substep size (the value returned by the previous call)
+        rtol, atol: Error tolerances applied to every state variable
+        max_substeps: Safety limit on accepted + rejected substeps
+        table: Optional rate lookup table
+
+    Returns:
+        Tuple of new (V, m, h, n) arrays and the next substep size
+    """
+    if np.size(V) == 0:
+        return V, m, h, n, h_step
+
+    y = [V, m, h, n]
+    t = 0.0
+    h_step = min(h_step, dt)
+
+    n_substeps = 0
+
+    while t < dt - 1e-12:
+        n_substeps += 1
+        if n_substeps > max_substeps:
+            raise RuntimeError(f"RK45 exceeded {max_substeps} substeps within dt={dt}")
+        step = min(h_step, dt - t)
+
+        k = [hh_derivatives(*y, I_total, c, table)]
+        for a_row in _DP_A[1:]:
+            stage = [
+                yi + step * sum(a * kj[var] for a, kj in zip(a_row, k))
+                for var, yi in enumerate(y)
+            ]
+            k.append(hh_derivatives(*stage, I_total, c, table))
+
+        # The 7th stage is evaluated at the 5th-order solution (FSAL)
+        y_new = stage
+        err = 0.0
+        for var, yi in enumerate(y):
+            e = step * sum(ei * kj[var] for ei, kj in zip(_DP_E, k))
+            scale = atol + rtol * np.maximum(np.abs(yi), np.abs(y_new[var]))
+            err = max(err, float(np.max(np.abs(e) / scale)))
+
+        factor = 5.0 if err == 0 else min(5.0, max(0.2, 0.9 * err ** -0.2))
+        new_step = step * factor
+        if err <= 1.0:
+            t += step
+            y = y_new
+            # A substep clipped to land on dt must not shrink the carried size
+            if step < h_step:
+                new_step = max(new_step, h_step)
+        h_step = new_step
+
+    V, m, h, n = y
+    return V, np.clip(m, 0, 1), np.clip(h, 0, 1), np.clip(n, 0, 1), h_step
@@ -126,6 +126,8 @@ class IzhikevichNeuron(Neuron):
         >>> fs_neuron = IzhikevichNeuron.from_preset(IzhikevichType.FAST_SPIKING)
     """
 
+    state_variables = Neuron.state_variables + ("u",)
+
     def __init__(self, params: Optional[IzhikevichParameters] = None):
         """
         Initialize Izhikevich neuron.
@@ -177,7 +179,7 @@ class IzhikevichNeuron(Neuron):
 
         # Add noise if specified
         if p.noise_std > 0:
-            V += np.random.normal(0, p.noise_std * np.sqrt(dt))
+            V += p.noise_std * np.sqrt(dt) * self._standard_normal()
 
         # Store updated u
         self.u = u
@@ -242,23 +244,30 @@ class IzhikevichNeuron(Neuron):
     def create_random(
         cls,
         excitatory: bool = True,
+        rng: Optional[np.random.Generator] = None,
         **kwargs
     ) -> "IzhikevichNeuron":
         """
         Create neuron with random parameters within typical ranges.
 
         Used for creating heterogeneous populations.
+
+        Args:
+            excitatory: Draw from the excitatory (RS-IB) or inhibitory
+                (FS-LTS) range
+            rng: Random generator (None = freshly seeded)
         """
+        rng = rng if rng is not None else np.random.default_rng()
         if excitatory:
             # Excitatory: random between RS and IB
-            r = np.random.random()
+            r = rng.random()
             a = 0.02
             b = 0.2
             c = -65.0 + 15 * r**2
             d = 8.0 - 6 * r**2
         else:
             # Inhibitory: random between FS and LTS
-            r = np.random.random()
+            r = rng.random()
             a = 0.02 + 0.08 * r
             b = 0.25 - 0.05 * r
             c = -65.0
@@ -0,0 +1,231 @@
+"""
+Neuron Integration Kernels
+
+Array update functions for the state of whole neuron populations,
+one per model, in two interchangeable implementations:
+
+- "numpy": hand-vectorized NumPy expressions (always available)
+- "numba": explicit loops compiled with numba.njit (optional
+  dependency, ``pip install numba``)
+
+``get_kernels("auto")`` picks numba when it is installed and falls
+back to NumPy otherwise. Both variants update arrays in place and
+evaluate the same expressions in the same order as the scalar
+``_compute_dV`` of each model, so they agree to rounding (spiking
+Hodgkin-Huxley dynamics amplify last-bit differences of exp()).
+
+Noise is drawn outside the kernels, from the population's Generator
+(the network's ``rng``), and added by the caller, which keeps results
+independent of the kernel backend.
+"""
+
+import logging
+import math
+from typing import Callable, Dict, NamedTuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Check if numba is available
+_NUMBA_AVAILABLE = False
+_numba = None
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+    _numba = numba
+except ImportError:
+    pass
+
+
+def is_numba_available() -> bool:
+    """Check if numba JIT kernels can be used."""
+    return _NUMBA_AVAILABLE
+
+
+class NeuronKernels(NamedTuple):
+    """Set of integration kernels for one backend."""
+    backend: str
+    lif: Callable
+    izhikevich: Callable
+    hodgkin_huxley: Callable
+
+
+# =============================================================================
+# NumPy kernels
+# =============================================================================
+
+def _lif_numpy(V, I_total, active, R_m, tau_m, V_rest, dt):
+    """dV = (-(V - V_rest) + R_m * I) / tau_m * dt for active neurons."""
+    dV = (-(V - V_rest) + R_m * I_total) / tau_m * dt
+    V[active] += dV[active]
+
+
+def _izhikevich_numpy(V, u, I_total, active, a, b, dt):
+    """Two half-dt Euler substeps of the Izhikevich equations."""
+    half_dt = dt / 2
+    V_new = V.copy()
+    u_new = u.copy()
+    for _ in range(2):
+        dV = (0.04 * V_new**2 + 5 * V_new + 140 - u_new + I_total) * half_dt
+        du = a * (b * V_new - u_new) * half_dt
+        V_new += dV
+        u_new += du
+    V[active] = V_new[active]
+    u[active] = u_new[active]
+
+
+def _hh_rates_numpy(V):
+    """Classic HH rate functions (alpha/beta for m, h, n)."""
+    Vs = V + 65
+
+    x = 25 - Vs
+    singular = np.abs(x) < 1e-7
+    safe = np.where(singular, 1.0, x)
+    alpha_m = np.where(singular, 1.0, 0.1 * safe / (np.exp(safe / 10) - 1))
+    beta_m = 4.0 * np.exp(-Vs / 18)
+
+    alpha_h = 0.07 * np.exp(-Vs / 20)
+    beta_h = 1.0 / (np.exp((30 - Vs) / 10) + 1)
+
+    x = 10 - Vs
+    singular = np.abs(x) < 1e-7
+    safe = np.where(singular, 1.0, x)
+    alpha_n = np.where(singular, 0.1, 0.01 * safe / (np.exp(safe / 10) - 1))
+    beta_n = 0.125 * np.exp(-Vs / 80)
+
+    return alpha_m, beta_m, alpha_h, beta_h, alpha_n, beta_n
+
+
+def _hodgkin_huxley_numpy(V, m, h, n, I_total, active,
+                          C_m, g_Na, g_K, g_L, E_Na, E_K, E_L, phi, dt):
+    """Forward Euler gating update followed by the membrane equation."""
+    alpha_m, beta_m, alpha_h, beta_h, alpha_n, beta_n = _hh_rates_numpy(V)
+
+    m_new = np.clip(m + phi * (alpha_m * (1 - m) - beta_m * m) * dt, 0, 1)
+    h_new = np.clip(h + phi * (alpha_h * (1 - h) - beta_h * h) * dt, 0, 1)
+    n_new = np.clip(n + phi * (alpha_n * (1 - n) - beta_n * n) * dt, 0, 1)
+
+    I_Na = g_Na * (m_new ** 3) * h_new * (V - E_Na)
+    I_K = g_K * (n_new ** 4) * (V - E_K)
+    I_L = g_L * (V - E_L)
+    dV = (I_total - I_Na - I_K - I_L) / C_m * dt
+
+    m[active] = m_new[active]
+    h[active] = h_new[active]
+    n[active] = n_new[active]
+    V[active] += dV[active]
+
+
+# =============================================================================
+# Loop kernels (compiled with numba when available)
+# =============================================================================
+
+def _lif_loop(V, I_total, active, R_m, tau_m, V_rest, dt):
+    for i in range(V.shape[0]):
+        if active[i]:
+            V[i] += (-(V[i] - V_rest[i]) + R_m[i] * I_total[i]) / tau_m[i] * dt
+
+
+def _izhikevich_loop(V, u, I_total, active, a, b, dt):
+    half_dt = dt / 2
+    for i in range(V.shape[0]):
+        if active[i]:
+            v = V[i]
+            w = u[i]
+            for _ in range(2):
+                dv = (0.04 * v**2 + 5 * v + 140 - w + I_total[i]) * half_dt
+                dw = a[i] * (b[i] * v - w) * half_dt
+                v += dv
+                w += dw
+            V[i] = v
+            u[i] = w
+
+
+def _hodgkin_huxley_loop(V, m, h, n, I_total, active,
+                         C_m, g_Na, g_K, g_L, E_Na, E_K, E_L, phi, dt):
+    for i in range(V.shape[0]):
+        if not active[i]:
+            continue
+        v = V[i]
+        Vs = v + 65
+
+        if abs(25 - Vs) < 1e-7:
+            alpha_m = 1.0
+        else:
+            alpha_m = 0.1 * (25 - Vs) / (math.exp((25 - Vs) / 10) - 1)
+        beta_m = 4.0 * math.exp(-Vs / 18)
+        alpha_h = 0.07 * math.exp(-Vs / 20)
+        beta_h = 1.0 / (math.exp((30 - Vs) / 10) + 1)
+        if abs(10 - Vs) < 1e-7:
+            alpha_n = 0.1
+        else:
+            alpha_n = 0.01 * (10 - Vs) / (math.exp((10 - Vs) / 10) - 1)
+        beta_n = 0.125 * math.exp(-Vs / 80)
+
+        p = phi[i]
+        mi = min(max(m[i] + p * (alpha_m * (1 - m[i]) - beta_m * m[i]) * dt, 0.0), 1.0)
+        hi = min(max(h[i] + p * (alpha_h * (1 - h[i]) - beta_h * h[i]) * dt, 0.0), 1.0)
+        ni = min(max(n[i] + p * (alpha_n * (1 - n[i]) - beta_n * n[i]) * dt, 0.0), 1.0)
+
+        I_Na = g_Na[i] * (mi ** 3) * hi * (v - E_Na[i])
+        I_K = g_K[i] * (ni ** 4) * (v - E_K[i])
+        I_L = g_L[i] * (v - E_L[i])
+
+        m[i] = mi
+        h[i] = hi
+        n[i] = ni
+        V[i] = v + (I_total[i] - I_Na - I_K - I_L) / C_m[i] * dt
+
+
+_NUMPY_KERNELS = NeuronKernels(
+    backend="numpy",
+    lif=_lif_numpy,
+    izhikevich=_izhikevich_numpy,
+    hodgkin_huxley=_hodgkin_huxley_numpy,
+)
+
+_KERNEL_CACHE: Dict[str, NeuronKernels] = {"numpy": _NUMPY_KERNELS}
+
+
+def _compile_numba_kernels() -> NeuronKernels:
+    """JIT-compile the loop kernels (compiled lazily on first call)."""
+    njit = _numba.njit(cache=True, nogil=True)
+    return NeuronKernels(
+        backend="numba",
+        lif=njit(_lif_loop),
+        izhikevich=njit(_izhikevich_loop),
+        hodgkin_huxley=njit(_hodgkin_huxley_loop),
+    )
+
+
+def get_kernels(backend: str = "auto") -> NeuronKernels:
+    """
+    Get integration kernels for a backend.
+
+    Args:
+        backend: "auto" (numba if installed, else numpy), "numpy" or "numba"
+
+    Returns:
+        NeuronKernels for the resolved backend
+
+    Raises:
+        ImportError: If "numba" is requested but not installed
+        ValueError: If the backend name is unknown
+    """
+    if backend == "auto":
+        backend = "numba" if _NUMBA_AVAILABLE else "numpy"
+
+    if backend not in ("numpy", "numba"):
+        raise ValueError(f"Unknown kernel backend: {backend!r}")
+
+    if backend == "numba" and not _NUMBA_AVAILABLE:
+        raise ImportError(
+            "numba is required for the 'numba' kernel backend. "
+            "Install with: pip install numba"
+        )
+
+    if backend not in _KERNEL_CACHE:
+        _KERNEL_CACHE[backend] = _compile_numba_kernels()
+        logger.info("Compiled numba neuron kernels")
+    return _KERNEL_CACHE[backend]
@@ -111,7 +111,7 @@ class LIFNeuron(Neuron):
 
         # Add noise if specified
         if p.noise_std > 0:
-            dV += np.random.normal(0, p.noise_std * np.sqrt(dt))
+            dV += p.noise_std * np.sqrt(dt) * self._standard_normal()
 
         return dV
 
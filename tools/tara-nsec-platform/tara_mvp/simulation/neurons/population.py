@@ -0,0 +1,805 @@
+"""
+Vectorized Neuron Populations
+
+Stores every neuron of one model as contiguous NumPy state arrays
+(V, refractory, I_syn, I_ext plus model-specific variables) and
+advances the whole population with one vectorized update per dt.
+
+Each bound neuron keeps working as an object: its ``state`` is
+replaced by a PopulationNeuronState view that reads and writes the
+population arrays, so ``receive_input``, spike callbacks and
+recorders keep working unchanged.
+
+Membrane updates for LIF, Izhikevich and Hodgkin-Huxley go through
+the kernel layer (see kernels.py), which uses numba when installed
+and hand-vectorized NumPy otherwise.
+
+Supported models:
+- LIFNeuron
+- AdaptiveLIFNeuron
+- IzhikevichNeuron
+- HodgkinHuxleyNeuron
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, List, Tuple, Type, Sequence
+import numpy as np
+
+from .base import Neuron, NeuronState
+from .lif import LIFNeuron
+from .adaptive_lif import AdaptiveLIFNeuron
+from .izhikevich import IzhikevichNeuron
+from .hodgkin_huxley import HodgkinHuxleyNeuron, HHIntegrator
+from .integrators import HHConstants, euler, exponential_euler, rk4, rk45
+from .kernels import get_kernels
+from .spikes import SpikeStore
+
+
+class PopulationNeuronState(NeuronState):
+    """
+    NeuronState view into a NeuronPopulation.
+
+    Scalar state (V, fired, refractory, inputs, time) lives in the
+    population arrays; spike times stay a per-neuron list (or the
+    neuron's SpikeTrain when it belongs to a network).
+    """
+
+    __slots__ = ("_population", "_index")
+
+    def __init__(self, population: "NeuronPopulation", index: int):
+        """
+        Initialize view.
+
+        Args:
+            population: Owning population
+            index: Position of the neuron within the population
+        """
+        self._population = population
+        self._index = index
+        self.spike_times: List[float] = []
+
+    @property
+    def V(self) -> float:
+        return float(self._population.V[self._index])
+
+    @V.setter
+    def V(self, value: float):
+        self._population.V[self._index] = value
+
+    @property
+    def fired(self) -> bool:
+        return bool(self._population.fired[self._index])
+
+    @fired.setter
+    def fired(self, value: bool):
+        self._population.fired[self._index] = value
+
+    @property
+    def refractory_remaining(self) -> float:
+        return float(self._population.refractory[self._index])
+
+    @refractory_remaining.setter
+    def refractory_remaining(self, value: float):
+        self._population.refractory[self._index] = value
+
+    @property
+    def I_syn(self) -> float:
+        return float(self._population.I_syn[self._index])
+
+    @I_syn.setter
+    def I_syn(self, value: float):
+        self._population.I_syn[self._index] = value
+
+    @property
+    def I_ext(self) -> float:
+        return float(self._population.I_ext[self._index])
+
+    @I_ext.setter
+    def I_ext(self, value: float):
+        self._population.I_ext[self._index] = value
+
+    @property
+    def t(self) -> float:
+        return self._population.t
+
+    @t.setter
+    def t(self, value: float):
+        self._population.t = value
+
+    @property
+    def V_history(self) -> List[float]:
+        """Voltage history of this neuron (built from population history)."""
+        history = self._population.get_V_history()
+        if history.size == 0:
+            return []
+        return history[:, self._index].tolist()
+
+    @V_history.setter
+    def V_history(self, value: List[float]):
+        # Population-wide history is cleared by NeuronPopulation.reset()
+        pass
+
+    def reset(self, V_rest: float = 0.0):
+        """Reset this neuron's slot in the population."""
+        self.V = V_rest
+        self.fired = False
+        self.refractory_remaining = 0.0
+        self.I_syn = 0.0
+        self.I_ext = 0.0
+        self.spike_times.clear()
+
+    def __repr__(self) -> str:
+        return f"PopulationNeuronState(index={self._index}, V={self.V:.2f})"
+
+
+class NeuronPopulation(ABC):
+    """
+    Abstract base class for vectorized neuron populations.
+
+    Mirrors Neuron.step() for a whole population:
+    1. Refractory neurons count down and ignore input
+    2. Active neurons integrate I_syn + I_ext
+    3. Threshold crossings fire, reset and notify spike callbacks
+    4. Inputs are cleared and time advances by dt
+
+    State arrays may be views into larger arrays (see ``bind``), which
+    lets a network keep one contiguous V / I_syn array across all of
+    its populations.
+
+    Membrane noise is pre-drawn from ``rng`` as one
+    (noise_chunk, n_noisy) standard normal block per noise_chunk steps.
+    """
+
+    #: Neuron class handled by this population
+    neuron_class: Type[Neuron] = Neuron
+
+    #: Steps of membrane noise drawn per block
+    noise_chunk: int = 128
+
+    def __init__(self, neurons: Sequence[Neuron], kernels: str = "auto"):
+        """
+        Initialize population from existing neuron objects.
+
+        Args:
+            neurons: Neurons of ``neuron_class`` (all with the same dt)
+            kernels: Kernel backend ("auto", "numpy" or "numba")
+        """
+        if not neurons:
+            raise ValueError("Population requires at least one neuron")
+
+        self.kernels = get_kernels(kernels)
+
+        self.neurons: List[Neuron] = list(neurons)
+        self.size = len(self.neurons)
+        self.dt = self.neurons[0].params.dt
+        self.t = self.neurons[0].state.t
+
+        for neuron in self.neurons:
+            if type(neuron) is not self.neuron_class:
+                raise TypeError(
+                    f"{type(self).__name__} cannot hold {type(neuron).__name__}"
+                )
+            if neuron.params.dt != self.dt:
+                raise ValueError("All neurons in a population must share dt")
+
+        # Core state (replaced by views in bind())
+        self.V = np.array([n.state.V for n in self.neurons], dtype=np.float64)
+        self.refractory = np.array(
+            [n.state.refractory_remaining for n in self.neurons], dtype=np.float64
+        )
+        self.I_syn = np.array([n.state.I_syn for n in self.neurons], dtype=np.float64)
+        self.I_ext = np.array([n.state.I_ext for n in self.neurons], dtype=np.float64)
+        self.fired = np.zeros(self.size, dtype=bool)
+
+        self._V_history: List[np.ndarray] = []
+        self._V_history_cache: Optional[np.ndarray] = None
+
+        # Shared spike store (see attach_spike_store)
+        self._spike_store: Optional[SpikeStore] = None
+        self._store_index: Optional[np.ndarray] = None
+
+        # Neurons with spike callbacks, refreshed when callbacks are added
+        self._has_callbacks = np.zeros(self.size, dtype=bool)
+        self._callback_generation = -1
+
+        # Noise (set up by models with a noise_std, see _init_noise)
+        self._rng = self.neurons[0].rng
+        self._noise_index = np.empty(0, dtype=np.int64)
+        self._noise_scale = np.empty(0)
+        self._noise_block = np.empty((0, 0))
+        self._noise_row = 0
+
+        self._load_parameters()
+        self._load_state()
+
+        # Existing spike history is preserved in the views
+        spike_times = [n.state.spike_times for n in self.neurons]
+        for i, neuron in enumerate(self.neurons):
+            neuron.state = PopulationNeuronState(self, i)
+            neuron.state.spike_times = spike_times[i]
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """Random generator for membrane noise (shared with the neurons)."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: np.random.Generator):
+        self._rng = rng
+        self._noise_block = np.empty((0, self._noise_index.size))
+        self._noise_row = 0
+
+    def _init_noise(self, noise_std: np.ndarray):
+        """Record per-neuron noise amplitudes (mV per sqrt(ms))."""
+        self.noise_std = noise_std
+        self._noise_index = np.flatnonzero(noise_std > 0)
+        self._noise_scale = noise_std[self._noise_index] * np.sqrt(self.dt)
+        self._noise_block = np.empty((0, self._noise_index.size))
+        self._noise_row = 0
+
+    def _add_noise(self, values: np.ndarray, active: np.ndarray):
+        """
+        Add one step of Gaussian noise to ``values`` of active noisy neurons.
+
+        Rows of the pre-drawn block are consumed one per step, whether
+        or not every noisy neuron is active.
+        """
+        if self._noise_index.size == 0:
+            return
+        if self._noise_row >= len(self._noise_block):
+            self._noise_block = self._rng.standard_normal(
+                (self.noise_chunk, self._noise_index.size)
+            )
+            self._noise_block *= self._noise_scale
+            self._noise_row = 0
+        noise = self._noise_block[self._noise_row]
+        self._noise_row += 1
+
+        on = active[self._noise_index]
+        values[self._noise_index[on]] += noise[on]
+
+    def _param(self, name: str) -> np.ndarray:
+        """Gather one parameter across the population."""
+        return np.array([getattr(n.params, name) for n in self.neurons], dtype=np.float64)
+
+    @abstractmethod
+    def _load_parameters(self):
+        """Gather per-neuron parameters into arrays."""
+        pass
+
+    def _load_state(self):
+        """Gather model-specific state variables into arrays (none by default)."""
+        return
+
+    @abstractmethod
+    def _integrate(self, I_total: np.ndarray, active: np.ndarray):
+        """
+        Integrate membrane dynamics for one step.
+
+        Args:
+            I_total: Total input current per neuron (nA)
+            active: Mask of non-refractory neurons to update
+        """
+        pass
+
+    @abstractmethod
+    def _threshold(self) -> np.ndarray:
+        """Return mask of neurons at or above threshold."""
+        pass
+
+    @abstractmethod
+    def _reset_spiking(self, spiked: np.ndarray):
+        """Apply post-spike reset to the neurons in ``spiked``."""
+        pass
+
+    @abstractmethod
+    def _reset_state(self):
+        """Reset model-specific state to initial conditions."""
+        pass
+
+    def bind(self, V: np.ndarray, I_syn: np.ndarray, I_ext: np.ndarray):
+        """
+        Move core state into externally owned arrays.
+
+        Used by the network population backend so all populations
+        share contiguous V / input arrays.
+
+        Args:
+            V: Slice receiving membrane potentials
+            I_syn: Slice receiving synaptic input
+            I_ext: Slice receiving external input
+        """
+        V[:] = self.V
+        I_syn[:] = self.I_syn
+        I_ext[:] = self.I_ext
+        self.V = V
+        self.I_syn = I_syn
+        self.I_ext = I_ext
+
+    def step(self, record_history: bool = True) -> np.ndarray:
+        """
+        Advance all neurons by one time step.
+
+        Args:
+            record_history: Whether to record voltage history
+
+        Returns:
+            Boolean array of neurons that fired this step
+        """
+        t = self.t
+        self.fired[:] = False
+
+        refractory = self.refractory > 0
+        self.refractory[refractory] -= self.dt
+        active = ~refractory
+
+        self._integrate(self.I_syn + self.I_ext, active)
+
+        spiked = active & self._threshold()
+        if spiked.any():
+            self.fired[spiked] = True
+            self._reset_spiking(spiked)
+            self._notify_spikes(np.flatnonzero(spiked), t)
+
+        if record_history:
+            self._V_history.append(self.V.copy())
+            self._V_history_cache = None
+
+        self.I_syn[:] = 0.0
+        self.I_ext[:] = 0.0
+        self.t = t + self.dt
+
+        return self.fired
+
+    def attach_spike_store(self, store: SpikeStore):
+        """
+        Record spikes into a shared SpikeStore.
+
+        Each neuron's ``spike_times`` becomes a view into the store and
+        every step appends all of its spikes with one ``extend`` call.
+
+        Args:
+            store: Store to record into (usually the network's)
+        """
+        for neuron in self.neurons:
+            store.bind(neuron)
+        self._spike_store = store
+        self._store_index = np.array(
+            [store.index[n.id] for n in self.neurons], dtype=np.int32
+        )
+
+    def _notify_spikes(self, indices: np.ndarray, t: float):
+        """Record spike times and run per-neuron spike callbacks."""
+        if self._spike_store is not None:
+            self._spike_store.extend(self._store_index[indices], t)
+        else:
+            for i in indices:
+                self.neurons[i].state.spike_times.append(t)
+
+        if self._callback_generation != Neuron.spike_callback_generation:
+            self._callback_generation = Neuron.spike_callback_generation
+            self._has_callbacks = np.array([bool(n._spike_callbacks) for n in self.neurons])
+        for i in indices[self._has_callbacks[indices]]:
+            neuron = self.neurons[i]
+            for callback in neuron._spike_callbacks:
+                callback(neuron, t)
+
+    def get_V_history(self) -> np.ndarray:
+        """Recorded voltages as a (steps, size) array."""
+        if self._V_history_cache is None or len(self._V_history_cache) != len(self._V_history):
+            if self._V_history:
+                self._V_history_cache = np.vstack(self._V_history)
+            else:
+                self._V_history_cache = np.empty((0, self.size))
+        return self._V_history_cache
+
+    def reset(self):
+        """Reset every neuron in the population to initial conditions."""
+        self.V[:] = [n.get_V_rest() for n in self.neurons]
+        self.refractory[:] = 0.0
+        self.I_syn[:] = 0.0
+        self.I_ext[:] = 0.0
+        self.fired[:] = False
+        self.t = 0.0
+        self._V_history = []
+        self._V_history_cache = None
+        self._reset_state()
+        if self._spike_store is not None:
+            self._spike_store.discard(self._store_index)
+        else:
+            for neuron in self.neurons:
+                neuron.state.spike_times.clear()
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Get copies of the population state arrays.
+
+        Besides the per-neuron arrays this holds the population time
+        ``t`` and, for noisy populations, the not yet used rows of the
+        pre-drawn ``noise`` block.
+        """
+        state = {
+            "V": self.V.copy(),
+            "refractory": self.refractory.copy(),
+            "fired": self.fired.copy(),
+            "t": np.array(self.t),
+        }
+        if self._noise_index.size:
+            state["noise"] = self._noise_block[self._noise_row:].copy()
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Load state saved by get_state (e.g. from a checkpoint).
+
+        Args:
+            state: Arrays keyed as in get_state
+        """
+        for name, value in state.items():
+            if name == "t":
+                self.t = float(value)
+            elif name == "noise":
+                self._noise_block = np.array(value, dtype=np.float64)
+                self._noise_row = 0
+            else:
+                getattr(self, name)[:] = value
+
+    def inherit(self, previous: Dict[str, Tuple["NeuronPopulation", int]]):
+        """
+        Take over the state of neurons previously stepped by other populations.
+
+        Used when a network rebuilds its backend after a topology change.
+        Per-neuron arrays (V, refractory, fired and model variables such
+        as ``w``, ``u`` or the HH gates) are copied by neuron ID, and the
+        unused pre-drawn noise when every noisy neuron was already noisy
+        in the same population. A population with unchanged membership
+        also keeps its voltage history.
+
+        Args:
+            previous: Mapping of neuron ID -> (old population, index in it)
+        """
+        sources = [previous.get(n.id) for n in self.neurons]
+        first = sources[0]
+        if (first is not None and type(first[0]) is type(self) and first[0].size == self.size
+                and all(s is not None and s[0] is first[0] and s[1] == i
+                        for i, s in enumerate(sources))):
+            old = first[0]
+            self.set_state(old.get_state())
+            self._V_history = old._V_history
+            self._V_history_cache = None
+            return
+
+        by_population: Dict[int, Tuple["NeuronPopulation", List[int], List[int]]] = {}
+        for i, source in enumerate(sources):
+            if source is not None:
+                entry = by_population.setdefault(id(source[0]), (source[0], [], []))
+                entry[1].append(i)
+                entry[2].append(source[1])
+        for old, dst, src in by_population.values():
+            state = old.get_state()
+            for name, value in state.items():
+                if value.shape == (old.size,):  # Per-neuron arrays only
+                    getattr(self, name)[dst] = value[src]
+            if len(by_population) == 1:
+                self.set_state({k: v for k, v in state.items() if np.ndim(v) == 0})
+
+        # Noise columns of neurons that were noisy in one old population
+        noisy = [sources[i] for i in self._noise_index.tolist()]
+        if noisy and all(s is not None and s[0] is noisy[0][0] for s in noisy):
+            old = noisy[0][0]
+            column = {int(i): c for c, i in enumerate(old._noise_index)}
+            if all(i in column for _, i in noisy):
+                self._noise_block = old._noise_block[
+                    old._noise_row:, [column[i] for _, i in noisy]
+                ]
+                self._noise_row = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size})"
+
+
+class LIFPopulation(NeuronPopulation):
+    """
+    Vectorized population of LIFNeuron.
+
+    dV = (-(V - V_rest) + R_m * I) / tau_m * dt  (+ optional noise)
+    """
+
+    neuron_class = LIFNeuron
+
+    def _load_parameters(self):
+        self.R_m = self._param("R_m")
+        self.tau_m = self._param("tau_m")
+        self.V_rest = self._param("V_rest")
+        self.V_threshold = self._param("V_threshold")
+        self.V_reset = self._param("V_reset")
+        self.t_refractory = self._param("t_refractory")
+        self._init_noise(self._param("noise_std"))
+
+    def _integrate(self, I_total: np.ndarray, active: np.ndarray):
+        self.kernels.lif(
+            self.V, I_total, active, self.R_m, self.tau_m, self.V_rest, self.dt
+        )
+        self._add_noise(self.V, active)
+
+    def _threshold(self) -> np.ndarray:
+        return self.V >= self.V_threshold
+
+    def _reset_spiking(self, spiked: np.ndarray):
+        self.V[spiked] = self.V_reset[spiked]
+        self.refractory[spiked] = self.t_refractory[spiked]
+
+    def _reset_state(self):
+        pass
+
+
+class AdaptiveLIFPopulation(NeuronPopulation):
+    """
+    Vectorized population of AdaptiveLIFNeuron.
+
+    Adds the adaptation current ``w`` (and the optional AdEx
+    exponential term) to the LIF update.
+    """
+
+    neuron_class = AdaptiveLIFNeuron
+
+    def _load_parameters(self):
+        self.R_m = self._param("R_m")
+        self.tau_m = self._param("tau_m")
+        self.V_rest = self._param("V_rest")
+        self.V_threshold = self._param("V_threshold")
+        self.V_reset = self._param("V_reset")
+        self.t_refractory = self._param("t_refractory")
+        self.a = self._param("a")
+        self.b = self._param("b")
+        self.tau_w = self._param("tau_w")
+        self.delta_T = self._param("delta_T")
+        self.V_T = self._param("V_T")
+        self._init_noise(self._param("noise_std"))
+        self._exponential = self.delta_T > 0
+
+    def _load_state(self):
+        self.w = np.array([n.w for n in self.neurons], dtype=np.float64)
+
+    def _integrate(self, I_total: np.ndarray, active: np.ndarray):
+        V = self.V
+        exp_term = np.zeros(self.size)
+        if self._exponential.any():
+            ex = self._exponential
+            exp_term[ex] = self.delta_T[ex] * np.exp((V[ex] - self.V_T[ex]) / self.delta_T[ex])
+
+        dV = (
+            -(V - self.V_rest)
+            + exp_term
+            + self.R_m * I_total
+            - self.R_m * self.w
+        ) / self.tau_m * self.dt
+        dw = (self.a * (V - self.V_rest) - self.w) / self.tau_w * self.dt
+
+        self._add_noise(dV, active)
+
+        self.w[active] += dw[active]
+        self.V[active] += dV[active]
+
+    def _threshold(self) -> np.ndarray:
+        return self.V >= self.V_threshold
+
+    def _reset_spiking(self, spiked: np.ndarray):
+        self.V[spiked] = self.V_reset[spiked]
+        self.w[spiked] += self.b[spiked]
+        self.refractory[spiked] = self.t_refractory[spiked]
+
+    def _reset_state(self):
+        self.w[:] = 0.0
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        state = super().get_state()
+        state["w"] = self.w.copy()
+        return state
+
+
+class IzhikevichPopulation(NeuronPopulation):
+    """
+    Vectorized population of IzhikevichNeuron.
+
+    Uses the same two half-dt substeps as IzhikevichNeuron._compute_dV.
+    """
+
+    neuron_class = IzhikevichNeuron
+
+    def _load_parameters(self):
+        self.a = self._param("a")
+        self.b = self._param("b")
+        self.c = self._param("c")
+        self.d = self._param("d")
+        self.V_peak = self._param("V_peak")
+        self.u_init = self._param("u_init")
+        self._init_noise(self._param("noise_std"))
+
+    def _load_state(self):
+        self.u = np.array([n.u for n in self.neurons], dtype=np.float64)
+
+    def _integrate(self, I_total: np.ndarray, active: np.ndarray):
+        self.kernels.izhikevich(self.V, self.u, I_total, active, self.a, self.b, self.dt)
+        self._add_noise(self.V, active)
+
+    def _threshold(self) -> np.ndarray:
+        return self.V >= self.V_peak
+
+    def _reset_spiking(self, spiked: np.ndarray):
+        self.V[spiked] = self.c[spiked]
+        self.u[spiked] += self.d[spiked]
+
+    def _reset_state(self):
+        self.u[:] = self.u_init
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        state = super().get_state()
+        state["u"] = self.u.copy()
+        return state
+
+
+class HodgkinHuxleyPopulation(NeuronPopulation):
+    """
+    Vectorized population of HodgkinHuxleyNeuron.
+
+    Gating variables m, h, n are population arrays. Like the single
+    neuron there is no reset: a spike is an upward crossing of
+    V_threshold between consecutive steps.
+
+    Neurons are grouped by ``params.integrator`` and rate table; forward
+    Euler with exact rates runs through the kernel layer, everything
+    else through integrators.py. RK45 shares one adaptive substep size
+    across its group.
+    """
+
+    neuron_class = HodgkinHuxleyNeuron
+
+    def _load_parameters(self):
+        self.C_m = self._param("C_m")
+        self.g_Na = self._param("g_Na")
+        self.g_K = self._param("g_K")
+        self.g_L = self._param("g_L")
+        self.E_Na = self._param("E_Na")
+        self.E_K = self._param("E_K")
+        self.E_L = self._param("E_L")
+        self.V_threshold = self._param("V_threshold")
+        self.phi = self._param("temp_factor")
+        self.constants = HHConstants(
+            self.C_m, self.g_Na, self.g_K, self.g_L,
+            self.E_Na, self.E_K, self.E_L, self.phi,
+        )
+
+        groups: Dict[tuple, List[int]] = {}
+        for i, neuron in enumerate(self.neurons):
+            key = (neuron.params.integrator, neuron.rate_table)
+            groups.setdefault(key, []).append(i)
+        self._groups = [
+            (integrator, table, np.array(index, dtype=np.intp))
+            for (integrator, table), index in groups.items()
+        ]
+        self._kernel_mask = np.zeros(self.size, dtype=bool)
+        self._kernel_mask[groups.get((HHIntegrator.EULER, None), [])] = True
+        rk45_neurons = [n for n in self.neurons if n.params.integrator is HHIntegrator.RK45]
+        self.rk45_rtol = min((n.params.rk45_rtol for n in rk45_neurons), default=1e-4)
+        self.rk45_atol = min((n.params.rk45_atol for n in rk45_neurons), default=1e-4)
+        self._rk45_step = self.dt
+
+    def _load_state(self):
+        self.m = np.array([n.m for n in self.neurons], dtype=np.float64)
+        self.h = np.array([n.h for n in self.neurons], dtype=np.float64)
+        self.n = np.array([n.n for n in self.neurons], dtype=np.float64)
+        # NaN until the first step, so the first step never counts as a crossing
+        self.prev_V = np.array(
+            [getattr(n, "_prev_V", np.nan) for n in self.neurons], dtype=np.float64
+        )
+
+    def _integrate(self, I_total: np.ndarray, active: np.ndarray):
+        for integrator, table, index in self._groups:
+            if integrator is HHIntegrator.EULER and table is None:
+                mask = active if len(index) == self.size else active & self._kernel_mask
+                self.kernels.hodgkin_huxley(
+                    self.V, self.m, self.h, self.n, I_total, mask,
+                    self.C_m, self.g_Na, self.g_K, self.g_L,
+                    self.E_Na, self.E_K, self.E_L, self.phi, self.dt,
+                )
+                continue
+
+            index = index[active[index]]
+            if index.size == 0:
+                continue
+            y = (self.V[index], self.m[index], self.h[index], self.n[index])
+            c = self.constants.take(index)
+
+            if integrator is HHIntegrator.EULER:
+                V, m, h, n = euler(*y, I_total[index], c, self.dt, table)
+            elif integrator is HHIntegrator.EXPONENTIAL_EULER:
+                V, m, h, n = exponential_euler(*y, I_total[index], c, self.dt, table)
+            elif integrator is HHIntegrator.RK4:
+                V, m, h, n = rk4(*y, I_total[index], c, self.dt, table)
+            else:
+                V, m, h, n, self._rk45_step = rk45(
+                    *y, I_total[index], c, self.dt, h_step=self._rk45_step,
+                    rtol=self.rk45_rtol, atol=self.rk45_atol, table=table,
+                )
+
+            self.V[index] = V
+            self.m[index] = m
+            self.h[index] = h
+            self.n[index] = n
+
+    def _threshold(self) -> np.ndarray:
+        crossed = (self.prev_V < self.V_threshold) & (self.V >= self.V_threshold)
+        self.prev_V[:] = self.V
+        return crossed
+
+    def _reset_spiking(self, spiked: np.ndarray):
+        pass  # Natural dynamics handle repolarization
+
+    def _reset_state(self):
+        for i, neuron in enumerate(self.neurons):
+            V_init = neuron.params.V_init
+            self.m[i] = neuron._m_inf(V_init)
+            self.h[i] = neuron._h_inf(V_init)
+            self.n[i] = neuron._n_inf(V_init)
+        self.prev_V[:] = np.nan
+        self._rk45_step = self.dt
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        state = super().get_state()
+        state["m"] = self.m.copy()
+        state["h"] = self.h.copy()
+        state["n"] = self.n.copy()
+        state["prev_V"] = self.prev_V.copy()
+        state["rk45_step"] = np.array(self._rk45_step)
+        return state
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        state = dict(state)
+        if "rk45_step" in state:
+            self._rk45_step = float(state.pop("rk45_step"))
+        super().set_state(state)
+
+
+# Registry of neuron class -> population class
+POPULATION_CLASSES: Dict[Type[Neuron], Type[NeuronPopulation]] = {
+    LIFNeuron: LIFPopulation,
+    AdaptiveLIFNeuron: AdaptiveLIFPopulation,
+    IzhikevichNeuron: IzhikevichPopulation,
+    HodgkinHuxleyNeuron: HodgkinHuxleyPopulation,
+}
+
+
+def supports_population(neuron: Neuron) -> bool:
+    """Check whether a neuron can be stepped by a vectorized population."""
+    return type(neuron) in POPULATION_CLASSES
+
+
+def create_populations(
+    neurons: Sequence[Neuron], kernels: str = "auto"
+) -> List[NeuronPopulation]:
+    """
+    Group neurons by model and build one population per group.
+
+    Neurons whose model has no population class are ignored;
+    callers keep stepping those as objects.
+
+    Args:
+        neurons: Neurons to group
+        kernels: Kernel backend ("auto", "numpy" or "numba")
+
+    Returns:
+        List of populations (in first-seen model order)
+    """
+    groups: Dict[Type[Neuron], List[Neuron]] = {}
+    for neuron in neurons:
+        if supports_population(neuron):
+            groups.setdefault(type(neuron), []).append(neuron)
+
+    return [
+        POPULATION_CLASSES[cls](members, kernels=kernels)
+        for cls, members in groups.items()
+    ]
@@ -0,0 +1,432 @@
+"""
+Spike Store
+
+Append-only spike storage shared by a network, its neurons and the
+recorder.
+
+Spikes are kept as two growable arrays, neuron index (int32) and
+spike time (float64), in the order they were emitted. A per-neuron
+offset index (CSR layout: spike times sorted by neuron, plus an
+``offsets`` array) is rebuilt lazily with one stable sort when a
+per-neuron view is needed, so counting, binning and windowing are
+``np.bincount`` / ``np.searchsorted`` calls instead of Python loops.
+
+Neurons added to a network get a SpikeTrain in place of their
+``state.spike_times`` list: a list-like view that appends to, and
+reads from, the network's store.
+"""
+
+from typing import Optional, Dict, List, Tuple, Union, Sequence
+import numpy as np
+
+
+def _neuron_order(
+    times: np.ndarray, neurons: np.ndarray, n_neurons: int, time_sorted: bool
+) -> np.ndarray:
+    """Permutation sorting spikes by (neuron, time)."""
+    if not time_sorted:
+        return np.lexsort((times, neurons))
+    # Stable sort keeps time order; 16-bit keys get NumPy's radix sort
+    if n_neurons <= np.iinfo(np.uint16).max:
+        neurons = neurons.astype(np.uint16)
+    return np.argsort(neurons, kind="stable")
+
+
+def sort_by_neuron(
+    times: np.ndarray,
+    neurons: np.ndarray,
+    n_neurons: int,
+    time_sorted: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group spikes by neuron (CSR layout).
+
+    Args:
+        times: Spike times
+        neurons: Neuron index of each spike
+        n_neurons: Number of neurons (rows)
+        time_sorted: Whether ``times`` is already non-decreasing
+
+    Returns:
+        Tuple of (offsets, sorted_times); the spikes of neuron ``i`` are
+        ``sorted_times[offsets[i]:offsets[i + 1]]`` in time order
+    """
+    order = _neuron_order(times, neurons, n_neurons, time_sorted)
+    offsets = np.zeros(n_neurons + 1, dtype=np.int64)
+    np.cumsum(np.bincount(neurons, minlength=n_neurons), out=offsets[1:])
+    return offsets, times[order]
+
+
+def window_counts(
+    times: np.ndarray,
+    neurons: np.ndarray,
+    n_neurons: int,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    time_sorted: bool = True,
+) -> np.ndarray:
+    """
+    Count each neuron's spikes in half-open windows ``[start, end)``.
+
+    Spikes are sorted by (neuron, time) and shifted by ``neuron * span``
+    so one ``np.searchsorted`` over all neurons answers every window.
+
+    Args:
+        times: Spike times
+        neurons: Neuron index of each spike
+        n_neurons: Number of neurons (rows)
+        starts: Window start times
+        ends: Window end times
+        time_sorted: Whether ``times`` is already non-decreasing
+
+    Returns:
+        (n_neurons, n_windows) int64 array of spike counts
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    if times.size == 0 or starts.size == 0:
+        return np.zeros((n_neurons, starts.size), dtype=np.int64)
+
+    base = min(times.min(), starts.min())
+    span = np.ceil(max(times.max(), ends.max()) - base) + 1.0
+    order = _neuron_order(times, neurons, n_neurons, time_sorted)
+    keys = neurons[order] * span + (times[order] - base)
+
+    rows = (np.arange(n_neurons) * span)[:, None]
+    lo = np.searchsorted(keys, rows + (starts - base), side="left")
+    hi = np.searchsorted(keys, rows + (ends - base), side="left")
+    return hi - lo
+
+
+class SpikeStore:
+    """
+    Append-only store of (neuron, time) spike events.
+
+    Neurons are registered once and addressed by integer index;
+    ``ids[i]`` is the ID of neuron ``i``. Spike counts per neuron are
+    kept up to date on every append, the CSR offset index is cached
+    until the next append.
+
+    Usage:
+        >>> store = SpikeStore()
+        >>> i = store.register("n0")
+        >>> store.append(i, 1.5)
+        >>> store.extend(np.array([0, 0]), 2.0)
+        >>> store.train(i)
+        array([1.5, 2. , 2. ])
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize store.
+
+        Args:
+            capacity: Initial number of spikes (grows by doubling)
+        """
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        self._neurons = np.empty(max(capacity, 1), dtype=np.int32)
+        self._times = np.empty(max(capacity, 1), dtype=np.float64)
+        self._n = 0
+        self._counts = np.zeros(16, dtype=np.int64)
+
+        # Whether times are non-decreasing in append order
+        self._time_sorted = True
+        self._version = 0
+        self._csr: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def n_neurons(self) -> int:
+        """Number of registered neurons."""
+        return len(self.ids)
+
+    @property
+    def neurons(self) -> np.ndarray:
+        """Neuron index of every spike, in append order (view)."""
+        return self._neurons[:self._n]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Time of every spike, in append order (view)."""
+        return self._times[:self._n]
+
+    @property
+    def time_sorted(self) -> bool:
+        """Whether ``times`` is non-decreasing."""
+        return self._time_sorted
+
+    def register(self, neuron_id: str) -> int:
+        """
+        Get the index of a neuron, registering it if new.
+
+        Args:
+            neuron_id: Neuron ID
+
+        Returns:
+            Index of the neuron in the store
+        """
+        i = self.index.get(neuron_id)
+        if i is None:
+            i = len(self.ids)
+            self.ids.append(neuron_id)
+            self.index[neuron_id] = i
+            if i == len(self._counts):
+                self._counts = np.concatenate([self._counts, np.zeros_like(self._counts)])
+            self._version += 1
+        return i
+
+    def train_view(self, neuron_id: str) -> "SpikeTrain":
+        """List-like view of one neuron's spikes (registers the neuron)."""
+        return SpikeTrain(self, self.register(neuron_id))
+
+    def bind(self, neuron) -> "SpikeTrain":
+        """
+        Replace ``neuron.state.spike_times`` with a view into this store.
+
+        Spikes already in the neuron's list are moved into the store.
+
+        Args:
+            neuron: Neuron to bind
+
+        Returns:
+            The neuron's SpikeTrain
+        """
+        existing = neuron.state.spike_times
+        if isinstance(existing, SpikeTrain) and existing.store is self:
+            return existing
+        train = self.train_view(neuron.id)
+        if len(existing):
+            train.extend(np.asarray(existing, dtype=np.float64))
+        neuron.state.spike_times = train
+        return train
+
+    def _reserve(self, extra: int):
+        """Grow the spike arrays to hold ``extra`` more spikes."""
+        needed = self._n + extra
+        if needed <= len(self._times):
+            return
+        capacity = max(needed, 2 * len(self._times))
+        for name in ("_neurons", "_times"):
+            old = getattr(self, name)
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._n] = old[:self._n]
+            setattr(self, name, grown)
+
+    def append(self, i: int, t: float):
+        """
+        Append one spike.
+
+        Args:
+            i: Neuron index
+            t: Spike time (ms)
+        """
+        if self._n == len(self._times):
+            self._reserve(1)
+        n = self._n
+        if n and t < self._times[n - 1]:
+            self._time_sorted = False
+        self._neurons[n] = i
+        self._times[n] = t
+        self._n = n + 1
+        self._counts[i] += 1
+        self._version += 1
+
+    def extend(self, indices: np.ndarray, t: Union[float, np.ndarray]):
+        """
+        Append several spikes at once.
+
+        Args:
+            indices: Neuron index of each spike
+            t: Spike time, shared or one per spike (ms)
+        """
+        indices = np.asarray(indices)
+        k = indices.size
+        if k == 0:
+            return
+        self._reserve(k)
+        n = self._n
+        times = self._times[n:n + k]
+        times[:] = t
+        if (n and times[0] < self._times[n - 1]) or (k > 1 and np.any(np.diff(times) < 0)):
+            self._time_sorted = False
+        self._neurons[n:n + k] = indices
+        self._n = n + k
+        np.add.at(self._counts, indices, 1)
+        self._version += 1
+
+    def count(self, i: int) -> int:
+        """Number of spikes of neuron ``i``."""
+        return int(self._counts[i])
+
+    def counts(self) -> np.ndarray:
+        """Spike count of every registered neuron."""
+        return self._counts[:self.n_neurons].copy()
+
+    def _offsets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Cached CSR (offsets, sorted_times) for the current contents."""
+        if self._csr is None or self._csr[0] != self._version:
+            offsets, sorted_times = sort_by_neuron(
+                self.times, self.neurons, self.n_neurons, self._time_sorted
+            )
+            self._csr = (self._version, offsets, sorted_times)
+        return self._csr[1], self._csr[2]
+
+    def train(self, i: int) -> np.ndarray:
+        """Spike times of neuron ``i`` in time order (read-only view)."""
+        if self._counts[i] == 0:
+            return np.empty(0)
+        offsets, sorted_times = self._offsets()
+        return sorted_times[offsets[i]:offsets[i + 1]]
+
+    def trains(self) -> List[np.ndarray]:
+        """Spike times of every registered neuron (views)."""
+        offsets, sorted_times = self._offsets()
+        return np.split(sorted_times, offsets[1:-1])
+
+    def count_between(self, t_start: float, t_end: float) -> np.ndarray:
+        """
+        Count each neuron's spikes with ``t_start <= t <= t_end``.
+
+        Returns:
+            Spike count per registered neuron
+        """
+        times, neurons = self.times, self.neurons
+        if self._time_sorted:
+            lo = np.searchsorted(times, t_start, side="left")
+            hi = np.searchsorted(times, t_end, side="right")
+            selected = neurons[lo:hi]
+        else:
+            selected = neurons[(times >= t_start) & (times <= t_end)]
+        return np.bincount(selected, minlength=self.n_neurons)
+
+    def since(self, start: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Spikes appended at or after position ``start``.
+
+        Returns:
+            Tuple of (times, neuron_indices) views
+        """
+        start = min(start, self._n)
+        return self._times[start:self._n], self._neurons[start:self._n]
+
+    def discard(self, indices: Union[int, Sequence[int], np.ndarray]):
+        """
+        Remove every spike of the given neuron(s).
+
+        Args:
+            indices: Neuron index or indices
+        """
+        indices = np.atleast_1d(np.asarray(indices))
+        if self._n == 0 or not self._counts[indices].any():
+            return
+        keep = ~np.isin(self.neurons, indices)
+        n = int(keep.sum())
+        self._neurons[:n] = self.neurons[keep]
+        self._times[:n] = self.times[keep]
+        self._n = n
+        self._counts[indices] = 0
+        self._version += 1
+
+    def clear(self):
+        """Remove all spikes (neurons stay registered)."""
+        self._n = 0
+        self._counts[:] = 0
+        self._time_sorted = True
+        self._version += 1
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Spike arrays for checkpoints (neurons are saved by index)."""
+        return {"neurons": self.neurons.copy(), "times": self.times.copy()}
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Replace all spikes with those saved by get_state.
+
+        Neuron indices refer to the registration order, which must
+        match the store the state was taken from.
+
+        Args:
+            state: Arrays keyed as in get_state
+        """
+        neurons = np.asarray(state["neurons"], dtype=np.int32)
+        times = np.asarray(state["times"], dtype=np.float64)
+        if neurons.size and neurons.max() >= self.n_neurons:
+            raise ValueError("Spike state refers to unregistered neurons")
+        self.clear()
+        self._reserve(neurons.size)
+        self._neurons[:neurons.size] = neurons
+        self._times[:times.size] = times
+        self._n = neurons.size
+        self._counts[:self.n_neurons] = np.bincount(neurons, minlength=self.n_neurons)
+        self._time_sorted = bool(np.all(np.diff(times) >= 0))
+        self._version += 1
+
+    def __repr__(self) -> str:
+        return f"SpikeStore(neurons={self.n_neurons}, spikes={self._n})"
+
+
+class SpikeTrain:
+    """
+    List-like view of one neuron's spikes in a SpikeStore.
+
+    Supports the list operations used on ``NeuronState.spike_times``
+    (append, len, indexing, iteration, comparison, clear) and converts
+    to an array with ``np.asarray``.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: SpikeStore, index: int):
+        """
+        Initialize view.
+
+        Args:
+            store: Backing store
+            index: Neuron index in the store
+        """
+        self.store = store
+        self.index = index
+
+    def append(self, t: float):
+        """Append a spike time."""
+        self.store.append(self.index, t)
+
+    def extend(self, times: Sequence[float]):
+        """Append several spike times."""
+        times = np.asarray(times, dtype=np.float64)
+        self.store.extend(np.full(times.size, self.index, dtype=np.int32), times)
+
+    def clear(self):
+        """Remove all spikes of this neuron from the store."""
+        self.store.discard(self.index)
+
+    def __len__(self) -> int:
+        return self.store.count(self.index)
+
+    def __bool__(self) -> bool:
+        return self.store.count(self.index) > 0
+
+    def __getitem__(self, key):
+        values = self.store.train(self.index)[key]
+        return values.tolist() if isinstance(key, slice) else float(values)
+
+    def __iter__(self):
+        return iter(self.store.train(self.index).tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.store.train(self.index), dtype=dtype)
+
+    def __eq__(self, other) -> bool:
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -5,12 +5,20 @@ Implements various synapse types for neural connectivity:
 - ChemicalSynapse: Standard AMPA/GABA-like synapses
 - ElectricalSynapse: Gap junctions
 - STDPSynapse: Spike-timing dependent plasticity
+- DelayBuffer: Network-wide circular buffer for transmission delays
+- SynapseMatrix: Sparse CSR storage for stepping many synapses at once
+- SynapseProjection: Array-backed batch of chemical synapses
+- STDPPlasticity: Vectorized STDP with per-neuron trace arrays
 """
 
 from .base import Synapse, SynapseParameters, SynapseState
 from .chemical import ChemicalSynapse, ChemicalSynapseParameters
 from .electrical import ElectricalSynapse, ElectricalSynapseParameters
 from .stdp import STDPSynapse, STDPParameters
+from .delay import DelayBuffer
+from .matrix import SynapseMatrix, MatrixSynapseState
+from .projection import SynapseProjection
+from .plasticity import STDPPlasticity, PlasticityState
 
 __all__ = [
     "Synapse",
@@ -22,4 +30,10 @@ __all__ = [
     "ElectricalSynapseParameters",
     "STDPSynapse",
     "STDPParameters",
+    "DelayBuffer",
+    "SynapseMatrix",
+    "MatrixSynapseState",
+    "SynapseProjection",
+    "STDPPlasticity",
+    "PlasticityState",
 ]
@@ -6,12 +6,13 @@ Abstract base class for all synapse types in NeuroSim.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING
 from enum import Enum
 import uuid
 
 if TYPE_CHECKING:
     from ..neurons.base import Neuron
+    from .delay import DelayBuffer
 
 
 class SynapseType(Enum):
@@ -48,29 +49,52 @@ class SynapseParameters:
         }
 
 
-@dataclass
 class SynapseState:
-    """Current state of a synapse."""
+    """
+    Current state of a synapse.
+
+    Slotted; the pending spike list is only allocated once a spike is
+    queued on the synapse itself (networks delay spikes in a shared
+    DelayBuffer instead).
+    """
+
+    __slots__ = ("g", "I", "_pending_spikes", "spike_count", "last_spike_time")
 
-    # Conductance/current state
-    g: float = 0.0            # Synaptic conductance (nS)
-    I: float = 0.0            # Synaptic current (nA)
+    def __init__(
+        self,
+        g: float = 0.0,                  # Synaptic conductance (nS)
+        I: float = 0.0,                  # Synaptic current (nA)
+        pending_spikes: Optional[list] = None,
+        spike_count: int = 0,            # Number of transmitted spikes
+        last_spike_time: float = -1000.0,  # Time of last presynaptic spike
+    ):
+        self.g = g
+        self.I = I
+        self._pending_spikes = pending_spikes
+        self.spike_count = spike_count
+        self.last_spike_time = last_spike_time
 
-    # Spike queue for delays
-    pending_spikes: list = field(default_factory=list)
+    @property
+    def pending_spikes(self) -> list:
+        """Arrival times of spikes queued for delivery (allocated on first access)."""
+        if self._pending_spikes is None:
+            self._pending_spikes = []
+        return self._pending_spikes
 
-    # Statistics
-    spike_count: int = 0       # Number of transmitted spikes
-    last_spike_time: float = -1000.0  # Time of last presynaptic spike
+    @pending_spikes.setter
+    def pending_spikes(self, value: list):
+        self._pending_spikes = value
 
     def reset(self):
         """Reset synapse state."""
         self.g = 0.0
         self.I = 0.0
-        self.pending_spikes = []
+        self._pending_spikes = None
         self.spike_count = 0
         self.last_spike_time = -1000.0
 
+    def __repr__(self) -> str:
+        return f"SynapseState(g={self.g:.4f}, I={self.I:.4f}, spike_count={self.spike_count})"
 
 class Synapse(ABC):
     """
@@ -80,6 +104,18 @@ class Synapse(ABC):
     transmitting signals with optional delay and plasticity.
     """
 
+    # Set when the synapse is stored in a SynapseMatrix
+    _matrix = None
+    _matrix_index = -1
+
+    # Set when spikes are delayed through a network-wide DelayBuffer
+    _delay_buffer = None
+
+    #: Dynamic variables saved by checkpoints (attribute paths)
+    state_variables: Tuple[str, ...] = (
+        "state.g", "state.I", "state.spike_count", "state.last_spike_time",
+    )
+
     def __init__(
         self,
         pre: "Neuron",
@@ -116,12 +152,29 @@ class Synapse(ABC):
     def weight(self, value: float):
         """Set synaptic weight."""
         self.params.weight = value
+        if self._matrix is not None:
+            self._matrix.set_weight(self._matrix_index, value)
+
+    def attach_delay_buffer(self, buffer: Optional["DelayBuffer"]):
+        """
+        Route delayed spikes through a shared DelayBuffer.
+
+        The buffer calls _on_spike_arrival() in the arrival step, so
+        step() no longer scans pending spikes. Pass None to fall back
+        to the per-synapse pending list.
+
+        Args:
+            buffer: Delay buffer (usually owned by the Network)
+        """
+        self._delay_buffer = buffer
 
     def _on_pre_spike(self, neuron: "Neuron", spike_time: float):
         """Handle presynaptic spike event."""
         # Queue spike for delivery after delay
-        delivery_time = spike_time + self.params.delay
-        self.state.pending_spikes.append(delivery_time)
+        if self._delay_buffer is not None:
+            self._delay_buffer.schedule(self, spike_time)
+        else:
+            self.state.pending_spikes.append(spike_time + self.params.delay)
         self.state.spike_count += 1
         self.state.last_spike_time = spike_time
 
@@ -148,8 +201,9 @@ class Synapse(ABC):
         Returns:
             Synaptic current delivered to postsynaptic neuron
         """
-        # Check for spike deliveries
-        self._deliver_spikes(t)
+        # Check for spike deliveries (the DelayBuffer delivers otherwise)
+        if self._delay_buffer is None:
+            self._deliver_spikes(t)
 
         # Compute current
         I = self._compute_current(t)
@@ -163,6 +217,8 @@ class Synapse(ABC):
 
     def _deliver_spikes(self, t: float):
         """Process pending spike deliveries."""
+        if not self.state.pending_spikes:
+            return
         delivered = []
         for spike_time in self.state.pending_spikes:
             if spike_time <= t:
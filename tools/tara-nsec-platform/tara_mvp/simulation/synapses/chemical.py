@@ -125,6 +125,8 @@ class ChemicalSynapse(Synapse):
         >>> synapse = ChemicalSynapse.create_gaba(pre, post)
     """
 
+    state_variables = Synapse.state_variables + ("g_rise", "g_decay", "x", "u")
+
     def __init__(
         self,
         pre: "Neuron",
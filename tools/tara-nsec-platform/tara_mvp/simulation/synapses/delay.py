@@ -0,0 +1,162 @@
+"""
+Synaptic Delay Buffer
+
+Network-wide circular buffer for delayed spike delivery.
+
+Each presynaptic spike is written once into the slot of the step in
+which it arrives (``ceil(delay / dt)`` steps ahead). Every network step
+drains exactly one slot, so delivery costs O(spikes arriving) instead
+of scanning a pending-spike list on every synapse.
+"""
+
+from typing import Dict, List, Sequence, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from .base import Synapse
+
+
+def delay_to_steps(delay: float, dt: float) -> int:
+    """
+    Convert a transmission delay to a whole number of steps.
+
+    Delays are rounded up, so a spike never arrives earlier than its
+    delay; the small tolerance keeps e.g. 1.0 / 0.1 at 10 steps.
+    """
+    return max(int(np.ceil(delay / dt - 1e-9)), 0)
+
+
+class DelayBuffer:
+    """
+    Circular delay line shared by all synapses of a network.
+
+    Slots hold ``(synapse, spike_time)`` entries; the buffer grows
+    automatically when a synapse with a longer delay schedules a spike.
+
+    Usage:
+        >>> buffer = DelayBuffer()
+        >>> synapse.attach_delay_buffer(buffer)
+        >>> # each step, after neurons have fired:
+        >>> buffer.deliver()
+    """
+
+    def __init__(self, n_slots: int = 16):
+        """
+        Initialize buffer.
+
+        Args:
+            n_slots: Initial number of slots (max delay in steps + 1)
+        """
+        self._slots: List[List[Tuple["Synapse", float]]] = [
+            [] for _ in range(max(n_slots, 1))
+        ]
+        self._step = 0
+        self._n_pending = 0
+
+    @property
+    def n_slots(self) -> int:
+        """Number of slots in the ring."""
+        return len(self._slots)
+
+    @property
+    def n_pending(self) -> int:
+        """Number of spikes in flight."""
+        return self._n_pending
+
+    def schedule(self, synapse: "Synapse", spike_time: float):
+        """
+        Write a presynaptic spike into its arrival slot.
+
+        Args:
+            synapse: Synapse transmitting the spike
+            spike_time: Time of the presynaptic spike (ms)
+        """
+        d = delay_to_steps(synapse.params.delay, synapse.params.dt)
+        if d >= len(self._slots):
+            self._grow(d + 1)
+        self._slots[(self._step + d) % len(self._slots)].append((synapse, spike_time))
+        self._n_pending += 1
+
+    def deliver(self) -> int:
+        """
+        Deliver all spikes arriving in the current step and advance.
+
+        Returns:
+            Number of spikes delivered
+        """
+        index = self._step % len(self._slots)
+        arriving = self._slots[index]
+        if arriving:
+            self._slots[index] = []
+            for synapse, spike_time in arriving:
+                synapse._on_spike_arrival(spike_time)
+            self._n_pending -= len(arriving)
+        self._step += 1
+        return len(arriving)
+
+    def pending(self, synapse: "Synapse") -> List[float]:
+        """Spike times still in flight on one synapse (for inspection)."""
+        return [
+            t for slot in self._slots for s, t in slot if s is synapse
+        ]
+
+    def _grow(self, n_slots: int):
+        """Resize the ring, keeping entries at their arrival steps."""
+        n_slots = max(n_slots, 2 * len(self._slots))
+        old = self._slots
+        self._slots = [[] for _ in range(n_slots)]
+        for offset in range(len(old)):
+            step = self._step + offset
+            self._slots[step % n_slots] = old[step % len(old)]
+
+    def get_state(self, synapses: Sequence["Synapse"]) -> Dict[str, np.ndarray]:
+        """
+        In-flight spikes for checkpoints.
+
+        Args:
+            synapses: Synapses that may have spikes in flight; entries
+                are saved by position in this sequence
+
+        Returns:
+            ``step``, ``n_slots`` and per entry its ``synapse``
+            position, spike ``time`` and arrival ``offset`` in steps
+        """
+        position = {id(s): i for i, s in enumerate(synapses)}
+        entries = [
+            (position[id(synapse)], spike_time, offset)
+            for offset in range(len(self._slots))
+            for synapse, spike_time in self._slots[(self._step + offset) % len(self._slots)]
+        ]
+        synapse, time, offset = zip(*entries) if entries else ((), (), ())
+        return {
+            "step": np.array(self._step),
+            "n_slots": np.array(len(self._slots)),
+            "synapse": np.array(synapse, dtype=np.int64),
+            "time": np.array(time, dtype=np.float64),
+            "offset": np.array(offset, dtype=np.int64),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray], synapses: Sequence["Synapse"]):
+        """
+        Replace the in-flight spikes with those saved by get_state.
+
+        Args:
+            state: Arrays keyed as in get_state
+            synapses: Synapses in the order used by get_state
+        """
+        self._step = int(state["step"])
+        self._slots = [[] for _ in range(max(int(state["n_slots"]), 1))]
+        for k, spike_time, offset in zip(
+            state["synapse"].tolist(), state["time"].tolist(), state["offset"].tolist()
+        ):
+            self._slots[(self._step + offset) % len(self._slots)].append(
+                (synapses[k], spike_time)
+            )
+        self._n_pending = len(state["synapse"])
+
+    def reset(self):
+        """Drop all in-flight spikes and restart at step 0."""
+        for slot in self._slots:
+            slot.clear()
+        self._step = 0
+        self._n_pending = 0
@@ -0,0 +1,644 @@
+"""
+Sparse Synapse Matrix
+
+Stores the weights, delays and receptor kinetics of many
+ChemicalSynapse / ElectricalSynapse objects as CSR matrices and steps
+them all at once:
+
+- Chemical: one CSR delivery matrix whose rows are (delay, presynaptic
+  neuron) channels and whose columns are (receptor group, postsynaptic
+  neuron) conductances. A spike is written once into a circular delay
+  buffer for each of its channels, at the slot of its arrival step;
+  each step drains one slot and delivers it by multiplying the sparse
+  arrival vector with this matrix.
+- Electrical: one CSR coupling matrix, I = G @ V - deg * V
+  (rectifying junctions are handled per-synapse).
+
+Conductance kinetics are linear, so only per-postsynaptic-neuron
+(g_rise, g_decay) pairs per receptor group are integrated. The
+original Synapse objects stay in the network as views: their ``state``
+reads conductance, current and spike counts back from the matrix.
+SynapseProjection edges are appended after the objects straight from
+their arrays.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
+from scipy import sparse
+
+from .base import Synapse, SynapseState, SynapseType
+from .chemical import ChemicalSynapse
+from .electrical import ElectricalSynapse
+from .stdp import STDPSynapse
+from .projection import SynapseProjection
+
+
+def supports_matrix(synapse: Synapse) -> bool:
+    """
+    Check whether a synapse can be stored in a SynapseMatrix.
+
+    STDP synapses are stored like chemical ones; their weights must
+    then be updated by an STDPPlasticity engine (see plasticity.py).
+    """
+    if type(synapse) in (ChemicalSynapse, STDPSynapse):
+        return not synapse.params.use_stp
+    return type(synapse) is ElectricalSynapse
+
+
+def _build_csr(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    data: np.ndarray,
+    shape: Tuple[int, int]
+) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """
+    Build a CSR matrix without merging duplicate entries.
+
+    Returns:
+        Tuple of (matrix, position of each input entry in matrix.data)
+    """
+    # One int64 key sorts by (row, col) much faster than np.lexsort
+    order = np.argsort(rows.astype(np.int64) * shape[1] + cols)
+    indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+    matrix = sparse.csr_matrix(
+        (data[order], cols[order].astype(np.int64), indptr), shape=shape
+    )
+    position = np.empty(len(order), dtype=np.int64)
+    position[order] = np.arange(len(order))
+    return matrix, position
+
+
+def _gather_rows(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Positions of all stored entries of ``rows`` in a CSR structure."""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    total = int(lengths.sum())
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _sparse_row_product(matrix: sparse.csr_matrix, rows: np.ndarray) -> np.ndarray:
+    """
+    Product of a 0/1 sparse row vector (ones at ``rows``) with a CSR matrix.
+
+    Equivalent to ``x @ matrix`` but gathers only the selected rows,
+    so the cost is proportional to the synapses that receive a spike.
+    """
+    nz = _gather_rows(matrix.indptr, rows)
+    return np.bincount(
+        matrix.indices[nz], weights=matrix.data[nz], minlength=matrix.shape[1]
+    )
+
+
+class MatrixSynapseState(SynapseState):
+    """
+    SynapseState view into a SynapseMatrix.
+
+    Conductance and current are reconstructed on access from the
+    presynaptic spike history, so inspection costs nothing while the
+    simulation runs.
+    """
+
+    __slots__ = ("_matrix", "_synapse", "_index")
+
+    def __init__(self, matrix: "SynapseMatrix", synapse: Synapse, index: int):
+        """
+        Initialize view.
+
+        Args:
+            matrix: Owning synapse matrix
+            synapse: Synapse object being viewed
+            index: Position of the synapse in the matrix
+        """
+        self._matrix = matrix
+        self._synapse = synapse
+        self._index = index
+
+    @property
+    def g(self) -> float:
+        return self._matrix.synapse_conductance(self._index)
+
+    @g.setter
+    def g(self, value: float):
+        pass
+
+    @property
+    def I(self) -> float:
+        return self._matrix.synapse_current(self._index)
+
+    @I.setter
+    def I(self, value: float):
+        pass
+
+    @property
+    def pending_spikes(self) -> List[float]:
+        return self._matrix.synapse_pending(self._index)
+
+    @pending_spikes.setter
+    def pending_spikes(self, value: list):
+        pass
+
+    @property
+    def spike_count(self) -> int:
+        if isinstance(self._synapse, ElectricalSynapse):
+            return 0
+        return len(self._synapse.pre.state.spike_times)
+
+    @spike_count.setter
+    def spike_count(self, value: int):
+        pass
+
+    @property
+    def last_spike_time(self) -> float:
+        if isinstance(self._synapse, ElectricalSynapse):
+            return -1000.0
+        spikes = self._synapse.pre.state.spike_times
+        return spikes[-1] if spikes else -1000.0
+
+    @last_spike_time.setter
+    def last_spike_time(self, value: float):
+        pass
+
+    def reset(self):
+        """State is owned by the matrix (see SynapseMatrix.reset)."""
+        pass
+
+    def __repr__(self) -> str:
+        return f"MatrixSynapseState(index={self._index}, g={self.g:.4f})"
+
+
+class SynapseMatrix:
+    """
+    CSR-backed storage and stepping for chemical and electrical synapses.
+
+    Neurons are addressed by their position in the V / I_syn arrays
+    passed to step(); ``index`` maps neuron IDs to those positions.
+
+    Usage:
+        >>> matrix = SynapseMatrix(synapses, index, n_neurons=len(index))
+        >>> matrix.step(fired, V, I_syn)     # once per time step
+        >>> W = matrix.get_connectivity()    # sparse (pre x post) weights
+    """
+
+    def __init__(
+        self,
+        synapses: List[Synapse],
+        index: Dict[str, int],
+        n_neurons: int,
+        start_step: int = 0,
+        projections: Optional[List[SynapseProjection]] = None
+    ):
+        """
+        Build matrices from synapse objects and projections.
+
+        Args:
+            synapses: Synapses accepted by supports_matrix()
+            index: Mapping of neuron ID -> array position
+            n_neurons: Length of the neuron state arrays
+            start_step: Network step count when the matrix is built
+            projections: Array-backed chemical projections (edges are
+                stored after the synapse objects, in projection order)
+        """
+        self.n_neurons = n_neurons
+        self.synapses: List[Synapse] = list(synapses)
+        self.projections: List[SynapseProjection] = list(projections or [])
+        self._step = start_step
+
+        n_objects = len(self.synapses)
+        sizes = [len(proj) for proj in self.projections]
+        self._projection_start = n_objects + np.concatenate(
+            [[0], np.cumsum(sizes, dtype=np.int64)]
+        ).astype(np.int64)
+
+        chemical = [
+            k for k, s in enumerate(self.synapses) if isinstance(s, ChemicalSynapse)
+        ]
+        electrical = [
+            k for k, s in enumerate(self.synapses) if isinstance(s, ElectricalSynapse)
+        ]
+        self._chemical = np.concatenate([
+            np.array(chemical, dtype=np.int64),
+            np.arange(n_objects, self._projection_start[-1], dtype=np.int64),
+        ])
+        self._electrical = np.array(electrical, dtype=np.int64)
+
+        # Per-synapse arrays (indexed by matrix position)
+        endpoints = [proj.positions(index) for proj in self.projections]
+        self.pre = np.concatenate(
+            [np.array([index[s.pre.id] for s in self.synapses], dtype=np.int64)]
+            + [pre for pre, _ in endpoints]
+        )
+        self.post = np.concatenate(
+            [np.array([index[s.post.id] for s in self.synapses], dtype=np.int64)]
+            + [post for _, post in endpoints]
+        )
+        self.weight = np.concatenate(
+            [np.array([s.weight for s in self.synapses], dtype=np.float64)]
+            + [proj.sync_weights() for proj in self.projections]
+        )
+
+        self._build_chemical(index)
+        self._build_electrical()
+
+        # Bind per-object views
+        for k, synapse in enumerate(self.synapses):
+            self.bind_view(synapse, k)
+        for proj, start in zip(self.projections, self._projection_start[:-1]):
+            proj.bind(self, int(start))
+
+    def bind_view(self, synapse: Synapse, k: int):
+        """Make a synapse object a view of matrix position ``k``."""
+        synapse._matrix = self
+        synapse._matrix_index = k
+        synapse.state = MatrixSynapseState(self, synapse, k)
+
+    # --- Construction ---
+
+    def _build_chemical(self, index: Dict[str, int]):
+        """Build the delay-expanded delivery matrix for chemical synapses."""
+        n = self.n_neurons
+        n_synapses = self.n_synapses
+        n_objects = len(self.synapses)
+
+        self.g_max = np.zeros(n_synapses)
+        self.delay_steps = np.zeros(n_synapses, dtype=np.int64)
+        self.group = np.full(n_synapses, -1, dtype=np.int64)
+
+        groups: Dict[Tuple, int] = {}
+
+        def assign(k, p):
+            self.g_max[k] = p.g_max
+            self.delay_steps[k] = int(np.ceil(p.delay / p.dt - 1e-9))
+            key = (
+                p.tau_rise, p.tau_decay, p.E_rev,
+                p.synapse_type == SynapseType.INHIBITORY, p.dt,
+            )
+            self.group[k] = groups.setdefault(key, len(groups))
+
+        for k in self._chemical[self._chemical < n_objects]:
+            assign(k, self.synapses[k].params)
+        for proj, start, end in zip(
+            self.projections, self._projection_start[:-1], self._projection_start[1:]
+        ):
+            assign(slice(start, end), proj.params)
+
+        ordered = sorted(groups, key=groups.get)
+        self._group_keys: List[Tuple] = ordered
+        self.tau_rise = np.array([g[0] for g in ordered])[:, None]
+        self.tau_decay = np.array([g[1] for g in ordered])[:, None]
+        self.E_rev = np.array([g[2] for g in ordered])[:, None]
+        self.sign = np.array([-1.0 if g[3] else 1.0 for g in ordered])[:, None]
+        self.dt = np.array([g[4] for g in ordered])[:, None]
+        n_groups = len(ordered)
+
+        self.g_rise = np.zeros((n_groups, n))
+        self.g_decay = np.zeros((n_groups, n))
+
+        # Delay channels: row = slot * n + pre, col = group * n + post
+        delays = self.delay_steps[self._chemical]
+        self._delay_values = np.unique(delays)
+        self._max_delay = int(self._delay_values.max()) if len(delays) else 0
+
+        slots = np.searchsorted(self._delay_values, delays)
+        rows = slots * n + self.pre[self._chemical]
+        cols = self.group[self._chemical] * n + self.post[self._chemical]
+        data = self.g_max[self._chemical] * self.weight[self._chemical]
+
+        self._delivery, position = _build_csr(
+            rows, cols, data, (len(self._delay_values) * n, n_groups * n)
+        )
+        self._delivery_position = np.full(self.n_synapses, -1, dtype=np.int64)
+        self._delivery_position[self._chemical] = position
+
+        # Outgoing channels of each presynaptic neuron, with their delays
+        channels = np.flatnonzero(np.diff(self._delivery.indptr))
+        channel_pre = channels % max(n, 1)
+        order = np.argsort(channel_pre, kind="stable")
+        self._channels = channels[order]
+        self._channel_delay = self._delay_values[channels[order] // max(n, 1)]
+        self._channel_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(channel_pre, minlength=n), out=self._channel_ptr[1:])
+
+        # Circular delay buffer: channels arriving in each of the next steps
+        self._ring: List[List[np.ndarray]] = [[] for _ in range(self._max_delay + 1)]
+
+    def _build_electrical(self):
+        """Build the gap-junction coupling matrix."""
+        n = self.n_neurons
+        syns = [self.synapses[k] for k in self._electrical]
+
+        self.g_gap = np.zeros(self.n_synapses)
+        self.rectifying = np.zeros(self.n_synapses, dtype=bool)
+        for k, s in zip(self._electrical, syns):
+            self.g_gap[k] = s.params.g_gap
+            self.rectifying[k] = s.params.rectifying
+
+        linear = self._electrical[~self.rectifying[self._electrical]]
+        self._linear_gap = linear
+        self._rectifying_gap = self._electrical[self.rectifying[self._electrical]]
+
+        self._coupling, position = _build_csr(
+            self.post[linear], self.pre[linear],
+            self.g_gap[linear] * self.weight[linear], (n, n)
+        )
+        self._coupling_position = np.full(self.n_synapses, -1, dtype=np.int64)
+        self._coupling_position[linear] = position
+        self._coupling_degree = np.asarray(self._coupling.sum(axis=1)).ravel()
+
+    # --- Simulation ---
+
+    @property
+    def n_synapses(self) -> int:
+        """Number of synapses stored in the matrix (objects and projection edges)."""
+        return len(self.weight)
+
+    def step(self, fired: np.ndarray, V: np.ndarray, I_syn: np.ndarray):
+        """
+        Deliver spikes and add synaptic current for one time step.
+
+        Args:
+            fired: Spike mask of this step
+            V: Membrane potentials (after the neuron update)
+            I_syn: Synaptic input array to accumulate into
+        """
+        if self._chemical.size:
+            self._step_chemical(fired, V, I_syn)
+        if self._electrical.size:
+            self._step_electrical(V, I_syn)
+        self._step += 1
+
+    def _step_chemical(self, fired: np.ndarray, V: np.ndarray, I_syn: np.ndarray):
+        m = self._step
+
+        if fired.any():
+            self._schedule(np.flatnonzero(fired), m)
+
+        slot = m % len(self._ring)
+        rows = self._ring[slot]
+        self._ring[slot] = []
+
+        if rows:
+            delta = _sparse_row_product(self._delivery, np.concatenate(rows))
+            delta = delta.reshape(self.g_rise.shape)
+            self.g_rise += delta
+            self.g_decay += delta
+
+        # Conductance dynamics and current (see ChemicalSynapse._compute_current)
+        self.g_rise -= self.g_rise / self.tau_rise * self.dt
+        self.g_decay -= self.g_decay / self.tau_decay * self.dt
+        g = self.g_decay - self.g_rise
+        I_syn += (g * (V[None, :] - self.E_rev) * self.sign).sum(axis=0)
+
+    def _schedule(self, spiking: np.ndarray, m: int):
+        """Write the channels of spiking neurons into their arrival slots."""
+        nz = _gather_rows(self._channel_ptr, spiking)
+        if nz.size == 0:
+            return
+        channels = self._channels[nz]
+        arrival = (m + self._channel_delay[nz]) % len(self._ring)
+
+        order = np.argsort(arrival, kind="stable")
+        slots, starts = np.unique(arrival[order], return_index=True)
+        for slot, chunk in zip(slots, np.split(channels[order], starts[1:])):
+            self._ring[slot].append(chunk)
+
+    def _step_electrical(self, V: np.ndarray, I_syn: np.ndarray):
+        if self._linear_gap.size:
+            I_syn += self._coupling @ V - self._coupling_degree * V
+
+        rect = self._rectifying_gap
+        if rect.size:
+            I = self.g_gap[rect] * self.weight[rect] * (V[self.pre[rect]] - V[self.post[rect]])
+            np.maximum(I, 0.0, out=I)
+            I_syn += np.bincount(self.post[rect], weights=I, minlength=self.n_neurons)
+
+    def reset(self):
+        """Clear conductances and in-flight spikes."""
+        self.g_rise[:] = 0.0
+        self.g_decay[:] = 0.0
+        self._ring = [[] for _ in range(len(self._ring))]
+        self._step = 0
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Conductances, weights and in-flight spikes for checkpoints.
+
+        In-flight delivery channels are saved flattened, with the
+        number arriving ``offset`` steps ahead in ``ring_sizes[offset]``.
+        """
+        n_slots = len(self._ring)
+        slots = [
+            np.concatenate(self._ring[(self._step + offset) % n_slots])
+            if self._ring[(self._step + offset) % n_slots] else np.empty(0, dtype=np.int64)
+            for offset in range(n_slots)
+        ]
+        return {
+            "step": np.array(self._step),
+            "g_rise": self.g_rise.copy(),
+            "g_decay": self.g_decay.copy(),
+            "weight": self.weight.copy(),
+            "ring": np.concatenate(slots) if slots else np.empty(0, dtype=np.int64),
+            "ring_sizes": np.array([len(c) for c in slots], dtype=np.int64),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Load state saved by get_state from a matrix of the same layout.
+
+        Args:
+            state: Arrays keyed as in get_state
+        """
+        if state["weight"].shape != self.weight.shape or len(state["ring_sizes"]) != len(self._ring):
+            raise ValueError("Synapse matrix state does not match this matrix")
+
+        self._step = int(state["step"])
+        self.g_rise[:] = state["g_rise"]
+        self.g_decay[:] = state["g_decay"]
+
+        n_slots = len(self._ring)
+        self._ring = [[] for _ in range(n_slots)]
+        chunks = np.split(np.asarray(state["ring"], dtype=np.int64),
+                          np.cumsum(state["ring_sizes"])[:-1])
+        for offset, chunk in enumerate(chunks):
+            if chunk.size:
+                self._ring[(self._step + offset) % n_slots].append(chunk)
+
+        self._load_weights(state["weight"])
+
+    def inherit(self, old: "SynapseMatrix", position: np.ndarray):
+        """
+        Take over the state of a matrix this one replaces.
+
+        Used when a network rebuilds its backend after a topology change.
+        Synapse objects and projections stored in both matrices keep
+        their weights, conductances carry over per receptor group and
+        postsynaptic neuron, and spikes in flight continue on their
+        (delay, presynaptic neuron) channels, which includes any
+        synapses added on those channels.
+
+        Args:
+            old: Matrix being replaced
+            position: New array position of each of ``old``'s neurons
+                (-1 if no longer stepped by this matrix)
+        """
+        self._step = old._step
+
+        # Weights of synapses present in both
+        weights = self.weight.copy()
+        previous = {id(s): k for k, s in enumerate(old.synapses)}
+        for k, synapse in enumerate(self.synapses):
+            if id(synapse) in previous:
+                weights[k] = old.weight[previous[id(synapse)]]
+        starts = {id(p): int(start) for p, start in zip(old.projections, old._projection_start)}
+        for proj, start in zip(self.projections, self._projection_start[:-1]):
+            if id(proj) in starts:
+                weights[start:start + len(proj)] = old.weight[
+                    starts[id(proj)]:starts[id(proj)] + len(proj)
+                ]
+        self._load_weights(weights)
+
+        # Conductances, by receptor group
+        valid = position >= 0
+        groups = {key: g for g, key in enumerate(self._group_keys)}
+        for g_old, key in enumerate(old._group_keys):
+            g = groups.get(key)
+            if g is not None:
+                self.g_rise[g, position[valid]] = old.g_rise[g_old, valid]
+                self.g_decay[g, position[valid]] = old.g_decay[g_old, valid]
+
+        # Spikes in flight, by delay and presynaptic neuron
+        if len(self._delay_values) == 0:
+            return
+        n_slots = len(self._ring)
+        for offset in range(len(old._ring)):
+            rows = old._ring[(old._step + offset) % len(old._ring)]
+            if not rows:
+                continue
+            channels = np.concatenate(rows)
+            delay = old._delay_values[channels // old.n_neurons]
+            pre = position[channels % old.n_neurons]
+            slot = np.minimum(
+                np.searchsorted(self._delay_values, delay), len(self._delay_values) - 1
+            )
+            keep = (pre >= 0) & (self._delay_values[slot] == delay)
+            if keep.any():
+                self._ring[(self._step + offset) % n_slots].append(
+                    slot[keep] * self.n_neurons + pre[keep]
+                )
+
+    def _load_weights(self, weights: np.ndarray):
+        """Set every weight that differs from ``weights``."""
+        changed = np.flatnonzero(weights != self.weight)
+        objects = changed[
+            (changed < len(self.synapses)) & (self._delivery_position[changed] >= 0)
+        ]
+        self.set_weights(objects, weights[objects])
+        for k in np.setdiff1d(changed, objects).tolist():
+            self.set_weight(k, float(weights[k]))
+
+    # --- Weights and connectivity ---
+
+    def set_weight(self, k: int, weight: float):
+        """
+        Update the weight of synapse ``k`` in all matrices.
+
+        Called by Synapse.weight's setter for bound synapses.
+        """
+        self.weight[k] = weight
+        if k >= len(self.synapses):
+            p = int(np.searchsorted(self._projection_start, k, side="right")) - 1
+            self.projections[p].weight[k - self._projection_start[p]] = weight
+        if self._delivery_position[k] >= 0:
+            self._delivery.data[self._delivery_position[k]] = self.g_max[k] * weight
+        if self._coupling_position[k] >= 0:
+            old = self._coupling.data[self._coupling_position[k]]
+            new = self.g_gap[k] * weight
+            self._coupling.data[self._coupling_position[k]] = new
+            self._coupling_degree[self.post[k]] += new - old
+
+    def set_weights(self, ks: np.ndarray, weights: np.ndarray):
+        """
+        Update the weights of chemical synapse objects ``ks`` at once.
+
+        Synapse ``params`` are not touched (bound STDP synapses read
+        their weight from the plasticity engine).
+        """
+        self.weight[ks] = weights
+        positions = self._delivery_position[ks]
+        self._delivery.data[positions] = self.g_max[ks] * weights
+
+    def get_connectivity(self) -> sparse.csr_matrix:
+        """Sparse (pre x post) weight matrix in array-position order."""
+        W = sparse.csr_matrix(
+            (self.weight, (self.pre, self.post)),
+            shape=(self.n_neurons, self.n_neurons),
+        )
+        W.sum_duplicates()
+        return W
+
+    # --- Per-synapse views ---
+
+    def _synapse(self, k: int) -> Synapse:
+        """Synapse object (or projection view) at matrix position ``k``."""
+        if k < len(self.synapses):
+            return self.synapses[k]
+        p = int(np.searchsorted(self._projection_start, k, side="right")) - 1
+        return self.projections[p].views()[k - self._projection_start[p]]
+
+    def _arrival_steps(self, k: int) -> np.ndarray:
+        """Steps at which spikes of synapse ``k``'s presynaptic neuron arrive."""
+        synapse = self._synapse(k)
+        dt = synapse.params.dt
+        spikes = np.asarray(synapse.pre.state.spike_times, dtype=np.float64)
+        return np.round(spikes / dt).astype(np.int64) + self.delay_steps[k]
+
+    def synapse_conductance(self, k: int) -> float:
+        """Reconstruct the conductance of one synapse after the last step."""
+        if self.group[k] < 0:
+            return float(self.g_gap[k] * self.weight[k])
+
+        arrivals = self._arrival_steps(k)
+        elapsed = self._step - arrivals
+        elapsed = elapsed[elapsed > 0]
+        if elapsed.size == 0:
+            return 0.0
+
+        g = self.group[k]
+        dt = self.dt[g, 0]
+        rho_rise = 1.0 - dt / self.tau_rise[g, 0]
+        rho_decay = 1.0 - dt / self.tau_decay[g, 0]
+        delta_g = self.g_max[k] * self.weight[k]
+        return float(delta_g * np.sum(rho_decay ** elapsed - rho_rise ** elapsed))
+
+    def synapse_current(self, k: int) -> float:
+        """Current delivered by one synapse at the last step."""
+        synapse = self._synapse(k)
+        if self.group[k] < 0:
+            I = self.g_gap[k] * self.weight[k] * (synapse.pre.V - synapse.post.V)
+            if self.rectifying[k] and I < 0:
+                I = 0.0
+            return float(I)
+
+        g = self.group[k]
+        I = self.synapse_conductance(k) * (synapse.post.V - self.E_rev[g, 0])
+        return float(I * self.sign[g, 0])
+
+    def synapse_pending(self, k: int) -> List[float]:
+        """Delivery times of spikes still in flight on one synapse."""
+        if self.group[k] < 0:
+            return []
+        arrivals = self._arrival_steps(k)
+        dt = self._synapse(k).params.dt
+        return [float(a * dt) for a in arrivals[arrivals >= self._step]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize matrix contents."""
+        return {
+            "n_synapses": self.n_synapses,
+            "chemical": int(self._chemical.size),
+            "electrical": int(self._electrical.size),
+            "receptor_groups": int(self.g_rise.shape[0]),
+            "delay_slots": int(len(self._ring)),
+            "nnz": int(self._delivery.nnz + self._coupling.nnz),
+        }
@@ -0,0 +1,481 @@
+"""
+Population-Level STDP
+
+Steps the plasticity of many STDPSynapse objects at once:
+
+- Spike traces are per-neuron arrays (pre trace per presynaptic
+  neuron, post trace per postsynaptic neuron, plus the slow triplet
+  traces), decayed once per step
+- Weights, eligibility traces and LTP/LTD totals are per-synapse
+  arrays; a step only touches the outgoing synapses (rows) and
+  incoming synapses (columns) of neurons that spiked
+- Eligibility decays lazily: each synapse stores the step of its last
+  update and is decayed in closed form when next read or updated
+- Weight history is sampled every ``history_interval`` steps
+
+Results match the per-object rule, including the order of pre- and
+postsynaptic updates when both neurons spike in the same step
+(neurons fire in array order, as the population backend steps them).
+
+Synapses are grouped by their plasticity parameters (see
+create_plasticity); each group gets one STDPPlasticity. The
+STDPSynapse objects stay usable: their ``stdp_state`` and ``weight``
+read from the engine.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple, Sequence, TYPE_CHECKING
+import numpy as np
+
+from .stdp import STDPSynapse, STDPState, STDPType
+
+if TYPE_CHECKING:
+    from .matrix import SynapseMatrix
+
+
+def _plasticity_key(synapse: STDPSynapse) -> Tuple:
+    """Plasticity parameters that must be shared within one engine."""
+    p = synapse.params
+    return (
+        p.stdp_type, p.A_plus, p.A_minus, p.tau_plus, p.tau_minus,
+        p.w_min, p.w_max, p.learning_rate, p.enabled,
+        p.use_eligibility, p.tau_eligibility,
+        p.A2_plus, p.A2_minus, p.tau_x, p.tau_y, p.dt, p.history_interval,
+    )
+
+
+def create_plasticity(
+    synapses: Sequence[STDPSynapse],
+    matrix: "SynapseMatrix"
+) -> List["STDPPlasticity"]:
+    """
+    Group STDP synapses by parameters and build one engine per group.
+
+    Args:
+        synapses: STDP synapses already stored in ``matrix``
+        matrix: SynapseMatrix delivering their spikes
+
+    Returns:
+        List of STDPPlasticity engines
+    """
+    groups: Dict[Tuple, List[STDPSynapse]] = {}
+    for synapse in synapses:
+        groups.setdefault(_plasticity_key(synapse), []).append(synapse)
+    return [STDPPlasticity(group, matrix) for group in groups.values()]
+
+
+def _csr_index(keys: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(indptr, order) grouping positions of ``keys`` by value."""
+    order = np.argsort(keys, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=indptr[1:])
+    return indptr, order
+
+
+def _gather(indptr: np.ndarray, order: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Synapse indices of all entries in ``rows`` of a CSR grouping."""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return order[offsets + np.arange(int(lengths.sum()))]
+
+
+class PlasticityState(STDPState):
+    """
+    STDPState view into an STDPPlasticity engine.
+
+    Traces, eligibility, LTP/LTD totals and weight history are read
+    from the engine arrays; assignments are ignored.
+    """
+
+    def __init__(self, engine: "STDPPlasticity", index: int):
+        """
+        Initialize view.
+
+        Args:
+            engine: Owning plasticity engine
+            index: Position of the synapse in the engine
+        """
+        self._engine = engine
+        self._index = index
+
+    @property
+    def pre_trace(self) -> float:
+        return float(self._engine.x[self._engine.pre[self._index]])
+
+    @pre_trace.setter
+    def pre_trace(self, value: float):
+        pass
+
+    @property
+    def post_trace(self) -> float:
+        return float(self._engine.y[self._engine.post[self._index]])
+
+    @post_trace.setter
+    def post_trace(self, value: float):
+        pass
+
+    @property
+    def pre_trace_slow(self) -> float:
+        return float(self._engine.x_slow[self._engine.pre[self._index]])
+
+    @pre_trace_slow.setter
+    def pre_trace_slow(self, value: float):
+        pass
+
+    @property
+    def post_trace_slow(self) -> float:
+        return float(self._engine.y_slow[self._engine.post[self._index]])
+
+    @post_trace_slow.setter
+    def post_trace_slow(self, value: float):
+        pass
+
+    @property
+    def eligibility(self) -> float:
+        return float(self._engine.current_eligibility(np.array([self._index]))[0])
+
+    @eligibility.setter
+    def eligibility(self, value: float):
+        pass
+
+    @property
+    def total_ltp(self) -> float:
+        return float(self._engine.total_ltp[self._index])
+
+    @total_ltp.setter
+    def total_ltp(self, value: float):
+        pass
+
+    @property
+    def total_ltd(self) -> float:
+        return float(self._engine.total_ltd[self._index])
+
+    @total_ltd.setter
+    def total_ltd(self, value: float):
+        pass
+
+    @property
+    def weight_history(self) -> List[float]:
+        return self._engine.synapse_history(self._index)
+
+    @weight_history.setter
+    def weight_history(self, value: list):
+        pass
+
+    def reset(self):
+        """State is owned by the engine (see STDPPlasticity.reset)."""
+        pass
+
+    def __repr__(self) -> str:
+        return f"PlasticityState(index={self._index}, weight={self._engine.weight[self._index]:.4f})"
+
+
+class STDPPlasticity:
+    """
+    Vectorized STDP for synapses sharing one set of plasticity parameters.
+
+    Neurons are addressed by their position in the ``fired`` mask
+    passed to step(), i.e. the SynapseMatrix neuron index.
+
+    Usage:
+        >>> engine = STDPPlasticity(stdp_synapses, matrix)
+        >>> engine.step(fired)       # after neurons fire, before matrix.step
+        >>> engine.apply_reward(1.0)
+    """
+
+    def __init__(self, synapses: Sequence[STDPSynapse], matrix: "SynapseMatrix"):
+        """
+        Build trace and weight arrays and bind synapse views.
+
+        Args:
+            synapses: STDP synapses with identical plasticity parameters,
+                already stored in ``matrix``
+            matrix: SynapseMatrix delivering their spikes (weights
+                changed here are written into it)
+        """
+        self.synapses: List[STDPSynapse] = list(synapses)
+        self.matrix = matrix
+        self.params = p = self.synapses[0].params
+        n = matrix.n_neurons
+
+        # Per-synapse arrays
+        self.matrix_index = np.array(
+            [s._matrix_index for s in self.synapses], dtype=np.int64
+        )
+        self.pre = matrix.pre[self.matrix_index]
+        self.post = matrix.post[self.matrix_index]
+        self.weight = np.array([s.weight for s in self.synapses], dtype=np.float64)
+        self.eligibility = np.zeros(len(self.synapses))
+        self._eligibility_step = np.zeros(len(self.synapses), dtype=np.int64)
+        self.total_ltp = np.zeros(len(self.synapses))
+        self.total_ltd = np.zeros(len(self.synapses))
+
+        # Synapses grouped by presynaptic (rows) and postsynaptic (columns) neuron
+        self._out_ptr, self._out = _csr_index(self.pre, n)
+        self._in_ptr, self._in = _csr_index(self.post, n)
+
+        # Per-neuron traces
+        self.x = np.zeros(n)          # Presynaptic trace (tau_plus)
+        self.y = np.zeros(n)          # Postsynaptic trace (tau_minus)
+        self.x_slow = np.zeros(n)     # Triplet presynaptic trace (tau_x)
+        self.y_slow = np.zeros(n)     # Triplet postsynaptic trace (tau_y)
+
+        # Per-step decay factors (Euler, as in STDPSynapse._compute_current)
+        self._decay_x = 1.0 - p.dt / p.tau_plus
+        self._decay_y = 1.0 - p.dt / p.tau_minus
+        self._decay_x_slow = 1.0 - p.dt / p.tau_x
+        self._decay_y_slow = 1.0 - p.dt / p.tau_y
+        self._decay_eligibility = 1.0 - p.dt / p.tau_eligibility
+
+        self._steps = 0
+        self._history: List[np.ndarray] = [self.weight.copy()]
+
+        for k, synapse in enumerate(self.synapses):
+            synapse._plasticity = self
+            synapse._plasticity_index = k
+            synapse.stdp_state = PlasticityState(self, k)
+
+    @property
+    def n_synapses(self) -> int:
+        """Number of synapses in the engine."""
+        return len(self.synapses)
+
+    # --- Simulation ---
+
+    def step(self, fired: np.ndarray):
+        """
+        Apply the plasticity of one time step.
+
+        Args:
+            fired: Spike mask of this step (matrix neuron order)
+        """
+        if self.params.enabled:
+            spiking = np.flatnonzero(fired)
+            if spiking.size:
+                self._apply_spikes(fired, spiking)
+
+        self.x *= self._decay_x
+        self.y *= self._decay_y
+        if self.params.stdp_type == STDPType.TRIPLET:
+            self.x_slow *= self._decay_x_slow
+            self.y_slow *= self._decay_y_slow
+
+        self._steps += 1
+        interval = self.params.history_interval
+        if interval and self._steps % interval == 0:
+            self._history.append(self.weight.copy())
+
+    def _apply_spikes(self, fired: np.ndarray, spiking: np.ndarray):
+        """Pre- and postsynaptic updates of the synapses of spiking neurons."""
+        p = self.params
+        rule = p.stdp_type
+        lr = p.learning_rate
+
+        # Presynaptic events (LTD side of the classic rule)
+        k_pre = _gather(self._out_ptr, self._out, spiking)
+        i, j = self.pre[k_pre], self.post[k_pre]
+        post_first = fired[j] & (j < i)
+        y_seen = self.y[j] + post_first
+        if rule == STDPType.CLASSIC:
+            dw_pre = -p.A_minus * y_seen * lr
+        elif rule == STDPType.SYMMETRIC:
+            dw_pre = p.A_plus * y_seen * lr
+        elif rule == STDPType.ANTI_HEBBIAN:
+            dw_pre = p.A_minus * y_seen * lr
+        else:
+            dw_pre = -p.A_minus * y_seen * lr
+            dw_pre -= p.A2_minus * y_seen * (self.x_slow[i] + 1.0) * lr
+
+        # Postsynaptic events (LTP side of the classic rule)
+        k_post = _gather(self._in_ptr, self._in, spiking)
+        i2, j2 = self.pre[k_post], self.post[k_post]
+        pre_first = fired[i2] & (i2 <= j2)
+        x_seen = self.x[i2] + pre_first
+        if rule in (STDPType.CLASSIC, STDPType.SYMMETRIC):
+            dw_post = p.A_plus * x_seen * lr
+        elif rule == STDPType.ANTI_HEBBIAN:
+            dw_post = -p.A_plus * x_seen * lr
+        else:
+            dw_post = p.A_plus * x_seen * lr
+            dw_post += p.A2_plus * x_seen * (self.y_slow[j2] + 1.0) * lr
+
+        # Apply in firing order: first each synapse's earlier event, then
+        # the later one of synapses whose pre and post both fired
+        self._update(k_pre[~post_first], dw_pre[~post_first])
+        self._update(k_post[~pre_first], dw_post[~pre_first])
+        self._update(k_post[pre_first], dw_post[pre_first])
+        self._update(k_pre[post_first], dw_pre[post_first])
+
+        # Learning totals (signs tracked as in STDPSynapse)
+        if rule in (STDPType.SYMMETRIC, STDPType.ANTI_HEBBIAN):
+            self.total_ltp[k_pre] += np.maximum(dw_pre, 0.0)
+        else:
+            self.total_ltd[k_pre] += np.maximum(-dw_pre, 0.0)
+        if rule == STDPType.ANTI_HEBBIAN:
+            self.total_ltd[k_post] += np.maximum(-dw_post, 0.0)
+        else:
+            self.total_ltp[k_post] += np.maximum(dw_post, 0.0)
+
+        if p.use_eligibility:
+            self._add_eligibility(k_pre, y_seen)
+            self._add_eligibility(k_post, x_seen)
+
+        # Traces of spiking neurons
+        self.x[spiking] += 1.0
+        self.y[spiking] += 1.0
+        if rule == STDPType.TRIPLET:
+            self.x_slow[spiking] += 1.0
+            self.y_slow[spiking] += 1.0
+
+        changed = np.concatenate([k_pre, k_post])
+        self.matrix.set_weights(self.matrix_index[changed], self.weight[changed])
+
+    def _update(self, k: np.ndarray, dw: np.ndarray):
+        """Clipped weight change of distinct synapses ``k``."""
+        if k.size:
+            self.weight[k] = np.clip(self.weight[k] + dw, self.params.w_min, self.params.w_max)
+
+    def _add_eligibility(self, k: np.ndarray, amount: np.ndarray):
+        """Add to eligibility traces (each synapse at most once per call)."""
+        self.eligibility[k] = self.current_eligibility(k) + amount
+        self._eligibility_step[k] = self._steps
+
+    def current_eligibility(self, k: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Eligibility traces decayed to the current step.
+
+        Args:
+            k: Synapse indices (default: all)
+        """
+        if k is None:
+            k = np.arange(self.n_synapses)
+        elapsed = self._steps - self._eligibility_step[k]
+        return self.eligibility[k] * self._decay_eligibility ** elapsed
+
+    def apply_reward(self, reward: float, k: Optional[np.ndarray] = None):
+        """
+        Reward-modulated weight change ``reward * eligibility * learning_rate``.
+
+        No effect unless the synapses use eligibility traces.
+
+        Args:
+            reward: Reward signal (positive or negative)
+            k: Synapse indices (default: all)
+        """
+        p = self.params
+        if not p.use_eligibility:
+            return
+        if k is None:
+            k = np.arange(self.n_synapses)
+        dw = reward * self.current_eligibility(k) * p.learning_rate
+        self._update(k, dw)
+        self.matrix.set_weights(self.matrix_index[k], self.weight[k])
+
+    def set_weight(self, k: int, weight: float):
+        """Set the weight of synapse ``k`` (matrix is updated by the synapse)."""
+        self.weight[k] = weight
+
+    def synapse_weight(self, k: int) -> float:
+        """Current weight of synapse ``k``."""
+        return float(self.weight[k])
+
+    def synapse_history(self, k: int) -> List[float]:
+        """Sampled weight history of synapse ``k``."""
+        return [float(h[k]) for h in self._history]
+
+    @property
+    def weight_history(self) -> np.ndarray:
+        """(n_samples, n_synapses) sampled weights."""
+        return np.array(self._history)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Weights, traces and sampled history for checkpoints."""
+        return {
+            "weight": self.weight.copy(),
+            "eligibility": self.eligibility.copy(),
+            "eligibility_step": self._eligibility_step.copy(),
+            "total_ltp": self.total_ltp.copy(),
+            "total_ltd": self.total_ltd.copy(),
+            "x": self.x.copy(),
+            "y": self.y.copy(),
+            "x_slow": self.x_slow.copy(),
+            "y_slow": self.y_slow.copy(),
+            "steps": np.array(self._steps),
+            "history": self.weight_history,
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]):
+        """
+        Load state saved by get_state and push the weights to the matrix.
+
+        Args:
+            state: Arrays keyed as in get_state
+        """
+        if state["weight"].shape != self.weight.shape:
+            raise ValueError("Plasticity state does not match this engine")
+        for name in ("weight", "eligibility", "total_ltp", "total_ltd",
+                     "x", "y", "x_slow", "y_slow"):
+            getattr(self, name)[:] = state[name]
+        self._eligibility_step[:] = state["eligibility_step"]
+        self._steps = int(state["steps"])
+        self._history = [row.copy() for row in state["history"]]
+        self.matrix.set_weights(self.matrix_index, self.weight)
+
+    def inherit(self, engines: Sequence["STDPPlasticity"], position: np.ndarray):
+        """
+        Take over the state of engines this one replaces.
+
+        Used when a network rebuilds its backend after a topology change.
+        Neuron traces and the step count come from the old engine with
+        the same plasticity parameters; eligibility, totals and weight
+        history are copied for each synapse the old engines held.
+
+        Args:
+            engines: Engines being replaced
+            position: New array position of each of their neurons
+                (-1 if no longer stepped by the matrix)
+        """
+        key = _plasticity_key(self.synapses[0])
+        matching = [e for e in engines if _plasticity_key(e.synapses[0]) == key]
+        if matching:
+            old = matching[0]
+            valid = position >= 0
+            for name in ("x", "y", "x_slow", "y_slow"):
+                getattr(self, name)[position[valid]] = getattr(old, name)[valid]
+            self._steps = old._steps
+
+        located = {id(s): (e, k) for e in engines for k, s in enumerate(e.synapses)}
+        history = [self.weight.copy() for _ in (matching[0]._history if matching else [])]
+        for k, synapse in enumerate(self.synapses):
+            if id(synapse) not in located:
+                continue
+            engine, j = located[id(synapse)]
+            self.eligibility[k] = engine.current_eligibility(np.array([j]))[0]
+            self._eligibility_step[k] = self._steps
+            self.total_ltp[k] = engine.total_ltp[j]
+            self.total_ltd[k] = engine.total_ltd[j]
+            if matching and engine is matching[0]:
+                for row, old_row in zip(history, engine._history):
+                    row[k] = old_row[j]
+        if history:
+            self._history = history
+
+    def reset(self):
+        """Clear traces, eligibility, totals and history (weights are kept)."""
+        for trace in (self.x, self.y, self.x_slow, self.y_slow,
+                      self.eligibility, self.total_ltp, self.total_ltd):
+            trace[:] = 0.0
+        self._eligibility_step[:] = 0
+        self._steps = 0
+        self._history = [self.weight.copy()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize engine."""
+        return {
+            "stdp_type": self.params.stdp_type.value,
+            "n_synapses": self.n_synapses,
+            "mean_weight": float(self.weight.mean()) if self.n_synapses else 0.0,
+            "total_ltp": float(self.total_ltp.sum()),
+            "total_ltd": float(self.total_ltd.sum()),
+            "history_samples": len(self._history),
+        }
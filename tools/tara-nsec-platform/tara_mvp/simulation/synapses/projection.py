@@ -0,0 +1,195 @@
+"""
+Synapse Projection
+
+Array-backed batch of ChemicalSynapse connections that share one
+parameter set (receptor kinetics, delay, dt) and differ only in their
+endpoints and weight.
+
+A projection stores its edges as (pre, post) index arrays into a
+source and a target neuron list plus a weight array, so a network with
+millions of connections is built and stepped without creating one
+Synapse object per connection. Networks step projections through a
+SynapseMatrix. For per-synapse inspection, views() creates one
+ChemicalSynapse per edge whose state reads back from that matrix;
+release_synapses() hands the edges over as independent synapses.
+"""
+
+from dataclasses import replace
+from typing import Optional, Dict, Any, List, Sequence, TYPE_CHECKING
+import uuid
+import numpy as np
+
+from .base import SynapseState
+from .chemical import ChemicalSynapse, ChemicalSynapseParameters
+
+if TYPE_CHECKING:
+    from ..neurons.base import Neuron
+
+
+class SynapseProjection:
+    """
+    Chemical synapses between two neuron lists, stored as arrays.
+
+    Edge ``k`` connects ``sources[pre[k]]`` to ``targets[post[k]]``
+    with weight ``weight[k]``; every other parameter comes from
+    ``params``.
+
+    Usage:
+        >>> params = ChemicalSynapseParameters.from_receptor(ReceptorType.AMPA)
+        >>> proj = SynapseProjection(exc, inh, pre, post, params)
+        >>> network.add_projection(proj)
+    """
+
+    def __init__(
+        self,
+        sources: Sequence["Neuron"],
+        targets: Sequence["Neuron"],
+        pre: np.ndarray,
+        post: np.ndarray,
+        params: ChemicalSynapseParameters,
+        weights: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize projection.
+
+        Args:
+            sources: Presynaptic neurons
+            targets: Postsynaptic neurons
+            pre: Source index of each edge
+            post: Target index of each edge
+            params: Parameters shared by all edges
+            weights: Per-edge weights (default: params.weight)
+        """
+        if params.use_stp:
+            raise ValueError("Short-term plasticity needs per-object ChemicalSynapse connections")
+
+        self.sources: List["Neuron"] = list(sources)
+        self.targets: List["Neuron"] = list(targets)
+        self.pre = np.asarray(pre, dtype=np.int64)
+        self.post = np.asarray(post, dtype=np.int64)
+        self.params = params
+
+        if weights is None:
+            self.weight = np.full(self.pre.size, params.weight, dtype=np.float64)
+        else:
+            self.weight = np.array(weights, dtype=np.float64)
+        if not (self.pre.size == self.post.size == self.weight.size):
+            raise ValueError("pre, post and weights must have the same length")
+
+        # Per-edge synapse views and the matrix stepping the edges
+        self._views: Optional[List[ChemicalSynapse]] = None
+        self._matrix = None
+        self._offset = 0
+
+    def __len__(self) -> int:
+        return int(self.pre.size)
+
+    def positions(self, index: Dict[str, int]):
+        """
+        Array positions of every edge's endpoints.
+
+        Args:
+            index: Mapping of neuron ID -> array position
+
+        Returns:
+            Tuple of (pre_positions, post_positions)
+        """
+        source_pos = np.array([index[n.id] for n in self.sources], dtype=np.int64)
+        target_pos = np.array([index[n.id] for n in self.targets], dtype=np.int64)
+        return source_pos[self.pre], target_pos[self.post]
+
+    def covers(self, index: Dict[str, int]) -> bool:
+        """Check whether all source and target neurons are in ``index``."""
+        return all(n.id in index for n in self.sources) and all(
+            n.id in index for n in self.targets
+        )
+
+    def bind(self, matrix, offset: int):
+        """
+        Attach to the SynapseMatrix that steps this projection.
+
+        Args:
+            matrix: SynapseMatrix holding the edges
+            offset: Matrix position of the first edge
+        """
+        self._matrix = matrix
+        self._offset = offset
+        if self._views is not None:
+            for j, view in enumerate(self._views):
+                matrix.bind_view(view, offset + j)
+
+    def sync_weights(self) -> np.ndarray:
+        """Pull weights changed through views into ``weight``; returns it."""
+        if self._views is not None:
+            self.weight[:] = [view.params.weight for view in self._views]
+        return self.weight
+
+    def views(self) -> List[ChemicalSynapse]:
+        """
+        One ChemicalSynapse view per edge, in edge order.
+
+        Views are not subscribed to their presynaptic neuron and are
+        never stepped; their state and weight are read from (and
+        written to) the matrix stepping the projection.
+        """
+        if self._views is None:
+            views = self.create_synapses()
+            view_ids = {id(view) for view in views}
+            for neuron in self.sources:
+                neuron._spike_callbacks = [
+                    cb for cb in neuron._spike_callbacks
+                    if id(getattr(cb, "__self__", None)) not in view_ids
+                ]
+            self._views = views
+            if self._matrix is not None:
+                self.bind(self._matrix, self._offset)
+        return self._views
+
+    def release_synapses(self) -> List[ChemicalSynapse]:
+        """
+        Hand the edges over as independent ChemicalSynapse objects.
+
+        Existing views are detached from the matrix and subscribed to
+        their presynaptic neuron; otherwise fresh synapses are created.
+        The projection should be discarded afterwards.
+        """
+        if self._views is None:
+            return self.create_synapses()
+
+        synapses, self._views = self._views, None
+        for synapse in synapses:
+            synapse._matrix = None
+            synapse._matrix_index = -1
+            synapse.state = SynapseState()
+            synapse.pre.on_spike(synapse._on_pre_spike)
+        self._matrix = None
+        return synapses
+
+    def create_synapses(self) -> List[ChemicalSynapse]:
+        """
+        Create one ChemicalSynapse object per edge.
+
+        Returns:
+            Synapses in edge order (not added to any network)
+        """
+        return [
+            ChemicalSynapse(
+                self.sources[i], self.targets[j],
+                replace(self.params, synapse_id=str(uuid.uuid4())[:8], weight=w),
+            )
+            for i, j, w in zip(self.pre.tolist(), self.post.tolist(), self.weight.tolist())
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize projection."""
+        return {
+            "n_sources": len(self.sources),
+            "n_targets": len(self.targets),
+            "n_synapses": len(self),
+            "params": self.params.to_dict(),
+            "mean_weight": float(self.weight.mean()) if len(self) else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        return (f"SynapseProjection({len(self.sources)} -> {len(self.targets)}, "
+                f"synapses={len(self)}, receptor={self.params.receptor.value})")
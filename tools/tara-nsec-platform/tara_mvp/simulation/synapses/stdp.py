@@ -65,6 +65,9 @@ class STDPParameters(ChemicalSynapseParameters):
     tau_x: float = 100.0      # Presynaptic triplet trace
     tau_y: float = 100.0      # Postsynaptic triplet trace
 
+    # Steps between weight_history samples (0 disables recording)
+    history_interval: int = 1
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         base = super().to_dict()
@@ -78,6 +81,7 @@ class STDPParameters(ChemicalSynapseParameters):
             "w_max": self.w_max,
             "learning_rate": self.learning_rate,
             "enabled": self.enabled,
+            "history_interval": self.history_interval,
         })
         return base
 
@@ -136,6 +140,17 @@ class STDPSynapse(ChemicalSynapse):
         >>> print(f"Weight changed from 1.0 to {synapse.weight}")
     """
 
+    # Set while plasticity is stepped by an STDPPlasticity engine
+    _plasticity = None
+    _plasticity_index = -1
+
+    state_variables = ChemicalSynapse.state_variables + (
+        "stdp_state.pre_trace", "stdp_state.post_trace",
+        "stdp_state.pre_trace_slow", "stdp_state.post_trace_slow",
+        "stdp_state.eligibility", "stdp_state.total_ltp", "stdp_state.total_ltd",
+        "_history_steps",
+    )
+
     def __init__(
         self,
         pre: "Neuron",
@@ -159,6 +174,7 @@ class STDPSynapse(ChemicalSynapse):
         post.on_spike(self._on_post_spike)
 
         # Store initial weight
+        self._history_steps = 0
         self.stdp_state.weight_history.append(self.params.weight)
 
     @property
@@ -170,6 +186,19 @@ class STDPSynapse(ChemicalSynapse):
     def params(self, value: STDPParameters):
         self._params = value
 
+    @property
+    def weight(self) -> float:
+        """Synaptic weight (read from the plasticity engine when bound)."""
+        if self._plasticity is not None:
+            return self._plasticity.synapse_weight(self._plasticity_index)
+        return self.params.weight
+
+    @weight.setter
+    def weight(self, value: float):
+        if self._plasticity is not None:
+            self._plasticity.set_weight(self._plasticity_index, value)
+        Synapse.weight.fset(self, value)
+
     def _on_pre_spike(self, neuron: "Neuron", spike_time: float):
         """Handle presynaptic spike - update trace and apply LTD."""
         super()._on_pre_spike(neuron, spike_time)
@@ -268,12 +297,7 @@ class STDPSynapse(ChemicalSynapse):
     def _update_weight(self, dw: float):
         """Update synaptic weight with bounds checking."""
         p = self.params
-        new_weight = np.clip(
-            self.params.weight + dw,
-            p.w_min,
-            p.w_max
-        )
-        self.params.weight = new_weight
+        p.weight = min(max(p.weight + dw, p.w_min), p.w_max)
 
     def _compute_current(self, t: float) -> float:
         """Compute synaptic current and decay traces."""
@@ -306,7 +330,9 @@ class STDPSynapse(ChemicalSynapse):
         Args:
             reward: Reward signal (positive or negative)
         """
-        if self.params.use_eligibility:
+        if self._plasticity is not None:
+            self._plasticity.apply_reward(reward, np.array([self._plasticity_index]))
+        elif self.params.use_eligibility:
             dw = reward * self.stdp_state.eligibility * self.params.learning_rate
             self._update_weight(dw)
 
@@ -314,8 +340,11 @@ class STDPSynapse(ChemicalSynapse):
         """Step synapse and record weight."""
         I = super().step(t)
 
-        # Record weight history periodically
-        self.stdp_state.weight_history.append(self.params.weight)
+        # Record weight history every history_interval steps
+        self._history_steps += 1
+        interval = self.params.history_interval
+        if interval and self._history_steps % interval == 0:
+            self.stdp_state.weight_history.append(self.params.weight)
 
         return I
 
@@ -323,12 +352,13 @@ class STDPSynapse(ChemicalSynapse):
         """Reset synapse state including STDP variables."""
         super().reset()
         self.stdp_state.reset()
+        self._history_steps = 0
         self.stdp_state.weight_history.append(self.params.weight)
 
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get learning statistics."""
         return {
-            "current_weight": self.params.weight,
+            "current_weight": self.weight,
             "initial_weight": self.stdp_state.weight_history[0] if self.stdp_state.weight_history else 1.0,
             "total_ltp": self.stdp_state.total_ltp,
             "total_ltd": self.stdp_state.total_ltd,
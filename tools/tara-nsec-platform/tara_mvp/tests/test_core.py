@@ -57,6 +57,20 @@ class TestCoherence:
         # Noisy signal should have lower coherence than perfect signal
         assert cs < 1.0
 
+    def test_coherence_batch_matches_calculate(self):
+        """Test that calculate_batch scores ragged rows like calculate()."""
+        from tara_mvp.core.coherence import CoherenceMetric
+
+        metric = CoherenceMetric(reference_freq=40.0)
+        rng = np.random.default_rng(0)
+        times = np.sort(rng.uniform(0, 0.5, (8, 64)), axis=1)
+        amplitudes = rng.normal(100, 10, (8, 64))
+        lengths = np.array([64, 1, 2, 10, 33, 64, 5, 40])
+
+        scores = metric.calculate_batch(times, amplitudes, lengths=lengths)
+        expected = [metric.calculate(t[:n], a[:n]) for t, a, n in zip(times, amplitudes, lengths)]
+        np.testing.assert_allclose(scores, expected, rtol=1e-12)
+
 
 class TestONILayers:
     """Tests for ONI 14-layer model."""
@@ -158,6 +172,57 @@ class TestFirewall:
         result = fw.filter(signal)
         assert result.decision.name == "REJECT"
 
+    def test_firewall_filter_arrays(self):
+        """Test that array batches get the same decisions as single signals."""
+        import numpy as np
+        from tara_mvp.core.firewall import NeuralFirewall, Signal
+
+        fw = NeuralFirewall(amplitude_bounds=(0, 200))
+        times = np.array([[0.0, 0.025, 0.050, 0.075, 0.100]] * 3)
+        amplitudes = np.array([
+            [100, 98, 102, 99, 101],
+            [100, 98, 102, 99, 101],
+            [100, 500, 100, 100, 100],
+        ], dtype=float)
+        authenticated = np.array([True, False, True])
+
+        batch = fw.filter_arrays(times, amplitudes, authenticated)
+        expected = [
+            NeuralFirewall(amplitude_bounds=(0, 200)).filter(Signal(list(t), list(a), bool(auth)))
+            for t, a, auth in zip(times, amplitudes, authenticated)
+        ]
+        assert [r.decision for r in batch] == [r.decision for r in expected]
+        assert fw.get_stats()["read"]["total"] == 3
+
+
+class TestStreamingMonitor:
+    """Tests for per-channel coherence in the neural monitor."""
+
+    def test_process_samples_scores_each_stride(self):
+        """Scores are emitted every stride and the worst channel drives the metric."""
+        from tara_mvp.core.coherence import CoherenceMetric
+        from tara_mvp.nsam import NeuralMonitor
+
+        rng = np.random.default_rng(0)
+        times = np.arange(200) * 0.025 + rng.normal(0, 0.001, 200)
+        amplitudes = rng.normal(100, 2, (200, 8))
+        amplitudes[:, 3] = rng.normal(100, 40, 200)
+
+        monitor = NeuralMonitor()
+        monitor.start()
+        monitor.track_coherence(n_channels=8, window=64, stride=20)
+        monitor.process_samples(times[:150], amplitudes[:150])
+        for i in range(150, 200):
+            monitor.process_samples(times[i], amplitudes[i])
+        session = monitor.stop()
+
+        assert session.samples_processed == 10
+        scores = monitor.channel_coherence
+        expected = CoherenceMetric().calculate(times[-64:], amplitudes[-64:, 3])
+        assert scores.argmin() == 3
+        assert scores[3] == pytest.approx(expected)
+        assert monitor.current_metrics["coherence"] == pytest.approx(scores.min())
+
 
 class TestScaleFrequency:
     """Tests for scale-frequency invariant."""
@@ -0,0 +1,1685 @@
+"""
+Tests for TARA simulation modules.
+
+Tests vectorized neuron populations and the network population backend.
+"""
+
+import functools
+
+import pytest
+import numpy as np
+
+
+def _build_recurrent(backend, n_neurons=60, seed=7):
+    """Small balanced network with strong external drive so it fires."""
+    from tara_mvp.simulation import RecurrentNetwork
+
+    return RecurrentNetwork.create_balanced(
+        n_neurons=n_neurons,
+        seed=seed,
+        backend=backend,
+        external_weight=20.0,
+    )
+
+
+def _run(network, n_steps=300, seed=3):
+    network.set_rng(np.random.default_rng(seed))
+    for _ in range(n_steps):
+        network.step()
+    return network
+
+
+class TestNeuronPopulations:
+    """Tests for vectorized neuron populations."""
+
+    @pytest.mark.parametrize("factory", [
+        lambda: __import__("tara_mvp.simulation.neurons", fromlist=["LIFNeuron"]).LIFNeuron(),
+        lambda: __import__(
+            "tara_mvp.simulation.neurons", fromlist=["AdaptiveLIFNeuron"]
+        ).AdaptiveLIFNeuron.create_adapting(),
+        lambda: __import__(
+            "tara_mvp.simulation.neurons", fromlist=["IzhikevichNeuron"]
+        ).IzhikevichNeuron(),
+        lambda: __import__(
+            "tara_mvp.simulation.neurons", fromlist=["HodgkinHuxleyNeuron"]
+        ).HodgkinHuxleyNeuron(),
+    ])
+    def test_population_matches_single_neuron(self, factory):
+        """Population step reproduces Neuron.step for each supported model."""
+        from tara_mvp.simulation.neurons import create_populations
+
+        reference = factory()
+        current = np.linspace(0.0, 12.0, 2000)
+        expected = reference.simulate(200, input_current=current)
+
+        neurons = [factory() for _ in range(3)]
+        (population,) = create_populations(neurons)
+        for i in range(len(current)):
+            population.I_ext[:] = current[i]
+            population.step()
+
+        V = population.get_V_history()
+        np.testing.assert_allclose(V[:, 0], expected["V"], atol=1e-9)
+        np.testing.assert_allclose(V[:, 2], expected["V"], atol=1e-9)
+        assert neurons[1].state.spike_times == list(expected["spike_times"])
+
+    def test_state_view_reads_and_writes_population(self):
+        """Neuron objects stay usable through the state view."""
+        from tara_mvp.simulation.neurons import LIFNeuron, create_populations
+
+        neurons = [LIFNeuron() for _ in range(4)]
+        (population,) = create_populations(neurons)
+
+        neurons[2].receive_input(1.5)
+        assert population.I_syn[2] == pytest.approx(1.5)
+
+        population.V[1] = -55.0
+        assert neurons[1].V == pytest.approx(-55.0)
+
+    def test_kernel_backend_selection(self):
+        """Auto picks numba when installed; numba raises cleanly when not."""
+        from tara_mvp.simulation.neurons import get_kernels, is_numba_available
+
+        assert get_kernels("numpy").backend == "numpy"
+        expected = "numba" if is_numba_available() else "numpy"
+        assert get_kernels("auto").backend == expected
+        if not is_numba_available():
+            with pytest.raises(ImportError):
+                get_kernels("numba")
+        with pytest.raises(ValueError):
+            get_kernels("cuda")
+
+    def test_numba_kernels_match_numpy(self):
+        """Compiled loop kernels agree with the NumPy kernels."""
+        from tara_mvp.simulation.neurons import (
+            HodgkinHuxleyNeuron, IzhikevichNeuron, LIFNeuron,
+            create_populations, is_numba_available,
+        )
+
+        if not is_numba_available():
+            pytest.skip("numba not installed")
+
+        # HH spikes amplify last-bit exp() differences, hence the looser bound
+        for cls, atol in ((LIFNeuron, 1e-8), (IzhikevichNeuron, 1e-8), (HodgkinHuxleyNeuron, 1e-2)):
+            runs = []
+            for backend in ("numpy", "numba"):
+                (population,) = create_populations(
+                    [cls() for _ in range(50)], kernels=backend
+                )
+                drive = np.linspace(0.0, 15.0, 50)
+                for _ in range(500):
+                    population.I_ext[:] = drive
+                    population.step()
+                runs.append(population.get_V_history())
+            np.testing.assert_allclose(runs[0], runs[1], atol=atol)
+
+
+def _hh_spike_times(integrator, dt, duration=50.0, current=10.0):
+    """Spike times and voltages of one driven HH neuron (population path)."""
+    from tara_mvp.simulation.neurons import (
+        HodgkinHuxleyNeuron, HodgkinHuxleyParameters, create_populations,
+    )
+
+    neuron = HodgkinHuxleyNeuron(HodgkinHuxleyParameters(dt=dt, integrator=integrator))
+    (population,) = create_populations([neuron])
+    for _ in range(int(round(duration / dt))):
+        population.I_ext[:] = current
+        population.step()
+    return np.array(neuron.state.spike_times), population.get_V_history()[:, 0]
+
+
+@functools.lru_cache(maxsize=None)
+def _hh_reference():
+    """Fine-step (RK4, dt=0.01) reference spike times, shared across tests."""
+    return _hh_spike_times("rk4", dt=0.01)[0]
+
+
+class TestHodgkinHuxleyIntegrators:
+    """Tests for the pluggable HH integration schemes."""
+
+    @pytest.mark.parametrize("integrator", ["exponential_euler", "rk45"])
+    def test_coarse_dt_matches_fine_reference(self, integrator):
+        """dt=0.1 stays stable and reproduces a fine-step RK4 reference."""
+        reference = _hh_reference()
+        spikes, V = _hh_spike_times(integrator, dt=0.1)
+
+        assert np.isfinite(V).all()
+        assert V.max() < 60.0
+        assert len(spikes) == len(reference) >= 3
+        np.testing.assert_allclose(spikes, reference, atol=0.5)
+
+    def test_forward_euler_breaks_down_at_coarse_dt(self):
+        """The default scheme is what the new integrators replace."""
+        reference = _hh_reference()
+        spikes, V = _hh_spike_times("euler", dt=0.1)
+
+        assert len(spikes) != len(reference) or V.max() > 60.0
+
+    @pytest.mark.parametrize("integrator", ["exponential_euler", "rk4", "rk45"])
+    def test_population_matches_single_neuron(self, integrator):
+        """Scalar neuron steps match the population's array integrators."""
+        from tara_mvp.simulation.neurons import (
+            HodgkinHuxleyNeuron, HodgkinHuxleyParameters,
+        )
+
+        dt = 0.05
+        neuron = HodgkinHuxleyNeuron(HodgkinHuxleyParameters(dt=dt, integrator=integrator))
+        expected = neuron.simulate(30.0, input_current=np.full(600, 10.0))
+        spikes, V = _hh_spike_times(integrator, dt=dt, duration=30.0)
+
+        np.testing.assert_allclose(V, expected["V"], atol=1e-9)
+        np.testing.assert_array_equal(spikes, expected["spike_times"])
+
+    def test_mixed_integrators_in_one_population(self):
+        """Neurons with different integrators can share a population."""
+        from tara_mvp.simulation.neurons import (
+            HodgkinHuxleyNeuron, HodgkinHuxleyParameters, create_populations,
+        )
+
+        neurons = [
+            HodgkinHuxleyNeuron(HodgkinHuxleyParameters(dt=0.1, integrator=name))
+            for name in ("exponential_euler", "rk45", "exponential_euler")
+        ]
+        (population,) = create_populations(neurons)
+        for _ in range(300):
+            population.I_ext[:] = 10.0
+            population.step()
+
+        assert np.isfinite(population.get_V_history()).all()
+        assert neurons[0].state.spike_times == neurons[2].state.spike_times
+        assert len(neurons[1].state.spike_times) == len(neurons[0].state.spike_times)
+
+
+class TestHodgkinHuxleyRateTable:
+    """Tests for the shared HH rate lookup tables."""
+
+    def test_documented_interpolation_error(self):
+        """Error is ~1e-7 at 0.01 mV and grows quadratically with spacing."""
+        from tara_mvp.simulation.neurons import HHRateTable
+
+        fine = HHRateTable(resolution=0.01).max_relative_error()
+        coarse = HHRateTable(resolution=0.1).max_relative_error()
+
+        assert fine < 2e-7
+        assert coarse < 2e-5
+        assert 50 < coarse / fine < 200
+
+    def test_out_of_range_falls_back_to_exact(self):
+        """Voltages outside the table are evaluated exactly."""
+        from tara_mvp.simulation.neurons import HHRateTable
+
+        table = HHRateTable(temp_factor=2.0)
+        V = np.array([-300.0, -65.0, 150.0])
+        np.testing.assert_allclose(
+            np.stack(table.lookup(V)), np.stack(table.exact(V)), rtol=1e-6
+        )
+        assert table.lookup_scalar(150.0) == pytest.approx(
+            [float(r[2]) for r in table.exact(V)]
+        )
+
+    def test_tables_shared_per_temperature_and_resolution(self):
+        """Neurons with equal temp_factor reuse one lazily built table."""
+        from tara_mvp.simulation.neurons import (
+            HodgkinHuxleyNeuron, HodgkinHuxleyParameters,
+        )
+
+        a, b, warm = (
+            HodgkinHuxleyNeuron(HodgkinHuxleyParameters(rate_table=True, temperature=T))
+            for T in (6.3, 6.3, 37.0)
+        )
+        assert HodgkinHuxleyNeuron().rate_table is None
+        assert a.rate_table is b.rate_table
+        assert a.rate_table is not warm.rate_table
+        assert warm.rate_table.temp_factor == pytest.approx(warm.params.temp_factor)
+
+    @pytest.mark.parametrize("integrator,dt", [("euler", 0.01), ("exponential_euler", 0.1)])
+    def test_table_reproduces_exact_spike_times(self, integrator, dt):
+        """Scalar and population paths with the table spike as without it."""
+        from tara_mvp.simulation.neurons import (
+            HodgkinHuxleyNeuron, HodgkinHuxleyParameters, create_populations,
+        )
+
+        current = np.full(int(round(30.0 / dt)), 10.0)
+        exact = HodgkinHuxleyNeuron(HodgkinHuxleyParameters(dt=dt, integrator=integrator))
+        expected = exact.simulate(30.0, input_current=current)
+
+        neurons = [
+            HodgkinHuxleyNeuron(HodgkinHuxleyParameters(
+                dt=dt, integrator=integrator, rate_table=True,
+            ))
+            for _ in range(2)
+        ]
+        scalar = neurons[0].simulate(30.0, input_current=current)
+        (population,) = create_populations(neurons[1:])
+        for value in current:
+            population.I_ext[:] = value
+            population.step()
+
+        assert len(expected["spike_times"]) >= 2
+        np.testing.assert_allclose(scalar["spike_times"], expected["spike_times"])
+        np.testing.assert_allclose(neurons[1].state.spike_times, expected["spike_times"])
+        np.testing.assert_allclose(scalar["V"], expected["V"], atol=1e-3)
+
+
+class TestColumnarRecorder:
+    """Tests for the preallocated, chunk-flushing recorder."""
+
+    def _record(self, backend, output_dir=None, flush_interval=10000):
+        from tara_mvp.simulation import RecordingConfig
+        from tara_mvp.simulation.engine.recorder import Recorder
+
+        net = _build_recurrent(backend, n_neurons=30)
+        recorder = Recorder(RecordingConfig(
+            output_dir=output_dir, flush_interval=flush_interval,
+        ))
+        recorder.setup(net, n_steps=250)
+        np.random.seed(3)
+        for step in range(250):
+            net.step(record_history=False)
+            recorder.record_step(step * net.params.dt, net)
+        return net, recorder
+
+    def test_population_gather_matches_objects(self):
+        """The vectorized backend gather records the same samples."""
+        from tara_mvp.simulation import NetworkBackend
+
+        _, obj = self._record(NetworkBackend.OBJECT)
+        _, pop = self._record(NetworkBackend.POPULATION)
+
+        V = obj.get_voltage_matrix()
+        assert V.shape == (250, 30) and V.dtype == np.float32
+        np.testing.assert_allclose(pop.get_voltage_matrix(), V, atol=1e-4)
+        assert obj.get_data().total_spikes.sum() > 0
+        np.testing.assert_array_equal(
+            obj.get_data().total_spikes, pop.get_data().total_spikes
+        )
+
+    def test_disk_chunks_keep_memory_constant(self, tmp_path):
+        """With output_dir, memory stays at one chunk and traces are memmapped."""
+        from tara_mvp.simulation import NetworkBackend
+
+        _, memory = self._record(NetworkBackend.POPULATION)
+        net, disk = self._record(NetworkBackend.POPULATION, str(tmp_path), flush_interval=40)
+
+        assert disk.memory_bytes < memory.memory_bytes / 4
+        traces = disk.get_voltage_traces()
+        assert isinstance(traces[net.neurons[disk.neuron_ids[0]].id], np.memmap)
+        np.testing.assert_array_equal(disk.get_voltage_matrix(), memory.get_voltage_matrix())
+
+        # Flushed files are ordinary .npy arrays
+        disk.flush()
+        on_disk = np.load(tmp_path / "voltages.npy")
+        assert on_disk.shape == (250, 30)
+        np.testing.assert_array_equal(np.load(tmp_path / "t.npy"), memory.get_data().t)
+
+
+class TestSpikeStore:
+    """Tests for the shared append-only spike store."""
+
+    def test_store_offsets_and_windows(self):
+        """Per-neuron trains, counts and window counts match a brute-force scan."""
+        from tara_mvp.simulation.neurons import SpikeStore
+        from tara_mvp.simulation.neurons.spikes import window_counts
+
+        rng = np.random.default_rng(0)
+        store = SpikeStore(capacity=4)
+        for nid in "abcde":
+            store.register(nid)
+        times = np.sort(rng.uniform(0, 100, 500))
+        neurons = rng.integers(0, 5, 500)
+        for i, t in zip(neurons[:200], times[:200]):
+            store.append(i, t)
+        store.extend(neurons[200:], times[200:])
+
+        assert len(store) == 500 and store.time_sorted
+        np.testing.assert_array_equal(store.counts(), np.bincount(neurons, minlength=5))
+        for i in range(5):
+            np.testing.assert_array_equal(store.train(i), times[neurons == i])
+
+        starts = np.arange(0, 90, 7.5)
+        counts = window_counts(store.times, store.neurons, 5, starts, starts + 10)
+        for i in range(5):
+            expected = [np.sum((times[neurons == i] >= s) & (times[neurons == i] < s + 10))
+                        for s in starts]
+            np.testing.assert_array_equal(counts[i], expected)
+
+        store.discard(2)
+        assert store.count(2) == 0 and len(store) == 500 - np.sum(neurons == 2)
+        np.testing.assert_array_equal(store.train(3), times[neurons == 3])
+
+    @pytest.mark.parametrize("backend", ["object", "population"])
+    def test_network_spikes_stored_once(self, backend):
+        """Neuron, network and recorder views all read the network's store."""
+        from tara_mvp.simulation import NetworkBackend, RecordingConfig
+        from tara_mvp.simulation.engine.recorder import Recorder
+        from tara_mvp.simulation.neurons import SpikeTrain
+
+        net = _build_recurrent(NetworkBackend(backend), n_neurons=30)
+        recorder = Recorder(RecordingConfig(sample_every=5))
+        recorder.setup(net, n_steps=300)
+        np.random.seed(3)
+        for step in range(300):
+            net.step(record_history=False)
+            recorder.record_step(step * net.params.dt, net)
+
+        store = net.state.spikes
+        assert len(store) > 0
+        assert all(isinstance(n.state.spike_times, SpikeTrain) for n in net)
+        assert len(store) == sum(len(n.state.spike_times) for n in net)
+        assert net.state.spike_counts == {
+            n.id: len(n.state.spike_times) for n in net if n.state.spike_times
+        }
+
+        # Recorder sees every spike, including those between samples
+        trains = recorder.get_data().spike_times
+        for neuron in net:
+            np.testing.assert_array_equal(trains[neuron.id], neuron.state.spike_times)
+
+        times, indices = recorder.get_raster_data()
+        assert times.size == len(store)
+        assert set(np.unique(indices)) <= set(range(30))
+
+        _, rate = recorder.compute_population_rate(window=5.0)
+        t_max = recorder.get_data().t.max()
+        hist, _ = np.histogram(store.times, bins=len(rate), range=(0, t_max))
+        np.testing.assert_allclose(rate, hist / (5.0 / 1000) / 30)
+
+    def test_reset_clears_store_and_views(self):
+        """Resetting a network empties the store; views keep recording."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _run(_build_recurrent(NetworkBackend.OBJECT), n_steps=200)
+        neuron = next(n for n in net if n.state.spike_times)
+        net.reset()
+
+        assert len(net.state.spikes) == 0 and not neuron.state.spike_times
+        _run(net, n_steps=200)
+        assert len(net.state.spikes) == sum(len(n.state.spike_times) for n in net) > 0
+
+
+class TestSpikeAnalysis:
+    """Tests for the vectorized spike-train analysis module."""
+
+    @pytest.fixture
+    def spikes(self):
+        rng = np.random.default_rng(1)
+        times = np.sort(rng.uniform(0, 1000, 4000))
+        neurons = rng.integers(0, 8, times.size)
+        return times, neurons
+
+    @pytest.mark.parametrize("window, step", [(100.0, 10.0), (75.0, 10.0)])
+    def test_sliding_window_matches_brute_force(self, spikes, window, step):
+        """Cumulative-bin and binary-search paths count the same spikes."""
+        from tara_mvp.simulation.engine.analysis import sliding_window_rates
+
+        times, neurons = spikes
+        centers, rates = sliding_window_rates(times, neurons, 8, 1000.0, window, step)
+        for i in range(8):
+            own = times[neurons == i]
+            expected = [np.sum((own >= c - window / 2) & (own < c + window / 2)) for c in centers]
+            np.testing.assert_allclose(rates[i], np.array(expected) / (window / 1000))
+
+    @pytest.mark.parametrize("kernel", ["box", "gaussian", "exponential"])
+    def test_fft_and_direct_smoothing_agree(self, spikes, kernel):
+        """Long kernels switch to FFT convolution without changing the result."""
+        from tara_mvp.simulation.engine import analysis
+
+        times, neurons = spikes
+        _, counts = analysis.bin_spikes(times, neurons, 8, 1.0, t_stop=1000.0)
+        weights, lag = analysis.make_kernel(kernel, 80.0, 1.0)
+        assert weights.size > analysis.FFT_THRESHOLD
+
+        fft = analysis.smoothed_rates(counts, 1.0, kernel, 80.0)
+        direct = np.zeros_like(fft)
+        for t in range(counts.shape[1]):
+            for k, w in enumerate(weights):
+                if 0 <= t - lag - k < counts.shape[1]:
+                    direct[:, t] += w * counts[:, t - lag - k]
+        np.testing.assert_allclose(fft, direct * 1000, atol=1e-9)
+        # Rates integrate back to spike counts, minus mass lost at the edges
+        assert fft.sum() / 1000 == pytest.approx(counts.sum(), rel=0.1)
+
+    def test_variability_statistics(self, spikes):
+        """Fano factor, ISI CV and correlations match NumPy references."""
+        from tara_mvp.simulation.engine import analysis
+
+        times, neurons = spikes
+        _, counts = analysis.bin_spikes(times, neurons, 9, 50.0, t_stop=1000.0)
+        assert counts.shape == (9, 20) and counts.sum() == times.size
+
+        fano = analysis.fano_factor(counts)
+        np.testing.assert_allclose(fano[:8], counts[:8].var(axis=1) / counts[:8].mean(axis=1))
+        assert np.isnan(fano[8])
+
+        cv = analysis.isi_cv(times, neurons, 9)
+        for i in range(8):
+            isi = np.diff(times[neurons == i])
+            assert cv[i] == pytest.approx(isi.std() / isi.mean())
+        assert np.isnan(cv[8])
+
+        corr = analysis.count_correlations(counts)
+        np.testing.assert_allclose(corr[:8, :8], np.corrcoef(counts[:8]), atol=1e-12)
+        assert np.isnan(corr[8]).all()
+
+    def test_recorder_analysis_methods(self):
+        """Recorder exposes the analysis functions per recorded neuron."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import RateKernel
+        from tara_mvp.simulation.engine.recorder import Recorder
+
+        net = _build_recurrent(NetworkBackend.POPULATION, n_neurons=30)
+        recorder = Recorder()
+        recorder.setup(net, n_steps=500)
+        np.random.seed(2)
+        for step in range(500):
+            net.step(record_history=False)
+            recorder.record_step(net.state.t, net)
+
+        centers, rates = recorder.compute_smoothed_rates(RateKernel.EXPONENTIAL, 5.0)
+        assert rates.shape == (30, centers.size)
+        assert set(recorder.compute_fano_factors(10.0)) == set(recorder.neuron_ids)
+        assert recorder.compute_count_correlations(5.0).shape == (30, 30)
+        firing = recorder.compute_firing_rates(window=20.0, step=5.0)
+        assert sum(r.sum() for r in firing.values()) > 0
+
+
+class TestPopulationBackend:
+    """Tests for the network population backend."""
+
+    def test_backend_folds_chemical_synapses(self):
+        """All plain chemical synapses of a LIF network are vectorized."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        summary = net._backend.to_dict()
+
+        assert summary["object_neurons"] == 0
+        assert summary["folded_synapses"] == net.n_synapses
+
+    def test_backend_matches_object_path(self):
+        """Population backend produces the same spikes as per-object stepping."""
+        from tara_mvp.simulation import NetworkBackend
+
+        obj = _run(_build_recurrent(NetworkBackend.OBJECT))
+        pop = _run(_build_recurrent(NetworkBackend.POPULATION))
+
+        # Neuron IDs are random, so compare in construction order
+        obj_counts = [len(n.state.spike_times) for n in obj]
+        pop_counts = [len(n.state.spike_times) for n in pop]
+        assert sum(obj_counts) > 0
+        assert obj_counts == pop_counts
+
+        # Both paths count delays in whole steps
+        obj_V = np.array([n.V for n in obj])
+        pop_V = np.array([n.V for n in pop])
+        np.testing.assert_allclose(obj_V, pop_V, atol=1e-9)
+
+    def test_engine_and_recorder_run_unchanged(self):
+        """SimulationEngine and Recorder work on a population-backed network."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine.simulator import run_simulation
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        result = run_simulation(net, duration=20.0, seed=1)
+
+        assert result.total_spikes == len(net.state.spike_times)
+        assert len(result.t) == 200
+        assert all(len(v) == 200 for v in result.voltages.values())
+
+    def test_reset_restores_initial_state(self):
+        """Resetting the network clears population state and spikes."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _run(_build_recurrent(NetworkBackend.POPULATION), n_steps=100)
+        net.reset()
+
+        assert net.state.t == 0.0
+        assert all(len(n.state.spike_times) == 0 for n in net)
+        assert all(n.V == n.get_V_rest() for n in net)
+
+    @pytest.mark.parametrize("backend", ["object", "population"])
+    @pytest.mark.parametrize("change", ["synapse", "neuron"])
+    def test_topology_change_keeps_trajectory(self, backend, change):
+        """A mid-run zero-weight synapse or idle neuron leaves the run unchanged."""
+        from tara_mvp.simulation import LIFNeuron, IzhikevichNeuron, ChemicalSynapse
+        from tara_mvp.simulation.neurons import AdaptiveLIFNeuron
+        from tara_mvp.simulation.synapses.stdp import STDPSynapse, STDPParameters
+
+        def run(modify):
+            neurons = [IzhikevichNeuron() for _ in range(4)] + [LIFNeuron() for _ in range(4)]
+            neurons += [AdaptiveLIFNeuron.create_adapting() for _ in range(2)]
+            for neuron in neurons[4:8]:
+                neuron.params.noise_std = 1.0
+            stdp = STDPParameters(weight=0.8, learning_rate=0.5, delay=1.0)
+            net = _custom_network(neurons, [
+                (i, j, (lambda a, b: STDPSynapse(a, b, stdp)) if 4 <= i < 8
+                 else (lambda a, b: ChemicalSynapse.create_ampa(a, b, weight=0.5, delay=2.0)))
+                for i in range(10) for j in range(10) if i != j and (i + j) % 3 == 0
+            ])
+            net.set_rng(np.random.default_rng(5))
+            if backend == "population":
+                net.use_population_backend()
+
+            drive = np.linspace(6.0, 14.0, len(neurons)).tolist()
+            for step in range(2000):
+                if step == 1000 and modify:
+                    if change == "synapse":
+                        synapse = ChemicalSynapse.create_ampa(neurons[0], neurons[5], weight=0.0)
+                        net.add_synapse(synapse)
+                    else:
+                        net.add_neuron(LIFNeuron())
+                for neuron, current in zip(neurons, drive):
+                    neuron.receive_input(current)
+                net.step()
+            plastic = [s for s in net.synapses if isinstance(s, STDPSynapse)]
+            return (
+                [len(n.state.spike_times) for n in neurons],
+                [n.V for n in neurons],
+                [n.u for n in neurons[:4]] if backend == "object"
+                else net._backend.populations[0].u.tolist(),
+                [s.weight for s in plastic],
+            )
+
+        expected = run(modify=False)
+        counts, V, u, weights = run(modify=True)
+        assert sum(expected[0]) > 0
+        assert counts == expected[0]
+        np.testing.assert_allclose(V, expected[1])
+        np.testing.assert_allclose(u, expected[2])
+        np.testing.assert_allclose(weights, expected[3])
+        assert min(expected[3]) < 0.8  # STDP did learn
+
+
+class TestSynapseMatrix:
+    """Tests for the sparse CSR synapse matrix."""
+
+    def test_synapse_views_sum_to_matrix_conductance(self):
+        """Per-synapse conductances reconstructed by the view match the arrays."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _run(_build_recurrent(NetworkBackend.POPULATION), n_steps=150)
+        backend = net._backend
+        matrix = backend.matrix
+
+        total = np.zeros(len(backend.index))
+        for synapse in net.synapses:
+            total[backend.index[synapse.post.id]] += synapse.state.g
+
+        expected = (matrix.g_decay - matrix.g_rise).sum(axis=0)
+        assert np.abs(expected).max() > 0
+        np.testing.assert_allclose(total, expected, atol=1e-9)
+
+    def test_sparse_connectivity_matches_dense(self):
+        """Sparse connectivity equals the dense matrix of the object path."""
+        from tara_mvp.simulation import NetworkBackend
+
+        obj = _build_recurrent(NetworkBackend.OBJECT)
+        pop = _build_recurrent(NetworkBackend.POPULATION)
+
+        W = pop.get_connectivity_matrix(sparse=True)
+        assert W.nnz <= pop.n_synapses
+        # Neuron IDs are random, so compare matrices in construction order
+        np.testing.assert_allclose(W.toarray(), obj.get_connectivity_matrix())
+        np.testing.assert_allclose(
+            obj.get_connectivity_matrix(sparse=True).toarray(),
+            obj.get_connectivity_matrix(),
+        )
+
+    def test_weight_setter_updates_matrix(self):
+        """Changing Synapse.weight updates the CSR delivery data."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        matrix = net._backend.matrix
+        synapse = net.synapses[0]
+        k = synapse._matrix_index
+
+        synapse.weight = 0.25
+        assert matrix.weight[k] == 0.25
+        assert matrix._delivery.data[matrix._delivery_position[k]] == pytest.approx(
+            matrix.g_max[k] * 0.25
+        )
+
+    def test_gap_junction_current_matches_objects(self):
+        """Electrical synapses in the matrix reproduce per-object currents."""
+        from tara_mvp.simulation import NetworkBackend, SmallWorldNetwork
+        from tara_mvp.simulation.synapses import ElectricalSynapse
+
+        net = SmallWorldNetwork.create_cortical_module(
+            n_neurons=80, seed=5, backend=NetworkBackend.POPULATION
+        )
+        backend = net._backend
+        gaps = [s for s in net.synapses if isinstance(s, ElectricalSynapse)]
+        assert gaps and backend.n_folded_synapses == net.n_synapses
+
+        rng = np.random.default_rng(0)
+        backend.V[:] = rng.uniform(-80.0, -50.0, size=backend.V.shape)
+
+        I_matrix = np.zeros_like(backend.V)
+        backend.matrix._step_electrical(backend.V, I_matrix)
+
+        I_objects = np.zeros_like(backend.V)
+        for synapse in gaps:
+            I_objects[backend.index[synapse.post.id]] += synapse.state.I
+        np.testing.assert_allclose(I_matrix, I_objects, atol=1e-9)
+
+
+class TestNetworkConstruction:
+    """Tests for vectorized connectivity sampling and array-backed projections."""
+
+    @pytest.mark.parametrize("p", [0.02, 0.3, 1.0])
+    def test_random_edges_density(self, p):
+        """Geometric skipping yields unique pairs at the requested density."""
+        from tara_mvp.simulation.networks.connectivity import random_edges
+
+        np.random.seed(0)
+        pre, post = random_edges(300, 200, p)
+        flat = pre * 200 + post
+        assert np.all(np.diff(flat) > 0)
+        assert flat.min() >= 0 and flat.max() < 300 * 200
+
+        total = 300 * 200
+        sigma = np.sqrt(total * p * (1 - p))
+        assert abs(len(flat) - total * p) <= 5 * sigma + 1e-9
+
+    @pytest.mark.parametrize("extent", [100.0, 3000.0])
+    def test_distance_edges_density(self, extent):
+        """KD-tree (wide extent) and thinning (narrow extent) both match p * exp(-d/100)."""
+        from tara_mvp.simulation.networks.connectivity import distance_edges
+
+        np.random.seed(1)
+        positions = np.random.uniform(0, extent, size=(400, 3))
+        pre, post = distance_edges(positions, positions, 0.5)
+
+        d = np.linalg.norm(positions[:, None, :] - positions[None, :, :], axis=2)
+        prob = 0.5 * np.exp(-d / 100)
+        expected, sigma = prob.sum(), np.sqrt((prob * (1 - prob)).sum())
+        assert abs(len(pre) - expected) <= 5 * sigma
+        assert np.all(d[pre, post] <= 100 * np.log(0.5 / 1e-6))
+
+    def test_projections_match_object_synapses(self):
+        """Stepping projections as arrays reproduces per-object synapses exactly."""
+        from tara_mvp.simulation import NetworkBackend, ChemicalSynapse
+
+        arrays = _build_recurrent(NetworkBackend.OBJECT)
+        objects = _build_recurrent(NetworkBackend.OBJECT)
+        objects.materialize_projections()
+
+        assert len(arrays.projections) == 4 and not objects.projections
+        assert arrays.n_synapses == objects.n_synapses
+        assert all(type(s) is ChemicalSynapse for s in objects.synapses)
+
+        _run(arrays)
+        _run(objects)
+        assert len(arrays.state.spikes) > 0
+        np.testing.assert_array_equal(arrays.state.spikes.neurons, objects.state.spikes.neurons)
+        np.testing.assert_allclose(
+            [n.V for n in arrays], [n.V for n in objects], atol=1e-9
+        )
+
+    def test_projection_views(self):
+        """Views expose projection edges; weights written through them reach the matrix."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _run(_build_recurrent(NetworkBackend.POPULATION), n_steps=50)
+        W = net.get_connectivity_matrix(sparse=True)
+        assert W.nnz == net.n_synapses
+        assert W.diagonal().sum() == 0  # no autapses
+
+        stats = net.get_connectivity_stats()
+        assert stats["n_ee"] + stats["n_ei"] + stats["n_ie"] + stats["n_ii"] == net.n_synapses
+
+        views = net.synapses
+        assert len(views) == net.n_synapses
+        assert all(s._on_pre_spike not in s.pre._spike_callbacks for s in views)
+        assert sum(s.state.g for s in views) != 0
+
+        view = views[0]
+        view.weight = 3.0
+        ids = list(net.neurons)
+        W = net.get_connectivity_matrix()
+        assert W[ids.index(view.pre.id), ids.index(view.post.id)] == 3.0
+        assert net._backend.matrix.weight[view._matrix_index] == 3.0
+
+        # Released synapses are independent objects again
+        net.materialize_projections()
+        assert not net.projections and view in net.synapses
+        assert view._on_pre_spike in view.pre._spike_callbacks
+        assert view.weight == 3.0
+
+
+class TestSmallWorldTopology:
+    """Tests for sparse Watts-Strogatz rewiring and graph metrics."""
+
+    @pytest.mark.parametrize("p_rewire", [0.0, 0.3, 1.0])
+    def test_rewiring_keeps_simple_graph(self, p_rewire):
+        """Rewired edges stay unique, avoid self-loops and keep the edge count."""
+        from tara_mvp.simulation import SmallWorldNetwork
+
+        net = SmallWorldNetwork.create_watts_strogatz(n=60, k=3, p=p_rewire, seed=4)
+        A = net.get_adjacency_matrix()
+
+        assert A.nnz == net.n_synapses == 60 * 3
+        assert A.diagonal().sum() == 0
+        assert A.max() == 1
+        np.testing.assert_array_equal(
+            (net.get_connectivity_matrix() != 0).astype(int), A.toarray()
+        )
+        if p_rewire == 0.0:
+            assert net.compute_clustering_coefficient() == pytest.approx(0.5)
+
+    def test_metrics_match_brute_force(self):
+        """Sparse clustering and bit-parallel BFS match per-node set/queue versions."""
+        from collections import deque
+        from tara_mvp.simulation import SmallWorldNetwork
+
+        net = SmallWorldNetwork.create_watts_strogatz(n=150, k=3, p=0.2, seed=5)
+        adjacency = net._adjacency
+
+        coefficients = []
+        for neighbors in adjacency:
+            k = len(neighbors)
+            if k >= 2:
+                edges = sum(b in adjacency[a] for a in neighbors for b in neighbors if a != b)
+                coefficients.append(edges / (k * (k - 1)))
+        assert net.compute_clustering_coefficient() == pytest.approx(np.mean(coefficients))
+
+        lengths = []
+        for source in range(150):
+            distances = {source: 0}
+            queue = deque([source])
+            while queue:
+                current = queue.popleft()
+                for neighbor in adjacency[current]:
+                    if neighbor not in distances:
+                        distances[neighbor] = distances[current] + 1
+                        queue.append(neighbor)
+            lengths.extend(d for d in distances.values() if d > 0)
+        # Sampling every node with small batches exercises the batching
+        assert net.compute_path_length(sample_size=150, batch_size=64) == pytest.approx(
+            np.mean(lengths)
+        )
+
+    def test_path_length_leaves_network_rng_alone(self):
+        """Sampling sources neither draws from nor depends on the network rng."""
+        from tara_mvp.simulation import SmallWorldNetwork
+
+        net = SmallWorldNetwork.create_watts_strogatz(n=200, k=3, p=0.2, seed=7)
+        state = net.rng.bit_generator.state
+        estimate = net.compute_path_length(sample_size=20)
+        assert net.rng.bit_generator.state == state
+
+        net.rng.random(10)
+        assert net.compute_path_length(sample_size=20) == estimate
+
+        rng = np.random.default_rng(1)
+        state = rng.bit_generator.state
+        net.compute_path_length(sample_size=20, rng=rng)
+        assert rng.bit_generator.state != state
+
+    def test_remove_connection_updates_topology(self):
+        """Removing a connection drops its synapse, callback and adjacency entry."""
+        from tara_mvp.simulation import SmallWorldNetwork
+
+        net = SmallWorldNetwork.create_watts_strogatz(n=30, k=2, p=0.0, seed=1)
+        neurons = list(net)
+        pre, post = neurons[0], neurons[1]
+        synapse = net.get_synapses_between(pre.id, post.id)[0]
+        degree = net.get_degree_distribution()["degrees"][0]
+
+        net._remove_connection(pre, post)
+
+        assert net.get_synapses_between(pre.id, post.id) == []
+        assert synapse not in net.synapses
+        assert synapse._on_pre_spike not in pre._spike_callbacks
+        assert net.get_degree_distribution()["degrees"][0] == degree - 1
+
+
+def _build_plastic(backend, stdp_type, use_eligibility=False, synchronous=False):
+    """
+    Balanced network with STDP on E -> E, switched to ``backend`` after setup.
+
+    ``synchronous`` connects all excitatory neurons (plus autapses) and
+    drives them hard, so pre and post often spike in the same step.
+    """
+    from tara_mvp.simulation import RecurrentNetwork, NetworkBackend
+    from tara_mvp.simulation.synapses.stdp import STDPSynapse, STDPParameters
+
+    if synchronous:
+        size = dict(n_neurons=20, p_ee=1.0, g=0.0, external_rate=5.0, external_weight=200.0)
+    else:
+        size = dict(n_neurons=60, external_weight=20.0)
+    net = RecurrentNetwork.create_balanced(
+        seed=7, backend=NetworkBackend.OBJECT, use_stdp=True, stdp_lr=0.5, **size,
+    )
+    if synchronous:
+        for neuron in [net.get_neuron(nid) for nid in net._exc_neurons[:4]]:
+            net.add_synapse(STDPSynapse(neuron, neuron, STDPParameters(weight=0.5, learning_rate=0.5)))
+    plastic = [s for s in net.synapses if isinstance(s, STDPSynapse)]
+    for synapse in plastic:
+        synapse.params.stdp_type = stdp_type
+        synapse.params.use_eligibility = use_eligibility
+    if backend == NetworkBackend.POPULATION:
+        net.use_population_backend()
+    return net, plastic
+
+
+class TestBatchedPlasticity:
+    """Tests for vectorized STDP in the population backend."""
+
+    @pytest.mark.parametrize("rule", ["classic", "symmetric", "anti_hebbian", "triplet"])
+    def test_matches_per_object_stdp(self, rule):
+        """Trace-array STDP reproduces per-synapse weights, traces and totals."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.synapses.stdp import STDPType
+
+        obj, obj_syn = _build_plastic(NetworkBackend.OBJECT, STDPType(rule))
+        pop, pop_syn = _build_plastic(NetworkBackend.POPULATION, STDPType(rule))
+        _run(obj)
+        _run(pop)
+
+        assert pop._backend.to_dict()["plastic_synapses"] == len(pop_syn) > 0
+        assert [len(n.state.spike_times) for n in obj] == [len(n.state.spike_times) for n in pop]
+
+        w_obj = np.array([s.weight for s in obj_syn])
+        w_pop = np.array([s.weight for s in pop_syn])
+        assert np.abs(w_obj - w_obj[0]).max() > 1e-3
+        np.testing.assert_allclose(w_pop, w_obj, atol=1e-9)
+        for name in ("pre_trace", "post_trace", "total_ltp", "total_ltd"):
+            np.testing.assert_allclose(
+                [getattr(s.stdp_state, name) for s in pop_syn],
+                [getattr(s.stdp_state, name) for s in obj_syn],
+                atol=1e-9,
+            )
+        np.testing.assert_allclose(
+            pop_syn[0].stdp_state.weight_history, obj_syn[0].stdp_state.weight_history, atol=1e-9
+        )
+
+    @pytest.mark.parametrize("rule", ["classic", "triplet"])
+    def test_same_step_spikes_follow_firing_order(self, rule):
+        """Coincident pre/post spikes (and autapses) update in neuron order."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.synapses.stdp import STDPType
+
+        obj, obj_syn = _build_plastic(NetworkBackend.OBJECT, STDPType(rule), synchronous=True)
+        pop, pop_syn = _build_plastic(NetworkBackend.POPULATION, STDPType(rule), synchronous=True)
+        _run(obj, n_steps=200)
+        _run(pop, n_steps=200)
+
+        np.testing.assert_allclose(
+            [s.weight for s in pop_syn], [s.weight for s in obj_syn], atol=1e-9
+        )
+
+    def test_reward_uses_lazily_decayed_eligibility(self):
+        """Network.apply_reward matches per-synapse reward-modulated STDP."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.synapses.stdp import STDPType
+
+        obj, obj_syn = _build_plastic(NetworkBackend.OBJECT, STDPType.CLASSIC, True)
+        pop, pop_syn = _build_plastic(NetworkBackend.POPULATION, STDPType.CLASSIC, True)
+        for net in (obj, pop):
+            _run(net, n_steps=150)
+            net.apply_reward(2.0)
+            _run(net, n_steps=50, seed=4)
+
+        np.testing.assert_allclose(
+            [s.stdp_state.eligibility for s in pop_syn],
+            [s.stdp_state.eligibility for s in obj_syn],
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            [s.weight for s in pop_syn], [s.weight for s in obj_syn], atol=1e-9
+        )
+
+    def test_history_interval(self):
+        """Weight history is sampled every history_interval steps."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.synapses.stdp import STDPType
+
+        for backend in (NetworkBackend.OBJECT, NetworkBackend.POPULATION):
+            net, plastic = _build_plastic(NetworkBackend.OBJECT, STDPType.CLASSIC)
+            for synapse in plastic:
+                synapse.params.history_interval = 25
+            if backend == NetworkBackend.POPULATION:
+                net.use_population_backend()
+            _run(net, n_steps=100)
+            assert len(plastic[0].stdp_state.weight_history) == 5
+
+
+class TestPoissonSource:
+    """Tests for streaming Poisson background input."""
+
+    def test_injects_counts_into_backend_arrays(self):
+        """Each step adds count * weight to I_syn of exactly the drawn targets."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import PoissonSource
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        source = PoissonSource(list(net.neurons), rate=5000.0, weight=0.25)
+
+        counts = source.draw(net.params.dt, np.random.default_rng(2))
+        net.set_rng(np.random.default_rng(2))
+        net._backend.I_syn[:] = 0.0
+        source.apply(net, 0.0)
+
+        expected = np.zeros(net.n_neurons)
+        positions = [net._backend.index[nid] for nid in source.target_ids]
+        expected[positions] = counts * 0.25
+        assert counts.sum() > 0
+        np.testing.assert_allclose(net._backend.I_syn, expected)
+        assert net.get_neuron(source.target_ids[0]).state.I_syn == expected[positions[0]]
+
+    def test_rate_and_window(self):
+        """Per-step counts follow the rate; nothing is drawn outside the window."""
+        from tara_mvp.simulation.engine import PoissonSource
+
+        source = PoissonSource(
+            [f"n{i}" for i in range(1000)], rate=200.0, start_time=5.0,
+            rng=np.random.default_rng(0),
+        )
+        counts = np.array([source.draw(0.1) for _ in range(200)])
+        assert counts.mean() == pytest.approx(200.0 * 0.1 / 1000, rel=0.05)
+        assert source.events(0.0, 5.0) == []
+
+    def test_schedule_streams_bounded_windows(self):
+        """Event-mode input is queued window by window, never all up front."""
+        from tara_mvp.simulation.engine import EventQueue, EventType, PoissonSource
+
+        source = PoissonSource([f"n{i}" for i in range(100)], rate=50.0, window=10.0)
+        queue = EventQueue()
+        source.schedule(queue, 0.0, 1000.0, rng=np.random.default_rng(1))
+
+        times, peak = [], len(queue)
+        while len(queue):
+            event = queue.pop()
+            if event.event_type == EventType.INPUT:
+                times.append(event.time)
+            event.execute()
+            peak = max(peak, len(queue))
+
+        assert times == sorted(times) and 0.0 <= times[0] and times[-1] < 1000.0
+        assert len(times) == pytest.approx(100 * 50.0, rel=0.05)
+        assert peak < 3 * 100 * 50.0 * 10.0 / 1000
+
+    def test_event_driven_run_uses_streamed_input(self):
+        """RecurrentNetwork background input still drives event-driven runs."""
+        from tara_mvp.simulation import RecurrentNetwork
+        from tara_mvp.simulation.engine.simulator import (
+            SimulationEngine, SimulationConfig, SimulationMode,
+        )
+
+        net = RecurrentNetwork.create_balanced(n_neurons=40, seed=3, external_weight=20.0)
+        engine = SimulationEngine(net, SimulationConfig(
+            duration=50.0, mode=SimulationMode.EVENT_DRIVEN, record=False,
+            verbose=False, seed=1,
+        ))
+        result = engine.run()
+
+        assert result.total_spikes > 0
+        assert len(engine.event_queue) < 40 * 1000.0 * 10.0 / 1000 * 3
+
+
+def _noisy_run(params, rng):
+    """Sweep run function mixing the run generator and global np.random."""
+    if params["x"] < 0:
+        raise ValueError("negative x")
+    return {"y": params["x"] * rng.normal(), "z": float(np.random.random()), "label": "ok"}
+
+
+class TestParameterSweep:
+    """Tests for the parallel parameter-sweep runner."""
+
+    def test_parallel_runs_match_serial(self):
+        """Per-run seeds make results independent of workers and order."""
+        from tara_mvp.simulation.engine.sweep import SweepRunner
+
+        grid = {"x": [1.0, 2.0, 3.0], "k": [0, 1]}
+        serial = SweepRunner(_noisy_run, grid, root_seed=5, workers=1).run().columns()
+        parallel = SweepRunner(_noisy_run, grid, root_seed=5, workers=2).run().columns()
+        other = SweepRunner(_noisy_run, grid, root_seed=6, workers=1).run().columns()
+
+        np.testing.assert_array_equal(serial["run"], np.arange(6))
+        np.testing.assert_array_equal(serial["x"], [1, 1, 2, 2, 3, 3])
+        for name in ("y", "z"):
+            np.testing.assert_array_equal(serial[name], parallel[name])
+        assert not np.array_equal(serial["y"], other["y"])
+        assert len(set(serial["z"])) == 6
+        assert serial["label"].dtype == object
+
+    def test_resume_after_interruption(self, tmp_path):
+        """Completed runs are read back; failed and missing runs are rerun."""
+        from tara_mvp.simulation.engine.sweep import SweepRunner, SweepResults
+
+        grid = {"x": [-1.0, 1.0, 2.0, 3.0]}
+        path = str(tmp_path / "sweep.jsonl")
+        full = SweepRunner(_noisy_run, grid, root_seed=2, workers=1, path=path).run()
+        assert full.to_dict() == {"n_runs": 4, "n_completed": 3, "n_failed": 1}
+
+        # Keep two records and a half-written line, as after a crash
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, "w") as f:
+            f.writelines(lines[:2])
+            f.write(lines[2][:10])
+
+        rerun = []
+        runner = SweepRunner(_noisy_run, grid, root_seed=2, workers=1, path=path)
+        runner.on_result(lambda record: rerun.append(record["run"]))
+        resumed = runner.run()
+
+        assert sorted(rerun) == [0, 2, 3]
+        np.testing.assert_array_equal(resumed.columns()["y"], full.columns()["y"])
+        assert len(SweepResults.load(path)) == 4
+
+        with pytest.raises(ValueError):
+            SweepRunner(_noisy_run, {"x": [5.0]}, workers=1, path=path).run()
+
+    def test_attack_sweep_is_reproducible(self):
+        """Attack scenarios derive their generator from the run seed."""
+        from tara_mvp.simulation.engine.sweep import SweepRunner, run_attack
+
+        grid = {"scenario": ["ransomware", "dos"], "intensity": [0.2, 0.9]}
+        first = SweepRunner(run_attack, grid, root_seed=3, workers=1).run().columns()
+        second = SweepRunner(run_attack, grid, root_seed=3, workers=1).run().columns()
+
+        assert (first["status"] == "ok").all()
+        np.testing.assert_array_equal(first["detected"], second["detected"])
+
+
+class TestRandomGenerators:
+    """Tests for explicit random generators in simulation and attacks."""
+
+    @staticmethod
+    def _noisy_network(seed, backend):
+        from tara_mvp.simulation import RecurrentNetwork, NetworkBackend
+
+        net = RecurrentNetwork.create_balanced(n_neurons=60, seed=seed, external_weight=20.0)
+        for neuron in net:
+            neuron.params.noise_std = 3.0
+        if backend == NetworkBackend.POPULATION:
+            net.use_population_backend()
+        return net
+
+    @pytest.mark.parametrize("backend", ["object", "population"])
+    def test_seeded_runs_are_reproducible(self, backend):
+        """Same seed, same spikes; global np.random state is never touched."""
+        from tara_mvp.simulation import NetworkBackend
+
+        backend = NetworkBackend(backend)
+        state = np.random.get_state()[1].copy()
+        rasters = []
+        for seed in (7, 7, 8):
+            net = self._noisy_network(seed, backend)
+            for _ in range(300):
+                net.step()
+            rasters.append(net.get_spike_raster())
+
+        np.testing.assert_array_equal(rasters[0][0], rasters[1][0])
+        np.testing.assert_array_equal(rasters[0][1], rasters[1][1])
+        assert rasters[0][0].size > 0
+        assert not np.array_equal(rasters[0][1], rasters[2][1])
+        np.testing.assert_array_equal(np.random.get_state()[1], state)
+
+    def test_block_noise_matches_scalar_noise(self):
+        """Population block noise has the per-step spread of the neuron path."""
+        from tara_mvp.simulation.neurons import LIFNeuron, LIFParameters, LIFPopulation
+
+        def neurons():
+            return [LIFNeuron(LIFParameters(noise_std=2.0)) for _ in range(2000)]
+
+        objects = neurons()
+        rng = np.random.default_rng(1)
+        for neuron in objects:
+            neuron.rng = rng
+            neuron.step()
+        population = LIFPopulation(neurons())
+        population.rng = np.random.default_rng(0)
+        population.step()
+
+        expected = 2.0 * np.sqrt(0.1)
+        V_rest = objects[0].params.V_rest
+        assert np.std([n.V - V_rest for n in objects]) == pytest.approx(expected, rel=0.1)
+        assert np.std(population.V - V_rest) == pytest.approx(expected, rel=0.1)
+        assert population._noise_block.shape == (population.noise_chunk, 2000)
+
+    def test_attack_simulator_seed(self):
+        """Detection draws come from the simulator's generator."""
+        from tara_mvp.attacks import AttackSimulator
+        from tara_mvp.attacks.scenarios import get_scenario
+
+        def outcomes(seed):
+            result = AttackSimulator(seed=seed).run_scenario(get_scenario("ransomware"))
+            return [(e.detected, e.blocked) for e in result.events]
+
+        assert outcomes(4) == outcomes(np.random.default_rng(4))
+        assert outcomes(4) == outcomes(4)
+
+
+class TestCheckpoint:
+    """Tests for simulation checkpoints and warm-start snapshots."""
+
+    @staticmethod
+    def _network(backend):
+        from tara_mvp.simulation.synapses.stdp import STDPType
+
+        net, _ = _build_plastic(backend, STDPType.CLASSIC)
+        for neuron in net:
+            neuron.params.noise_std = 2.0
+        net.set_rng(np.random.default_rng(3))
+        return net
+
+    @staticmethod
+    def _engine(network, duration=50.0):
+        from tara_mvp.simulation.engine import SimulationEngine, SimulationConfig, PoissonSource
+
+        engine = SimulationEngine(network, SimulationConfig(
+            duration=duration, record=False, verbose=False,
+        ))
+        engine.add_poisson_input(PoissonSource(list(network.neurons)[:20], rate=500.0, weight=5.0))
+        return engine
+
+    @pytest.mark.parametrize("backend", ["object", "population"])
+    def test_resumed_run_matches_uninterrupted(self, backend, tmp_path):
+        """Checkpoint mid-run, restore into a rebuilt network, same spikes and weights."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import SimulationEngine
+
+        backend = NetworkBackend(backend)
+        path = tmp_path / "run.npz"
+        full = self._network(backend)
+        engine = self._engine(full)
+        engine.on_step(lambda t, net: engine._step == 250 and engine.checkpoint(path))
+        engine.run()
+
+        resumed = self._network(backend)
+        SimulationEngine.restore(path, resumed).run()
+
+        assert full.state.spikes.times.size > 0
+        np.testing.assert_array_equal(full.state.spikes.neurons, resumed.state.spikes.neurons)
+        np.testing.assert_array_equal(full.state.spikes.times, resumed.state.spikes.times)
+        np.testing.assert_allclose([n.V for n in full], [n.V for n in resumed])
+        np.testing.assert_allclose(
+            [s.weight for s in full.synapses], [s.weight for s in resumed.synapses]
+        )
+        assert resumed.state.step_count == full.state.step_count == 500
+
+    def test_restored_engine_keeps_config(self, tmp_path):
+        """Verbosity, report interval and recording config survive a checkpoint."""
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import SimulationEngine, SimulationConfig, RecordingConfig
+        from tara_mvp.simulation.engine.recorder import RecordingVariable
+
+        path = tmp_path / "run.npz"
+        network = self._network(NetworkBackend.POPULATION)
+        recording = RecordingConfig(
+            variables=[RecordingVariable.VOLTAGE],
+            neuron_ids=list(network.neurons)[:3],
+            sample_every=5,
+            output_dir=str(tmp_path / "recording"),
+        )
+        config = SimulationConfig(
+            duration=20.0, verbose=False, report_interval=5.0, recording_config=recording,
+        )
+        engine = SimulationEngine(network, config)
+        engine.on_step(lambda t, net: engine._step == 100 and engine.checkpoint(path))
+        engine.run()
+
+        restored = SimulationEngine.restore(path, self._network(NetworkBackend.POPULATION))
+        assert restored.config.verbose is False
+        assert restored.config.report_interval == 5.0
+        assert restored.config.recording_config == recording
+        assert restored.recorder.config == recording
+        assert restored.config.to_dict() == config.to_dict()
+
+    def test_layout_mismatch_is_rejected(self, tmp_path):
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import SimulationEngine
+
+        path = tmp_path / "run.npz"
+        self._engine(self._network(NetworkBackend.OBJECT), duration=5.0).checkpoint(path)
+
+        with pytest.raises(ValueError):
+            SimulationEngine.restore(path, _build_recurrent(NetworkBackend.OBJECT, n_neurons=40))
+        with pytest.raises(ValueError):
+            SimulationEngine.restore(path, self._network(NetworkBackend.POPULATION))
+
+    def test_snapshot_library_reuses_warm_state(self, tmp_path):
+        from tara_mvp.simulation import NetworkBackend
+        from tara_mvp.simulation.engine import SnapshotLibrary
+
+        library = SnapshotLibrary(tmp_path / "snapshots")
+        first = _build_recurrent(NetworkBackend.POPULATION)
+        assert library.warm("balanced", first, warmup=20.0) is False
+
+        second = _build_recurrent(NetworkBackend.POPULATION)
+        assert library.warm("balanced", second, warmup=20.0) is True
+        assert library.names() == ["balanced"]
+        assert second.state.step_count == 200
+        np.testing.assert_array_equal(first.state.spikes.times, second.state.spikes.times)
+        np.testing.assert_allclose([n.V for n in first], [n.V for n in second])
+
+        _run(first, n_steps=50)
+        _run(second, n_steps=50)
+        np.testing.assert_array_equal(first.state.spikes.times, second.state.spikes.times)
+
+
+class TestDelayBuffer:
+    """Tests for the network-wide synaptic delay buffer."""
+
+    def _pair(self, delay):
+        from tara_mvp.simulation.neurons import LIFNeuron
+        from tara_mvp.simulation.synapses import ChemicalSynapse
+
+        pre, post = LIFNeuron(), LIFNeuron()
+        return ChemicalSynapse.create_ampa(pre, post, delay=delay)
+
+    @pytest.mark.parametrize("delay", [0.0, 0.3, 1.0, 4.25])
+    def test_spike_arrives_after_delay_steps(self, delay):
+        """A spike is delivered exactly ceil(delay / dt) steps later."""
+        from tara_mvp.simulation.synapses import DelayBuffer
+
+        synapse = self._pair(delay)
+        buffer = DelayBuffer(n_slots=2)
+        synapse.attach_delay_buffer(buffer)
+
+        synapse._on_pre_spike(synapse.pre, 0.0)
+        assert synapse.state.pending_spikes == []
+        assert buffer.n_pending == 1
+
+        expected = int(np.ceil(delay / synapse.params.dt - 1e-9))
+        arrivals = [buffer.deliver() for _ in range(expected + 2)]
+        assert arrivals.index(1) == expected
+        assert synapse.g_decay > 0
+        assert buffer.n_pending == 0
+
+    def test_standalone_synapse_keeps_pending_list(self):
+        """Synapses outside a network still queue spikes themselves."""
+        synapse = self._pair(1.0)
+        synapse._on_pre_spike(synapse.pre, 0.0)
+
+        assert synapse.state.pending_spikes == [1.0]
+        synapse.step(1.0)
+        assert synapse.state.pending_spikes == []
+        assert synapse.state.g > 0
+
+    def test_small_world_routes_delays_through_buffer(self):
+        """Networks attach their synapses to the shared buffer."""
+        from tara_mvp.simulation import SmallWorldNetwork
+
+        net = SmallWorldNetwork.create_watts_strogatz(n=40, k=2, p=0.2, seed=3)
+        for neuron in list(net)[:5]:
+            neuron.params.V_rest = neuron.params.V_threshold + 5.0
+        net.reset()
+        _run(net, n_steps=100)
+
+        assert all(s._delay_buffer is net._delay_buffer for s in net.synapses)
+        assert all(s.state.pending_spikes == [] for s in net.synapses)
+        assert sum(s.state.spike_count for s in net.synapses) > 0
+
+
+def _custom_network(neurons, connections):
+    """Network from explicit neurons and (pre, post, synapse_factory) triples."""
+    from tara_mvp.simulation.networks.base import Network
+
+    class _Custom(Network):
+        def _create_neurons(self):
+            self.add_neurons(neurons)
+
+        def _create_synapses(self):
+            for pre, post, factory in connections:
+                self.add_synapse(factory(neurons[pre], neurons[post]))
+
+    return _Custom()
+
+
+def _engine(network, mode, duration=40.0, record=False, dt=0.1):
+    from tara_mvp.simulation import SimulationEngine, SimulationConfig
+
+    config = SimulationConfig(
+        duration=duration, dt=dt, mode=mode, record=record, verbose=False
+    )
+    return SimulationEngine(network, config)
+
+
+class TestEventDrivenMode:
+    """Tests for the event-driven and hybrid simulation modes."""
+
+    def test_tonic_lif_fires_at_analytic_times(self):
+        """Constant drive produces closed-form threshold crossings."""
+        from tara_mvp.simulation import LIFNeuron, SimulationMode
+
+        neuron = LIFNeuron()
+        engine = _engine(_custom_network([neuron], []), SimulationMode.EVENT_DRIVEN, 50.0)
+        engine.add_input_current(neuron.id, 2.0)
+        result = engine.run()
+
+        p = neuron.params
+        V_inf = p.V_rest + p.R_m * 2.0
+        period = p.tau_m * np.log((p.V_reset - V_inf) / (p.V_threshold - V_inf))
+        expected = period + np.arange(3) * (period + p.t_refractory)
+        np.testing.assert_allclose(neuron.state.spike_times, expected)
+        assert result.total_spikes == 3
+
+    def test_matches_time_stepped_synaptic_response(self):
+        """Spike timing and PSP size agree with the time-stepped engine."""
+        from tara_mvp.simulation import LIFNeuron, ChemicalSynapse, SimulationMode
+
+        def run(mode):
+            neurons = [LIFNeuron(), LIFNeuron()]
+            net = _custom_network(neurons, [
+                (0, 1, lambda a, b: ChemicalSynapse.create_ampa(a, b, delay=1.0)),
+            ])
+            engine = _engine(net, mode, record=True)
+            engine.add_input_current(neurons[0].id, 3.0, onset=0.0, duration=8.0)
+            result = engine.run()
+            return neurons, result.voltages[neurons[1].id]
+
+        (pre_s, _), V_s = run(SimulationMode.TIME_STEPPED)
+        (pre_e, _), V_e = run(SimulationMode.EVENT_DRIVEN)
+
+        assert len(V_e) == len(V_s) == 400
+        assert pre_e.state.spike_times[0] == pytest.approx(pre_s.state.spike_times[0], abs=0.2)
+        assert V_e.min() == pytest.approx(V_s.min(), rel=0.1)
+
+    def test_cost_independent_of_time_step(self):
+        """Without recording, work scales with events rather than steps."""
+        from tara_mvp.simulation import SimulationMode
+
+        def run(dt):
+            from tara_mvp.simulation import NetworkBackend
+
+            net = _build_recurrent(NetworkBackend.OBJECT, n_neurons=40)
+            for neuron in net:
+                neuron.params.dt = dt
+            net.params.external_rate = 0.0
+            engine = _engine(net, SimulationMode.EVENT_DRIVEN, 100.0, dt=dt)
+            engine.add_input_current([n.id for n in list(net)[:10]], 2.5)
+            return net, engine.run()
+
+        net_a, coarse = run(0.1)
+        net_b, fine = run(0.01)
+
+        assert coarse.metrics["events_processed"] == fine.metrics["events_processed"]
+        assert coarse.total_spikes == fine.total_spikes > 0
+        assert [n.state.spike_times for n in net_a] == [n.state.spike_times for n in net_b]
+
+    def test_event_driven_rejects_non_lif_neurons(self):
+        """Pure event-driven mode refuses neurons it cannot integrate."""
+        from tara_mvp.simulation import IzhikevichNeuron, SimulationMode
+
+        engine = _engine(
+            _custom_network([IzhikevichNeuron()], []), SimulationMode.EVENT_DRIVEN
+        )
+        with pytest.raises(ValueError, match="HYBRID"):
+            engine.run()
+
+    def test_hybrid_couples_stepped_and_event_neurons(self):
+        """Stepped Izhikevich and event-driven LIF neurons drive each other."""
+        from tara_mvp.simulation import (
+            LIFNeuron, IzhikevichNeuron, ChemicalSynapse, SimulationMode,
+        )
+
+        neurons = [IzhikevichNeuron(), LIFNeuron(), IzhikevichNeuron()]
+        net = _custom_network(neurons, [
+            (0, 1, lambda a, b: ChemicalSynapse.create_ampa(a, b, weight=0.1)),
+            (1, 2, lambda a, b: ChemicalSynapse.create_ampa(a, b, weight=0.1)),
+        ])
+        engine = _engine(net, SimulationMode.HYBRID, 60.0, record=True)
+        engine.add_input_current(neurons[0].id, 10.0)
+        engine.add_input_current(neurons[1].id, 2.0)
+        result = engine.run()
+
+        izh, lif, target = neurons
+        assert izh.state.spike_times and lif.state.spike_times
+        # LIF spikes reach the stepped target through its object synapse
+        assert net.synapses[1].state.spike_count == len(lif.state.spike_times)
+        assert len(result.voltages[target.id]) == 600
+        # Event-driven spikes show up in the recorder
+        assert len(result.spike_times[lif.id]) == len(lif.state.spike_times)
+        # Per-object callbacks are restored after the run
+        assert net.synapses[0]._on_pre_spike in izh._spike_callbacks
+
+
+class TestIncrementalRun:
+    """Tests for chunked (iter_run) and asyncio (arun) simulation runs."""
+
+    @staticmethod
+    def _engine(duration=60.0, record=True):
+        from tara_mvp.simulation import NetworkBackend, SimulationMode
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        net.set_rng(np.random.default_rng(3))
+        return _engine(net, SimulationMode.TIME_STEPPED, duration, record=record)
+
+    def test_chunks_cover_the_whole_run(self):
+        """Chunks partition the run's spikes and samples; result matches run()."""
+        engine = self._engine()
+        chunks = list(engine.iter_run(chunk_ms=25.0))
+        result = engine.result
+
+        assert [c.step for c in chunks] == [250, 500, 600]
+        assert chunks[-1].t_end == pytest.approx(60.0) and chunks[-1].progress == 1.0
+        assert sum(c.n_spikes for c in chunks) == result.total_spikes > 0
+        np.testing.assert_array_equal(np.concatenate([c.t for c in chunks]), result.t)
+        assert chunks[0].voltages.shape == (250, 60)
+
+        reference = self._engine().run()
+        assert list(reference.spike_counts.values()) == list(result.spike_counts.values())
+
+    def test_closing_early_stops_the_run(self):
+        engine = self._engine(record=False)
+        chunks = engine.iter_run(chunk_ms=10.0)
+        next(chunks)
+        chunks.close()
+
+        assert engine.network.state.step_count == 100
+        assert engine.result is None
+
+    def test_pause_blocks_until_resume(self):
+        """A paused run ends its chunk early and waits for resume()."""
+        import threading
+
+        engine = self._engine(record=False)
+        engine.on_step(lambda t, net: engine.pause() if engine._step == 150 else None)
+        chunks = engine.iter_run(chunk_ms=10.0)
+        steps = [next(chunks).step for _ in range(2)]
+        assert steps == [100, 150] and engine.paused
+
+        threading.Timer(0.05, engine.resume).start()
+        assert next(chunks).step == 250
+        assert list(chunks)[-1].step == 600
+
+    def test_arun_streams_chunks_to_coroutine(self):
+        import asyncio
+
+        engine = self._engine(record=False)
+        seen = []
+
+        async def consume(chunk):
+            await asyncio.sleep(0)
+            seen.append(chunk.population_rate)
+
+        result = asyncio.run(engine.arun(chunk_ms=20.0, on_chunk=consume))
+        assert len(seen) == 3
+        assert result.mean_firing_rate == pytest.approx(np.mean(seen))
+
+    def test_cancelling_arun_stops_the_worker(self):
+        """Cancelling mid-chunk raises CancelledError once the worker has stopped."""
+        import asyncio
+        import threading
+        import time
+
+        engine = self._engine(duration=10000.0, record=False)
+        started = threading.Event()
+        engine.on_step(lambda t, net: started.set())
+
+        async def main():
+            task = asyncio.ensure_future(engine.arun(chunk_ms=None))
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        step = engine._step
+        assert not engine._running
+        assert 0 < step < 100000
+        assert engine.result is None
+        time.sleep(0.05)
+        assert engine._step == step
+
+    def test_event_driven_run_is_chunked(self):
+        """Pure event-driven runs yield chunks without stepping every dt."""
+        from tara_mvp.simulation import NetworkBackend, SimulationMode
+
+        net = _build_recurrent(NetworkBackend.OBJECT, n_neurons=40)
+        net.params.external_rate = 0.0
+        engine = _engine(net, SimulationMode.EVENT_DRIVEN, 100.0)
+        engine.add_input_current([n.id for n in list(net)[:10]], 2.5)
+        chunks = list(engine.iter_run(chunk_ms=25.0))
+
+        assert [c.step for c in chunks] == [250, 500, 750, 1000]
+        assert sum(c.n_spikes for c in chunks) == engine.result.total_spikes > 0
+        assert net.state.step_count == 1000
+
+
+class TestBatchedHooks:
+    """Tests for batched spike hooks and strided step callbacks."""
+
+    @pytest.mark.parametrize("backend", ["object", "population"])
+    def test_spike_hooks_see_every_spike_once(self, backend):
+        """Batched hooks (any stride) and per-spike callbacks agree with the store."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _build_recurrent(NetworkBackend(backend))
+        per_spike, per_step, strided = [], [], []
+        net.on_spike(lambda neuron, t: per_spike.append((net.state.spikes.index[neuron.id], t)))
+        net.on_spikes(lambda neurons, times: per_step.append((neurons.copy(), times.copy())))
+        net.on_spikes(lambda neurons, times: strided.append(len(times)), every=40)
+        _run(net, n_steps=320)
+
+        neurons, times = net.get_spike_raster()
+        assert len(per_spike) == len(times) > 0
+        assert [i for i, _ in per_spike] == net.state.spikes.neurons.tolist()
+        np.testing.assert_array_equal(np.concatenate([n for n, _ in per_step]), net.state.spikes.neurons)
+        assert all(len(np.unique(t)) == 1 for _, t in per_step)
+        assert sum(strided) == len(times) and len(strided) <= 320 // 40
+
+    def test_population_callbacks_added_after_build(self):
+        """Neuron callbacks registered after the backend is built still fire."""
+        from tara_mvp.simulation import NetworkBackend
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        _run(net, n_steps=20)
+        start = len(net.state.spikes)
+        calls = []
+        for neuron in net:
+            neuron.on_spike(lambda n, t: calls.append((net.state.spikes.index[n.id], t)))
+        _run(net, n_steps=300)
+
+        times, neurons = net.state.spikes.since(start)
+        assert calls and calls == list(zip(neurons.tolist(), times.tolist()))
+
+    def test_step_hooks_receive_windows(self):
+        from tara_mvp.simulation import NetworkBackend, SimulationMode
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        engine = _engine(net, SimulationMode.TIME_STEPPED, 33.0)
+        windows = []
+        engine.on_steps(lambda w: windows.append((w.step, w.t.copy(), len(w.spike_times), w.V)), every=100)
+        result = engine.run()
+
+        assert [w[0] for w in windows] == [100, 200, 300, 330]
+        np.testing.assert_allclose(np.concatenate([w[1] for w in windows]), np.arange(330) * 0.1)
+        assert sum(w[2] for w in windows) == result.total_spikes > 0
+        np.testing.assert_array_equal(windows[-1][3], [n.V for n in net])
+
+    def test_step_hooks_keep_pure_event_driven_runs(self):
+        """Strided hooks do not force event-driven runs to step every dt."""
+        from tara_mvp.simulation import NetworkBackend, SimulationMode
+
+        def run(every):
+            net = _build_recurrent(NetworkBackend.OBJECT, n_neurons=40)
+            net.params.external_rate = 0.0
+            engine = _engine(net, SimulationMode.EVENT_DRIVEN, 100.0)
+            engine.add_input_current([n.id for n in list(net)[:10]], 2.5)
+            steps = []
+            if every:
+                engine.on_steps(lambda w: steps.append(w.step), every=every)
+            return engine.run(), steps
+
+        plain, _ = run(None)
+        hooked, steps = run(250)
+        assert steps == [250, 500, 750, 1000]
+        assert hooked.total_spikes == plain.total_spikes > 0
+        assert hooked.metrics["events_processed"] == plain.metrics["events_processed"]
+
+
+class TestCompactState:
+    """Tests for slotted states and record-array events."""
+
+    def test_states_are_slotted_and_lazy(self):
+        from tara_mvp.simulation import LIFNeuron, NetworkBackend
+        from tara_mvp.simulation.engine import Event, EventType
+        from tara_mvp.simulation.synapses.base import SynapseState
+
+        neuron = LIFNeuron()
+        assert not hasattr(neuron.state, "__dict__")
+        assert neuron.state._V_history is None and neuron.state._spike_times is None
+        neuron.step()
+        assert len(neuron.state.V_history) == 1
+
+        synapse_state = SynapseState()
+        assert not hasattr(synapse_state, "__dict__") and synapse_state._pending_spikes is None
+        assert not hasattr(Event(1.0, EventType.CUSTOM), "__dict__")
+
+        net = _build_recurrent(NetworkBackend.POPULATION)
+        _run(net, n_steps=5)
+        assert not hasattr(next(iter(net)).state, "__dict__")
+
+    def test_records_and_events_pop_in_time_order(self):
+        from tara_mvp.simulation.engine import Event, EventQueue, EventType
+
+        queue = EventQueue()
+        queue.push_inputs(np.array([3.0, 1.0, 5.0]), ["a", "b"], np.array([0, 1, 0]), weight=0.5)
+        queue.push(Event(2.0, EventType.CUSTOM))
+        queue.push_inputs(np.array([4.0]), ["b"], np.array([0]), weight=np.array([2.0]))
+        assert len(queue) == 5 and queue.peek().time == 1.0
+
+        events = queue.pop_until(3.0)
+        assert [e.time for e in events] == [1.0, 2.0, 3.0]
+        assert [e.target_id for e in events] == ["b", None, "a"]
+        assert events[0].data == {"weight": 0.5}
+
+        records = queue.pop_records(4.5)
+        assert records["time"].tolist() == [4.0]
+        assert queue.values[records["payload"][0]] == 2.0
+        assert queue.pop().time == 5.0 and not queue
+
+    def test_input_records_match_event_objects(self):
+        """Inputs queued as records drive the network like Event objects."""
+        from tara_mvp.simulation import NetworkBackend, SimulationMode
+        from tara_mvp.simulation.engine import Event, EventType
+        from tara_mvp.simulation.engine.events import PoissonInputGenerator
+
+        def run(as_records):
+            net = _build_recurrent(NetworkBackend.OBJECT, n_neurons=40)
+            net.params.external_rate = 0.0
+            engine = _engine(net, SimulationMode.TIME_STEPPED, 50.0)
+            generator = PoissonInputGenerator(
+                [n.id for n in list(net)[:10]], rate=1000.0, weight=40.0, end_time=50.0,
+                rng=np.random.default_rng(5),
+            )
+            engine.add_poisson_input(generator)
+            if not as_records:
+                events = engine.event_queue.events()
+                engine.event_queue.clear()
+                for event in events:
+                    engine.event_queue.push(Event(
+                        event.time, EventType.INPUT, event.target_id, data=dict(event.data),
+                    ))
+            return engine.run()
+
+        records, objects = run(True), run(False)
+        assert records.total_spikes == objects.total_spikes > 0
+        assert list(records.spike_counts.values()) == list(objects.spike_counts.values())
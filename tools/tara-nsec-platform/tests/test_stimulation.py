@@ -436,6 +436,40 @@ class TestStimulationStats:
         stats = configured_firewall.get_stats()
         assert stats["flow_direction"] == FlowDirection.BIDIRECTIONAL.name
 
+    def test_stats_outlive_log_retention(self, unauthorized_stim_command):
+        """Stats count every command while the log keeps only the newest."""
+        firewall = NeuralFirewall(authorized_regions={"M1"}, log_retention=3)
+        results = [firewall.filter_stimulation(unauthorized_stim_command) for _ in range(8)]
+
+        stats = firewall.get_stats()["stimulation"]
+        assert stats["total"] == 8
+        assert stats["retained"] == 3
+        assert stats["rejected"] == 8
+        assert stats["failed_check_counts"]["authenticated"] == 8
+        # Retained rows are rebuilt from the log columns
+        assert firewall.stimulation_log == results[-3:]
+
+    def test_close_writes_both_spill_files(self, tmp_path, unauthorized_stim_command):
+        """Closing the firewall flushes the read and stimulation spill files."""
+        from tara_mvp.core.decision_log import read_spill
+        from tara_mvp.core.firewall import Signal
+
+        read_path = str(tmp_path / "read.bin")
+        stim_path = str(tmp_path / "stimulation.bin")
+        signal = Signal(arrival_times=[0.0, 0.025], amplitudes=[100.0, 100.0], authenticated=True)
+        with NeuralFirewall(
+            authorized_regions={"M1"}, log_retention=2,
+            log_spill_path=read_path, stimulation_log_spill_path=stim_path,
+        ) as firewall:
+            for _ in range(5):
+                firewall.filter(signal)
+                firewall.filter_stimulation(unauthorized_stim_command)
+
+        assert len(list(read_spill(read_path))) == 3
+        stimulation = list(read_spill(stim_path))
+        assert len(stimulation) == 3
+        assert all(row[0] == Decision.REJECT.value for row in stimulation)
+
 
 # =============================================================================
 # Log Management Tests